@@ -1,4 +1,8 @@
 from genie.base import *
 from genie import abstract
 
-abstract.declare_token(__name__)
\ No newline at end of file
+abstract.declare_token(__name__)
+
+# Import the parser modules on first use
+from genie.libs.parser.lazy import lazy_getattr
+__getattr__ = lazy_getattr(__name__, __path__)
@@ -17,6 +17,9 @@ from genie.metaparser.util.schemaengine import Schema, \
                                                 Any, \
                                                 Optional
 
+# import parser utils
+from genie.libs.parser.utils.records import RecordIterator, RecordSplitter
+
 
 # =============================================
 # Schema for 
@@ -386,7 +389,7 @@ class ShowVpnSessiondbSuperSchema(MetaParser):
 # =============================================
 
 
-class ShowVpnSessiondbSuper(ShowVpnSessiondbSuperSchema):
+class ShowVpnSessiondbSuper(RecordIterator, ShowVpnSessiondbSuperSchema):
     """Super Parser for
         * show vpn-sessiondb
         * show vpn-sessiondb anyconnect
@@ -394,6 +397,11 @@ class ShowVpnSessiondbSuper(ShowVpnSessiondbSuperSchema):
         * show vpn-sessiondb webvpn
     """
 
+    # Sessions start with their username, under the header of their type,
+    # see iter_records
+    records = RecordSplitter(start=r'^Username\s+:',
+                             context=(r'^Session\s+Type:',))
+
     def cli(self, sort=None, output=None):
 
         parsed_dict = {}
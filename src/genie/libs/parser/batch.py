@@ -0,0 +1,299 @@
+'''Bulk parsing of captured outputs, offline, across all cores.
+
+The outputs are listed in a manifest, one capture per line, in JSON Lines:
+
+    {"os": "iosxe", "platform": "cat9k", "command": "show version",
+     "path": "captures/R1/show_version.txt", "device": "R1"}
+
+or in CSV, with the same columns in a header row. `platform`, `model` and
+`device` are optional, relative paths are relative to the manifest.
+
+Each command is resolved into a parser once per os/platform/model, and the
+captures are parsed by a pool of processes warmed up with a bundle of the
+resolved parsers (see utils/warm_start.py). Results are written as they
+come, one JSON object per capture:
+
+    {"path": ..., "device": ..., "os": ..., "command": ...,
+     "parser": "genie.libs.parser.iosxe.show_platform.ShowVersion",
+     "status": "ok", "parsed": {...}, "error": null, "seconds": 0.0012}
+
+where status is `ok`, `empty` (the parser found nothing in the output),
+`error` (the parser raised, the capture could not be read or its manifest
+entry is malformed) or `unresolved` (no parser for the command).
+
+    python -m genie.libs.parser.batch manifest.jsonl -o results.jsonl
+    python -m genie.libs.parser.batch manifest.csv -o results.jsonl \\
+        --processes 16 --bundle /var/cache/parsers/nightly.bundle
+
+Captures are handed to the workers by path, a bounded number at a time, and
+only the commands and their resolutions are held in memory, so a run scales
+to as many captures as the manifest lists.
+'''
+
+# python
+import os
+import sys
+import csv
+import json
+import time
+import logging
+import argparse
+import threading
+import multiprocessing
+
+from genie.metaparser.util.exceptions import SchemaEmptyParserError
+
+from .utils import common, warm_start
+
+log = logging.getLogger(__name__)
+
+# Columns of a manifest
+MANIFEST_FIELDS = ('os', 'platform', 'model', 'command', 'path', 'device')
+
+
+class OfflineDevice(object):
+    '''Stand-in for the device a capture was taken from.
+
+    It holds what parser resolution reads from a device, and refuses to run
+    commands: everything a parser needs must be in the capture.
+    '''
+
+    def __init__(self, os, platform=None, model=None, name=None):
+        self.os = os
+        self.platform = platform
+        self.model = model
+        self.name = name or os
+        self.custom = {}
+
+    def execute(self, command, *args, **kwargs):
+        raise RuntimeError("'{c}' was not captured for device {d}".format(
+            c=command, d=self.name))
+
+
+def _json_rows(f):
+    '''Yield the objects of a JSON Lines file, or the error of the lines
+    which cannot be decoded'''
+    for line in f:
+        if not line.strip():
+            continue
+        try:
+            yield json.loads(line)
+        except ValueError as e:
+            yield e
+
+
+def read_manifest(path):
+    '''Yield the entries of a manifest, a dict per capture.
+
+    Entries which cannot be decoded, or have no os, command or path, are
+    yielded with their `error`, None for the others: they are reported in
+    the results instead of stopping the run.
+
+    Args:
+        path (`str`): JSON Lines manifest, or CSV manifest if the file name
+                      ends with .csv
+    '''
+    folder = os.path.dirname(os.path.abspath(path))
+    with open(path, newline='') as f:
+        if path.endswith('.csv'):
+            rows = csv.DictReader(f)
+        else:
+            rows = _json_rows(f)
+
+        for number, row in enumerate(rows, 1):
+            error = None
+            if isinstance(row, ValueError):
+                error = 'is not valid JSON: {}'.format(row)
+            elif not isinstance(row, dict):
+                error = 'is not a JSON object'
+            if error:
+                row = {}
+
+            entry = {field: row.get(field) or None
+                     for field in MANIFEST_FIELDS}
+            if error is None and not all(
+                    isinstance(entry[field], str)
+                    for field in ('os', 'command', 'path')):
+                error = 'needs an os, a command and a path'
+
+            if error is None:
+                entry['path'] = os.path.join(folder, entry['path'])
+                entry['error'] = None
+            else:
+                entry['error'] = '{p}: entry {n} {e}'.format(p=path, n=number,
+                                                            e=error)
+            yield entry
+
+
+def _device_key(entry):
+    return entry['os'], entry['platform'], entry['model']
+
+
+def resolve(entries):
+    '''Resolve the commands of manifest entries into parsers.
+
+    Each command is resolved once per os/platform/model.
+
+    Returns:
+        tuple: {(os, platform, model, command): (parser class, kwargs) or
+               None if no parser was found}, and the warm start bundle of
+               the parsers
+    '''
+    commands = {}
+    for entry in entries:
+        if entry.get('error'):
+            continue
+        commands.setdefault(_device_key(entry), set()).add(entry['command'])
+
+    devices = [OfflineDevice(*key) for key in commands]
+    bundle = warm_start.build_bundle(
+        sorted(set().union(*commands.values())), devices)
+
+    resolutions = {}
+    for device in devices:
+        key = (device.os, device.platform, device.model)
+        for command in commands[key]:
+            # Served from the cache filled by build_bundle
+            try:
+                resolutions[key + (command,)] = common.get_parser(command,
+                                                                  device)
+            except Exception as e:
+                log.debug("No parser for '{c}' on {d}: {e}".format(
+                    c=command, d=key, e=e))
+                resolutions[key + (command,)] = None
+
+    return resolutions, bundle
+
+
+def _init_worker(bundle):
+    '''Warm up a worker, see warm_start.attach'''
+    try:
+        warm_start.attach(bundle)
+    except Exception as e:
+        # A cold worker still parses
+        log.warning('Could not warm up the worker: {}'.format(e))
+
+
+def parse_capture(task):
+    '''Parse a capture in a worker.
+
+    Args:
+        task (`tuple`): manifest entry, and the parser class and kwargs of
+                        its command, None if it has no parser
+
+    Returns:
+        dict: the result line of the capture
+    '''
+    entry, parser_cls, kwargs = task
+    result = {'path': entry['path'],
+              'device': entry['device'],
+              'os': entry['os'],
+              'command': entry['command'],
+              'parser': None,
+              'status': 'unresolved',
+              'parsed': None,
+              'error': None,
+              'seconds': 0}
+    if entry.get('error'):
+        # Malformed manifest entry
+        result['status'] = 'error'
+        result['error'] = entry['error']
+        return result
+    if parser_cls is None:
+        return result
+
+    result['parser'] = '{}.{}'.format(parser_cls.__module__,
+                                      parser_cls.__name__)
+    result['status'] = 'ok'
+    start = time.perf_counter()
+    try:
+        with open(entry['path'], errors='replace') as f:
+            output = f.read()
+        device = OfflineDevice(entry['os'], entry['platform'], entry['model'],
+                               entry['device'])
+        result['parsed'] = parser_cls(device=device).parse(output=output,
+                                                           **kwargs)
+    except SchemaEmptyParserError:
+        result['status'] = 'empty'
+    except Exception as e:
+        result['status'] = 'error'
+        result['error'] = '{}: {}'.format(type(e).__name__, e)
+    result['seconds'] = time.perf_counter() - start
+
+    return result
+
+
+def run(manifest, out, processes=None, bundle=None, chunksize=16):
+    '''Parse the captures of a manifest and write their results.
+
+    Args:
+        manifest (`str`): path of the manifest, see read_manifest
+        out: file the results are written to, as JSON Lines
+        processes (`int`): size of the pool, the number of CPUs by default
+        bundle (`str`): stored warm start bundle to attach the workers to,
+                        instead of the bundle of the resolved parsers
+        chunksize (`int`): captures handed to a worker at once
+
+    Returns:
+        dict: number of captures per status, and the time the run took
+    '''
+    start = time.perf_counter()
+    resolutions, resolved_bundle = resolve(read_manifest(manifest))
+    if bundle is None:
+        bundle = resolved_bundle
+
+    # Captures read from the manifest and not written yet, the manifest is
+    # read a second time rather than held in memory
+    window = threading.Semaphore((processes or os.cpu_count() or 1) *
+                                 chunksize * 4)
+
+    def tasks():
+        for entry in read_manifest(manifest):
+            window.acquire()
+            key = _device_key(entry) + (entry['command'],)
+            yield (entry,) + (resolutions.get(key) or (None, None))
+
+    counts = {'ok': 0, 'empty': 0, 'error': 0, 'unresolved': 0}
+    with multiprocessing.Pool(processes, _init_worker, (bundle,)) as pool:
+        for result in pool.imap_unordered(parse_capture, tasks(), chunksize):
+            window.release()
+            counts[result['status']] += 1
+            out.write(json.dumps(result, default=str))
+            out.write('\n')
+
+    counts['seconds'] = time.perf_counter() - start
+    return counts
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m genie.libs.parser.batch',
+        description=__doc__.splitlines()[0])
+    parser.add_argument('manifest', help='JSON Lines or CSV manifest of the '
+                                         'captures')
+    parser.add_argument('-o', '--output', default='-',
+                        help='JSON Lines file of the results, stdout by '
+                             'default')
+    parser.add_argument('--processes', type=int, default=None,
+                        help='size of the pool, the number of CPUs by '
+                             'default')
+    parser.add_argument('--bundle', default=None,
+                        help='stored warm start bundle for the workers')
+    parser.add_argument('--chunksize', type=int, default=16,
+                        help='captures handed to a worker at once')
+    args = parser.parse_args(argv)
+
+    if args.output == '-':
+        counts = run(args.manifest, sys.stdout, args.processes, args.bundle,
+                     args.chunksize)
+    else:
+        with open(args.output, 'w') as out:
+            counts = run(args.manifest, out, args.processes, args.bundle,
+                         args.chunksize)
+
+    print('ok: {ok}, empty: {empty}, error: {error}, unresolved: '
+          '{unresolved} in {seconds:.1f}s'.format(**counts), file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,3 +1,7 @@
 # Enable abstraction using this directory name as the abstraction token
 from genie import abstract
 abstract.declare_token(__name__)
+
+# Import the parser modules on first use
+from genie.libs.parser.lazy import lazy_getattr
+__getattr__ = lazy_getattr(__name__, __path__)
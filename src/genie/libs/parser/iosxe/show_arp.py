@@ -22,6 +22,8 @@ from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 # parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.patterns import PatternTable
+from genie.libs.parser.utils.records import RecordIterator, RecordSplitter
 
 
 # =============================================
@@ -64,7 +66,7 @@ class ShowArpSchema(MetaParser):
     }
 
 
-class ShowArp(ShowArpSchema):
+class ShowArp(RecordIterator, ShowArpSchema):
     """ Parser for show arp
                   show arp <WROD>
                   show arp vrf <vrf>
@@ -73,6 +75,19 @@ class ShowArp(ShowArpSchema):
     cli_command = ['show arp','show arp vrf {vrf}','show arp vrf {vrf} {intf_or_ip}','show arp {intf_or_ip}']
     exclude = ['age']
 
+    patterns = PatternTable(
+        # Internet  192.168.234.1           -   58bf.eaff.e508  ARPA   Vlan100
+        # Internet  10.169.197.93          -   fa16.3eff.b7ad  ARPA
+        p1=r'^(?P<protocol>\w+) +(?P<address>[\d\.\:]+) +(?P<age>[\d\-]+) +'
+           '(?P<mac>[\w\.]+) +(?P<type>\w+)( +(?P<interface>[\w\.\/\-]+))?$',
+    )
+
+    # Every line is matched against all the patterns at once
+    scanner = patterns.scanner()
+
+    # Every line is an entry, see iter_records
+    records = RecordSplitter(start=patterns.p1)
+
     def cli(self, vrf='', intf_or_ip='', cmd=None, output=None):
         if output is None:
             if not cmd:
@@ -88,21 +103,14 @@ class ShowArp(ShowArpSchema):
         else:
             out = output
 
-        # Internet  192.168.234.1           -   58bf.eaff.e508  ARPA   Vlan100
-        # Internet  10.169.197.93          -   fa16.3eff.b7ad  ARPA
-        p1 = re.compile(r'^(?P<protocol>\w+) +(?P<address>[\d\.\:]+) +(?P<age>[\d\-]+) +'
-                         '(?P<mac>[\w\.]+) +(?P<type>\w+)( +(?P<interface>[\w\.\/\-]+))?$')
         # initial variables
         ret_dict = {}
 
-        for line in out.splitlines():
-            line = line.strip()
+        for name, group in self.scanner.scan(out):
 
             # Internet  192.168.234.1           -   58bf.eaff.e508  ARPA   Vlan100
             # Internet  10.169.197.93          -   fa16.3eff.b7ad  ARPA
-            m = p1.match(line)
-            if m:
-                group = m.groupdict()
+            if name == 'p1':
                 address = group['address']
                 interface = group['interface']
                 if interface:
@@ -116,6 +116,9 @@ from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
 # Parser
 from genie.libs.parser.iosxe.show_vrf import ShowVrf
 
+# import parser utils
+from genie.libs.parser.utils.common import intern_value, intern_values
+
 
 # ============================================
 # Schema for:
@@ -901,6 +904,10 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
         * 'show ip bgp {address_family} rd {rd} detail'
     '''
 
+    # Not a RecordIterator: the "RD" address family is kept across address
+    # families, and the vrf dictionary only switched for a new vrf, so an
+    # entry cannot be parsed on its own
+
     def cli(self, address_family='', vrf='', rd='', output=None):
         # Init dictionary
         ret_dict = {}
@@ -1106,7 +1113,8 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
             # Paths: (1 available, best #1, table default, RIB-failure(17))
             m = p2.match(line)
             if m:
-                group = m.groupdict()
+                group = intern_values(m.groupdict(), (
+                    'paths', 'available_path', 'best_path'))
                 original_address_family = address_family.lower()
 
                 if 'instance' not in ret_dict:
@@ -1239,7 +1247,9 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
             m = p4.match(line)
             if m:
                 index += 1
-                group = m.groupdict()
+                group = intern_values(m.groupdict(), (
+                    'next_hop', 'gateway', 'originator', 'next_hop_igp_metric',
+                    'next_hop_via'))
 
                 if new_address_family:
                     if 'index' not in new_addr_family_dict['prefixes'][prefixes]:
@@ -1293,7 +1303,7 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
             # Origin IGP, localpref 100, valid, external, atomic-aggregate, best
             m = p5.match(line)
             if m:
-                group = m.groupdict()
+                group = intern_values(m.groupdict(), ('weight',))
                 status_codes = ''
 
                 if group['aggregate']:
@@ -1324,7 +1334,7 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
                     if state == 'internal':
                         status_codes += 'i'
 
-                subdict['status_codes'] = status_codes
+                subdict['status_codes'] = intern_value(status_codes)
 
                 # Adding the keys we got from 'Refresh Epoch' line
                 if refresh_epoch:
@@ -1393,7 +1403,8 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
             # Extended Community: RT:65535:1 ENCAP:8 Router MAC:001E.7AFF.FCD2
             m = p8.match(line)
             if m:
-                group = m.groupdict()
+                group = intern_values(m.groupdict(), (
+                    'ext_community', 'encap', 'router_mac'))
 
                 if 'evpn' not in subdict:
                     subdict['evpn'] = {}
@@ -1412,7 +1423,7 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
             # Extended Community: RT:65109:50 RT:65109:51 , recursive-via-connected
             m = p8_2.match(line)
             if m:
-                group = m.groupdict()
+                group = intern_values(m.groupdict(), ('ext_community',))
                 ext_community = group['ext_community']
 
                 if 'evpn' in subdict:
@@ -1429,7 +1440,7 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
             # Community: 1:1 65100:101 65100:175 65100:500 65100:601 65151:65000 65351:1
             m = p8_3.match(line)
             if m:
-                subdict['community'] = m.groupdict()['community']
+                subdict['community'] = intern_value(m.groupdict()['community'])
                 continue
 
             # AGI version(0), VE Block Size(10) Label Base(16)
@@ -1519,12 +1530,12 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
             m = p17.match(line)
             if m and refresh_epoch_flag or m and m.groupdict()['route_info']:
                 group = m.groupdict()
-                route_info = group['route_info']
+                route_info = intern_value(group['route_info'])
 
                 if group['route_status']:
                     temp_route_status = group['route_status'].strip(' ')
                     if temp_route_status.startswith('(') and temp_route_status.endswith(')'):
-                        route_status = temp_route_status.strip("()")
+                        route_status = intern_value(temp_route_status.strip("()"))
                     elif 'imported path from' in temp_route_status:
                         imported_path_from = temp_route_status.lstrip('imported path from')
                         imported_safety_path = False
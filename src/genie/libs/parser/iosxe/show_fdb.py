@@ -19,7 +19,9 @@ from genie.metaparser.util.schemaengine import Schema, \
                                          Use
 
 # import parser utils
-from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.common import Common, intern_value
+from genie.libs.parser.utils.patterns import PatternTable
+from genie.libs.parser.utils.records import RecordIterator, RecordSplitter
 
 
 class ShowMacAddressTableSchema(MetaParser):
@@ -54,68 +56,73 @@ class ShowMacAddressTableSchema(MetaParser):
         Optional('total_mac_addresses'): int,
     }
 
-class ShowMacAddressTable(ShowMacAddressTableSchema):
+class ShowMacAddressTable(RecordIterator, ShowMacAddressTableSchema):
     """Parser for show mac address-table"""
 
     cli_command = ['show mac address-table',
                    'show mac address-table vlan {vlan}']
 
-    def cli(self, vlan='', output=None):
-        if output is None:
-            # get output from device
-            if vlan:
-                out = self.device.execute(self.cli_command[1].format(vlan=vlan))
-            else:
-                out = self.device.execute(self.cli_command[0])
-        else:
-            out = output
-
-        # initial return dictionary
-        ret_dict = mac_dict = {}
-        entry_type = entry = learn = age = ''
-
+    patterns = PatternTable(
         # Total Mac Addresses for this criterion: 93
-        p1 = re.compile(r'^Total +Mac +Addresses +for +this +criterion: +(?P<val>\d+)$')
+        p1=r'^Total +Mac +Addresses +for +this +criterion: +(?P<val>\d+)$',
 
         # 10    aaaa.bbff.8888    STATIC      Gi1/0/8 Gi1/0/9
         # 20    aaaa.bbff.8888    STATIC      Drop
         # All    0100.0cff.999a    STATIC      CPU
-        p2 = re.compile(r'^(?P<entry>[\w\*] )?\s*(?P<vlan>All|[\d\-]+) +(?P<mac>[\w.]+)'
-                        r' +(?P<entry_type>\w+) +(?P<intfs>\S+|[^\s]+\s[^\s]+)$')
+        p2=r'^(?P<entry>[\w\*] )?\s*(?P<vlan>All|[\d\-]+) +(?P<mac>[\w.]+)'
+           r' +(?P<entry_type>\w+) +(?P<intfs>\S+|[^\s]+\s[^\s]+)$',
 
         # Gi1/9,Gi1/10,Gi1/11,Gi1/12
         #               Router,Switch
-        p3 = re.compile(r'^(?P<intfs>(vPC Peer-Link)?[\w\/\,\(\)]+)$')
+        p3=r'^(?P<intfs>(vPC Peer-Link)?[\w\/\,\(\)]+)$',
 
         # *  101  44dd.eeff.55bb   dynamic  Yes         10   Gi1/40
         # *  102  aa11.bbff.ee55    static  Yes          -   Gi1/2,Gi1/4,Gi1/5,Gi1/6
         # *  400  0000.0000.0000    static  No           -   vPC Peer-Link
         # *  ---  0000.0000.0000    static  No           -   Router
-        p4 = re.compile(r'^(?P<entry>[\w\*] )?\s*(?P<vlan>All|[\d\-]+) +(?P<mac>[\w.]+)'
-                        r' +(?P<entry_type>\w+) +(?P<learn>\w+) +(?P<age>[\d\-\~]+) '
-                        r'+(?P<intfs>(vPC )?[\w\/\,\-\(\)\s]+)$')
+        p4=r'^(?P<entry>[\w\*] )?\s*(?P<vlan>All|[\d\-]+) +(?P<mac>[\w.]+)'
+           r' +(?P<entry_type>\w+) +(?P<learn>\w+) +(?P<age>[\d\-\~]+) '
+           r'+(?P<intfs>(vPC )?[\w\/\,\-\(\)\s]+)$',
 
         # 964    0000.0000.0000   dynamic ip,ipx                Router
-        p5 = re.compile(r'^(?P<entry>[\w\*] )?\s*(?P<vlan>All|[\d\-]+) '
-                        r'+(?P<mac>[\w.]+) +(?P<entry_type>\w+) '
-                        r'+(?P<protocols>[\w\,]+) '
-                        r'+(?P<intfs>\S+|[^\s]+\s[^\s]+)$')
-        
-        for line in out.splitlines():
-            line = line.strip()
+        p5=r'^(?P<entry>[\w\*] )?\s*(?P<vlan>All|[\d\-]+) '
+           r'+(?P<mac>[\w.]+) +(?P<entry_type>\w+) '
+           r'+(?P<protocols>[\w\,]+) '
+           r'+(?P<intfs>\S+|[^\s]+\s[^\s]+)$',
+    )
+
+    # Every line is matched against all the patterns at once
+    scanner = patterns.scanner()
+
+    # Entries start with their vlan and mac address, followed by the lines
+    # listing more of their ports, see iter_records
+    records = RecordSplitter(start=(patterns.p2, patterns.p4, patterns.p5))
+
+    def cli(self, vlan='', output=None):
+        if output is None:
+            # get output from device
+            if vlan:
+                out = self.device.execute(self.cli_command[1].format(vlan=vlan))
+            else:
+                out = self.device.execute(self.cli_command[0])
+        else:
+            out = output
+
+        # initial return dictionary
+        ret_dict = mac_dict = {}
+        entry_type = entry = learn = age = ''
+
+        for name, group in self.scanner.scan(out):
 
             # Total Mac Addresses for this criterion: 93
-            m = p1.match(line)
-            if m:
-                ret_dict.update({'total_mac_addresses': int(m.groupdict()['val'])})
+            if name == 'p1':
+                ret_dict.update({'total_mac_addresses': int(group['val'])})
                 continue
 
             # 10    aaaa.bbff.8888    STATIC      Gi1/0/8 Gi1/0/9
             # 20    aaaa.bbff.8888    STATIC      Drop
             # All    0100.0cff.999a    STATIC      CPU
-            m = p2.match(line)
-            if m:
-                group = m.groupdict()
+            elif name == 'p2':
                 mac = group['mac']
                 vlan = int(group['vlan']) if re.search('\d+', group['vlan']) \
                                           else group['vlan'].lower()
@@ -130,7 +137,8 @@ class ShowMacAddressTable(ShowMacAddressTableSchema):
                 if 'drop' in intfs.lower():
                     drop_dict = mac_dict.setdefault('drop', {})
                     drop_dict.update({'drop': True})
-                    drop_dict.update({'entry_type': group['entry_type'].lower()})
+                    drop_dict.update({'entry_type': intern_value(
+                        group['entry_type'].lower())})
                     continue
 
                 for intf in intfs.replace(' ',',').split(','):
@@ -138,18 +146,16 @@ class ShowMacAddressTable(ShowMacAddressTableSchema):
                     intf_dict = mac_dict.setdefault('interfaces', {}) \
                                         .setdefault(intf, {})
                     intf_dict.update({'interface': intf})
-                    entry_type = group['entry_type'].lower()
+                    entry_type = intern_value(group['entry_type'].lower())
                     intf_dict.update({'entry_type': entry_type})
                     if group['entry']:
-                        entry = group['entry'].strip()
+                        entry = intern_value(group['entry'].strip())
                         intf_dict.update({'entry': entry})
                 continue
 
             # Gi1/9,Gi1/10,Gi1/11,Gi1/12
             #               Router,Switch
-            m = p3.match(line)
-            if m:
-                group = m.groupdict()
+            elif name == 'p3':
                 intfs = group['intfs'].strip()
 
                 if 'drop' in intfs.lower():
@@ -176,9 +182,7 @@ class ShowMacAddressTable(ShowMacAddressTableSchema):
             # *  102  aa11.bbff.ee55    static  Yes          -   Gi1/2,Gi1/4,Gi1/5,Gi1/6
             # *  400  0000.0000.0000    static  No           -   vPC Peer-Link
             # *  ---  0000.0000.0000    static  No           -   Router
-            m = p4.match(line)
-            if m:
-                group = m.groupdict()
+            elif name == 'p4':
                 mac = group['mac']
                 vlan = int(group['vlan']) if re.search('\d+', group['vlan']) \
                                           else group['vlan'].lower()
@@ -193,7 +197,8 @@ class ShowMacAddressTable(ShowMacAddressTableSchema):
                 if 'drop' in intfs.lower():
                     drop_dict = mac_dict.setdefault('drop', {})
                     drop_dict.update({'drop': True})
-                    drop_dict.update({'entry_type': group['entry_type'].lower()})
+                    drop_dict.update({'entry_type': intern_value(
+                        group['entry_type'].lower())})
                     continue
 
                 for intf in intfs.split(','):
@@ -201,13 +206,13 @@ class ShowMacAddressTable(ShowMacAddressTableSchema):
                     intf_dict = mac_dict.setdefault('interfaces', {}) \
                                         .setdefault(intf, {})
                     intf_dict.update({'interface': intf})
-                    entry_type = group['entry_type'].lower()
+                    entry_type = intern_value(group['entry_type'].lower())
                     intf_dict.update({'entry_type': entry_type})
                     if group['entry']:
-                        entry = group['entry'].strip()
+                        entry = intern_value(group['entry'].strip())
                         intf_dict.update({'entry': entry})
                     if group['learn']:
-                        learn = group['learn']
+                        learn = intern_value(group['learn'])
                         intf_dict.update({'learn': learn})
                     if group['age']:
                         if group['age'].isdigit():
@@ -218,9 +223,7 @@ class ShowMacAddressTable(ShowMacAddressTableSchema):
                 continue
 
             # 964    0000.0000.0000   dynamic ip,ipx                Router
-            m = p5.match(line)
-            if m:
-                group = m.groupdict()
+            elif name == 'p5':
                 mac = group['mac']
                 vlan = int(group['vlan']) if re.search('\d+', group['vlan']) \
                                           else group['vlan'].lower()
@@ -235,7 +238,8 @@ class ShowMacAddressTable(ShowMacAddressTableSchema):
                 if 'drop' in intfs.lower():
                     drop_dict = mac_dict.setdefault('drop', {})
                     drop_dict.update({'drop': True})
-                    drop_dict.update({'entry_type': group['entry_type'].lower()})
+                    drop_dict.update({'entry_type': intern_value(
+                        group['entry_type'].lower())})
                     continue
 
                 for intf in intfs.replace(' ',',').split(','):
@@ -243,14 +247,15 @@ class ShowMacAddressTable(ShowMacAddressTableSchema):
                     intf_dict = mac_dict.setdefault('interfaces', {}) \
                                         .setdefault(intf, {})
                     intf_dict.update({'interface': intf})
-                    entry_type = group['entry_type'].lower()
+                    entry_type = intern_value(group['entry_type'].lower())
                     intf_dict.update({'entry_type': entry_type})
                     if group['entry']:
-                        entry = group['entry'].strip()
+                        entry = intern_value(group['entry'].strip())
                         intf_dict.update({'entry': entry})
 
                     if group['protocols']:
-                        intf_dict.update({'protocols': group['protocols'].split(',')})
+                        intf_dict.update({'protocols': list(map(
+                            intern_value, group['protocols'].split(',')))})
                 continue
 
         return ret_dict
@@ -20,7 +20,9 @@ from genie.metaparser.util.schemaengine import (Schema,
                                                 Use)
 
 # import parser utils
-from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.common import Common, intern_values
+from genie.libs.parser.utils.patterns import PatternTable
+from genie.libs.parser.utils.records import RecordIterator, iter_lines
 
 
 class ShowIpNatTranslationsSchema(MetaParser):
@@ -61,7 +63,7 @@ class ShowIpNatTranslationsSchema(MetaParser):
     }
 
 
-class ShowIpNatTranslations(ShowIpNatTranslationsSchema):
+class ShowIpNatTranslations(RecordIterator, ShowIpNatTranslationsSchema):
     """
         * show ip nat translations
         * show ip nat translations verbose
@@ -74,21 +76,7 @@ class ShowIpNatTranslations(ShowIpNatTranslationsSchema):
                    'show ip nat translations vrf {vrf}',
                    'show ip nat translations vrf {vrf} verbose']
 
-    def cli(self, vrf=None, option=None, output=None):
-        if output is None:
-            if option and vrf is None:
-                cmd = self.cli_command[1].format(verbose=option)
-            elif option and vrf:
-                cmd = self.cli_command[3].format(vrf=vrf, verbose=option)
-            elif vrf and option is None:
-                cmd = self.cli_command[2].format(vrf=vrf)
-            else:
-                cmd = self.cli_command[0]
-
-            out = self.device.execute(cmd)
-        else:
-            out = output
-
+    patterns = PatternTable(
         # udp  10.5.5.1:1025          192.0.2.1:4000 --- ---
         # udp  10.5.5.1:1024          192.0.2.3:4000 --- ---
         # udp  10.5.5.1:1026          192.0.2.2:4000 --- ---
@@ -99,41 +87,66 @@ class ShowIpNatTranslations(ShowIpNatTranslationsSchema):
         # tcp 172.16.94.209:1067  192.168.1.95:1067  172.16.196.161:23    172.16.196.161:23
         # icmp 10.10.140.200:66      10.10.40.100:66       10.10.140.110:66      10.10.140.110:66
         # any ---                ---                10.1.0.2          10.144.0.2
-        p1 = re.compile(r'^(?P<protocol>-+|udp|tcp|icmp|any) +(?P<inside_global>\S+) '
-                        r'+(?P<inside_local>\S+) +(?P<outside_local>\S+) '
-                        r'+(?P<outside_global>\S+)$')
-        
+        p1=r'^(?P<protocol>-+|udp|tcp|icmp|any) +(?P<inside_global>\S+) '
+           r'+(?P<inside_local>\S+) +(?P<outside_local>\S+) '
+           r'+(?P<outside_global>\S+)$',
+
         # create: 02/15/12 11:38:01, use: 02/15/12 11:39:02, timeout: 00:00:00
         # create 04/09/11 10:51:48, use 04/09/11 10:52:31, timeout: 00:01:00
-        p2 = re.compile(r'^create(?:\:)? +(?P<create>[\S ]+), '
-                        r'+use(?:\:)? +(?P<use>[\S ]+), +timeout(?:\:)? '
-                        r'+(?P<timeout>\S+)$')
+        p2=r'^create(?:\:)? +(?P<create>[\S ]+), '
+           r'+use(?:\:)? +(?P<use>[\S ]+), +timeout(?:\:)? '
+           r'+(?P<timeout>\S+)$',
 
-        # IOS-XE: 
+        # IOS-XE:
         # Map-Id(In): 1
-        # IOS: 
+        # IOS:
         # Map-Id(In):1, Mac-Address: 0000.0000.0000 Input-IDB: GigabitEthernet0/3/1
-        p3 = re.compile(r'^Map\-Id\(In\)[\:|\s]+(?P<map_id_in>\d+)(?:[\,|\s]'
-                        r'+Mac\-Address\: +(?P<mac_address>\S+) +Input\-IDB\: '
-                        r'+(?P<input_idb>\S+))?$')
+        p3=r'^Map\-Id\(In\)[\:|\s]+(?P<map_id_in>\d+)(?:[\,|\s]'
+           r'+Mac\-Address\: +(?P<mac_address>\S+) +Input\-IDB\: '
+           r'+(?P<input_idb>\S+))?$',
 
         # IOS-XE: Mac-Address: 0000.0000.0000    Input-IDB: TenGigabitEthernet1/1/0
-        p4 = re.compile(r'^Mac-Address: +(?P<mac_address>\S+) +Input-IDB: '
-                        r'+(?P<input_idb>\S+)$')
+        p4=r'^Mac-Address: +(?P<mac_address>\S+) +Input-IDB: '
+           r'+(?P<input_idb>\S+)$',
 
         # entry-id: 0x0, use_count:1
-        p5 = re.compile(r'^entry-id: +(?P<entry_id>\S+), '
-                        r'+use_count:+(?P<use_count>\d+)$')
+        p5=r'^entry-id: +(?P<entry_id>\S+), '
+           r'+use_count:+(?P<use_count>\d+)$',
 
         # Total number of translations: 3
-        p6 = re.compile(r'^Total +number +of +translations: '
-                        r'+(?P<number_of_translations>\d+)$')
-        
+        p6=r'^Total +number +of +translations: '
+           r'+(?P<number_of_translations>\d+)$',
+
         # Group_id:0   vrf: genie
-        p7 = re.compile(r'^Group_id\:(?P<group_id>\d+) +vrf\: +(?P<vrf_name>\S+)$')
+        p7=r'^Group_id\:(?P<group_id>\d+) +vrf\: +(?P<vrf_name>\S+)$',
 
         # Format(H:M:S) Time-left :0:0:-1
-        p8 = re.compile(r'^Format\S+ +Time\-left +\:(?P<time_left>\S+)$')
+        p8=r'^Format\S+ +Time\-left +\:(?P<time_left>\S+)$',
+    )
+
+    # Every line is matched against all the patterns at once
+    scanner = patterns.scanner()
+
+    # Fields repeating over translations, interned so that they share one
+    # string: the few outside hosts many inside hosts talk to, timestamps...
+    interned = ('protocol', 'outside_local', 'outside_global', 'create',
+                'use', 'timeout', 'mac_address', 'input_idb', 'entry_id',
+                'time_left')
+
+    def cli(self, vrf=None, option=None, output=None):
+        if output is None:
+            if option and vrf is None:
+                cmd = self.cli_command[1].format(verbose=option)
+            elif option and vrf:
+                cmd = self.cli_command[3].format(vrf=vrf, verbose=option)
+            elif vrf and option is None:
+                cmd = self.cli_command[2].format(vrf=vrf)
+            else:
+                cmd = self.cli_command[0]
+
+            out = self.device.execute(cmd)
+        else:
+            out = output
 
         # initialize variables
         ret_dict = {}
@@ -144,8 +157,8 @@ class ShowIpNatTranslations(ShowIpNatTranslationsSchema):
         vrf_name = ''
         vrf_flag = False
 
-        for line in out.splitlines():
-            line = line.strip()
+        for name, group in self.scanner.scan(out):
+            intern_values(group, self.interned)
 
             # udp  10.5.5.1:1025          192.0.2.1:4000 --- ---
             # udp  10.5.5.1:1024          192.0.2.3:4000 --- ---
@@ -156,9 +169,7 @@ class ShowIpNatTranslations(ShowIpNatTranslationsSchema):
             # tcp 172.16.94.209:11012 192.168.1.89:11012 172.16.196.220:23    172.16.196.220:23
             # tcp 172.16.94.209:1067  192.168.1.95:1067  172.16.196.161:23    172.16.196.161:23
             # any ---                ---                10.1.0.2          10.144.0.2
-            m1 = p1.match(line)
-            if m1:
-                group = m1.groupdict()
+            if name == 'p1':
                 if 'vrf' in ret_dict:
                     if vrf_flag:
                         protocol_dict = index_dict.setdefault(index, {})
@@ -192,9 +203,7 @@ class ShowIpNatTranslations(ShowIpNatTranslationsSchema):
             
             # create: 02/15/12 11:38:01, use: 02/15/12 11:39:02, timeout: 00:00:00
             # create 04/09/11 10:51:48, use 04/09/11 10:52:31, timeout: 00:01:00
-            m2 = p2.match(line)
-            if m2:
-                group = m2.groupdict()
+            elif name == 'p2':
                 if protocol_dict:
                     details_dict = protocol_dict.setdefault('details', {})
                     details_dict.update(group)
@@ -209,10 +218,7 @@ class ShowIpNatTranslations(ShowIpNatTranslationsSchema):
             # Map-Id(In): 1
             # IOS: 
             # Map-Id(In):1, Mac-Address: 0000.0000.0000 Input-IDB: GigabitEthernet0/3/1
-            m3 = p3.match(line)
-            if m3:
-                group = m3.groupdict()
-
+            elif name == 'p3':
                 if protocol_dict:
                     details_dict.update({'map_id_in': int(group['map_id_in'])})
 
@@ -233,10 +239,7 @@ class ShowIpNatTranslations(ShowIpNatTranslationsSchema):
 
             # IOS-XE: 
             # Mac-Address: 0000.0000.0000    Input-IDB: TenGigabitEthernet1/1/0
-            m4 = p4.match(line)
-            if m4:
-                group = m4.groupdict()
-
+            elif name == 'p4':
                 if protocol_dict:
                     details_dict.update(group)
                 else:
@@ -245,9 +248,7 @@ class ShowIpNatTranslations(ShowIpNatTranslationsSchema):
                 continue
             
             # entry-id: 0x0, use_count:1
-            m5 = p5.match(line)
-            if m5:
-                group = m5.groupdict()
+            elif name == 'p5':
                 if protocol_dict:
                     details_dict.update({'entry_id': group['entry_id']})
                     details_dict.update({'use_count': int(group['use_count'])})
@@ -267,19 +268,16 @@ class ShowIpNatTranslations(ShowIpNatTranslationsSchema):
                 continue
             
             # Total number of translations: 3
-            m6 = p6.match(line)
-            if m6:
+            elif name == 'p6':
 
-                anumber = int(m6.groupdict()['number_of_translations'])
+                anumber = int(group['number_of_translations'])
                 total_dict = ret_dict.setdefault('vrf', {})
                 total_dict.update({'number_of_translations': anumber})
 
                 continue
 
             # Group_id:0   vrf: genie
-            m7 = p7.match(line)
-            if m7:
-                group = m7.groupdict()
+            elif name == 'p7':
                 vrf_name = group['vrf_name']
                 if tmp_dict:
                     vrf_name_dict = vrf_dict.setdefault(group['vrf_name'], {})
@@ -293,9 +291,8 @@ class ShowIpNatTranslations(ShowIpNatTranslationsSchema):
                 continue
 
             # Format(H:M:S) Time-left :0:0:-1
-            m8 = p8.match(line)
-            if m8:
-                time_left = m8.groupdict()['time_left']
+            elif name == 'p8':
+                time_left = group['time_left']
                 if tmp_dict:
                     m8_dict = vrf_name_dict.setdefault('index', {})
                     tmp_dict[1].update({'time_left': time_left})
@@ -308,6 +305,72 @@ class ShowIpNatTranslations(ShowIpNatTranslationsSchema):
 
         return ret_dict
 
+    def iter_records(self, output, vrf=None, option=None):
+        '''Yield the translations of an output one at a time, see
+        RecordIterator.
+
+        cli() only files a translation once it has read the next one, so
+        translations are not parsed on their own with cli() but read here,
+        and numbered in the order they are read.
+        '''
+        index = 0
+        entry = vrf_name = None
+
+        for name, group in self.scanner.scan(iter_lines(output)):
+            intern_values(group, self.interned)
+
+            # udp  10.5.5.1:1025          192.0.2.1:4000 --- ---
+            if name == 'p1' or name == 'p6':
+                if entry:
+                    yield {'vrf': {vrf_name: {'index': {index: entry}}}}
+                entry = None
+
+            if name == 'p1':
+                index += 1
+                entry = group
+                vrf_name = 'default'
+
+            # Total number of translations: 3
+            elif name == 'p6':
+                yield {'vrf': {'number_of_translations':
+                               int(group['number_of_translations'])}}
+
+            # Lines detailing the translation above them
+            elif entry is None:
+                continue
+
+            # create: 02/15/12 11:38:01, use: 02/15/12 11:39:02, timeout: 00:00:00
+            # Mac-Address: 0000.0000.0000    Input-IDB: TenGigabitEthernet1/1/0
+            elif name == 'p2' or name == 'p4':
+                entry.setdefault('details', {}).update(group)
+
+            # Map-Id(In):1, Mac-Address: 0000.0000.0000 Input-IDB: GigabitEthernet0/3/1
+            elif name == 'p3':
+                details_dict = entry.setdefault('details', {})
+                details_dict['map_id_in'] = int(group['map_id_in'])
+                if group['mac_address']:
+                    details_dict['mac_address'] = group['mac_address']
+                if group['input_idb']:
+                    details_dict['input_idb'] = group['input_idb']
+
+            # entry-id: 0x0, use_count:1
+            elif name == 'p5':
+                details_dict = entry.setdefault('details', {})
+                details_dict['entry_id'] = group['entry_id']
+                details_dict['use_count'] = int(group['use_count'])
+
+            # Group_id:0   vrf: genie
+            elif name == 'p7':
+                entry['group_id'] = int(group['group_id'])
+                vrf_name = group['vrf_name']
+
+            # Format(H:M:S) Time-left :0:0:-1
+            elif name == 'p8':
+                entry['time_left'] = group['time_left']
+
+        if entry:
+            yield {'vrf': {vrf_name: {'index': {index: entry}}}}
+
 
 class ShowIpNatStatisticsSchema(MetaParser):
     """ Schema for command:
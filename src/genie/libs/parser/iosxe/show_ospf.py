@@ -40,6 +40,7 @@ from netaddr import IPAddress, IPNetwork
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.records import RecordIterator, RecordSplitter
 
 # ===========================================================
 # Schema for:
@@ -5081,7 +5082,7 @@ class ShowIpOspfDatabase(ShowIpOspfDatabaseSchema):
 #   * 'show ip ospf database opaque'
 #   * 'show ip ospf database opaque-area self-originate'
 # =====================================
-class ShowIpOspfDatabaseTypeParser(MetaParser):
+class ShowIpOspfDatabaseTypeParser(RecordIterator, MetaParser):
 
     ''' Parser for:
         * 'show ip ospf database external'
@@ -5092,6 +5093,15 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
         * 'show ip ospf database opaque-area self-originate''
     '''
 
+    # OSPF Router with ID (10.36.3.3) (Process ID 1)
+    #   Router Link States (Area 0)
+    #     Routing Bit Set on this LSA
+    #     LS age: 1565
+    records = RecordSplitter(start=r'^LS +age:',
+                             context=(r'^OSPF +Router +with +ID',
+                                      r'^.* +Link +States'),
+                             lead=(r'^Routing +Bit +Set +on +this +LSA$',))
+
     def cli(self, db_type, out=None):
 
         assert db_type in ['external', 'network', 'summary', 'router',
@@ -7,6 +7,9 @@ from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, \
                                          Any, \
                                          Optional
+from genie.libs.parser.utils.common import intern_value
+from genie.libs.parser.utils.patterns import PatternTable
+from genie.libs.parser.utils.records import RecordIterator, RecordSplitter
 
 
 # ====================================================
@@ -176,7 +179,7 @@ class ShowIpRouteSchema(MetaParser):
 # ====================================================
 #  parser for show ip route
 # ====================================================
-class ShowIpRoute(ShowIpRouteSchema):
+class ShowIpRoute(RecordIterator, ShowIpRouteSchema):
     """Parser for :
         show ip route
         show ip route vrf <vrf>"""
@@ -186,6 +189,88 @@ class ShowIpRoute(ShowIpRouteSchema):
     exclude = ['updated']
     IP_VER='ipv4'
 
+    patterns = PatternTable(
+        # Routing Table: VRF1
+        # Routing Table: VRF-infra
+        p1=r'^Routing Table: +(?P<vrf>[\w?-]+)$',
+
+        # 10.1.0.0/32 is subnetted, 1 subnets
+        # 10.0.0.0/8 is variably subnetted, 5 subnets, 2 masks
+        p2=r'^(?P<subnetted_ip>[\d\/\.]+) +is +(variably )?subnetted, '
+           r'+(?P<number_of_subnets>[\d]+) +subnets(, +(?P<number_of_masks>[\d]+) +masks)?$',
+
+        # C        10.4.1.1 is directly connected, Loopback0
+        # S        10.16.2.2 [1/0] via 10.186.2.2, GigabitEthernet0/1
+        # S*       10.16.2.2 [1/0] via 10.186.2.2, GigabitEthernet0/1
+        # O        10.2.3.0/24 [110/2] via 10.186.2.2, 06:46:59, GigabitEthernet0/1
+        # i L1     10.151.22.22 [115/20] via 10.186.2.2, 06:47:04, GigabitEthernet0/1
+        # D        192.168.205.1
+        # S*       0.0.0.0/0 [1/0] via 10.50.15.1
+        p3=r'^(?P<code>[\w\*]+) +(?P<code1>[\w]+)? +(?P<network>[0-9\.\:\/]+)?( '
+           r'+is +directly +connected,)? *\[?(?P<route_preference>[\d\/]+)?\]?( *('
+           r'via +)?(?P<next_hop>[\d\.]+))?,?( +(?P<date>[0-9][\w\:]+))?,?( +(?P<interface>[\S]+))?$',
+
+        # L        FF00::/8 [0/0]
+        p3_ipv6=r'^(?P<code>[\w\*]+) +(?P<code1>[\w]+)? +(?P<network>[\w\.\:\/]+)?( '
+                r'+is +directly +connected,)? *\[?(?P<route_preference>[\d\/]+)?\]?( *('
+                r'via +)?(?P<next_hop>[\d\.]+))?,?( +(?P<date>[0-9][\w\:]+))?,?( +(?P<interface>[\S]+))?$',
+
+        #    [110/2] via 10.1.2.2, 06:46:59, GigabitEthernet0/0
+        p4=r'^\[(?P<route_preference>[\d\/]+)\] +via +(?P<next_hop>[\d\.]+)?,?'
+           r'( +(?P<date>[0-9][\w\:]+),?)?( +(?P<interface>[\S]+))?$',
+
+        #       is directly connected, GigabitEthernet0/2
+        p5=r'^is +directly +connected,( +\[(?P<route_preference>[\d\/]+)\] '
+           r'+via +(?P<next_hop>[\d\.]+)?,)?( +(?P<date>[0-9][\w\:]+),)?'
+           r'( +(?P<interface>[\S]+))?$',
+
+        #      via 2001:DB8:1:1::2
+        #      via 10.4.1.1%default, indirectly connected
+        #      via 2001:DB8:4:6::6
+        #      via 2001:DB8:20:4:6::6%VRF2
+        #      via Null0, receive
+        p6=r'^via( +(?P<next_hop>[\w]+[.:][\w\:\.\%]+),?)?'
+           r'( +(?P<interface>[\w\.\/\-\_]+))?,?( +receive)?'
+           r'( +directly connected)?( +indirectly connected)?$',
+
+        p100=r'^Routing +entry +for +'
+             '(?P<entry>(?P<ip>[\w\:\.]+)\/(?P<mask>\d+))'
+             '(, +(?P<net>[\w\s]+))?$',
+
+        p200=r'^Known +via +\"(?P<known_via>[\w\s]+)\", +'
+             'distance +(?P<distance>\d+), +'
+             'metric +(?P<metric>\d+)'
+             '(, +type +(?P<type>[\w\-\s]+)(?P<connected>, connected)?)?$',
+
+        p300=r'^Redistributing +via +(?P<redist_via>\w+) *'
+             '(?P<redist_via_tag>\d+)?$',
+
+        p400=r'^Last +update +from +(?P<from>[\w\.]+) +'
+             'on +(?P<interface>[\w\.\/\-]+), +'
+             '(?P<age>[\w\.\:]+) +ago$',
+
+        p500=r'^\*? *(?P<nexthop>[\w\.]+)(, +'
+             'from +(?P<from>[\w\.]+), +'
+             '(?P<age>[\w\.\:]+) +ago, +'
+             'via +(?P<interface>[\w\.\/\-]+))?$',
+
+        p600=r'^Route +metric +is +(?P<metric>\d+), +'
+             'traffic +share +count +is +(?P<share_count>\d+)$',
+
+        p700=r'^Total +delay +is +(?P<total_delay>\d+) +microseconds, '
+             '+minimum +bandwidth +is +(?P<minimum_bandwidth>\d+) +Kbit$',
+
+        p800=r'^Reliability +(?P<reliability>[\d\/]+), +minimum +MTU +(?P<minimum_mtu>\d+) +bytes$',
+
+        p900=r'^Loading +(?P<loading>[\d\/]+), Hops +(?P<hops>\d+)$',
+    )
+
+    # Routes start with their code, followed by the lines of their other
+    # next hops, and belong to the vrf and subnet above them, see
+    # iter_records
+    records = RecordSplitter(start=patterns.p3,
+                             context=(patterns.p1, patterns.p2))
+
     def cli(self, vrf=None, protocol=None, output=None):
 
         if output is None:
@@ -223,32 +308,8 @@ class ShowIpRoute(ShowIpRouteSchema):
 
         result_dict = {}
 
-        # initial regexp pattern
-        p100 = re.compile(r'^Routing +entry +for +'
-                        '(?P<entry>(?P<ip>[\w\:\.]+)\/(?P<mask>\d+))'
-                        '(, +(?P<net>[\w\s]+))?$')
-        p200 = re.compile(r'^Known +via +\"(?P<known_via>[\w\s]+)\", +'
-                        'distance +(?P<distance>\d+), +'
-                        'metric +(?P<metric>\d+)'
-                        '(, +type +(?P<type>[\w\-\s]+)(?P<connected>, connected)?)?$')
-        p300 = re.compile(r'^Redistributing +via +(?P<redist_via>\w+) *'
-                        '(?P<redist_via_tag>\d+)?$')
-        p400 = re.compile(r'^Last +update +from +(?P<from>[\w\.]+) +'
-                        'on +(?P<interface>[\w\.\/\-]+), +'
-                        '(?P<age>[\w\.\:]+) +ago$')
-        p500 = re.compile(r'^\*? *(?P<nexthop>[\w\.]+)(, +'
-                        'from +(?P<from>[\w\.]+), +'
-                        '(?P<age>[\w\.\:]+) +ago, +'
-                        'via +(?P<interface>[\w\.\/\-]+))?$')
-        p600 = re.compile(r'^Route +metric +is +(?P<metric>\d+), +'
-                        'traffic +share +count +is +(?P<share_count>\d+)$')
-
-        p600 = re.compile(r'^Route +metric +is +(?P<metric>\d+), +'
-                          'traffic +share +count +is +(?P<share_count>\d+)$')
-        p700 = re.compile(r'^Total +delay +is +(?P<total_delay>\d+) +microseconds, '
-                          '+minimum +bandwidth +is +(?P<minimum_bandwidth>\d+) +Kbit$')
-        p800 = re.compile(r'^Reliability +(?P<reliability>[\d\/]+), +minimum +MTU +(?P<minimum_mtu>\d+) +bytes$')
-        p900 = re.compile(r'^Loading +(?P<loading>[\d\/]+), Hops +(?P<hops>\d+)$')
+        p = self.patterns
+        p3 = p.p3 if self.IP_VER == 'ipv4' else p.p3_ipv6
 
         # initial variables
         ret_dict = {}
@@ -263,17 +324,14 @@ class ShowIpRoute(ShowIpRouteSchema):
             next_hop = interface = updated = metrics = route_preference = ""
             # Routing Table: VRF1
             # Routing Table: VRF-infra
-            p1 = re.compile(r'^Routing Table: +(?P<vrf>[\w?-]+)$')
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 vrf = m.groupdict()['vrf']
                 continue
 
             # 10.1.0.0/32 is subnetted, 1 subnets
             # 10.0.0.0/8 is variably subnetted, 5 subnets, 2 masks
-            p2 = re.compile(r'^(?P<subnetted_ip>[\d\/\.]+) +is +(variably )?subnetted, '
-                            r'+(?P<number_of_subnets>[\d]+) +subnets(, +(?P<number_of_masks>[\d]+) +masks)?$')
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 # if you see the issue by "show ip route", it means that active is True.
                 # it means all routes in the output should be active=True
@@ -297,29 +355,19 @@ class ShowIpRoute(ShowIpRouteSchema):
             # D        192.168.205.1
             # S*       0.0.0.0/0 [1/0] via 10.50.15.1
             # L        FF00::/8 [0/0]
-            if self.IP_VER == 'ipv4':
-                p3 = re.compile(
-                    r'^(?P<code>[\w\*]+) +(?P<code1>[\w]+)? +(?P<network>[0-9\.\:\/]+)?( '
-                    r'+is +directly +connected,)? *\[?(?P<route_preference>[\d\/]+)?\]?( *('
-                    r'via +)?(?P<next_hop>[\d\.]+))?,?( +(?P<date>[0-9][\w\:]+))?,?( +(?P<interface>[\S]+))?$')
-            else:
-                p3 = re.compile(
-                    r'^(?P<code>[\w\*]+) +(?P<code1>[\w]+)? +(?P<network>[\w\.\:\/]+)?( '
-                    r'+is +directly +connected,)? *\[?(?P<route_preference>[\d\/]+)?\]?( *('
-                    r'via +)?(?P<next_hop>[\d\.]+))?,?( +(?P<date>[0-9][\w\:]+))?,?( +(?P<interface>[\S]+))?$')
-
             m = p3.match(line)
             if m:
                 active = True
                 if m.groupdict()['code']:
-                    source_protocol_codes = m.groupdict()['code'].strip()
+                    source_protocol_codes = intern_value(m.groupdict()['code'].strip())
                     for key,val in source_protocol_dict.items():
                         source_protocol_replaced = source_protocol_codes.split('*')[0]
                         if source_protocol_replaced in val:
                             source_protocol = key
 
                 if m.groupdict()['code1']:
-                    source_protocol_codes = '{} {}'.format(source_protocol_codes, m.groupdict()['code1'])
+                    source_protocol_codes = intern_value('{} {}'.format(
+                        source_protocol_codes, m.groupdict()['code1']))
 
                 if m.groupdict()['network']:
                     network = m.groupdict()['network']
@@ -338,16 +386,16 @@ class ShowIpRoute(ShowIpRouteSchema):
                         metrics = routepreference.split('/')[1]
 
                 if m.groupdict()['next_hop']:
-                    next_hop = m.groupdict()['next_hop']
+                    next_hop = intern_value(m.groupdict()['next_hop'])
                     index = 1
                 else:
                     index = 0
 
                 if m.groupdict()['interface']:
-                    interface = m.groupdict()['interface']
+                    interface = intern_value(m.groupdict()['interface'])
 
                 if m.groupdict()['date']:
-                    updated = m.groupdict()['date']
+                    updated = intern_value(m.groupdict()['date'])
 
                 route_dict = result_dict.setdefault('vrf', {}).setdefault(vrf, {})\
                                         .setdefault('address_family', {}).setdefault(af, {})\
@@ -383,22 +431,20 @@ class ShowIpRoute(ShowIpRouteSchema):
                 continue
 
             #    [110/2] via 10.1.2.2, 06:46:59, GigabitEthernet0/0
-            p4 = re.compile(r'^\[(?P<route_preference>[\d\/]+)\] +via +(?P<next_hop>[\d\.]+)?,?'
-                            r'( +(?P<date>[0-9][\w\:]+),?)?( +(?P<interface>[\S]+))?$')
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 routepreference = m.groupdict()['route_preference']
                 if routepreference and '/' in routepreference:
                     route_preference = routepreference.split('/')[0]
                     metrics = routepreference.split('/')[1]
 
-                next_hop = m.groupdict()['next_hop']
+                next_hop = intern_value(m.groupdict()['next_hop'])
                 index +=1
                 if m.groupdict()['interface']:
-                    interface = m.groupdict()['interface']
+                    interface = intern_value(m.groupdict()['interface'])
 
                 if m.groupdict()['date']:
-                    updated = m.groupdict()['date']
+                    updated = intern_value(m.groupdict()['date'])
 
                 route_dict = result_dict.setdefault('vrf', {}).setdefault(vrf, {})\
                                         .setdefault('address_family', {}).setdefault(af, {})\
@@ -434,10 +480,7 @@ class ShowIpRoute(ShowIpRouteSchema):
                 continue
 
             #       is directly connected, GigabitEthernet0/2
-            p5 = re.compile(r'^is +directly +connected,( +\[(?P<route_preference>[\d\/]+)\] '
-                            r'+via +(?P<next_hop>[\d\.]+)?,)?( +(?P<date>[0-9][\w\:]+),)?'
-                            r'( +(?P<interface>[\S]+))?$')
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
 
                 if m.groupdict()['route_preference']:
@@ -448,11 +491,11 @@ class ShowIpRoute(ShowIpRouteSchema):
 
                 index += 1
                 if m.groupdict()['next_hop']:
-                    next_hop = m.groupdict()['next_hop']
+                    next_hop = intern_value(m.groupdict()['next_hop'])
                 if m.groupdict()['interface']:
-                    interface = m.groupdict()['interface']
+                    interface = intern_value(m.groupdict()['interface'])
                 if m.groupdict()['date']:
-                    updated = m.groupdict()['date']
+                    updated = intern_value(m.groupdict()['date'])
 
                 route_dict = result_dict.setdefault('vrf', {}).setdefault(vrf, {})\
                                         .setdefault('address_family', {}).setdefault(af, {})\
@@ -488,22 +531,19 @@ class ShowIpRoute(ShowIpRouteSchema):
             #      via 2001:DB8:4:6::6
             #      via 2001:DB8:20:4:6::6%VRF2
             #      via Null0, receive
-            p6 = re.compile(r'^via( +(?P<next_hop>[\w]+[.:][\w\:\.\%]+),?)?'
-                            r'( +(?P<interface>[\w\.\/\-\_]+))?,?( +receive)?'
-                            r'( +directly connected)?( +indirectly connected)?$')
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 vrf_val = ''
-                tmp_next_hop = m.groupdict()['next_hop']
+                tmp_next_hop = intern_value(m.groupdict()['next_hop'])
                 if tmp_next_hop:
                     if '%' in  tmp_next_hop:
-                        next_hop = tmp_next_hop.split('%')[0]
-                        vrf_val = tmp_next_hop.split('%')[1]
+                        next_hop = intern_value(tmp_next_hop.split('%')[0])
+                        vrf_val = intern_value(tmp_next_hop.split('%')[1])
                     else:
-                        next_hop = tmp_next_hop
+                        next_hop = intern_value(tmp_next_hop)
 
                 if m.groupdict()['interface']:
-                    interface = m.groupdict()['interface']
+                    interface = intern_value(m.groupdict()['interface'])
 
                 index += 1
                 route_dict = result_dict.setdefault('vrf', {}).setdefault(vrf, {})\
@@ -536,7 +576,7 @@ class ShowIpRoute(ShowIpRouteSchema):
             # Routing entry for 10.151.0.0/24, 1 known subnets
             # Routing entry for 0.0.0.0/0, supernet
             # Routing entry for 192.168.154.0/24
-            m = p100.match(line)
+            m = p.p100.match(line)
             if m:
                 group = m.groupdict()
                 entry_dict = result_dict.setdefault('vrf', {}).setdefault(vrf, {}).setdefault('address_family',
@@ -549,7 +589,7 @@ class ShowIpRoute(ShowIpRouteSchema):
 
             # Known via "eigrp 1", distance 130, metric 10880, type internal
             # Known via "rip", distance 120, metric 2
-            m = p200.match(line)
+            m = p.p200.match(line)
             if m:
                 group = m.groupdict()
                 route_dict.update({'distance': int(group['distance'])})
@@ -560,7 +600,7 @@ class ShowIpRoute(ShowIpRouteSchema):
 
             # Redistributing via rip
             # Redistributing via eigrp 1
-            m = p300.match(line)
+            m = p.p300.match(line)
             if m:
                 group = m.groupdict()
                 route_dict.update({k: v for k, v in group.items() if v})
@@ -568,7 +608,7 @@ class ShowIpRoute(ShowIpRouteSchema):
 
             # Last update from 192.168.151.2 on Vlan101, 2w3d ago
             # Last update from 192.168.246.2 on Vlan103, 00:00:12 ago
-            m = p400.match(line)
+            m = p.p400.match(line)
             if m:
                 group = m.groupdict()
                 update_dict = route_dict.setdefault('update', {})
@@ -577,7 +617,7 @@ class ShowIpRoute(ShowIpRouteSchema):
 
             # * 192.168.151.2, from 192.168.151.2, 2w3d ago, via Vlan101
             # * 10.69.1.2
-            m = p500.match(line)
+            m = p.p500.match(line)
             if m:
                 group = m.groupdict()
                 index += 1
@@ -590,27 +630,27 @@ class ShowIpRoute(ShowIpRouteSchema):
                 continue
 
             # Route metric is 10880, traffic share count is 1
-            m = p600.match(line)
+            m = p.p600.match(line)
             if m:
                 group = m.groupdict()
                 path_dict.update({k: v for k, v in group.items() if v})
 
             # Total delay is 20 microseconds, minimum bandwidth is 1000000 Kbit
-            m = p700.match(line)
+            m = p.p700.match(line)
             if m:
                 group = m.groupdict()
                 path_dict.update({k: v for k, v in group.items() if v})
                 continue
 
             # Reliability 255/255, minimum MTU 1500 bytes
-            m = p800.match(line)
+            m = p.p800.match(line)
             if m:
                 group = m.groupdict()
                 path_dict.update({k: v for k, v in group.items() if v})
                 continue
 
             # Loading 1/255, Hops 1
-            m = p900.match(line)
+            m = p.p900.match(line)
             if m:
                 group = m.groupdict()
                 path_dict.update({k: v for k, v in group.items() if v})
@@ -630,6 +670,12 @@ class ShowIpv6Route(ShowIpRoute):
     exclude = ['uptime']
 
     IP_VER = 'ipv6'
+
+    # Same entries as ShowIpRoute, with IPv6 prefixes
+    records = RecordSplitter(start=ShowIpRoute.patterns.p3_ipv6,
+                             context=(ShowIpRoute.patterns.p1,
+                                      ShowIpRoute.patterns.p2))
+
     def cli(self, vrf=None, protocol=None, interface=None, output=None):
         
         if output is None:
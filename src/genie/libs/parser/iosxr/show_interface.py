@@ -33,6 +33,7 @@ from genie.metaparser.util.schemaengine import Schema, \
 
 # import parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.patterns import PatternTable
 
 logger = logging.getLogger(__name__)
 
@@ -481,609 +482,653 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
         'reliability', 'in_discards', 'in_broadcast_pkts', 'out_broadcast_pkts', 'rxload', 'txload', 
         'interface_state', 'in_unknown_protos', 'last_clear', 'carrier_transitions', 'in_giants']
 
+    patterns = PatternTable(
+        # MgmtEth0/0/CPU0/0 is administratively down, line protocol is administratively down
+        p1=r'^\s*(?P<interface>[a-zA-Z0-9\/\.\-]+) +is'
+           ' +(?P<enabled>(administratively down|down))(?:,'
+           ' +line +protocol +is +(?P<line_protocol>'
+           '(administratively down|down)))?$',
+
+        p1_1=r'^\s*(?P<interface>[a-zA-Z0-9\/\.\-]+) +is'
+             ' +(?P<enabled>(administratively up|up))(?:,'
+             ' +line +protocol +is +(?P<line_protocol>'
+             '(administratively up|up)))?$',
+
+        # Interface state transitions: 1
+        p2=r'^\s*Interface +state +transitions:'
+           ' +(?P<interface_state>[0-9]+)$',
+
+        # Hardware is Null interface
+        # Hardware is Management Ethernet, address is 5254.00ff.3007 (bia 5254.00ff.3007)
+        p3=r'^\s*Hardware is (?P<types>[a-zA-Z\,\s]+)(?:'
+           ' +address +is (?P<mac_address>[a-z0-9\.]+) +\(bia'
+           ' +(?P<phys_address>[a-z0-9\.]+)\))?$',
+
+        # Hardware is VLAN sub-interface(s), address is aaaa.bbff.8888
+        p3_1=r'^\s*Hardware is (?P<types>[\w\W]+) +address'
+             ' +is +(?P<mac_address>[a-z0-9\.]+)$',
+
+        #Description: desc
+        p3_2=r'^\s*Description: +(?P<description>[\w\W]+)$',
+
+        # Internet address is 10.1.1.1/24
+        p4=r'^\s*Internet +address +is +(?P<ip>[a-z0-9\.]+)'
+           '(\/(?P<prefix_length>[0-9]+))?$',
+
+        # MTU 1500 bytes, BW 0 Kbit (Max: 1000000 Kbit)
+        # MTU 6000 bytes, BW 20000000 Kbit (Max: 20000000 Kbit)
+        p5=r'^\s*MTU +(?P<mtu>[0-9]+) +bytes, +BW'
+           ' +(?P<bandwidth>[0-9]+) +Kbit(?: *\(Max: +\d+'
+           ' +Kbit\))?$',
+
+        # reliability 255/255, txload Unknown, rxload Unknown
+        p6=r'^\s*reliability +(?P<reliability>[a-zA-Z0-9\/]+),'
+           ' +txload +(?P<txload>[a-zA-Z0-9\/]+), +rxload'
+           ' +(?P<rxload>[a-zA-Z0-9\/]+)$',
 
-    def cli(self, interface='', output=None):
-        if output is None:
-            if interface:
-                cmd = self.cli_command[1].format(interface=interface)
-            else:
-                cmd = self.cli_command[0]
-            out = self.device.execute(cmd)
-        else:
-            out = output
-
-        interface_detail_dict = {}
-
-        # it's supported for NCS500 that output has non utf8 character
-        if "non_utf-8_character b'" in out:
-            out = out.split("non_utf-8_character b'")[1]
-
-        elif "b'" in out:
-            out = out.split("b'")[1]
-
-        for line in out.splitlines():
-            line = line.strip()
-
-            # MgmtEth0/0/CPU0/0 is administratively down, line protocol is administratively down
-            p1 = re.compile(r'^\s*(?P<interface>[a-zA-Z0-9\/\.\-]+) +is'
-                             ' +(?P<enabled>(administratively down|down))(?:,'
-                             ' +line +protocol +is +(?P<line_protocol>'
-                             '(administratively down|down)))?$')
-            m = p1.match(line)
-            if m:
-                interface = m.groupdict()['interface']
-                enabled = m.groupdict()['enabled']
-                line_protocol = m.groupdict()['line_protocol']
-
-                if interface not in interface_detail_dict:
-                    interface_detail_dict[interface] = {}
-                interface_detail_dict[interface]['line_protocol'] = line_protocol
-                interface_detail_dict[interface]['oper_status'] = 'down'            
-                interface_detail_dict[interface]['enabled'] = False
-                continue
-
-            p1_1 = re.compile(r'^\s*(?P<interface>[a-zA-Z0-9\/\.\-]+) +is'
-                               ' +(?P<enabled>(administratively up|up))(?:,'
-                               ' +line +protocol +is +(?P<line_protocol>'
-                               '(administratively up|up)))?$')
-            m = p1_1.match(line)
-            if m:
-                interface = m.groupdict()['interface']
-                enabled = m.groupdict()['enabled']
-                line_protocol = m.groupdict()['line_protocol']
-
-                if interface not in interface_detail_dict:
-                    interface_detail_dict[interface] = {}
-                interface_detail_dict[interface]['line_protocol'] = line_protocol
-                interface_detail_dict[interface]['oper_status'] = 'up'
-                interface_detail_dict[interface]['enabled'] = True
-                continue
-
-            # Interface state transitions: 1
-            p2 = re.compile(r'^\s*Interface +state +transitions:'
-                             ' +(?P<interface_state>[0-9]+)$')
-            m = p2.match(line)
-            if m:
-                interface_state = int(m.groupdict()['interface_state'])
-                interface_detail_dict[interface]['interface_state'] = interface_state
-                continue
+        # Encapsulation 802.1Q Virtual LAN, VLAN Id 10, 2nd VLAN Id 10,
+        p7=r'^\s*Encapsulation +(?P<encapsulation>[a-zA-Z0-9\.\s]+),'
+           ' +VLAN +Id +(?P<first_dot1q>[0-9]+), +2nd +VLAN'
+           ' +Id +(?P<second_dot1q>[0-9]+),$',
 
-            # Hardware is Null interface
-            # Hardware is Management Ethernet, address is 5254.00ff.3007 (bia 5254.00ff.3007)
+        # Encapsulation 802.1Q Virtual LAN, VLAN Id 20,  loopback not set,
+        p7_1=r'^\s*Encapsulation +(?P<encapsulation>[a-zA-Z0-9\.\s]+),'
+             ' +VLAN +Id +(?P<first_dot1q>[0-9]+), +loopback'
+             ' +(?P<loopback_status>[a-zA-Z\s]+),$',
 
-            p3 = re.compile(r'^\s*Hardware is (?P<types>[a-zA-Z\,\s]+)(?:'
-                             ' +address +is (?P<mac_address>[a-z0-9\.]+) +\(bia'
-                             ' +(?P<phys_address>[a-z0-9\.]+)\))?$')
-            m = p3.match(line)
-            if m:
-                types = m.groupdict()['types'].lower()
-                types = types.replace(",","")
-                types = types.replace("interface","")
-                types = types.strip()
-                mac_address = m.groupdict()['mac_address']
-                phys_address = m.groupdict()['phys_address']
-
-                interface_detail_dict[interface]['types'] = types
-                if mac_address:
-                    interface_detail_dict[interface]['mac_address'] = str(m.groupdict()['mac_address'])
-                if phys_address:
-                    interface_detail_dict[interface]['phys_address'] = str(m.groupdict()['phys_address'])
-                continue
+        p7_2=r'^\s*Encapsulation +(?P<encapsulation>[a-zA-Z0-9\.\s]+),'
+             ' +VLAN +Id +(?P<first_dot1q>[0-9]+), +2nd +VLAN +Id'
+             ' +(?P<second_dot1q>[0-9]+),(?: +loopback'
+             ' +(?P<loopback_status>[a-zA-Z\s]+),)?$',
 
-            # Hardware is VLAN sub-interface(s), address is aaaa.bbff.8888
-            p3_1 = re.compile(r'^\s*Hardware is (?P<types>[\w\W]+) +address'
-                               ' +is +(?P<mac_address>[a-z0-9\.]+)$')
-            m = p3_1.match(line)
-            if m:
-                types = m.groupdict()['types'].lower()
-                types = types.replace(",","")
-                types = types.replace("interface","")
-                mac_address = m.groupdict()['mac_address']
-    
-                interface_detail_dict[interface]['types'] = types
-                if mac_address:
-                    interface_detail_dict[interface]['mac_address'] = str(m.groupdict()['mac_address'])
-                continue
+        # Encapsulation ARPA,
+        p7_3=r'^\s*Encapsulation +(?P<encapsulation>[a-zA-Z0-9\.\s]+),$',
 
-            #Description: desc
-            p3_2 = re.compile(r'^\s*Description: +(?P<description>[\w\W]+)$')
-            m = p3_2.match(line)
-            if m:
-                interface_detail_dict[interface]['description']\
-                = str(m.groupdict()['description'])
-                continue
+        # Encapsulation Null,  loopback not set,
+        p7_4=r'^\s*Encapsulation +(?P<encapsulation>[a-zA-Z0-9\.\s]+),'
+             ' +loopback +(?P<loopback_status>[a-zA-Z\s]+),$',
 
-            # Internet address is 10.1.1.1/24
-            p4 = re.compile(r'^\s*Internet +address +is +(?P<ip>[a-z0-9\.]+)'
-                             '(\/(?P<prefix_length>[0-9]+))?$')
-            m = p4.match(line)
-            if m:
-                ip = m.groupdict()['ip']
-                prefix_length = m.groupdict()['prefix_length']
-
-                address = ip + '/' + prefix_length
-                if 'ipv4' not in interface_detail_dict[interface]:
-                    interface_detail_dict[interface]['ipv4'] = {}
-                if address not in interface_detail_dict[interface]['ipv4']:
-                    interface_detail_dict[interface]['ipv4'][address] = {}
+        # loopback not set,
+        p7_5=r'^\s*loopback +(?P<loopback_status>[a-zA-Z\s]+),$',
 
-                interface_detail_dict[interface]['ipv4'][address]['ip'] = ip
-                interface_detail_dict[interface]['ipv4'][address]\
-                ['prefix_length'] = prefix_length
-                continue
+        # Last input never, output never
+        p8=r'^\s*Last +input +(?P<last_input>[\w\W]+),'
+           ' +output +(?P<last_output>[\w\W]+)$',
 
-            # MTU 1500 bytes, BW 0 Kbit (Max: 1000000 Kbit)
-            # MTU 6000 bytes, BW 20000000 Kbit (Max: 20000000 Kbit)
-            p5 = re.compile(r'^\s*MTU +(?P<mtu>[0-9]+) +bytes, +BW'
-                             ' +(?P<bandwidth>[0-9]+) +Kbit(?: *\(Max: +\d+'
-                             ' +Kbit\))?$')
-            m = p5.match(line)
-            if m:
-                mtu = int(m.groupdict()['mtu'])
-                bandwidth = int(m.groupdict()['bandwidth'])
+        # ARP type ARPA, ARP timeout 04:00:00
+        p8_1=r'^\s*ARP +type +(?P<arp_type>\S+), +ARP +timeout'
+             ' +(?P<arp_timeout>\S+)',
 
-                interface_detail_dict[interface]['mtu'] = mtu
-                interface_detail_dict[interface]['bandwidth'] = bandwidth
-                continue
+        p8_2=r'^\s*Last +link +flapped +(?P<last_link_flapped>\S+)$',
 
-            # reliability 255/255, txload Unknown, rxload Unknown
-            p6 = re.compile(r'^\s*reliability +(?P<reliability>[a-zA-Z0-9\/]+),'
-                             ' +txload +(?P<txload>[a-zA-Z0-9\/]+), +rxload'
-                             ' +(?P<rxload>[a-zA-Z0-9\/]+)$')
-            m = p6.match(line)
-            if m:
-                reliability = m.groupdict()['reliability']
-                txload = m.groupdict()['txload'].lower()
-                rxload = m.groupdict()['rxload'].lower()
+        # Last clearing of "show interface" counters never
+        p8_3=r'^\s*Last +clearing +of +"show interface"'
+             ' +counters +(?P<last_clear>[\w\W]+)$',
 
-                interface_detail_dict[interface]['reliability'] = reliability
-                interface_detail_dict[interface]['txload'] = txload
-                interface_detail_dict[interface]['rxload'] = rxload
-                continue
-            
-            # Encapsulation 802.1Q Virtual LAN, VLAN Id 10, 2nd VLAN Id 10,
-            p7 = re.compile(r'^\s*Encapsulation +(?P<encapsulation>[a-zA-Z0-9\.\s]+),'
-                             ' +VLAN +Id +(?P<first_dot1q>[0-9]+), +2nd +VLAN'
-                             ' +Id +(?P<second_dot1q>[0-9]+),$')
-            m = p7.match(line)
-            if m:
-                encapsulation = str(m.groupdict()['encapsulation']).lower()
+        # 5 minute input rate 0 bits/sec, 0 packets/sec
+        p9=r'^\s*(?P<load_interval>[0-9]+) +(?P<timecheck>minute|second|)'
+           ' +input +rate +(?P<in_rate>[0-9]+) +bits/sec,'
+           ' +(?P<in_rate_pkts>[0-9]+) +packets/sec$',
 
-                if 'encapsulations' not in interface_detail_dict[interface]:
-                    interface_detail_dict[interface]['encapsulations'] = {}
+        # Full-duplex, 1000Mb/s, unknown, link type is autonegotiation
+        # Duplex unknown, 0Kb/s, unknown, link type is autonegotiation
+        p9_1=r'^\s*(?P<duplex_mode>[\w\W]+), +(?P<port_speed>\S+)(Mb/s|Kb/s|Gb/s),'
+             ' +(?P<location>\S+), +link +type +is'
+             ' +(?P<auto_negotiate>(autonegotiation))$',
 
-                interface_detail_dict[interface]['encapsulations']\
-                ['encapsulation'] = encapsulation
-                interface_detail_dict[interface]['encapsulations']\
-                ['first_dot1q'] = str(m.groupdict()['first_dot1q'])
-                interface_detail_dict[interface]['encapsulations']\
-                ['second_dot1q'] = str(m.groupdict()['second_dot1q'])
-                continue
+        p9_2=r'^\s*(?P<duplex_mode>[\w\W]+), +(?P<port_speed>\S+),'
+             ' +(?P<location>\S+), +link +type +is +(?P<auto_negotiate>(force-up))$',
 
-            # Encapsulation 802.1Q Virtual LAN, VLAN Id 20,  loopback not set,
-            p7_1 = re.compile(r'^\s*Encapsulation +(?P<encapsulation>[a-zA-Z0-9\.\s]+),'
-                               ' +VLAN +Id +(?P<first_dot1q>[0-9]+), +loopback'
-                               ' +(?P<loopback_status>[a-zA-Z\s]+),$')
-            m = p7_1.match(line)
-            if m:
-                encapsulation = str(m.groupdict()['encapsulation']).lower()
-                loopback_status = str(m.groupdict()['loopback_status'])
+        # output flow control is off, input flow control is off
+        p9_3=r'^\s*output +flow +control +is +(?P<flow_control_send>(off)),'
+             ' +input +flow +control +is +(?P<flow_control_receive>(off))$',
 
-                if 'encapsulations' not in interface_detail_dict[interface]:
-                    interface_detail_dict[interface]['encapsulations'] = {}
+        p9_4=r'^\s*output +flow +control +is +(?P<flow_control_send>(on)),'
+             ' +input +flow +control +is +(?P<flow_control_receive>(on))$',
 
-                interface_detail_dict[interface]['encapsulations']\
-                ['encapsulation'] = encapsulation
-                interface_detail_dict[interface]['encapsulations']\
-                ['first_dot1q'] = str(m.groupdict()['first_dot1q'])
+        p9_5=r'^\s*output +flow +control +is +(?P<flow_control_send>(on)),'
+             ' +input +flow +control +is +(?P<flow_control_receive>(off))$',
 
-                if loopback_status != "not set":
-                    interface_detail_dict[interface]['loopback_status']\
-                    = m.groupdict()['loopback_status']
-                continue
-            
-            p7_2 = re.compile(r'^\s*Encapsulation +(?P<encapsulation>[a-zA-Z0-9\.\s]+),'
-                               ' +VLAN +Id +(?P<first_dot1q>[0-9]+), +2nd +VLAN +Id'
-                               ' +(?P<second_dot1q>[0-9]+),(?: +loopback'
-                               ' +(?P<loopback_status>[a-zA-Z\s]+),)?$')
-            m = p7_2.match(line)
-            if m:
-                encapsulation = str(m.groupdict()['encapsulation']).lower()
-                loopback_status = str(m.groupdict()['loopback_status'])
-
-                if 'encapsulations' not in interface_detail_dict[interface]:
-                    interface_detail_dict[interface]['encapsulations'] = {}
-
-                interface_detail_dict[interface]['encapsulations']\
-                ['encapsulation'] = encapsulation
-                interface_detail_dict[interface]['encapsulations']\
-                ['first_dot1q'] = str(m.groupdict()['first_dot1q'])
-                interface_detail_dict[interface]['encapsulations']\
-                ['second_dot1q'] = str(m.groupdict()['second_dot1q'])
-
-                if loopback_status != "not set":
-                    interface_detail_dict[interface]['loopback_status']\
-                    = m.groupdict()['loopback_status']
-                continue
+        p9_6=r'^\s*output +flow +control +is +(?P<flow_control_send>(off)),'
+             ' +input +flow +control +is +(?P<flow_control_receive>(on))$',
 
-            # Encapsulation ARPA,
-            p7_3 = re.compile(r'^\s*Encapsulation +(?P<encapsulation>[a-zA-Z0-9\.\s]+),$')
-            m = p7_3.match(line)
-            if m:
-                encapsulation = str(m.groupdict()['encapsulation']).lower()
+        # Carrier delay (up) is 10 msec
+        p9_7=r'^\s*Carrier +delay +\(up\) +is'
+             ' +(?P<carrier_delay>[0-9]+) +msec$',
 
-                if 'encapsulations' not in interface_detail_dict[interface]:
-                    interface_detail_dict[interface]['encapsulations'] = {}
+        # 5 minute output rate 0 bits/sec, 0 packets/sec
+        p10=r'^\s*(?P<load_interval>[0-9]+) +(?P<timecheck>minute|second|)'
+            ' +output +rate +(?P<out_rate>[0-9]+) +bits/sec,'
+            ' +(?P<out_rate_pkts>[0-9]+) +packets/sec$',
 
-                interface_detail_dict[interface]['encapsulations']\
-                ['encapsulation'] = encapsulation
-                continue
+        # 0 packets input, 0 bytes, 0 total input drops
+        p11=r'^\s*(?P<in_pkts>[0-9]+) +packets +input,'
+            ' +(?P<in_octets>[0-9]+) +bytes, +(?P<in_discards>[0-9]+)'
+            ' +total +input +drops$',
 
-            # Encapsulation Null,  loopback not set,
-            p7_4 = re.compile(r'^\s*Encapsulation +(?P<encapsulation>[a-zA-Z0-9\.\s]+),'
-                               ' +loopback +(?P<loopback_status>[a-zA-Z\s]+),$')
-            m = p7_4.match(line)
-            if m:
-                encapsulation = str(m.groupdict()['encapsulation']).lower()
-                loopback_status = str(m.groupdict()['loopback_status'])
+        # 0 drops for unrecognized upper-level protocol
+        p12=r'^\s*(?P<in_unknown_protos>[0-9]+) +drops +for +unrecognized'
+            ' +upper-level +protocol$',
 
+        # Received 0 broadcast packets, 0 multicast packets
+        p13=r'^\s*Received +(?P<in_broadcast_pkts>[0-9]+)'
+            ' +broadcast +packets, +(?P<in_multicast_pkts>[0-9]+)'
+            ' +multicast +packets$',
 
-                if 'encapsulations' not in interface_detail_dict[interface]:
-                    interface_detail_dict[interface]['encapsulations'] = {}
+        # 0 runts, 0 giants, 0 throttles, 0 parity
+        p14=r'^\s*(?P<in_runts>[0-9]+) +runts, +(?P<in_giants>[0-9]+)'
+            ' +giants, +(?P<in_throttles>[0-9]+) +throttles,'
+            ' +(?P<in_parity>[0-9]+) parity$',
 
-                interface_detail_dict[interface]['encapsulations']\
-                ['encapsulation'] = encapsulation
+        # 0 input errors, 0 CRC, 0 frame, 0 overrun, 0 ignored, 0 abort
+        p15=r'^\s*(?P<in_frame_errors>[0-9]+) +input +errors,'
+            ' +(?P<in_crc_errors>[0-9]+) +CRC,'
+            ' +(?P<in_frame>[0-9]+)'
+            ' +frame, +(?P<in_overrun>[0-9]+) +overrun,'
+            ' +(?P<in_ignored>[0-9]+) +ignored,'
+            ' +(?P<in_abort>[0-9]+) +abort$',
 
-                if loopback_status != "not set":
-                    interface_detail_dict[interface]['loopback_status']\
-                    = m.groupdict()['loopback_status']
-                continue
+        # 0 packets output, 0 bytes, 0 total output drops
+        p16=r'^\s*(?P<out_pkts>[0-9]+) +packets +output,'
+            ' +(?P<out_octets>[0-9]+) +bytes, +(?P<out_discards>[0-9]+)'
+            ' +total +output +drops$',
 
-            # loopback not set,
-            p7_5 = re.compile(r'^\s*loopback +(?P<loopback_status>[a-zA-Z\s]+),$')
-            m = p7_5.match(line)
-            if m:
-                loopback_status = str(m.groupdict()['loopback_status'])
+        # Output 0 broadcast packets, 0 multicast packets
+        p17=r'^\s*Output +(?P<out_broadcast_pkts>[0-9]+)'
+            ' +broadcast +packets, +(?P<out_multicast_pkts>[0-9]+)'
+            ' +multicast +packets$',
 
-                if loopback_status != "not set":
-                    interface_detail_dict[interface]['loopback_status']\
-                    = m.groupdict()['loopback_status']
-                continue
+        # 0 output errors, 0 underruns, 0 applique, 0 resets
+        p18=r'^\s*(?P<out_errors>[0-9]+) +output +errors,'
+            ' +(?P<out_underruns>[0-9]+) +underruns,'
+            ' +(?P<out_applique>[0-9]+) +applique,'
+            ' +(?P<out_resets>[0-9]+) +resets$',
 
-            # Last input never, output never
-            p8 = re.compile(r'^\s*Last +input +(?P<last_input>[\w\W]+),'
-                             ' +output +(?P<last_output>[\w\W]+)$')
-            m = p8.match(line)
-            if m:
-                interface_detail_dict[interface]['last_input']\
-                 = m.groupdict()['last_input']
-                interface_detail_dict[interface]['last_output']\
-                 = m.groupdict()['last_output']
-                continue
+        # 0 output buffer failures, 0 output buffers swapped out
+        p19=r'^\s*(?P<out_buffer_failures>[0-9]+) +output'
+            ' +buffer +failures, +(?P<out_buffer_swapped_out>[0-9]+)'
+            ' +output +buffers +swapped +out$',
 
-            # ARP type ARPA, ARP timeout 04:00:00
-            p8_1 = re.compile(r'^\s*ARP +type +(?P<arp_type>\S+), +ARP +timeout'
-                               ' +(?P<arp_timeout>\S+)')
-            m = p8_1.match(line)
-            if m:
-                arp_type = str(m.groupdict()['arp_type']).lower()
+        # 0 carrier transitions
+        p20=r'^\s*(?P<carrier_transitions>[0-9]+) +carrier +transitions$',
+    )
 
-                interface_detail_dict[interface]['arp_type']\
-                 = arp_type
-                interface_detail_dict[interface]['arp_timeout']\
-                 = m.groupdict()['arp_timeout']
-                continue
+    # Patterns tried on every line, in order
+    dispatcher = patterns.dispatcher(
+        'p1', 'p1_1', 'p2', 'p3', 'p3_1', 'p3_2', 'p4', 'p5', 'p6',
+        'p7', 'p7_1', 'p7_2', 'p7_3', 'p7_4', 'p7_5', 'p8', 'p8_1',
+        'p8_2', 'p8_3', 'p9', 'p9_1', 'p9_2', 'p9_3', 'p9_4', 'p9_5',
+        'p9_6', 'p9_7', 'p10', 'p11', 'p12', 'p13', 'p14', 'p15',
+        'p16', 'p17', 'p18', 'p19', 'p20')
 
-            p8_2 = re.compile(r'^\s*Last +link +flapped +(?P<last_link_flapped>\S+)$')
-            m = p8_2.match(line)
-            if m:
-                interface_detail_dict[interface]['last_link_flapped']\
-                 = m.groupdict()['last_link_flapped']
-                continue
+    def cli(self, interface='', output=None):
+        if output is None:
+            if interface:
+                cmd = self.cli_command[1].format(interface=interface)
+            else:
+                cmd = self.cli_command[0]
+            out = self.device.execute(cmd)
+        else:
+            out = output
 
-            # Last clearing of "show interface" counters never
-            p8_3 = re.compile(r'^\s*Last +clearing +of +"show interface"'
-                               ' +counters +(?P<last_clear>[\w\W]+)$')
-            m = p8_3.match(line)
-            if m:
-                last_clear = str(m.groupdict()['last_clear'])
-                continue
+        interface_detail_dict = {}
 
-            # 5 minute input rate 0 bits/sec, 0 packets/sec
-            p9 = re.compile(r'^\s*(?P<load_interval>[0-9]+) +(?P<timecheck>minute|second|)'
-                             ' +input +rate +(?P<in_rate>[0-9]+) +bits/sec,'
-                             ' +(?P<in_rate_pkts>[0-9]+) +packets/sec$')
-            m = p9.match(line)
-            if m:
-                load_interval = int(m.groupdict()['load_interval'])
-                in_rate = int(m.groupdict()['in_rate'])
-                in_rate_pkts = int(m.groupdict()['in_rate_pkts'])
-                timecheck = str(m.groupdict()['timecheck'])
+        # it's supported for NCS500 that output has non utf8 character
+        if "non_utf-8_character b'" in out:
+            out = out.split("non_utf-8_character b'")[1]
 
-                if timecheck == "minute":
-                    load_interval = load_interval * 60
+        elif "b'" in out:
+            out = out.split("b'")[1]
 
-                if 'counters' not in interface_detail_dict[interface]:
-                    interface_detail_dict[interface]['counters'] = {}
-                if 'rate' not in interface_detail_dict[interface]['counters']:
-                    interface_detail_dict[interface]['counters']['rate'] = {}
+        for line in out.splitlines():
+            line = line.strip()
+            for name, m in self.dispatcher.matches(line):
+
+                # MgmtEth0/0/CPU0/0 is administratively down, line protocol is administratively down
+                if name == 'p1':
+                    interface = m.groupdict()['interface']
+                    enabled = m.groupdict()['enabled']
+                    line_protocol = m.groupdict()['line_protocol']
+
+                    if interface not in interface_detail_dict:
+                        interface_detail_dict[interface] = {}
+                    interface_detail_dict[interface]['line_protocol'] = line_protocol
+                    interface_detail_dict[interface]['oper_status'] = 'down'            
+                    interface_detail_dict[interface]['enabled'] = False
+                    break
+
+                elif name == 'p1_1':
+                    interface = m.groupdict()['interface']
+                    enabled = m.groupdict()['enabled']
+                    line_protocol = m.groupdict()['line_protocol']
+
+                    if interface not in interface_detail_dict:
+                        interface_detail_dict[interface] = {}
+                    interface_detail_dict[interface]['line_protocol'] = line_protocol
+                    interface_detail_dict[interface]['oper_status'] = 'up'
+                    interface_detail_dict[interface]['enabled'] = True
+                    break
+
+                # Interface state transitions: 1
+                elif name == 'p2':
+                    interface_state = int(m.groupdict()['interface_state'])
+                    interface_detail_dict[interface]['interface_state'] = interface_state
+                    break
+
+                # Hardware is Null interface
+                # Hardware is Management Ethernet, address is 5254.00ff.3007 (bia 5254.00ff.3007)
+
+                elif name == 'p3':
+                    types = m.groupdict()['types'].lower()
+                    types = types.replace(",","")
+                    types = types.replace("interface","")
+                    types = types.strip()
+                    mac_address = m.groupdict()['mac_address']
+                    phys_address = m.groupdict()['phys_address']
+
+                    interface_detail_dict[interface]['types'] = types
+                    if mac_address:
+                        interface_detail_dict[interface]['mac_address'] = str(m.groupdict()['mac_address'])
+                    if phys_address:
+                        interface_detail_dict[interface]['phys_address'] = str(m.groupdict()['phys_address'])
+                    break
+
+                # Hardware is VLAN sub-interface(s), address is aaaa.bbff.8888
+                elif name == 'p3_1':
+                    types = m.groupdict()['types'].lower()
+                    types = types.replace(",","")
+                    types = types.replace("interface","")
+                    mac_address = m.groupdict()['mac_address']
+    
+                    interface_detail_dict[interface]['types'] = types
+                    if mac_address:
+                        interface_detail_dict[interface]['mac_address'] = str(m.groupdict()['mac_address'])
+                    break
+
+                #Description: desc
+                elif name == 'p3_2':
+                    interface_detail_dict[interface]['description']\
+                    = str(m.groupdict()['description'])
+                    break
+
+                # Internet address is 10.1.1.1/24
+                elif name == 'p4':
+                    ip = m.groupdict()['ip']
+                    prefix_length = m.groupdict()['prefix_length']
+
+                    address = ip + '/' + prefix_length
+                    if 'ipv4' not in interface_detail_dict[interface]:
+                        interface_detail_dict[interface]['ipv4'] = {}
+                    if address not in interface_detail_dict[interface]['ipv4']:
+                        interface_detail_dict[interface]['ipv4'][address] = {}
+
+                    interface_detail_dict[interface]['ipv4'][address]['ip'] = ip
+                    interface_detail_dict[interface]['ipv4'][address]\
+                    ['prefix_length'] = prefix_length
+                    break
+
+                # MTU 1500 bytes, BW 0 Kbit (Max: 1000000 Kbit)
+                # MTU 6000 bytes, BW 20000000 Kbit (Max: 20000000 Kbit)
+                elif name == 'p5':
+                    mtu = int(m.groupdict()['mtu'])
+                    bandwidth = int(m.groupdict()['bandwidth'])
+
+                    interface_detail_dict[interface]['mtu'] = mtu
+                    interface_detail_dict[interface]['bandwidth'] = bandwidth
+                    break
+
+                # reliability 255/255, txload Unknown, rxload Unknown
+                elif name == 'p6':
+                    reliability = m.groupdict()['reliability']
+                    txload = m.groupdict()['txload'].lower()
+                    rxload = m.groupdict()['rxload'].lower()
+
+                    interface_detail_dict[interface]['reliability'] = reliability
+                    interface_detail_dict[interface]['txload'] = txload
+                    interface_detail_dict[interface]['rxload'] = rxload
+                    break
+            
+                # Encapsulation 802.1Q Virtual LAN, VLAN Id 10, 2nd VLAN Id 10,
+                elif name == 'p7':
+                    encapsulation = str(m.groupdict()['encapsulation']).lower()
+
+                    if 'encapsulations' not in interface_detail_dict[interface]:
+                        interface_detail_dict[interface]['encapsulations'] = {}
+
+                    interface_detail_dict[interface]['encapsulations']\
+                    ['encapsulation'] = encapsulation
+                    interface_detail_dict[interface]['encapsulations']\
+                    ['first_dot1q'] = str(m.groupdict()['first_dot1q'])
+                    interface_detail_dict[interface]['encapsulations']\
+                    ['second_dot1q'] = str(m.groupdict()['second_dot1q'])
+                    break
+
+                # Encapsulation 802.1Q Virtual LAN, VLAN Id 20,  loopback not set,
+                elif name == 'p7_1':
+                    encapsulation = str(m.groupdict()['encapsulation']).lower()
+                    loopback_status = str(m.groupdict()['loopback_status'])
+
+                    if 'encapsulations' not in interface_detail_dict[interface]:
+                        interface_detail_dict[interface]['encapsulations'] = {}
+
+                    interface_detail_dict[interface]['encapsulations']\
+                    ['encapsulation'] = encapsulation
+                    interface_detail_dict[interface]['encapsulations']\
+                    ['first_dot1q'] = str(m.groupdict()['first_dot1q'])
+
+                    if loopback_status != "not set":
+                        interface_detail_dict[interface]['loopback_status']\
+                        = m.groupdict()['loopback_status']
+                    break
+            
+                elif name == 'p7_2':
+                    encapsulation = str(m.groupdict()['encapsulation']).lower()
+                    loopback_status = str(m.groupdict()['loopback_status'])
+
+                    if 'encapsulations' not in interface_detail_dict[interface]:
+                        interface_detail_dict[interface]['encapsulations'] = {}
+
+                    interface_detail_dict[interface]['encapsulations']\
+                    ['encapsulation'] = encapsulation
+                    interface_detail_dict[interface]['encapsulations']\
+                    ['first_dot1q'] = str(m.groupdict()['first_dot1q'])
+                    interface_detail_dict[interface]['encapsulations']\
+                    ['second_dot1q'] = str(m.groupdict()['second_dot1q'])
+
+                    if loopback_status != "not set":
+                        interface_detail_dict[interface]['loopback_status']\
+                        = m.groupdict()['loopback_status']
+                    break
+
+                # Encapsulation ARPA,
+                elif name == 'p7_3':
+                    encapsulation = str(m.groupdict()['encapsulation']).lower()
+
+                    if 'encapsulations' not in interface_detail_dict[interface]:
+                        interface_detail_dict[interface]['encapsulations'] = {}
+
+                    interface_detail_dict[interface]['encapsulations']\
+                    ['encapsulation'] = encapsulation
+                    break
+
+                # Encapsulation Null,  loopback not set,
+                elif name == 'p7_4':
+                    encapsulation = str(m.groupdict()['encapsulation']).lower()
+                    loopback_status = str(m.groupdict()['loopback_status'])
+
+
+                    if 'encapsulations' not in interface_detail_dict[interface]:
+                        interface_detail_dict[interface]['encapsulations'] = {}
+
+                    interface_detail_dict[interface]['encapsulations']\
+                    ['encapsulation'] = encapsulation
+
+                    if loopback_status != "not set":
+                        interface_detail_dict[interface]['loopback_status']\
+                        = m.groupdict()['loopback_status']
+                    break
+
+                # loopback not set,
+                elif name == 'p7_5':
+                    loopback_status = str(m.groupdict()['loopback_status'])
+
+                    if loopback_status != "not set":
+                        interface_detail_dict[interface]['loopback_status']\
+                        = m.groupdict()['loopback_status']
+                    break
+
+                # Last input never, output never
+                elif name == 'p8':
+                    interface_detail_dict[interface]['last_input']\
+                     = m.groupdict()['last_input']
+                    interface_detail_dict[interface]['last_output']\
+                     = m.groupdict()['last_output']
+                    break
+
+                # ARP type ARPA, ARP timeout 04:00:00
+                elif name == 'p8_1':
+                    arp_type = str(m.groupdict()['arp_type']).lower()
+
+                    interface_detail_dict[interface]['arp_type']\
+                     = arp_type
+                    interface_detail_dict[interface]['arp_timeout']\
+                     = m.groupdict()['arp_timeout']
+                    break
+
+                elif name == 'p8_2':
+                    interface_detail_dict[interface]['last_link_flapped']\
+                     = m.groupdict()['last_link_flapped']
+                    break
+
+                # Last clearing of "show interface" counters never
+                elif name == 'p8_3':
+                    last_clear = str(m.groupdict()['last_clear'])
+                    break
+
+                # 5 minute input rate 0 bits/sec, 0 packets/sec
+                elif name == 'p9':
+                    load_interval = int(m.groupdict()['load_interval'])
+                    in_rate = int(m.groupdict()['in_rate'])
+                    in_rate_pkts = int(m.groupdict()['in_rate_pkts'])
+                    timecheck = str(m.groupdict()['timecheck'])
+
+                    if timecheck == "minute":
+                        load_interval = load_interval * 60
+
+                    if 'counters' not in interface_detail_dict[interface]:
+                        interface_detail_dict[interface]['counters'] = {}
+                    if 'rate' not in interface_detail_dict[interface]['counters']:
+                        interface_detail_dict[interface]['counters']['rate'] = {}
                 
-                interface_detail_dict[interface]['counters']['rate']\
-                ['load_interval'] = load_interval
-                interface_detail_dict[interface]['counters']['rate']\
-                ['in_rate'] = in_rate
-                interface_detail_dict[interface]['counters']['rate']\
-                ['in_rate_pkts'] = in_rate_pkts
-                interface_detail_dict[interface]['counters']\
-                ['last_clear'] = last_clear
-                continue
-
-            # Full-duplex, 1000Mb/s, unknown, link type is autonegotiation
-            # Duplex unknown, 0Kb/s, unknown, link type is autonegotiation
-            p9_1 = re.compile(r'^\s*(?P<duplex_mode>[\w\W]+), +(?P<port_speed>\S+)(Mb/s|Kb/s|Gb/s),'
-                               ' +(?P<location>\S+), +link +type +is'
-                               ' +(?P<auto_negotiate>(autonegotiation))$')
-            m = p9_1.match(line)
-            if m:
-                auto_negotiate = m.groupdict()['auto_negotiate']
-                duplex_mode = str(m.groupdict()['duplex_mode']).lower()
-                duplex_mode = duplex_mode.replace("-duplex","")
-
-                interface_detail_dict[interface]['duplex_mode'] = duplex_mode
-                interface_detail_dict[interface]['port_speed'] = str(m.groupdict()['port_speed'])
-                interface_detail_dict[interface]['location'] = str(m.groupdict()['location'])
-                interface_detail_dict[interface]['auto_negotiate'] = True
-                continue
-
-            p9_2 = re.compile(r'^\s*(?P<duplex_mode>[\w\W]+), +(?P<port_speed>\S+),'
-                               ' +(?P<location>\S+), +link +type +is +(?P<auto_negotiate>(force-up))$')
-            m = p9_2.match(line)
-            if m:
-                auto_negotiate = m.groupdict()['auto_negotiate']
-                duplex_mode = str(m.groupdict()['duplex_mode']).lower()
-                duplex_mode = duplex_mode.replace("-duplex","")
-
-                interface_detail_dict[interface]['duplex_mode'] = duplex_mode
-                interface_detail_dict[interface]['port_speed'] = str(m.groupdict()['port_speed'])
-                interface_detail_dict[interface]['location'] = str(m.groupdict()['location'])
-                interface_detail_dict[interface]['auto_negotiate'] = False
-                continue
-
-            # output flow control is off, input flow control is off
-            p9_3 = re.compile(r'^\s*output +flow +control +is +(?P<flow_control_send>(off)),'
-                               ' +input +flow +control +is +(?P<flow_control_receive>(off))$')
-            m = p9_3.match(line)
-            if m:
-                flow_control_send = m.groupdict()['flow_control_send']
-                flow_control_receive = m.groupdict()['flow_control_receive']
-
-                if 'flow_control' not in interface_detail_dict[interface]:
-                    interface_detail_dict[interface]['flow_control'] = {}
-
-                interface_detail_dict[interface]['flow_control']['flow_control_send'] = False
-                interface_detail_dict[interface]['flow_control']['flow_control_receive'] = False
-                continue
-
-            p9_4 = re.compile(r'^\s*output +flow +control +is +(?P<flow_control_send>(on)),'
-                               ' +input +flow +control +is +(?P<flow_control_receive>(on))$')
-            m = p9_4.match(line)
-            if m:
-                flow_control_send = m.groupdict()['flow_control_send']
-                flow_control_receive = m.groupdict()['flow_control_receive']
-
-                if 'flow_control' not in interface_detail_dict[interface]:
-                    interface_detail_dict[interface]['flow_control'] = {}
-
-                interface_detail_dict[interface]['flow_control']['flow_control_send'] = True
-                interface_detail_dict[interface]['flow_control']['flow_control_receive'] = True
-                continue
-
-            p9_5 = re.compile(r'^\s*output +flow +control +is +(?P<flow_control_send>(on)),'
-                               ' +input +flow +control +is +(?P<flow_control_receive>(off))$')
-            m = p9_5.match(line)
-            if m:
-                flow_control_send = m.groupdict()['flow_control_send']
-                flow_control_receive = m.groupdict()['flow_control_receive']
-
-                if 'flow_control' not in interface_detail_dict[interface]:
-                    interface_detail_dict[interface]['flow_control'] = {}
-
-                interface_detail_dict[interface]['flow_control']['flow_control_send'] = True
-                interface_detail_dict[interface]['flow_control']['flow_control_receive'] = False
-                continue
-
-            p9_6 = re.compile(r'^\s*output +flow +control +is +(?P<flow_control_send>(off)),'
-                               ' +input +flow +control +is +(?P<flow_control_receive>(on))$')
-            m = p9_6.match(line)
-            if m:
-                flow_control_send = m.groupdict()['flow_control_send']
-                flow_control_receive = m.groupdict()['flow_control_receive']
-
-                if 'flow_control' not in interface_detail_dict[interface]:
-                    interface_detail_dict[interface]['flow_control'] = {}
-
-                interface_detail_dict[interface]['flow_control']['flow_control_send'] = False
-                interface_detail_dict[interface]['flow_control']['flow_control_receive'] = True
-                continue
-
-            # Carrier delay (up) is 10 msec
-            p9_7 = re.compile(r'^\s*Carrier +delay +\(up\) +is'
-                               ' +(?P<carrier_delay>[0-9]+) +msec$')
-            m = p9_7.match(line)
-            if m:
-                carrier_delay = m.groupdict()['carrier_delay']
-
-                interface_detail_dict[interface]['carrier_delay'] = carrier_delay
-                continue
-
-            # 5 minute output rate 0 bits/sec, 0 packets/sec
-            p10 = re.compile(r'^\s*(?P<load_interval>[0-9]+) +(?P<timecheck>minute|second|)'
-                              ' +output +rate +(?P<out_rate>[0-9]+) +bits/sec,'
-                              ' +(?P<out_rate_pkts>[0-9]+) +packets/sec$')
-            m = p10.match(line)
-            if m:
-                load_interval = int(m.groupdict()['load_interval'])
-                out_rate = int(m.groupdict()['out_rate'])
-                out_rate_pkts = int(m.groupdict()['out_rate_pkts'])
-                timecheck = str(m.groupdict()['timecheck'])
-
-                if timecheck == "minute":
-                    load_interval = load_interval * 60
-
-                if 'counters' not in interface_detail_dict[interface]:
-                    interface_detail_dict[interface]['counters'] = {}
-                if 'rate' not in interface_detail_dict[interface]['counters']:
-                    interface_detail_dict[interface]['counters']['rate'] = {}
-
-                interface_detail_dict[interface]['counters']['rate']\
-                ['load_interval'] = load_interval
-                interface_detail_dict[interface]['counters']['rate']\
-                ['out_rate'] = out_rate
-                interface_detail_dict[interface]['counters']['rate']\
-                ['out_rate_pkts'] = out_rate_pkts
-                continue
-
-            # 0 packets input, 0 bytes, 0 total input drops
-            p11 = re.compile(r'^\s*(?P<in_pkts>[0-9]+) +packets +input,'
-                              ' +(?P<in_octets>[0-9]+) +bytes, +(?P<in_discards>[0-9]+)'
-                              ' +total +input +drops$')
-            m = p11.match(line)
-            if m:
-                in_pkts = int(m.groupdict()['in_pkts'])
-                in_octets = int(m.groupdict()['in_octets'])
-                in_discards = int(m.groupdict()['in_discards'])
-
-                interface_detail_dict[interface]['counters']\
-                ['in_pkts'] = in_pkts
-                interface_detail_dict[interface]['counters']\
-                ['in_octets'] = in_octets
-                interface_detail_dict[interface]['counters']\
-                ['in_discards'] = in_discards
-                continue
-
-            # 0 drops for unrecognized upper-level protocol
-            p12 = re.compile(r'^\s*(?P<in_unknown_protos>[0-9]+) +drops +for +unrecognized'
-                              ' +upper-level +protocol$')
-            m = p12.match(line)
-            if m:
-                interface_detail_dict[interface]['counters']\
-                ['in_unknown_protos'] = int(m.groupdict()['in_unknown_protos'])
-                continue
-
-            # Received 0 broadcast packets, 0 multicast packets
-            p13 = re.compile(r'^\s*Received +(?P<in_broadcast_pkts>[0-9]+)'
-                              ' +broadcast +packets, +(?P<in_multicast_pkts>[0-9]+)'
-                              ' +multicast +packets$')
-            m = p13.match(line)
-            if m:
-                interface_detail_dict[interface]['counters']\
-                ['in_broadcast_pkts'] = int(m.groupdict()['in_broadcast_pkts'])
-                interface_detail_dict[interface]['counters']\
-                ['in_multicast_pkts'] = int(m.groupdict()['in_multicast_pkts'])
-                continue
-
-            # 0 runts, 0 giants, 0 throttles, 0 parity
-            p14 = re.compile(r'^\s*(?P<in_runts>[0-9]+) +runts, +(?P<in_giants>[0-9]+)'
-                              ' +giants, +(?P<in_throttles>[0-9]+) +throttles,'
-                              ' +(?P<in_parity>[0-9]+) parity$')
-            m = p14.match(line)
-            if m:
-                interface_detail_dict[interface]['counters']\
-                ['in_runts'] = int(m.groupdict()['in_runts'])
-                interface_detail_dict[interface]['counters']\
-                ['in_giants'] = int(m.groupdict()['in_giants'])
-                interface_detail_dict[interface]['counters']\
-                ['in_throttles'] = int(m.groupdict()['in_throttles'])
-                interface_detail_dict[interface]['counters']\
-                ['in_parity'] = int(m.groupdict()['in_parity'])
-                continue
-
-            # 0 input errors, 0 CRC, 0 frame, 0 overrun, 0 ignored, 0 abort
-            p15 = re.compile(r'^\s*(?P<in_frame_errors>[0-9]+) +input +errors,'
-                              ' +(?P<in_crc_errors>[0-9]+) +CRC,'
-                              ' +(?P<in_frame>[0-9]+)'
-                              ' +frame, +(?P<in_overrun>[0-9]+) +overrun,'
-                              ' +(?P<in_ignored>[0-9]+) +ignored,'
-                              ' +(?P<in_abort>[0-9]+) +abort$')
-            m = p15.match(line)
-            if m:
-                interface_detail_dict[interface]['counters']\
-                ['in_frame_errors'] = int(m.groupdict()['in_frame_errors'])
-                interface_detail_dict[interface]['counters']\
-                ['in_crc_errors'] = int(m.groupdict()['in_crc_errors'])
-                interface_detail_dict[interface]['counters']\
-                ['in_frame'] = int(m.groupdict()['in_frame'])
-                interface_detail_dict[interface]['counters']\
-                ['in_overrun'] = int(m.groupdict()['in_overrun'])
-                interface_detail_dict[interface]['counters']\
-                ['in_ignored'] = int(m.groupdict()['in_ignored'])
-                interface_detail_dict[interface]['counters']\
-                ['in_abort'] = int(m.groupdict()['in_abort'])
-                continue
-
-            # 0 packets output, 0 bytes, 0 total output drops 
-            p16 = re.compile(r'^\s*(?P<out_pkts>[0-9]+) +packets +output,'
-                              ' +(?P<out_octets>[0-9]+) +bytes, +(?P<out_discards>[0-9]+)'
-                              ' +total +output +drops$')
-            m = p16.match(line)
-            if m:
-                interface_detail_dict[interface].setdefault('counters', {})
-                interface_detail_dict[interface]['counters']\
-                ['out_pkts'] = int(m.groupdict()['out_pkts'])
-                interface_detail_dict[interface]['counters']\
-                ['out_octets'] = int(m.groupdict()['out_octets'])
-                interface_detail_dict[interface]['counters']\
-                ['out_discards'] = int(m.groupdict()['out_discards'])
-                continue
+                    interface_detail_dict[interface]['counters']['rate']\
+                    ['load_interval'] = load_interval
+                    interface_detail_dict[interface]['counters']['rate']\
+                    ['in_rate'] = in_rate
+                    interface_detail_dict[interface]['counters']['rate']\
+                    ['in_rate_pkts'] = in_rate_pkts
+                    interface_detail_dict[interface]['counters']\
+                    ['last_clear'] = last_clear
+                    break
+
+                # Full-duplex, 1000Mb/s, unknown, link type is autonegotiation
+                # Duplex unknown, 0Kb/s, unknown, link type is autonegotiation
+                elif name == 'p9_1':
+                    auto_negotiate = m.groupdict()['auto_negotiate']
+                    duplex_mode = str(m.groupdict()['duplex_mode']).lower()
+                    duplex_mode = duplex_mode.replace("-duplex","")
+
+                    interface_detail_dict[interface]['duplex_mode'] = duplex_mode
+                    interface_detail_dict[interface]['port_speed'] = str(m.groupdict()['port_speed'])
+                    interface_detail_dict[interface]['location'] = str(m.groupdict()['location'])
+                    interface_detail_dict[interface]['auto_negotiate'] = True
+                    break
+
+                elif name == 'p9_2':
+                    auto_negotiate = m.groupdict()['auto_negotiate']
+                    duplex_mode = str(m.groupdict()['duplex_mode']).lower()
+                    duplex_mode = duplex_mode.replace("-duplex","")
+
+                    interface_detail_dict[interface]['duplex_mode'] = duplex_mode
+                    interface_detail_dict[interface]['port_speed'] = str(m.groupdict()['port_speed'])
+                    interface_detail_dict[interface]['location'] = str(m.groupdict()['location'])
+                    interface_detail_dict[interface]['auto_negotiate'] = False
+                    break
+
+                # output flow control is off, input flow control is off
+                elif name == 'p9_3':
+                    flow_control_send = m.groupdict()['flow_control_send']
+                    flow_control_receive = m.groupdict()['flow_control_receive']
+
+                    if 'flow_control' not in interface_detail_dict[interface]:
+                        interface_detail_dict[interface]['flow_control'] = {}
+
+                    interface_detail_dict[interface]['flow_control']['flow_control_send'] = False
+                    interface_detail_dict[interface]['flow_control']['flow_control_receive'] = False
+                    break
+
+                elif name == 'p9_4':
+                    flow_control_send = m.groupdict()['flow_control_send']
+                    flow_control_receive = m.groupdict()['flow_control_receive']
+
+                    if 'flow_control' not in interface_detail_dict[interface]:
+                        interface_detail_dict[interface]['flow_control'] = {}
+
+                    interface_detail_dict[interface]['flow_control']['flow_control_send'] = True
+                    interface_detail_dict[interface]['flow_control']['flow_control_receive'] = True
+                    break
+
+                elif name == 'p9_5':
+                    flow_control_send = m.groupdict()['flow_control_send']
+                    flow_control_receive = m.groupdict()['flow_control_receive']
+
+                    if 'flow_control' not in interface_detail_dict[interface]:
+                        interface_detail_dict[interface]['flow_control'] = {}
+
+                    interface_detail_dict[interface]['flow_control']['flow_control_send'] = True
+                    interface_detail_dict[interface]['flow_control']['flow_control_receive'] = False
+                    break
+
+                elif name == 'p9_6':
+                    flow_control_send = m.groupdict()['flow_control_send']
+                    flow_control_receive = m.groupdict()['flow_control_receive']
+
+                    if 'flow_control' not in interface_detail_dict[interface]:
+                        interface_detail_dict[interface]['flow_control'] = {}
+
+                    interface_detail_dict[interface]['flow_control']['flow_control_send'] = False
+                    interface_detail_dict[interface]['flow_control']['flow_control_receive'] = True
+                    break
+
+                # Carrier delay (up) is 10 msec
+                elif name == 'p9_7':
+                    carrier_delay = m.groupdict()['carrier_delay']
+
+                    interface_detail_dict[interface]['carrier_delay'] = carrier_delay
+                    break
+
+                # 5 minute output rate 0 bits/sec, 0 packets/sec
+                elif name == 'p10':
+                    load_interval = int(m.groupdict()['load_interval'])
+                    out_rate = int(m.groupdict()['out_rate'])
+                    out_rate_pkts = int(m.groupdict()['out_rate_pkts'])
+                    timecheck = str(m.groupdict()['timecheck'])
+
+                    if timecheck == "minute":
+                        load_interval = load_interval * 60
+
+                    if 'counters' not in interface_detail_dict[interface]:
+                        interface_detail_dict[interface]['counters'] = {}
+                    if 'rate' not in interface_detail_dict[interface]['counters']:
+                        interface_detail_dict[interface]['counters']['rate'] = {}
+
+                    interface_detail_dict[interface]['counters']['rate']\
+                    ['load_interval'] = load_interval
+                    interface_detail_dict[interface]['counters']['rate']\
+                    ['out_rate'] = out_rate
+                    interface_detail_dict[interface]['counters']['rate']\
+                    ['out_rate_pkts'] = out_rate_pkts
+                    break
+
+                # 0 packets input, 0 bytes, 0 total input drops
+                elif name == 'p11':
+                    in_pkts = int(m.groupdict()['in_pkts'])
+                    in_octets = int(m.groupdict()['in_octets'])
+                    in_discards = int(m.groupdict()['in_discards'])
+
+                    interface_detail_dict[interface]['counters']\
+                    ['in_pkts'] = in_pkts
+                    interface_detail_dict[interface]['counters']\
+                    ['in_octets'] = in_octets
+                    interface_detail_dict[interface]['counters']\
+                    ['in_discards'] = in_discards
+                    break
+
+                # 0 drops for unrecognized upper-level protocol
+                elif name == 'p12':
+                    interface_detail_dict[interface]['counters']\
+                    ['in_unknown_protos'] = int(m.groupdict()['in_unknown_protos'])
+                    break
+
+                # Received 0 broadcast packets, 0 multicast packets
+                elif name == 'p13':
+                    interface_detail_dict[interface]['counters']\
+                    ['in_broadcast_pkts'] = int(m.groupdict()['in_broadcast_pkts'])
+                    interface_detail_dict[interface]['counters']\
+                    ['in_multicast_pkts'] = int(m.groupdict()['in_multicast_pkts'])
+                    break
+
+                # 0 runts, 0 giants, 0 throttles, 0 parity
+                elif name == 'p14':
+                    interface_detail_dict[interface]['counters']\
+                    ['in_runts'] = int(m.groupdict()['in_runts'])
+                    interface_detail_dict[interface]['counters']\
+                    ['in_giants'] = int(m.groupdict()['in_giants'])
+                    interface_detail_dict[interface]['counters']\
+                    ['in_throttles'] = int(m.groupdict()['in_throttles'])
+                    interface_detail_dict[interface]['counters']\
+                    ['in_parity'] = int(m.groupdict()['in_parity'])
+                    break
+
+                # 0 input errors, 0 CRC, 0 frame, 0 overrun, 0 ignored, 0 abort
+                elif name == 'p15':
+                    interface_detail_dict[interface]['counters']\
+                    ['in_frame_errors'] = int(m.groupdict()['in_frame_errors'])
+                    interface_detail_dict[interface]['counters']\
+                    ['in_crc_errors'] = int(m.groupdict()['in_crc_errors'])
+                    interface_detail_dict[interface]['counters']\
+                    ['in_frame'] = int(m.groupdict()['in_frame'])
+                    interface_detail_dict[interface]['counters']\
+                    ['in_overrun'] = int(m.groupdict()['in_overrun'])
+                    interface_detail_dict[interface]['counters']\
+                    ['in_ignored'] = int(m.groupdict()['in_ignored'])
+                    interface_detail_dict[interface]['counters']\
+                    ['in_abort'] = int(m.groupdict()['in_abort'])
+                    break
+
+                # 0 packets output, 0 bytes, 0 total output drops 
+                elif name == 'p16':
+                    interface_detail_dict[interface].setdefault('counters', {})
+                    interface_detail_dict[interface]['counters']\
+                    ['out_pkts'] = int(m.groupdict()['out_pkts'])
+                    interface_detail_dict[interface]['counters']\
+                    ['out_octets'] = int(m.groupdict()['out_octets'])
+                    interface_detail_dict[interface]['counters']\
+                    ['out_discards'] = int(m.groupdict()['out_discards'])
+                    break
     
-            # Output 0 broadcast packets, 0 multicast packets
-            p17 = re.compile(r'^\s*Output +(?P<out_broadcast_pkts>[0-9]+)'
-                              ' +broadcast +packets, +(?P<out_multicast_pkts>[0-9]+)'
-                              ' +multicast +packets$')
-            m = p17.match(line)
-            if m:
-                interface_detail_dict[interface]['counters']\
-                ['out_broadcast_pkts'] = int(m.groupdict()['out_broadcast_pkts'])
-                interface_detail_dict[interface]['counters']\
-                ['out_multicast_pkts'] = int(m.groupdict()['out_multicast_pkts'])
-                continue
-
-            # 0 output errors, 0 underruns, 0 applique, 0 resets
-            p18 = re.compile(r'^\s*(?P<out_errors>[0-9]+) +output +errors,'
-                              ' +(?P<out_underruns>[0-9]+) +underruns,'
-                              ' +(?P<out_applique>[0-9]+) +applique,'
-                              ' +(?P<out_resets>[0-9]+) +resets$')
-            m = p18.match(line)
-            if m:
-                interface_detail_dict[interface]['counters']\
-                ['out_errors'] = int(m.groupdict()['out_errors'])
-                interface_detail_dict[interface]['counters']\
-                ['out_underruns'] = int(m.groupdict()['out_underruns'])
-                interface_detail_dict[interface]['counters']\
-                ['out_applique'] = int(m.groupdict()['out_applique'])
-                interface_detail_dict[interface]['counters']\
-                ['out_resets'] = int(m.groupdict()['out_resets'])
-                continue
-
-            # 0 output buffer failures, 0 output buffers swapped out
-            p19 = re.compile(r'^\s*(?P<out_buffer_failures>[0-9]+) +output'
-                              ' +buffer +failures, +(?P<out_buffer_swapped_out>[0-9]+)'
-                              ' +output +buffers +swapped +out$')
-            m = p19.match(line)
-            if m:
-                interface_detail_dict[interface]['counters']\
-                ['out_buffer_failures'] = int(m.groupdict()['out_buffer_failures'])
-                interface_detail_dict[interface]['counters']\
-                ['out_buffer_swapped_out'] = int(m.groupdict()['out_buffer_swapped_out'])
-                continue
-
-            # 0 carrier transitions
-            p20 = re.compile(r'^\s*(?P<carrier_transitions>[0-9]+) +carrier +transitions$')
-            m = p20.match(line)
-            if m:
-                interface_detail_dict[interface]['counters']\
-                ['carrier_transitions'] = int(m.groupdict()['carrier_transitions'])
-                continue
+                # Output 0 broadcast packets, 0 multicast packets
+                elif name == 'p17':
+                    interface_detail_dict[interface]['counters']\
+                    ['out_broadcast_pkts'] = int(m.groupdict()['out_broadcast_pkts'])
+                    interface_detail_dict[interface]['counters']\
+                    ['out_multicast_pkts'] = int(m.groupdict()['out_multicast_pkts'])
+                    break
+
+                # 0 output errors, 0 underruns, 0 applique, 0 resets
+                elif name == 'p18':
+                    interface_detail_dict[interface]['counters']\
+                    ['out_errors'] = int(m.groupdict()['out_errors'])
+                    interface_detail_dict[interface]['counters']\
+                    ['out_underruns'] = int(m.groupdict()['out_underruns'])
+                    interface_detail_dict[interface]['counters']\
+                    ['out_applique'] = int(m.groupdict()['out_applique'])
+                    interface_detail_dict[interface]['counters']\
+                    ['out_resets'] = int(m.groupdict()['out_resets'])
+                    break
+
+                # 0 output buffer failures, 0 output buffers swapped out
+                elif name == 'p19':
+                    interface_detail_dict[interface]['counters']\
+                    ['out_buffer_failures'] = int(m.groupdict()['out_buffer_failures'])
+                    interface_detail_dict[interface]['counters']\
+                    ['out_buffer_swapped_out'] = int(m.groupdict()['out_buffer_swapped_out'])
+                    break
+
+                # 0 carrier transitions
+                elif name == 'p20':
+                    interface_detail_dict[interface]['counters']\
+                    ['carrier_transitions'] = int(m.groupdict()['carrier_transitions'])
+                    break
 
         return interface_detail_dict
 
@@ -2377,573 +2422,548 @@ class ShowInterfaces(ShowInterfacesSchema):
     exclude = []
 
 
-    def cli(self, interface="", output=None):
-        if output is None:
-            if interface:
-                cmd = self.cli_command[1].format(interface=interface)
-            else:
-                cmd = self.cli_command[0]
-            out = self.device.execute(cmd)
-        else:
-            out = output
-
-        result_dict = {}
-
-        # GigabitEthernet1 is up, line protocol is up 
+    patterns = PatternTable(
+        # GigabitEthernet1 is up, line protocol is up
         # TenGigE0/0/0/4 is administratively down, line protocol is administratively down
-        p1 = re.compile(r'^(?P<interface>\S+) +is +(?P<enabled>[\w\s]+), '
-                         '+line +protocol +is +(?P<line_protocol>[\w\s]+)$')
+        p1=r'^(?P<interface>\S+) +is +(?P<enabled>[\w\s]+), '
+           '+line +protocol +is +(?P<line_protocol>[\w\s]+)$',
 
-        # Interface state transitions: 9 
-        p2 = re.compile(r'^Interface +state +transitions: +(?P<interface_state_transitions>[\d]+)$')
+        # Interface state transitions: 9
+        p2=r'^Interface +state +transitions: +(?P<interface_state_transitions>[\d]+)$',
 
         # Hardware is Loopback
         # Hardware is Gigabit Ethernet, address is 0057.d2ff.428c (bia 0057.d2ff.428c)
-        p3 = re.compile(r'^Hardware +is +(?P<type>[\w\-\/\s\+\(\)]+)'
-                         '(, *address +is +(?P<mac_address>[\w\.]+))?'
-                         '( *\(bia *(?P<phys_address>[\w\.]+)\))?$')
+        p3=r'^Hardware +is +(?P<type>[\w\-\/\s\+\(\)]+)'
+           '(, *address +is +(?P<mac_address>[\w\.]+))?'
+           '( *\(bia *(?P<phys_address>[\w\.]+)\))?$',
 
         # Layer 2 Transport Mode
-        p4 = re.compile(r'^Layer +2 +Transport +Mode$')
+        p4=r'^Layer +2 +Transport +Mode$',
 
         # Description: to-ML26-BE1
-        p5 = re.compile(r'^Description: *(?P<description>.*)$')
+        p5=r'^Description: *(?P<description>.*)$',
 
         # Internet address is 10.4.4.4/24
         # Internet address is Unknown
-        p6 = re.compile(r'^Internet +[A|a]ddress +is +(?P<ipv4>(?P<ip>[\d\.]+)'
-                         '\/(?P<prefix_length>[\d]+))?(?P<unknown>Unknown)?$')
+        p6=r'^Internet +[A|a]ddress +is +(?P<ipv4>(?P<ip>[\d\.]+)'
+           '\/(?P<prefix_length>[\d]+))?(?P<unknown>Unknown)?$',
 
         # MTU 1500 bytes, BW 10000 Kbit
         # MTU 1518 bytes, BW 10000000 Kbit (Max: 10000000 Kbit)
-        p7 = re.compile(r'^MTU +(?P<mtu>[\d]+) +bytes, +BW +(?P<bandwidth>[\d]+) +Kbit'
-                         '(.*Max: +(?P<bandwidth_max>[\d]+).*)?$')
+        p7=r'^MTU +(?P<mtu>[\d]+) +bytes, +BW +(?P<bandwidth>[\d]+) +Kbit'
+           '(.*Max: +(?P<bandwidth_max>[\d]+).*)?$',
 
         # reliability 255/255, txload 1/255, rxload 1/255
         # reliability Unknown, txload Unknown, rxload Unknown
-        p8 = re.compile(r'^reliability +(?P<reliability>[\w\/]+), '
-                         '+txload +(?P<txload>[\w\/]+), +rxload '
-                         '+(?P<rxload>[\w\/]+)$')
+        p8=r'^reliability +(?P<reliability>[\w\/]+), '
+           '+txload +(?P<txload>[\w\/]+), +rxload '
+           '+(?P<rxload>[\w\/]+)$',
 
         # Encapsulation ARPA,
         # Encapsulation 802.1Q Virtual LAN,
         # Encapsulation ARPA,  loopback not set,
         # Encapsulation 802.1Q Virtual LAN, VLAN Id 10,  loopback not set,
         # Encapsulation 802.1Q Virtual LAN, VLAN Id 10, 2nd VLAN Id 10,
-        p9 = re.compile(r'^Encapsulation +(?P<encapsulation>[\w\.\s]+),'
-                         '( +VLAN +Id +(?P<first_dot1q>\d+),)?'
-                         '( +2nd +VLAN +Id +(?P<second_dot1q>\d+),)?'
-                         '( +loopback +(?P<loopback>[\w\s]+),)?$')
+        p9=r'^Encapsulation +(?P<encapsulation>[\w\.\s]+),'
+           '( +VLAN +Id +(?P<first_dot1q>\d+),)?'
+           '( +2nd +VLAN +Id +(?P<second_dot1q>\d+),)?'
+           '( +loopback +(?P<loopback>[\w\s]+),)?$',
 
         # Outer Match: Dot1Q VLAN 300
-        p10 = re.compile(r'^Outer +Match: +(?P<outer_match>[\w\s]+)$')
+        p10=r'^Outer +Match: +(?P<outer_match>[\w\s]+)$',
 
         # Ethertype Any, MAC Match src any, dest any
-        p11 = re.compile(r'^Ethertype +(?P<ethertype>\w+), '
-                           '+MAC +Match +(?P<mac_match>[\w\s]+), '
-                           '+dest +(?P<dest>\w+)$')
+        p11=r'^Ethertype +(?P<ethertype>\w+), '
+            '+MAC +Match +(?P<mac_match>[\w\s]+), '
+            '+dest +(?P<dest>\w+)$',
 
         # Full-duplex, 0Kb/s
         # Full-duplex, 1000Mb/s, link type is force-up
         # Full-duplex, Auto Speed, SR, link type is force-up
         # Duplex unknown, 0Kb/s, THD, link type is autonegotiation
-        p12 = re.compile(r'^(?P<duplex_mode>[\w\s\-]+([d|D]uplex|unknown)), '
-                          '+(?P<port_speed>[\w\s\/]+)(, +(?P<media_type>\S+))?'
-                          '(, +link +type +is +(?P<link_type>\S+))?$')
+        p12=r'^(?P<duplex_mode>[\w\s\-]+([d|D]uplex|unknown)), '
+            '+(?P<port_speed>[\w\s\/]+)(, +(?P<media_type>\S+))?'
+            '(, +link +type +is +(?P<link_type>\S+))?$',
 
         # output flow control is off, input flow control is off
         # output flow control is off, input flow control is unsupported
-        p13 = re.compile(r'^output +flow +control +is +(?P<send>\w+), +'
-                          'input +flow +control +is +(?P<receive>\w+)$')
+        p13=r'^output +flow +control +is +(?P<send>\w+), +'
+            'input +flow +control +is +(?P<receive>\w+)$',
 
         # Carrier delay (up) is 10 msec
         # Carrier delay (up) is 10 msec, Carrier delay (down) is 60 msec
-        p14 = re.compile(r'^Carrier +delay +\(up\) +is +(?P<carrier_delay_up>\d+) +msec'
-                '(, +Carrier +delay +\(down\) +is +(?P<carrier_delay_down>\d+) +msec)?$')
+        p14=r'^Carrier +delay +\(up\) +is +(?P<carrier_delay_up>\d+) +msec'
+            '(, +Carrier +delay +\(down\) +is +(?P<carrier_delay_down>\d+) +msec)?$',
 
         # loopback not set,
-        p15 = re.compile(r'^loopback +(?P<loopback>[\w\s]+),$')
+        p15=r'^loopback +(?P<loopback>[\w\s]+),$',
 
         # Last link flapped 5w6d
-        p16 = re.compile(r'^Last +link +flapped +(?P<last_link_flapped>\S+)$')
+        p16=r'^Last +link +flapped +(?P<last_link_flapped>\S+)$',
 
         # ARP type ARPA, ARP timeout 04:00:00
-        p17 = re.compile(r'^ARP +type +(?P<arp_type>\w+), +'
-                          'ARP +timeout +(?P<arp_timeout>[\w\:\.]+)$')
+        p17=r'^ARP +type +(?P<arp_type>\w+), +'
+            'ARP +timeout +(?P<arp_timeout>[\w\:\.]+)$',
 
         # Last input never, output 00:01:05
-        p18 = re.compile(r'^Last +input +(?P<last_input>[\w\.\:]+), +'
-                          'output +(?P<last_output>[\w\.\:]+)$')
+        p18=r'^Last +input +(?P<last_input>[\w\.\:]+), +'
+            'output +(?P<last_output>[\w\.\:]+)$',
 
         # No. of members in this bundle: 1
-        p19 = re.compile(r'^No\. +of +members +in +this +bundle: +(?P<member_count>\d+)$')
+        p19=r'^No\. +of +members +in +this +bundle: +(?P<member_count>\d+)$',
 
         # TenGigE0/0/0/1               Full-duplex  10000Mb/s    Active
-        p20 = re.compile(r'^(?P<interface>[\w\/\.]+) '
-                          '+(?P<duplex_mode>[\w\-\s]+([d|D]uplex|unknown)) '
-                          '+(?P<speed>[\w\/\s]+?) +(?P<state>\w+)$')
+        p20=r'^(?P<interface>[\w\/\.]+) '
+            '+(?P<duplex_mode>[\w\-\s]+([d|D]uplex|unknown)) '
+            '+(?P<speed>[\w\/\s]+?) +(?P<state>\w+)$',
 
         # Last clearing of "show interface" counters 1d02h
-        p21 = re.compile(r'^Last +clearing +of +"show +interface" +counters +'
-                          '(?P<last_clear>[\w\:\.]+)$')
+        p21=r'^Last +clearing +of +"show +interface" +counters +'
+            '(?P<last_clear>[\w\:\.]+)$',
 
         # Input/output data rate is disabled.
-        p22 = re.compile(r'^Input\/output +data +rate +is +disabled\.$')
+        p22=r'^Input\/output +data +rate +is +disabled\.$',
 
         # 5 minute input rate 0 bits/sec, 0 packets/sec
-        p23 = re.compile(r'^(?P<load_interval>[\d\#]+)'
-                          ' *(?P<unit>(minute|second|minutes|seconds)) +input +rate'
-                          ' +(?P<in_rate>[\d]+) +bits/sec,'
-                          ' +(?P<in_rate_pkts>[\d]+) +packets/sec$')
+        p23=r'^(?P<load_interval>[\d\#]+)'
+            ' *(?P<unit>(minute|second|minutes|seconds)) +input +rate'
+            ' +(?P<in_rate>[\d]+) +bits/sec,'
+            ' +(?P<in_rate_pkts>[\d]+) +packets/sec$',
 
         # 5 minute output rate 0 bits/sec, 0 packets/sec
-        p24 = re.compile(r'^(?P<load_interval>[\d\#]+)'
-                          ' *(minute|second|minutes|seconds) +output +rate'
-                          ' +(?P<out_rate>[\d]+) +bits/sec,'
-                          ' +(?P<out_rate_pkts>[\d]+) +packets/sec$')
+        p24=r'^(?P<load_interval>[\d\#]+)'
+            ' *(minute|second|minutes|seconds) +output +rate'
+            ' +(?P<out_rate>[\d]+) +bits/sec,'
+            ' +(?P<out_rate_pkts>[\d]+) +packets/sec$',
 
         # 0 packets input, 0 bytes
         # 0 packets input, 0 bytes, 0 total input drops
-        p25 = re.compile(r'^(?P<in_pkts>[\d]+) +packets +input, +(?P<in_octets>[\d]+) +bytes'
-                          '(, +(?P<in_total_drops>[\d]+) +total +input +drops)?$')
+        p25=r'^(?P<in_pkts>[\d]+) +packets +input, +(?P<in_octets>[\d]+) +bytes'
+            '(, +(?P<in_total_drops>[\d]+) +total +input +drops)?$',
 
         # 1258859 drops for unrecognized upper-level protocol
-        p26 = re.compile(r'(?P<in_unknown_protos>[\d]+) +drops +for '
-                          '+unrecognized +upper-level +protocol$')
+        p26=r'(?P<in_unknown_protos>[\d]+) +drops +for '
+            '+unrecognized +upper-level +protocol$',
 
         # 0 input drops, 0 queue drops, 0 input errors
-        p27 = re.compile(r'(?P<in_drops>[\d]+) +input +drops, '
-                          '+(?P<in_queue_drops>[\d]+) +queue +drops, '
-                          '+(?P<in_errors>[\d]+) +input +errors$')
+        p27=r'(?P<in_drops>[\d]+) +input +drops, '
+            '+(?P<in_queue_drops>[\d]+) +queue +drops, '
+            '+(?P<in_errors>[\d]+) +input +errors$',
 
         # Received 0 broadcast packets, 0 multicast packets
-        p28 = re.compile(r'^Received +(?P<in_broadcast_pkts>\d+) +broadcast +packets, '
-                          '+(?P<in_multicast_pkts>\d+) +multicast +packets$')
+        p28=r'^Received +(?P<in_broadcast_pkts>\d+) +broadcast +packets, '
+            '+(?P<in_multicast_pkts>\d+) +multicast +packets$',
 
         # 0 runts, 0 giants, 0 throttles, 0 parity
-        p29 = re.compile(r'^(?P<in_runts>[\d]+) +runts, +(?P<in_giants>[\d]+) +giants, '
-                          '+(?P<in_throttles>[\d]+) +throttles, +(?P<in_parity>[\d]+) +parity$')
+        p29=r'^(?P<in_runts>[\d]+) +runts, +(?P<in_giants>[\d]+) +giants, '
+            '+(?P<in_throttles>[\d]+) +throttles, +(?P<in_parity>[\d]+) +parity$',
 
         # 0 input errors, 0 CRC, 0 frame, 0 overrun, 0 ignored, 0 abort
-        p30 = re.compile(r'^(?P<in_errors>[\d]+) +input +errors, +'
-                          '(?P<in_crc_errors>[\d]+) +CRC, +'
-                          '(?P<in_frame>[\d]+) +frame, +'
-                          '(?P<in_overrun>[\d]+) +overrun, +'
-                          '(?P<in_ignored>[\d]+) +ignored, +'
-                          '(?P<in_abort>[\d]+) +abort$')
+        p30=r'^(?P<in_errors>[\d]+) +input +errors, +'
+            '(?P<in_crc_errors>[\d]+) +CRC, +'
+            '(?P<in_frame>[\d]+) +frame, +'
+            '(?P<in_overrun>[\d]+) +overrun, +'
+            '(?P<in_ignored>[\d]+) +ignored, +'
+            '(?P<in_abort>[\d]+) +abort$',
 
         # 0 packets output, 0 bytes
         # 0 packets output, 0 bytes, 0 total output drops
-        p31 = re.compile(r'^(?P<out_pkts>[\d]+) +packets +output, +(?P<out_octets>[\d]+) +bytes'
-                          '(, +(?P<out_total_drops>[\d]+) +total +output +drops)?$')
+        p31=r'^(?P<out_pkts>[\d]+) +packets +output, +(?P<out_octets>[\d]+) +bytes'
+            '(, +(?P<out_total_drops>[\d]+) +total +output +drops)?$',
 
         # Output 0 broadcast packets, 178045 multicast packets
-        p32 = re.compile(r'^Output +(?P<out_broadcast_pkts>\d+) +broadcast +packets, '
-                          '+(?P<out_multicast_pkts>\d+) +multicast +packets$')
-        
+        p32=r'^Output +(?P<out_broadcast_pkts>\d+) +broadcast +packets, '
+            '+(?P<out_multicast_pkts>\d+) +multicast +packets$',
+
         # 0 output errors, 0 underruns, 0 applique, 0 resets
-        p33 = re.compile(r'^(?P<out_errors>[\d]+) +output +errors, '
-                          '+(?P<out_underruns>[\d]+) +underruns, '
-                          '+(?P<out_applique>[\d]+) +applique, '
-                          '+(?P<out_resets>[\d]+) +resets$')
+        p33=r'^(?P<out_errors>[\d]+) +output +errors, '
+            '+(?P<out_underruns>[\d]+) +underruns, '
+            '+(?P<out_applique>[\d]+) +applique, '
+            '+(?P<out_resets>[\d]+) +resets$',
 
         # 0 output drops, 0 queue drops, 0 output errors
-        p34 = re.compile(r'(?P<out_drops>[\d]+) +output +drops, '
-                          '+(?P<out_queue_drops>[\d]+) +queue +drops, '
-                          '+(?P<out_errors>[\d]+) +output +errors$')
+        p34=r'(?P<out_drops>[\d]+) +output +drops, '
+            '+(?P<out_queue_drops>[\d]+) +queue +drops, '
+            '+(?P<out_errors>[\d]+) +output +errors$',
 
         # 0 output buffer failures, 0 output buffers swapped out
-        p35 = re.compile(r'^(?P<out_buffer_failure>[\d]+) +output +buffer +failures, '
-                          '+(?P<out_buffers_swapped>[\d]+) +output +buffers +swapped +out$')
+        p35=r'^(?P<out_buffer_failure>[\d]+) +output +buffer +failures, '
+            '+(?P<out_buffers_swapped>[\d]+) +output +buffers +swapped +out$',
 
         # 0 carrier transitions
-        p36 = re.compile(r'^(?P<carrier_transitions>[\d]+) +carrier +transitions$')
-
-        for line in out.splitlines():
-            line = line.strip()
+        p36=r'^(?P<carrier_transitions>[\d]+) +carrier +transitions$',
+    )
 
-            # GigabitEthernet1 is up, line protocol is up
-            # TenGigE0/0/0/4 is administratively down, line protocol is administratively down
-            m = p1.match(line)
-            if m:
-                group = m.groupdict()
-                interface = group['interface']
-                enabled = group['enabled']
-                line_protocol = group['line_protocol']
+    # Patterns tried on every line, in order
+    dispatcher = patterns.dispatcher(
+        'p1', 'p2', 'p3', 'p4', 'p5', 'p6', 'p7', 'p8', 'p9', 'p10',
+        'p11', 'p12', 'p13', 'p14', 'p15', 'p16', 'p17', 'p18', 'p19',
+        'p20', 'p21', 'p23', 'p24', 'p25', 'p26', 'p27', 'p28', 'p29',
+        'p30', 'p31', 'p32', 'p33', 'p34', 'p35', 'p36')
 
-                intf_dict = result_dict.setdefault(interface, {})
-                if 'administratively down' in enabled or 'delete' in enabled:
-                    intf_dict['enabled'] = False
-                else:
-                    intf_dict['enabled'] = True
-
-                if line_protocol:
-                    intf_dict['line_protocol'] = line_protocol
-                    intf_dict['oper_status'] = line_protocol
-                continue
-
-            # Interface state transitions: 9
-            m = p2.match(line)
-            if m:
-                interface_state_transitions = int(m.groupdict()['interface_state_transitions'])
-                intf_dict['interface_state_transitions'] = interface_state_transitions
-                continue
-
-            # Hardware is Loopback
-            # Hardware is Gigabit Ethernet, address is 0057.d2ff.428c (bia 0057.d2ff.428c)
-            m = p3.match(line)
-            if m:
-                types = m.groupdict()['type']
-                mac_address = m.groupdict()['mac_address']
-                phys_address = m.groupdict()['phys_address']
-                intf_dict['type'] = types
-                if mac_address:
-                    intf_dict['mac_address'] = mac_address
-                if phys_address:
-                    intf_dict['phys_address'] = phys_address
-                continue
-
-            # Layer 2 Transport Mode
-            m = p4.match(line)
-            if m:
-                intf_dict['layer2'] = True
-                continue
-
-            # Description: desc
-            m = p5.match(line)
-            if m:
-                description = m.groupdict()['description']
-                intf_dict['description'] = description
-                continue
-
-            # Internet Address is 10.4.4.4/24
-            # Internet address is Unknown
-            m = p6.match(line)
-            if m:
-                ipv4 = m.groupdict()['ipv4']
-                ip = m.groupdict()['ip']
-                prefix_length = m.groupdict()['prefix_length']
-                unknown = m.groupdict()['unknown']
-
-                if ipv4 and not unknown:
-                    ipv4_dict = intf_dict.setdefault('ipv4', {}).setdefault(ipv4, {})
-                    ipv4_dict['ip'] = ip
-                    ipv4_dict['prefix_length'] = prefix_length
-                continue
-
-            # MTU 1500 bytes, BW 10000 Kbit
-            # MTU 1518 bytes, BW 10000000 Kbit (Max: 10000000 Kbit)
-            m = p7.match(line)
-            if m:
-                mtu = m.groupdict()['mtu']
-                bandwidth = m.groupdict()['bandwidth']
-                bandwidth_max = m.groupdict()['bandwidth_max']
-
-                intf_dict['mtu'] = int(mtu)
-                intf_dict['bandwidth'] = int(bandwidth)
-                if bandwidth_max:
-                    intf_dict['bandwidth_max'] = int(bandwidth_max)
-                continue
-
-            # reliability 255/255, txload 1/255, rxload 1/255
-            m = p8.match(line)
-            if m:
-                reliability = m.groupdict()['reliability']
-                txload = m.groupdict()['txload']
-                rxload = m.groupdict()['rxload']
-
-                intf_dict['reliability'] = reliability
-                intf_dict['txload'] = txload
-                intf_dict['rxload'] = rxload
-                continue
-
-            # Encapsulation ARPA,
-            # Encapsulation 802.1Q Virtual LAN, Vlan ID 1, loopback not set
-            # Encapsulation 802.1Q Virtual LAN, VLAN Id 10, 2nd VLAN Id 10,
-            m = p9.match(line)
-            if m:
-                group = m.groupdict()
-                encapsulation = group['encapsulation'].lower()
-                encapsulation = encapsulation.replace("802.1q virtual lan","dot1q")
-                first_dot1q = group['first_dot1q']
-                second_dot1q = group['second_dot1q']
-                loopback = group['loopback']
+    def cli(self, interface="", output=None):
+        if output is None:
+            if interface:
+                cmd = self.cli_command[1].format(interface=interface)
+            else:
+                cmd = self.cli_command[0]
+            out = self.device.execute(cmd)
+        else:
+            out = output
 
-                encap_dict = intf_dict.setdefault('encapsulations', {})
-                encap_dict['encapsulation'] = encapsulation
+        result_dict = {}
 
-                if first_dot1q:
-                    encap_dict['first_dot1q'] = first_dot1q
+        for line in out.splitlines():
+            line = line.strip()
+            for name, m in self.dispatcher.matches(line):
+
+                # GigabitEthernet1 is up, line protocol is up
+                # TenGigE0/0/0/4 is administratively down, line protocol is administratively down
+                if name == 'p1':
+                    group = m.groupdict()
+                    interface = group['interface']
+                    enabled = group['enabled']
+                    line_protocol = group['line_protocol']
+
+                    intf_dict = result_dict.setdefault(interface, {})
+                    if 'administratively down' in enabled or 'delete' in enabled:
+                        intf_dict['enabled'] = False
+                    else:
+                        intf_dict['enabled'] = True
+
+                    if line_protocol:
+                        intf_dict['line_protocol'] = line_protocol
+                        intf_dict['oper_status'] = line_protocol
+                    break
+
+                # Interface state transitions: 9
+                elif name == 'p2':
+                    interface_state_transitions = int(m.groupdict()['interface_state_transitions'])
+                    intf_dict['interface_state_transitions'] = interface_state_transitions
+                    break
+
+                # Hardware is Loopback
+                # Hardware is Gigabit Ethernet, address is 0057.d2ff.428c (bia 0057.d2ff.428c)
+                elif name == 'p3':
+                    types = m.groupdict()['type']
+                    mac_address = m.groupdict()['mac_address']
+                    phys_address = m.groupdict()['phys_address']
+                    intf_dict['type'] = types
+                    if mac_address:
+                        intf_dict['mac_address'] = mac_address
+                    if phys_address:
+                        intf_dict['phys_address'] = phys_address
+                    break
+
+                # Layer 2 Transport Mode
+                elif name == 'p4':
+                    intf_dict['layer2'] = True
+                    break
+
+                # Description: desc
+                elif name == 'p5':
+                    description = m.groupdict()['description']
+                    intf_dict['description'] = description
+                    break
+
+                # Internet Address is 10.4.4.4/24
+                # Internet address is Unknown
+                elif name == 'p6':
+                    ipv4 = m.groupdict()['ipv4']
+                    ip = m.groupdict()['ip']
+                    prefix_length = m.groupdict()['prefix_length']
+                    unknown = m.groupdict()['unknown']
+
+                    if ipv4 and not unknown:
+                        ipv4_dict = intf_dict.setdefault('ipv4', {}).setdefault(ipv4, {})
+                        ipv4_dict['ip'] = ip
+                        ipv4_dict['prefix_length'] = prefix_length
+                    break
+
+                # MTU 1500 bytes, BW 10000 Kbit
+                # MTU 1518 bytes, BW 10000000 Kbit (Max: 10000000 Kbit)
+                elif name == 'p7':
+                    mtu = m.groupdict()['mtu']
+                    bandwidth = m.groupdict()['bandwidth']
+                    bandwidth_max = m.groupdict()['bandwidth_max']
+
+                    intf_dict['mtu'] = int(mtu)
+                    intf_dict['bandwidth'] = int(bandwidth)
+                    if bandwidth_max:
+                        intf_dict['bandwidth_max'] = int(bandwidth_max)
+                    break
+
+                # reliability 255/255, txload 1/255, rxload 1/255
+                elif name == 'p8':
+                    reliability = m.groupdict()['reliability']
+                    txload = m.groupdict()['txload']
+                    rxload = m.groupdict()['rxload']
+
+                    intf_dict['reliability'] = reliability
+                    intf_dict['txload'] = txload
+                    intf_dict['rxload'] = rxload
+                    break
+
+                # Encapsulation ARPA,
+                # Encapsulation 802.1Q Virtual LAN, Vlan ID 1, loopback not set
+                # Encapsulation 802.1Q Virtual LAN, VLAN Id 10, 2nd VLAN Id 10,
+                elif name == 'p9':
+                    group = m.groupdict()
+                    encapsulation = group['encapsulation'].lower()
+                    encapsulation = encapsulation.replace("802.1q virtual lan","dot1q")
+                    first_dot1q = group['first_dot1q']
+                    second_dot1q = group['second_dot1q']
+                    loopback = group['loopback']
+
+                    encap_dict = intf_dict.setdefault('encapsulations', {})
+                    encap_dict['encapsulation'] = encapsulation
+
+                    if first_dot1q:
+                        encap_dict['first_dot1q'] = first_dot1q
                 
-                if second_dot1q:
-                    encap_dict['second_dot1q'] = second_dot1q
+                    if second_dot1q:
+                        encap_dict['second_dot1q'] = second_dot1q
                    
-                if loopback:
+                    if loopback:
+                        intf_dict['loopback'] = loopback
+                    break
+
+                # Outer Match: Dot1Q VLAN 300
+                elif name == 'p10':
+                    outer_match = m.groupdict()['outer_match']
+                    encap_dict['outer_match'] = outer_match
+                    break
+
+                # Ethertype Any, MAC Match src any, dest any
+                elif name == 'p11':
+                    group = m.groupdict()
+                    ethertype = group['ethertype']
+                    mac_match = group['mac_match']
+                    dest = group['dest']
+
+                    encap_dict['ethertype'] = ethertype
+                    encap_dict['mac_match'] = mac_match
+                    encap_dict['dest'] = dest
+                    break
+
+                # Full-duplex, 0Kb/s
+                # Full-duplex, 1000Mb/s, link type is force-up
+                # Full-duplex, Auto Speed, SR, link type is force-up
+                # Duplex unknown, 0Kb/s, THD, link type is autonegotiation
+                elif name == 'p12':
+                    group = m.groupdict()
+                    duplex_mode = group['duplex_mode'].lower()
+                    duplex_mode = duplex_mode.replace("duplex", "").replace("-","")
+                    port_speed = group['port_speed']
+                    link_type = group['link_type']
+                    media_type = group['media_type']
+
+                    intf_dict['duplex_mode'] = duplex_mode.strip()
+                    intf_dict['port_speed'] = port_speed
+                    if link_type:
+                        intf_dict['link_type'] = link_type
+                        if 'auto' in link_type:
+                            intf_dict['auto_negotiate'] = True
+                        else:
+                            intf_dict['auto_negotiate'] = False
+                    if media_type:
+                        intf_dict['media_type'] = media_type
+                    break
+
+                # output flow control is off, input flow control is off
+                elif name == 'p13':
+                    receive = m.groupdict()['receive'].lower()
+                    send = m.groupdict()['send'].lower()
+                    flow_dict = intf_dict.setdefault('flow_control', {})
+
+                    if 'on' in receive:
+                        flow_dict['receive'] = True
+                    elif 'off' in receive or 'unsupported' in receive:
+                        flow_dict['receive'] = False
+
+                    if 'on' in send:
+                        flow_dict['send'] = True
+                    elif 'off' in send or 'unsupported' in send:
+                        flow_dict['send'] = False
+                    break
+
+                # Carrier delay (up) is 10 msec
+                # Carrier delay (up) is 10 msec, Carrier delay (down) is 60 msec
+                elif name == 'p14':
+                    group = m.groupdict()
+                    carrier_delay_up = group['carrier_delay_up']
+                    carrier_delay_down = group['carrier_delay_down']
+
+                    if carrier_delay_up:
+                        intf_dict['carrier_delay_up'] = int(carrier_delay_up)
+                    if carrier_delay_down:
+                        intf_dict['carrier_delay_down'] = int(carrier_delay_down)
+                    break
+
+                # loopback not set,
+                elif name == 'p15':
+                    loopback = m.groupdict()['loopback']
                     intf_dict['loopback'] = loopback
-                continue
-
-            # Outer Match: Dot1Q VLAN 300
-            m = p10.match(line)
-            if m:
-                outer_match = m.groupdict()['outer_match']
-                encap_dict['outer_match'] = outer_match
-                continue
-
-            # Ethertype Any, MAC Match src any, dest any
-            m = p11.match(line)
-            if m:
-                group = m.groupdict()
-                ethertype = group['ethertype']
-                mac_match = group['mac_match']
-                dest = group['dest']
-
-                encap_dict['ethertype'] = ethertype
-                encap_dict['mac_match'] = mac_match
-                encap_dict['dest'] = dest
-                continue
-
-            # Full-duplex, 0Kb/s
-            # Full-duplex, 1000Mb/s, link type is force-up
-            # Full-duplex, Auto Speed, SR, link type is force-up
-            # Duplex unknown, 0Kb/s, THD, link type is autonegotiation
-            m = p12.match(line)
-            if m:
-                group = m.groupdict()
-                duplex_mode = group['duplex_mode'].lower()
-                duplex_mode = duplex_mode.replace("duplex", "").replace("-","")
-                port_speed = group['port_speed']
-                link_type = group['link_type']
-                media_type = group['media_type']
-
-                intf_dict['duplex_mode'] = duplex_mode.strip()
-                intf_dict['port_speed'] = port_speed
-                if link_type:
-                    intf_dict['link_type'] = link_type
-                    if 'auto' in link_type:
-                        intf_dict['auto_negotiate'] = True
-                    else:
-                        intf_dict['auto_negotiate'] = False
-                if media_type:
-                    intf_dict['media_type'] = media_type
-                continue
-
-            # output flow control is off, input flow control is off
-            m = p13.match(line)
-            if m:
-                receive = m.groupdict()['receive'].lower()
-                send = m.groupdict()['send'].lower()
-                flow_dict = intf_dict.setdefault('flow_control', {})
-
-                if 'on' in receive:
-                    flow_dict['receive'] = True
-                elif 'off' in receive or 'unsupported' in receive:
-                    flow_dict['receive'] = False
-
-                if 'on' in send:
-                    flow_dict['send'] = True
-                elif 'off' in send or 'unsupported' in send:
-                    flow_dict['send'] = False
-                continue
-
-            # Carrier delay (up) is 10 msec
-            # Carrier delay (up) is 10 msec, Carrier delay (down) is 60 msec
-            m = p14.match(line)
-            if m:
-                group = m.groupdict()
-                carrier_delay_up = group['carrier_delay_up']
-                carrier_delay_down = group['carrier_delay_down']
-
-                if carrier_delay_up:
-                    intf_dict['carrier_delay_up'] = int(carrier_delay_up)
-                if carrier_delay_down:
-                    intf_dict['carrier_delay_down'] = int(carrier_delay_down)
-                continue
-
-            # loopback not set,
-            m = p15.match(line)
-            if m:
-                loopback = m.groupdict()['loopback']
-                intf_dict['loopback'] = loopback
-                continue
-
-            # Last link flapped 5w6d
-            m = p16.match(line)
-            if m:
-                last_link_flapped = m.groupdict()['last_link_flapped']
-                intf_dict['last_link_flapped'] = last_link_flapped
-                continue
-
-
-            # ARP type ARPA, ARP timeout 04:00:00
-            m = p17.match(line)
-            if m:
-                arp_type = m.groupdict()['arp_type'].lower()
-                arp_timeout = m.groupdict()['arp_timeout']
-                intf_dict['arp_type'] = arp_type
-                intf_dict['arp_timeout'] = arp_timeout
-                continue
-
-            # Last input never, output 00:01:05
-            m = p18.match(line)
-            if m:
-                last_input = m.groupdict()['last_input']
-                last_output = m.groupdict()['last_output']
-                intf_dict['last_input'] = last_input
-                intf_dict['last_output'] = last_output
-                continue
-
-            # No. of members in this bundle: 1
-            m = p19.match(line)
-            if m:
-                port_dict = intf_dict.setdefault('port_channel', {})
-                port_dict['member_count'] = int(m.groupdict()['member_count'])
-                continue
-
-            # TenGigE0/0/0/1               Full-duplex  10000Mb/s    Active
-            m = p20.match(line)
-            if m:
-                group = m.groupdict()
-                interface = group['interface']
-                duplex_mode = group['duplex_mode']
-                speed = group['speed']
-                state = group['state']
-
-                members_intf_dict = port_dict.setdefault('members', {}).setdefault(interface, {})
-                members_intf_dict['interface'] = interface
-                members_intf_dict['duplex_mode'] = duplex_mode
-                members_intf_dict['speed'] = speed
-                members_intf_dict['state'] = state
-                continue
-
-            # Last clearing of "show interface" counters 1d02h
-            m = p21.match(line)
-            if m:
-                last_clear = m.groupdict()['last_clear']
-                counter_dict = intf_dict.setdefault('counters', {})
-                counter_dict['last_clear'] = last_clear
-                continue
-
-            # 5 minute input rate 0 bits/sec, 0 packets/sec
-            m = p23.match(line)
-            if m:
-                group = m.groupdict()
-                load_interval = int(group['load_interval'])
-                in_rate = int(group['in_rate'])
-                in_rate_pkts = int(group['in_rate_pkts'])
-                unit = group['unit']
-
-                rate_dict = intf_dict.setdefault('counters', {}).setdefault('rate', {})
-                # covert minutes to seconds
-                if 'minute' in unit:
-                    load_interval = load_interval * 60
+                    break
+
+                # Last link flapped 5w6d
+                elif name == 'p16':
+                    last_link_flapped = m.groupdict()['last_link_flapped']
+                    intf_dict['last_link_flapped'] = last_link_flapped
+                    break
+
+
+                # ARP type ARPA, ARP timeout 04:00:00
+                elif name == 'p17':
+                    arp_type = m.groupdict()['arp_type'].lower()
+                    arp_timeout = m.groupdict()['arp_timeout']
+                    intf_dict['arp_type'] = arp_type
+                    intf_dict['arp_timeout'] = arp_timeout
+                    break
+
+                # Last input never, output 00:01:05
+                elif name == 'p18':
+                    last_input = m.groupdict()['last_input']
+                    last_output = m.groupdict()['last_output']
+                    intf_dict['last_input'] = last_input
+                    intf_dict['last_output'] = last_output
+                    break
+
+                # No. of members in this bundle: 1
+                elif name == 'p19':
+                    port_dict = intf_dict.setdefault('port_channel', {})
+                    port_dict['member_count'] = int(m.groupdict()['member_count'])
+                    break
+
+                # TenGigE0/0/0/1               Full-duplex  10000Mb/s    Active
+                elif name == 'p20':
+                    group = m.groupdict()
+                    interface = group['interface']
+                    duplex_mode = group['duplex_mode']
+                    speed = group['speed']
+                    state = group['state']
+
+                    members_intf_dict = port_dict.setdefault('members', {}).setdefault(interface, {})
+                    members_intf_dict['interface'] = interface
+                    members_intf_dict['duplex_mode'] = duplex_mode
+                    members_intf_dict['speed'] = speed
+                    members_intf_dict['state'] = state
+                    break
+
+                # Last clearing of "show interface" counters 1d02h
+                elif name == 'p21':
+                    last_clear = m.groupdict()['last_clear']
+                    counter_dict = intf_dict.setdefault('counters', {})
+                    counter_dict['last_clear'] = last_clear
+                    break
+
+                # 5 minute input rate 0 bits/sec, 0 packets/sec
+                elif name == 'p23':
+                    group = m.groupdict()
+                    load_interval = int(group['load_interval'])
+                    in_rate = int(group['in_rate'])
+                    in_rate_pkts = int(group['in_rate_pkts'])
+                    unit = group['unit']
+
+                    rate_dict = intf_dict.setdefault('counters', {}).setdefault('rate', {})
+                    # covert minutes to seconds
+                    if 'minute' in unit:
+                        load_interval = load_interval * 60
                 
-                rate_dict['load_interval'] = load_interval
-                rate_dict['in_rate'] = in_rate
-                rate_dict['in_rate_pkts'] = in_rate_pkts                    
-                continue
-
-            # 5 minute output rate 0 bits/sec, 0 packets/sec
-            m = p24.match(line)
-            if m:
-                group = m.groupdict()
-                out_rate = int(group['out_rate'])
-                out_rate_pkts = int(group['out_rate_pkts'])
-
-                rate_dict = intf_dict.setdefault('counters', {}).setdefault('rate', {})
-                rate_dict['out_rate'] = out_rate
-                rate_dict['out_rate_pkts'] = out_rate_pkts
-                continue
-
-            # 0 packets input, 0 bytes
-            # 0 packets input, 0 bytes, 0 total input drops
-            m = p25.match(line)
-            if m:
-                group = m.groupdict()
-                counter_dict = intf_dict.setdefault('counters', {})
-                for k, v in group.items():
-                    if v:
-                        counter_dict.update({k: int(v)})
-                continue
-
-            # 1258859 drops for unrecognized upper-level protocol
-            m = p26.match(line)
-            if m:
-                counter_dict['in_unknown_protos'] = int(m.groupdict()['in_unknown_protos'])
-                continue
-
-            # 0 input drops, 0 queue drops, 0 input errors
-            m = p27.match(line)
-            if m:
-                group = m.groupdict()
-                counter_dict.update({k: int(v) for k, v in group.items()})
-                continue
-
-            # Received 0 broadcast packets, 0 multicast packets
-            m = p28.match(line)
-            if m:
-                group = m.groupdict()
-                counter_dict.update({k: int(v) for k, v in group.items()})
-                continue
-
-            # 0 runts, 0 giants, 0 throttles, 0 parity
-            m = p29.match(line)
-            if m:
-                group = m.groupdict()
-                counter_dict.update({k: int(v) for k, v in group.items()})
-                continue
-
-            # 0 input errors, 0 CRC, 0 frame, 0 overrun, 0 ignored, 0 abort
-            m = p30.match(line)
-            if m:
-                group = m.groupdict()
-                counter_dict.update({k: int(v) for k, v in group.items()})
-                continue
-
-            # 0 packets output, 0 bytes
-            # 0 packets output, 0 bytes, 0 total output drops
-            m = p31.match(line)
-            if m:
-                group = m.groupdict()
-                for k, v in group.items():
-                    if v:
-                        counter_dict.update({k: int(v)})
-                continue
-
-            # Output 0 broadcast packets, 178045 multicast packets
-            m = p32.match(line)
-            if m:
-                group = m.groupdict()
-                counter_dict.update({k: int(v) for k, v in group.items()})
-                continue
-
-
-            # 0 output errors, 0 underruns, 0 applique, 0 resets
-            m = p33.match(line)
-            if m:
-                group = m.groupdict()
-                counter_dict.update({k: int(v) for k, v in group.items()})
-                continue
-
-            # 0 output drops, 0 queue drops, 0 output errors
-            m = p34.match(line)
-            if m:
-                group = m.groupdict()
-                counter_dict.update({k: int(v) for k, v in group.items()})
-                continue
-
-            # 0 output buffer failures, 0 output buffers swapped out
-            m = p35.match(line)
-            if m:
-                group = m.groupdict()
-                counter_dict.update({k: int(v) for k, v in group.items()})
-                continue
-
-            # 0 carrier transitions
-            m = p36.match(line)
-            if m:
-                group = m.groupdict()
-                counter_dict.update({k: int(v) for k, v in group.items()})
-                continue
+                    rate_dict['load_interval'] = load_interval
+                    rate_dict['in_rate'] = in_rate
+                    rate_dict['in_rate_pkts'] = in_rate_pkts                    
+                    break
+
+                # 5 minute output rate 0 bits/sec, 0 packets/sec
+                elif name == 'p24':
+                    group = m.groupdict()
+                    out_rate = int(group['out_rate'])
+                    out_rate_pkts = int(group['out_rate_pkts'])
+
+                    rate_dict = intf_dict.setdefault('counters', {}).setdefault('rate', {})
+                    rate_dict['out_rate'] = out_rate
+                    rate_dict['out_rate_pkts'] = out_rate_pkts
+                    break
+
+                # 0 packets input, 0 bytes
+                # 0 packets input, 0 bytes, 0 total input drops
+                elif name == 'p25':
+                    group = m.groupdict()
+                    counter_dict = intf_dict.setdefault('counters', {})
+                    for k, v in group.items():
+                        if v:
+                            counter_dict.update({k: int(v)})
+                    break
+
+                # 1258859 drops for unrecognized upper-level protocol
+                elif name == 'p26':
+                    counter_dict['in_unknown_protos'] = int(m.groupdict()['in_unknown_protos'])
+                    break
+
+                # 0 input drops, 0 queue drops, 0 input errors
+                elif name == 'p27':
+                    group = m.groupdict()
+                    counter_dict.update({k: int(v) for k, v in group.items()})
+                    break
+
+                # Received 0 broadcast packets, 0 multicast packets
+                elif name == 'p28':
+                    group = m.groupdict()
+                    counter_dict.update({k: int(v) for k, v in group.items()})
+                    break
+
+                # 0 runts, 0 giants, 0 throttles, 0 parity
+                elif name == 'p29':
+                    group = m.groupdict()
+                    counter_dict.update({k: int(v) for k, v in group.items()})
+                    break
+
+                # 0 input errors, 0 CRC, 0 frame, 0 overrun, 0 ignored, 0 abort
+                elif name == 'p30':
+                    group = m.groupdict()
+                    counter_dict.update({k: int(v) for k, v in group.items()})
+                    break
+
+                # 0 packets output, 0 bytes
+                # 0 packets output, 0 bytes, 0 total output drops
+                elif name == 'p31':
+                    group = m.groupdict()
+                    for k, v in group.items():
+                        if v:
+                            counter_dict.update({k: int(v)})
+                    break
+
+                # Output 0 broadcast packets, 178045 multicast packets
+                elif name == 'p32':
+                    group = m.groupdict()
+                    counter_dict.update({k: int(v) for k, v in group.items()})
+                    break
+
+
+                # 0 output errors, 0 underruns, 0 applique, 0 resets
+                elif name == 'p33':
+                    group = m.groupdict()
+                    counter_dict.update({k: int(v) for k, v in group.items()})
+                    break
+
+                # 0 output drops, 0 queue drops, 0 output errors
+                elif name == 'p34':
+                    group = m.groupdict()
+                    counter_dict.update({k: int(v) for k, v in group.items()})
+                    break
+
+                # 0 output buffer failures, 0 output buffers swapped out
+                elif name == 'p35':
+                    group = m.groupdict()
+                    counter_dict.update({k: int(v) for k, v in group.items()})
+                    break
+
+                # 0 carrier transitions
+                elif name == 'p36':
+                    group = m.groupdict()
+                    counter_dict.update({k: int(v) for k, v in group.items()})
+                    break
 
         return result_dict
         
@@ -26,6 +26,7 @@ from netaddr import IPAddress, IPNetwork
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.records import RecordIterator, RecordSplitter
 
 #============================================
 # Schema for 'show isis fast-reroute summary'
@@ -3549,13 +3550,19 @@ class ShowIsisDatabaseDetailSchema(MetaParser):
     }
 
 
-class ShowIsisDatabaseDetail(ShowIsisDatabaseDetailSchema):
+class ShowIsisDatabaseDetail(RecordIterator, ShowIsisDatabaseDetailSchema):
     ''' Parser for commands:
        * show isis database detail
     '''
 
     cli_command = 'show isis database detail'
 
+    # IS-IS test (Level-1) Link State Database
+    #   R3.00-00            * 0x0000000d    0x0476        578  /*            1/0/0
+    records = RecordSplitter(
+        start=r'^[\w\-\.]+( *\*)? +\w+ +\w+ +(\d+|\*)( *\/(\d+|\*))? +\d+\/\d+\/\d+$',
+        context=(r'IS\-IS\s+(\S+)?\s*\(*Level\-\d+\)*\s+Link\s+State\s+Database',))
+
     def cli(self, output=None):
 
         if not output:
@@ -29,6 +29,8 @@ import re
 from genie.metaparser import MetaParser
 from pyats.utils.exceptions import SchemaError
 from genie.metaparser.util.schemaengine import Any, Optional, Use, Schema
+from genie.libs.parser.utils.patterns import PatternTable
+from genie.libs.parser.utils.validation import CompiledSchema
 '''
 Schema for:
     * show route table {table}
@@ -292,81 +294,81 @@ class ShowRouteSchema(MetaParser):
             }
         }
     """
+    # Create nh-list Entry Schema
+    nh_schema = CompiledSchema({
+            Optional("mpls-label"): str,
+            Optional("selected-next-hop"): str,
+            Optional("nh-local-interface"): str,
+            Optional("nh-table"): str,
+            Optional("to"): str,
+            Optional("via"): str
+        })
+
+    def validate_nh_list(value):
+        # Pass nh list of dict in value
+        if not isinstance(value, list):
+            raise SchemaError('nh list is not a list')
+        # Validate each dictionary in list
+        for item in value:
+            ShowRouteSchema.nh_schema.validate(item)
+        return value
+
+    # Create rt-list Entry Schema
+    rt_schema = CompiledSchema({
+            Optional("@junos:style"): str,
+            Optional("rt-destination"): str,
+            "rt-entry": {
+                Optional("active-tag"): str,
+                "age": {
+                    "#text": str,
+                    Optional("@junos:seconds"): str
+                },
+                Optional('as-path'): str,
+                Optional("current-active"): str,
+                Optional("last-active"): str,
+                Optional("learned-from"): str,
+                Optional("local-preference"): str,
+                Optional("peer-id"): str,
+                Optional("med"): str,
+                Optional("metric"): str,
+                Optional("metric2"): str,
+                Optional("nh"): Use(validate_nh_list),
+                Optional('nh-type'): str,
+                "preference": str,
+                Optional("preference2"): str,
+                "protocol-name": str,
+                Optional('rt-tag'): str,
+                Optional("validation-state"): str
+            }
+        })
+
+    def validate_rt_list(value):
+        # Pass rt list of dict in value
+        if not isinstance(value, list):
+            raise SchemaError('rt list is not a list')
+        # Validate each dictionary in list
+        for item in value:
+            ShowRouteSchema.rt_schema.validate(item)
+        return value
+
+    # Create RouteEntry Schema
+    route_entry_schema = CompiledSchema({
+            "active-route-count": str,
+            "destination-count": str,
+            "hidden-route-count": str,
+            "holddown-route-count": str,
+            Optional("rt"): Use(validate_rt_list),
+            "table-name": str,
+            "total-route-count": str
+        })
+
     def validate_route_table_list(value):
         # Pass route-table list of dict in value
         if not isinstance(value, list):
             raise SchemaError('route-table is not a list')
-        
-        def validate_rt_list(value):
-            # Pass rt list of dict in value
-            if not isinstance(value, list):
-                raise SchemaError('rt list is not a list')
-            
-            def validate_nh_list(value):
-                # Pass nh list of dict in value
-                if not isinstance(value, list):
-                    raise SchemaError('nh list is not a list')
-                # Create nh-list Entry Schema
-                nh_schema = Schema({
-                            Optional("mpls-label"): str,
-                            Optional("selected-next-hop"): str,
-                            Optional("nh-local-interface"): str,
-                            Optional("nh-table"): str,
-                            Optional("to"): str,
-                            Optional("via"): str
-                        })
-                # Validate each dictionary in list
-                for item in value:
-                    nh_schema.validate(item)
-                return value
-
-            # Create rt-list Entry Schema
-            rt_schema = Schema({
-                    Optional("@junos:style"): str,
-                    Optional("rt-destination"): str,
-                    "rt-entry": {
-                        Optional("active-tag"): str,
-                        "age": {
-                            "#text": str,
-                            Optional("@junos:seconds"): str
-                        },
-                        Optional('as-path'): str,
-                        Optional("current-active"): str,
-                        Optional("last-active"): str,
-                        Optional("learned-from"): str,
-                        Optional("local-preference"): str,
-                        Optional("peer-id"): str,
-                        Optional("med"): str,
-                        Optional("metric"): str,
-                        Optional("metric2"): str,
-                        Optional("nh"): Use(validate_nh_list),
-                        Optional('nh-type'): str,
-                        "preference": str,
-                        Optional("preference2"): str,
-                        "protocol-name": str,
-                        Optional('rt-tag'): str,
-                        Optional("validation-state"): str
-                    }
-                })
-            # Validate each dictionary in list
-            for item in value:
-                rt_schema.validate(item)
-            return value
-
-
-        # Create RouteEntry Schema
-        route_entry_schema = Schema({
-                "active-route-count": str,
-                "destination-count": str,
-                "hidden-route-count": str,
-                "holddown-route-count": str,
-                Optional("rt"): Use(validate_rt_list),
-                "table-name": str,
-                "total-route-count": str
-            })
         # Validate each dictionary in list
         for item in value:
-            route_entry_schema.validate(item)
+            ShowRouteSchema.route_entry_schema.validate(item)
         return value
 
     # Main Schema
@@ -712,180 +714,173 @@ class ShowRouteProtocolExtensiveSchema(MetaParser):
             }
         }
     """
+    # Create nh Schema, of the rt-entry and of its protocol-nh
+    nh_schema = CompiledSchema({
+        Optional("@junos:indent"): str,
+        Optional("label-element"): str,
+        Optional("label-element-childcount"): str,
+        Optional("label-element-lspid"): str,
+        Optional("label-element-parent"): str,
+        Optional("label-element-refcount"): str,
+        Optional("label-ttl-action"): str,
+        Optional("load-balance-label"): str,
+        Optional("mpls-label"): str,
+        Optional("nh-string"): str,
+        Optional("selected-next-hop"): str,
+        Optional("session"): str,
+        Optional("to"): str,
+        Optional("via"): str,
+        Optional("weight"): str
+    })
+
+    def validate_nh_list(value):
+        # Pass nh list of dict in value
+        if not isinstance(value, list):
+            raise SchemaError('nh is not a list')
+        # Validate each dictionary in list
+        for item in value:
+            ShowRouteProtocolExtensiveSchema.nh_schema.validate(item)
+        return value
+
+    def validate_protocol_nh_nh_list(value):
+        # Pass nh list of dict in value
+        if isinstance(value, dict):
+            value = [value]
+        if not isinstance(value, list):
+            raise SchemaError('nh is not a list')
+        # Validate each dictionary in list
+        for item in value:
+            ShowRouteProtocolExtensiveSchema.nh_schema.validate(item)
+        return value
+
+    # Create protocol-nh Schema
+    protocol_nh_schema = CompiledSchema({
+        Optional("@junos:indent"): str,
+        Optional("forwarding-nh-count"): str,
+        "indirect-nh": str,
+        Optional("label-ttl-action"): str,
+        Optional("load-balance-label"): str,
+        Optional("metric"): str,
+        Optional("mpls-label"): str,
+        Optional("nh"): Use(validate_protocol_nh_nh_list),
+        Optional("nh-index"): str,
+        Optional("nh-type"): str,
+        Optional("output"): str,
+        "to": str
+    })
+
+    def validate_protocol_nh_list(value):
+        # Pass nh list of dict in value
+        if isinstance(value, dict):
+            value = [value]
+        if not isinstance(value, list):
+            raise SchemaError('protocol-nh is not a list')
+        # Validate each dictionary in list
+        for item in value:
+            ShowRouteProtocolExtensiveSchema.protocol_nh_schema.validate(item)
+        return value
+
+    # Create rt-entry Schema
+    rt_entry_schema = CompiledSchema({
+        Optional("accepted"): str,
+        Optional("active-tag"): str,
+        Optional("age"): {
+            "#text": str,
+            Optional("@junos:seconds"): str
+        },
+        Optional("announce-bits"): str,
+        Optional("announce-tasks"): str,
+        Optional("as-path"): str,
+        Optional("cluster-list"): str,
+        Optional("bgp-rt-flag"): str,
+        Optional("bgp-path-attributes"): {
+            "attr-as-path-effective": {
+                "aspath-effective-string": str,
+                "attr-value": str
+            }
+        },
+        Optional("current-active"): str,
+        Optional("inactive-reason"): str,
+        Optional("last-active"): str,
+        Optional("local-as"): str,
+        Optional("local-preference"): str,
+        Optional("peer-as"): str,
+        Optional("metric"): str,
+        Optional("metric2"): str,
+        Optional("nh"): Use(validate_nh_list),
+        Optional("nh-address"): str,
+        Optional("nh-index"): str,
+        Optional("nh-kernel-id"): str,
+        Optional("nh-reference-count"): str,
+        Optional("gateway"): str,
+        Optional("nh-type"): str,
+        Optional("preference"): str,
+        Optional("preference2"): str,
+        Optional("protocol-name"): str,
+        Optional("protocol-nh"): Use(validate_protocol_nh_list),
+        Optional("rt-entry-state"): str,
+        Optional("rt-ospf-area"): str,
+        Optional("rt-tag"): str,
+        Optional("peer-id"): str,
+        Optional("task-name"): str,
+        Optional("validation-state"): str
+    })
+
+    def validate_rt_entry_list(value):
+        if isinstance(value, dict):
+            value = [value]
+        if not isinstance(value, list):
+            raise SchemaError('rt-entry is not a list')
+        # Validate each dictionary in list
+        for item in value:
+            ShowRouteProtocolExtensiveSchema.rt_entry_schema.validate(item)
+        return value
+
+    # Create rt Schema
+    rt_schema = CompiledSchema({
+        Optional("@junos:style"): str,
+        "rt-announced-count": str,
+        "rt-destination": str,
+        Optional("rt-entry"): Use(validate_rt_entry_list),
+        "rt-entry-count": {
+            "#text": str,
+            Optional("@junos:format"): str
+        },
+        Optional("rt-prefix-length"): str,
+        Optional("rt-state"): str,
+        Optional("tsi"): {
+            "#text": str,
+            Optional("@junos:indent"): str
+        }
+    })
+
+    def validate_rt_list(value):
+        # Pass rt list of dict in value
+        if not isinstance(value, list):
+            raise SchemaError('rt is not a list')
+        # Validate each dictionary in list
+        for item in value:
+            ShowRouteProtocolExtensiveSchema.rt_schema.validate(item)
+        return value
+
+    # Create Route Table Schema
+    route_table_schema = CompiledSchema({
+        "active-route-count": str,
+        "destination-count": str,
+        "hidden-route-count": str,
+        "holddown-route-count": str,
+        Optional("rt"): Use(validate_rt_list),
+        "table-name": str,
+        "total-route-count": str
+    })
+
     def validate_route_table_list(value):
         # Pass route-table list of dict in value
         if not isinstance(value, list):
             raise SchemaError('route-table is not a list')
-        
-        def validate_rt_list(value):
-            # Pass rt list of dict in value
-            if not isinstance(value, list):
-                raise SchemaError('rt is not a list')
-            def validate_rt_entry_list(value):
-                if isinstance(value, dict):
-                    value = [value]
-                if not isinstance(value, list):
-                    raise SchemaError('rt-entry is not a list')
-                def validate_nh_list(value):
-                    # Pass nh list of dict in value
-                    if not isinstance(value, list):
-                        raise SchemaError('nh is not a list')
-                    nh_schema = Schema({
-                        Optional("@junos:indent"): str,
-                        Optional("label-element"): str,
-                        Optional("label-element-childcount"): str,
-                        Optional("label-element-lspid"): str,
-                        Optional("label-element-parent"): str,
-                        Optional("label-element-refcount"): str,
-                        Optional("label-ttl-action"): str,
-                        Optional("load-balance-label"): str,
-                        Optional("mpls-label"): str,
-                        Optional("nh-string"): str,
-                        Optional("selected-next-hop"): str,
-                        Optional("session"): str,
-                        Optional("to"): str,
-                        Optional("via"): str,
-                        Optional("weight"): str
-                    })
-                    # Validate each dictionary in list
-                    for item in value:
-                        nh_schema.validate(item)
-                    return value
-                def validate_protocol_nh_list(value):
-                    # Pass nh list of dict in value
-                    if isinstance(value, dict):
-                        value = [value]
-                    if not isinstance(value, list):
-                        raise SchemaError('protocol-nh is not a list')
-                    def validate_nh_list(value):
-                        # Pass nh list of dict in value
-                        if isinstance(value, dict):
-                            value = [value]
-                        if not isinstance(value, list):
-                            raise SchemaError('nh is not a list')
-                        nh_schema = Schema({
-                            Optional("@junos:indent"): str,
-                            Optional("label-element"): str,
-                            Optional("label-element-childcount"): str,
-                            Optional("label-element-lspid"): str,
-                            Optional("label-element-parent"): str,
-                            Optional("label-element-refcount"): str,
-                            Optional("label-ttl-action"): str,
-                            Optional("load-balance-label"): str,
-                            Optional("mpls-label"): str,
-                            Optional("nh-string"): str,
-                            Optional("selected-next-hop"): str,
-                            Optional("session"): str,
-                            Optional("to"): str,
-                            Optional("via"): str,
-                            Optional("weight"): str
-                        })
-                        # Validate each dictionary in list
-                        for item in value:
-                            nh_schema.validate(item)
-                        return value
-                    protocol_nh_schema = Schema({
-                        Optional("@junos:indent"): str,
-                        Optional("forwarding-nh-count"): str,
-                        "indirect-nh": str,
-                        Optional("label-ttl-action"): str,
-                        Optional("load-balance-label"): str,
-                        Optional("metric"): str,
-                        Optional("mpls-label"): str,
-                        Optional("nh"): Use(validate_nh_list),
-                        Optional("nh-index"): str,
-                        Optional("nh-type"): str,
-                        Optional("output"): str,
-                        "to": str
-                    })
-                    # Validate each dictionary in list
-                    for item in value:
-                        protocol_nh_schema.validate(item)
-                    return value
-                rt_entry_schema = Schema({
-                    Optional("accepted"): str,
-                    Optional("active-tag"): str,
-                    Optional("age"): {
-                        "#text": str,
-                        Optional("@junos:seconds"): str
-                    },
-                    Optional("announce-bits"): str,
-                    Optional("announce-tasks"): str,
-                    Optional("as-path"): str,
-                    Optional("cluster-list"): str,
-                    Optional("bgp-rt-flag"): str,
-                    Optional("bgp-path-attributes"): {
-                        "attr-as-path-effective": {
-                            "aspath-effective-string": str,
-                            "attr-value": str
-                        }
-                    },
-                    Optional("current-active"): str,
-                    Optional("inactive-reason"): str,
-                    Optional("last-active"): str,
-                    Optional("local-as"): str,
-                    Optional("local-preference"): str,
-                    Optional("peer-as"): str,
-                    Optional("metric"): str,
-                    Optional("metric2"): str,
-                    Optional("nh"): Use(validate_nh_list),
-                    Optional("nh-address"): str,
-                    Optional("nh-index"): str,
-                    Optional("nh-kernel-id"): str,
-                    Optional("nh-reference-count"): str,
-                    Optional("gateway"): str,
-                    Optional("nh-type"): str,
-                    Optional("preference"): str,
-                    Optional("preference2"): str,
-                    Optional("protocol-name"): str,
-                    Optional("protocol-nh"): Use(validate_protocol_nh_list),
-                    Optional("rt-entry-state"): str,
-                    Optional("rt-ospf-area"): str,
-                    Optional("rt-tag"): str,
-                    Optional("peer-id"): str,
-                    Optional("task-name"): str,
-                    Optional("validation-state"): str
-                })
-                # Validate each dictionary in list
-                for item in value:
-                    rt_entry_schema.validate(item)
-                return value
-
-            # Create rt Schema
-            rt_schema = Schema({
-                Optional("@junos:style"): str,
-                "rt-announced-count": str,
-                "rt-destination": str,
-                Optional("rt-entry"): Use(validate_rt_entry_list),
-                "rt-entry-count": {
-                    "#text": str,
-                    Optional("@junos:format"): str
-                },
-                Optional("rt-prefix-length"): str,
-                Optional("rt-state"): str,
-                Optional("tsi"): {
-                    "#text": str,
-                    Optional("@junos:indent"): str
-                }
-            })
-            # Validate each dictionary in list
-            for item in value:
-                rt_schema.validate(item)
-            return value
-
-        # Create Route Table Schema
-        route_table_schema = Schema({
-            "active-route-count": str,
-            "destination-count": str,
-            "hidden-route-count": str,
-            "holddown-route-count": str,
-            Optional("rt"): Use(validate_rt_list),
-            "table-name": str,
-            "total-route-count": str
-        })
         # Validate each dictionary in list
         for item in value:
-            route_table_schema.validate(item)
+            ShowRouteProtocolExtensiveSchema.route_table_schema.validate(item)
         return value
 
     # Main Schema
@@ -914,169 +909,132 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
                     'show route extensive',
                     'show route extensive {destination}',
                     'show route protocol {protocol} {destination} extensive']
-    def cli(self, protocol=None, table=None, 
-            destination=None, route=None, 
-            output=None):
-        if not output:
-            if protocol and table and destination:
-                cmd = self.cli_command[2].format(
-                    protocol=protocol,
-                    table=table,
-                    destination=destination)
-            elif protocol and destination:
-                cmd = self.cli_command[6].format(
-                    protocol=protocol,
-                    destination=destination)
-            elif table and protocol:
-                cmd = self.cli_command[1].format(
-                    protocol=protocol,
-                    table=table)
-            elif protocol:
-                cmd = self.cli_command[0].format(
-                    protocol=protocol)
-            elif route:
-                cmd = self.cli_command[3].format(
-                    route=route)
-            elif destination:
-                cmd = self.cli_command[5].format(
-                    destination=destination)
-            else:
-                cmd = self.cli_command[4]
-            out = self.device.execute(cmd)
-        else:
-            out = output
-
-        ret_dict = {}
-        state_type = None
-        forwarding_nh_count = None
-        protocol_nh_found = None
-        originating_rib_found = None
-
+    patterns = PatternTable(
         # inet.0: 929 destinations, 1615 routes (929 active, 0 holddown, 0 hidden)
-        p1 = re.compile(r'^(?P<table_name>\S+): +(?P<destination_count>\d+) +'
-                        r'destinations, +(?P<total_route_count>\d+) +routes +'
-                        r'\((?P<active_route_count>\d+) +active, +(?P<holddown_route_count>\d+) +'
-                        r'holddown, +(?P<hidden_route_count>\d+) +hidden\)$')
+        p1=r'^(?P<table_name>\S+): +(?P<destination_count>\d+) +'
+           r'destinations, +(?P<total_route_count>\d+) +routes +'
+           r'\((?P<active_route_count>\d+) +active, +(?P<holddown_route_count>\d+) +'
+           r'holddown, +(?P<hidden_route_count>\d+) +hidden\)$',
 
         # 0.0.0.0/0 (1 entry, 1 announced)
         # 10.1.0.0/24 (2 entries, 1 announced)
         # 0.0.0.0 (1 entry, 1 announced)
-        p2 = re.compile(r'^(?P<rt_destination>\S+)(\/(?P<rt_prefix_length>\d+))? +'
-                        r'\((?P<format>(?P<text>\d+) +(entry|entries)), +(?P<announced>\d+) +announced\)$')
+        p2=r'^(?P<rt_destination>\S+)(\/(?P<rt_prefix_length>\d+))? +'
+           r'\((?P<format>(?P<text>\d+) +(entry|entries)), +(?P<announced>\d+) +announced\)$',
 
         # State: <FlashAll>
         # State: <Active Int Ext>
-        p3 = re.compile(r'State: +\<(?P<rt_state>[\S\s]+)\>$')
+        p3=r'State: +\<(?P<rt_state>[\S\s]+)\>$',
 
         # *OSPF   Preference: 150/10
         # *BGP    Preference: 170/-121
-        p4 = re.compile(r'^(?P<active_tag>\*)?(?P<protocol>\S+)\s+'
-                        r'Preference:\s+(?P<preference>\d+)(\/(\-)?(?P<preference2>\d+))?$')
+        p4=r'^(?P<active_tag>\*)?(?P<protocol>\S+)\s+'
+           r'Preference:\s+(?P<preference>\d+)(\/(\-)?(?P<preference2>\d+))?$',
 
         # Next hop type: Router, Next hop index: 613
-        p5 = re.compile(r'^Next +hop type: +(?P<nh_type>\S+), +Next +hop +'
-                        r'index: +(?P<nh_index>\d+)$')
+        p5=r'^Next +hop type: +(?P<nh_type>\S+), +Next +hop +'
+           r'index: +(?P<nh_index>\d+)$',
 
         # Address: 0xdfa7934
-        p6 = re.compile(r'^Address: +(?P<nh_address>\S+)$')
+        p6=r'^Address: +(?P<nh_address>\S+)$',
 
         # Next-hop reference count: 458
-        p7 = re.compile(r'^Next-hop +reference +count: +(?P<nh_reference_count>\d+)$')
+        p7=r'^Next-hop +reference +count: +(?P<nh_reference_count>\d+)$',
 
         # Source: 10.16.2.2
-        p7_1 = re.compile(r'^Source: +(?P<gateway>\S+)$')
+        p7_1=r'^Source: +(?P<gateway>\S+)$',
 
         # Next hop: 10.169.14.121 via ge-0/0/1.0 weight 0x1, selected
         # Nexthop: 10.169.14.121 via ge-0/0/1.0
-        p8 = re.compile(r'^(?P<nh_string>Next *hop):( +(?P<to>\S+))? +via +(?P<via>\S+)'
-                        r'( +weight +(?P<weight>\w+))?(, +(?P<selected_next_hop>\w+))?$')
+        p8=r'^(?P<nh_string>Next *hop):( +(?P<to>\S+))? +via +(?P<via>\S+)'
+           r'( +weight +(?P<weight>\w+))?(, +(?P<selected_next_hop>\w+))?$',
 
         # Protocol next hop: 10.169.14.240
-        p8_1 = re.compile(r'^Protocol +next +hop: +(?P<to>\S+)( +Metric: +(?P<metric>\d+))?$')
+        p8_1=r'^Protocol +next +hop: +(?P<to>\S+)( +Metric: +(?P<metric>\d+))?$',
 
         # Session Id: 0x141
-        p9 = re.compile(r'^Session +Id: +\d+[a-z]+(?P<session_id>\w+)$')
+        p9=r'^Session +Id: +\d+[a-z]+(?P<session_id>\w+)$',
 
-        # Local AS: 65171 
+        # Local AS: 65171
         # Local AS: 65171 Peer AS: 65171
         # Local AS:     1 Peer AS:     3
-        p10 = re.compile(r'^Local +AS: +(?P<local_as>\d+)( +Peer +AS: +(?P<peer_as>\d+))?$')
+        p10=r'^Local +AS: +(?P<local_as>\d+)( +Peer +AS: +(?P<peer_as>\d+))?$',
 
-        # Age: 3w2d 4:43:35   Metric: 101 
+        # Age: 3w2d 4:43:35   Metric: 101
         # Age: 3:07:25    Metric: 200
         # Age: 29w6d 21:42:46
-        p11 = re.compile(r'^Age:\s+(?P<age>(\w+(\s+\S+)?)|[\d:]+)(\s+Metric:\s+(?P<metric>\d+))?$')
+        p11=r'^Age:\s+(?P<age>(\w+(\s+\S+)?)|[\d:]+)(\s+Metric:\s+(?P<metric>\d+))?$',
 
         # Age: 12 Metric2: 50
-        p11_2 = re.compile(r'^Age:\s+(?P<age>(\w+(\s+\S+)?)|[\d:]+)(\s+Metric2:\s+(?P<metric2>\d+))?$')
+        p11_2=r'^Age:\s+(?P<age>(\w+(\s+\S+)?)|[\d:]+)(\s+Metric2:\s+(?P<metric2>\d+))?$',
 
-        # Validation State: unverified 
-        p12 = re.compile(r'^Validation +State: +(?P<validation_state>\S+)$')
+        # Validation State: unverified
+        p12=r'^Validation +State: +(?P<validation_state>\S+)$',
+
+        # Tag: 0
+        p13=r'^Tag: +(?P<rt_tag>\d+)$',
 
-        # Tag: 0 
-        p13 = re.compile(r'^Tag: +(?P<rt_tag>\d+)$')
-        
         # Task: OSPF
-        p14 = re.compile(r'^Task: +(?P<task>\S+)$')
+        p14=r'^Task: +(?P<task>\S+)$',
 
-        # Announcement bits (3): 0-KRT 5-LDP 7-Resolve tree 3 
-        p15 = re.compile(r'^Announcement +bits +\((?P<announce_bits>\d+)\): +'
-                         r'(?P<announce_tasks>[\S\s]+)$')
+        # Announcement bits (3): 0-KRT 5-LDP 7-Resolve tree 3
+        p15=r'^Announcement +bits +\((?P<announce_bits>\d+)\): +'
+            r'(?P<announce_tasks>[\S\s]+)$',
 
-        # AS path: I 
+        # AS path: I
         # AS path: 30000 4 103 104 105 106 107 108 109 I
         # AS path: I (Originator) Cluster list:  0.0.0.1 0.0.0.2 0.0.0.4
-        p16 = re.compile(r'^(?P<aspath_effective_string>AS +path:) '
-                         r'+((?P<attr_value>[\S\s]+) +Cluster +list: '
-                         r'(?P<cluster_list>[\d\.\s]+)|(?P<attr_value2>[\S\s]+))$')
+        p16=r'^(?P<aspath_effective_string>AS +path:) '
+            r'+((?P<attr_value>[\S\s]+) +Cluster +list: '
+            r'(?P<cluster_list>[\d\.\s]+)|(?P<attr_value2>[\S\s]+))$',
 
         # Accepted Multipath
-        p16_1 = re.compile(r'^Accepted +(?P<accepted>\S+)$')
+        p16_1=r'^Accepted +(?P<accepted>\S+)$',
 
         # KRT in-kernel 0.0.0.0/0 -> {10.169.14.121}
-        p17 = re.compile(r'^(?P<text>KRT +in-kernel+[\S\s]+)$')
+        p17=r'^(?P<text>KRT +in-kernel+[\S\s]+)$',
 
         # Inactive reason: Route Preference
-        p18 = re.compile(r'^Inactive\s+reason: +(?P<inactive_reason>[\S\s]+)$')
+        p18=r'^Inactive\s+reason: +(?P<inactive_reason>[\S\s]+)$',
 
         # Area: 0.0.0.8
-        p19 = re.compile(r'^Area: +(?P<rt_ospf_area>\S+)$')
+        p19=r'^Area: +(?P<rt_ospf_area>\S+)$',
 
         # Label operation: Push 17000
         # Label operation: Push 17000, Push 1650, Push 1913(top)
-        p20 = re.compile(r'^Label +operation: +(?P<mpls_label>[\S\s]+)$')
+        p20=r'^Label +operation: +(?P<mpls_label>[\S\s]+)$',
 
         # Label TTL action: no-prop-ttl
         # Label TTL action: no-prop-ttl, no-prop-ttl, no-prop-ttl(top)
-        p21 = re.compile(r'^Label +TTL +action: +(?P<label_ttl_action>[\S\s]+)$')
+        p21=r'^Label +TTL +action: +(?P<label_ttl_action>[\S\s]+)$',
 
         # Load balance label: Label 17000: None; Label 1650: None; Label 1913: None;
-        p22 = re.compile(r'^Load +balance +label: +(?P<load_balance_label>[\S\s]+)$')
+        p22=r'^Load +balance +label: +(?P<load_balance_label>[\S\s]+)$',
 
         # Label element ptr: 0xc5f6ec0
-        p23 = re.compile(r'^Label +element +ptr: +(?P<label_element>\S+)$')
+        p23=r'^Label +element +ptr: +(?P<label_element>\S+)$',
 
         # Label parent element ptr: 0x0
-        p24 = re.compile(r'^Label +parent +element +ptr: +(?P<label_element_parent>\S+)$')
-        
+        p24=r'^Label +parent +element +ptr: +(?P<label_element_parent>\S+)$',
+
         # Label element references: 2
-        p25 = re.compile(r'^Label +element +references: +(?P<label_element_refcount>\d+)$')
+        p25=r'^Label +element +references: +(?P<label_element_refcount>\d+)$',
 
         # Label element child references: 1
-        p26 = re.compile(r'^Label +element +child +references: +(?P<label_element_childcount>\d+)$')
+        p26=r'^Label +element +child +references: +(?P<label_element_childcount>\d+)$',
 
         # Label element lsp id: 0
-        p27 = re.compile(r'^Label +element +lsp +id: +(?P<label_element_lspid>\d+)$')
+        p27=r'^Label +element +lsp +id: +(?P<label_element_lspid>\d+)$',
 
         # Task: OSPF3 I/O./var/run/ppmd_control
-        p28 = re.compile(r'^Task: +(?P<task_name>[\S\s]+)$')
+        p28=r'^Task: +(?P<task_name>[\S\s]+)$',
 
         # OSPF3 realm ipv6-unicast area : 0.0.0.0, LSA ID : 0.0.0.1, LSA type : Extern
-        p29 = re.compile(r'^OSPF3\s+realm\s+ipv6-unicast\s+area\s:[\S\s]+$')
+        p29=r'^OSPF3\s+realm\s+ipv6-unicast\s+area\s:[\S\s]+$',
 
         # Page 0 idx 1, (group hktGCS002 type Internal) Type 1 val 0x10c0b9b0 (adv_entry)
-        p30 = re.compile(r'^Page +\d+ +idx +\d+[\S\s]+$')
-        
+        p30=r'^Page +\d+ +idx +\d+[\S\s]+$',
+
         # Advertised metrics:
         #     Flags: Nexthop Change
         #     Nexthop: Self
@@ -1087,34 +1045,75 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
         # Path 10.220.0.0
         # from 10.169.14.240
         # Vector len 4.  Val: 1
-        p31 = re.compile(r'^(Advertised +metrics:)|'
-                         r'(Flags: +)|(Nexthop: +)|(MED: +)|'
-                         r'(Localpref: +)|(AS +path:)|(Communities:)|'
-                         r'(Path +\S+)|(from +\S+)|(Vector +len)')
-        
+        p31=r'^(Advertised +metrics:)|'
+            r'(Flags: +)|(Nexthop: +)|(MED: +)|'
+            r'(Localpref: +)|(AS +path:)|(Communities:)|'
+            r'(Path +\S+)|(from +\S+)|(Vector +len)',
+
         # Indirect next hop: 0xc285884 1048574 INH Session ID: 0x1ac
-        p32 = re.compile(r'^Indirect +next +hop: +(?P<indirect_nh>[\S\s]+)$')
+        p32=r'^Indirect +next +hop: +(?P<indirect_nh>[\S\s]+)$',
 
         # Indirect next hops: 1
-        p33 = re.compile(r'^Indirect +next +hops: +(?P<forwarding_nh_count>\d+)$')
+        p33=r'^Indirect +next +hops: +(?P<forwarding_nh_count>\d+)$',
 
         # 10.169.14.240/32 Originating RIB: inet.0
-        p34 = re.compile(r'^\S+ +Originating +RIB: +[\S\s]+$')
+        p34=r'^\S+ +Originating +RIB: +[\S\s]+$',
 
         # Node path count: 1
         # Forwarding nexthops: 1
-        p35 = re.compile(r'^(Node +path +count: +)|(Forwarding +nexthops: +)[\S\s]+$')
+        p35=r'^(Node +path +count: +)|(Forwarding +nexthops: +)[\S\s]+$',
 
         # Cluster list:  10.16.2.2 10.64.4.4
-        p36 = re.compile(r'^Cluster +list: +(?P<cluster_list>[\S\s]+)$')
+        p36=r'^Cluster +list: +(?P<cluster_list>[\S\s]+)$',
 
         # Router ID: 10.16.2.2
-        p37 = re.compile(r'^Router +ID: +(?P<peer_id>\S+)$')
+        p37=r'^Router +ID: +(?P<peer_id>\S+)$',
+    )
+
+    def cli(self, protocol=None, table=None, 
+            destination=None, route=None, 
+            output=None):
+        if not output:
+            if protocol and table and destination:
+                cmd = self.cli_command[2].format(
+                    protocol=protocol,
+                    table=table,
+                    destination=destination)
+            elif protocol and destination:
+                cmd = self.cli_command[6].format(
+                    protocol=protocol,
+                    destination=destination)
+            elif table and protocol:
+                cmd = self.cli_command[1].format(
+                    protocol=protocol,
+                    table=table)
+            elif protocol:
+                cmd = self.cli_command[0].format(
+                    protocol=protocol)
+            elif route:
+                cmd = self.cli_command[3].format(
+                    route=route)
+            elif destination:
+                cmd = self.cli_command[5].format(
+                    destination=destination)
+            else:
+                cmd = self.cli_command[4]
+            out = self.device.execute(cmd)
+        else:
+            out = output
+
+        ret_dict = {}
+        state_type = None
+        forwarding_nh_count = None
+        protocol_nh_found = None
+        originating_rib_found = None
+
+        p = self.patterns
 
         for line in out.splitlines():
             line = line.strip()
             # inet.0: 929 destinations, 1615 routes (929 active, 0 holddown, 0 hidden)
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 route_table = ret_dict.setdefault('route-information', {}). \
@@ -1126,7 +1125,7 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
 
             # 0.0.0.0/0 (1 entry, 1 announced)
             # 10.1.0.0/24 (2 entries, 1 announced)
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 group = m.groupdict()
                 state_type = 'route_table'
@@ -1157,7 +1156,7 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
 
             # State: <FlashAll>
             # State: <Active Int Ext>
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 group = m.groupdict()
                 if state_type == 'route_table':
@@ -1167,7 +1166,7 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
                 continue
 
             # *OSPF   Preference: 150/10
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 group = m.groupdict()
                 state_type = 'protocol'
@@ -1200,7 +1199,7 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
                 continue
 
             # Next hop type: Router, Next hop index: 613
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 group = m.groupdict()
                 nh_type = group['nh_type']
@@ -1210,28 +1209,28 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
                 continue
 
             # Address: 0xdfa7934
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 group = m.groupdict()
                 rt_entry_dict.update({'nh-address': group['nh_address']})
                 continue
 
             # Next-hop reference count: 458
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 group = m.groupdict()
                 rt_entry_dict.update({'nh-reference-count': group['nh_reference_count']})
                 continue
 
             # Source: 10.16.2.2
-            m = p7_1.match(line)
+            m = p.p7_1.match(line)
             if m:
                 group = m.groupdict()
                 rt_entry_dict.update({'gateway': group['gateway']})
                 continue
                 
             # Next hop: 10.169.14.121 via ge-0/0/1.0 weight 0x1, selected
-            m = p8.match(line)
+            m = p.p8.match(line)
             if m:
                 group = m.groupdict()
                 if originating_rib_found:
@@ -1259,7 +1258,7 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
                 continue
             
             # Protocol Next hop: 10.169.14.121 via ge-0/0/1.0 weight 0x1, selected
-            m = p8_1.match(line)
+            m = p.p8_1.match(line)
             if m:
                 group = m.groupdict()
                 protocol_nh_found = True
@@ -1273,7 +1272,7 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
                 continue
 
             # Session Id: 0x141
-            m = p9.match(line)
+            m = p.p9.match(line)
             if m:
                 group = m.groupdict()
                 if originating_rib_found:
@@ -1289,7 +1288,7 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
             # Local AS: 65171 
             # Local AS: 65171 Peer AS: 65171
             # Local AS:     1 Peer AS:     3
-            m = p10.match(line)
+            m = p.p10.match(line)
             if m:
                 group = m.groupdict()
                 rt_entry_dict.update({'local-as': group['local_as']})
@@ -1298,7 +1297,7 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
                 continue
 
             # Age: 3w2d 4:43:35   Metric: 101 
-            m = p11.match(line)
+            m = p.p11.match(line)
             if m:
                 group = m.groupdict()
                 age_dict = rt_entry_dict.setdefault('age', {})
@@ -1309,7 +1308,7 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
                 continue
 
             # Age: 12 Metric2: 50
-            m = p11_2.match(line)
+            m = p.p11_2.match(line)
             if m:
                 group = m.groupdict()
                 age_dict = rt_entry_dict.setdefault('age', {})
@@ -1320,28 +1319,28 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
                 continue            
 
             # Validation State: unverified 
-            m = p12.match(line)
+            m = p.p12.match(line)
             if m:
                 group = m.groupdict()
                 rt_entry_dict.update({'validation-state': group['validation_state']})
                 continue
 
             # Tag: 0 
-            m = p13.match(line)
+            m = p.p13.match(line)
             if m:
                 group = m.groupdict()
                 rt_entry_dict.update({'rt-tag': group['rt_tag']})
                 continue
             
             # Task: OSPF
-            m = p14.match(line)
+            m = p.p14.match(line)
             if m:
                 group = m.groupdict()
                 rt_entry_dict.update({'task-name': group['task']})
                 continue
 
             # Announcement bits (3): 0-KRT 5-LDP 7-Resolve tree 3 
-            m = p15.match(line)
+            m = p.p15.match(line)
             if m:
                 group = m.groupdict()
                 rt_entry_dict.update({'announce-bits': group['announce_bits']})
@@ -1350,7 +1349,7 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
 
             # AS path: I 
             # AS path: I (Originator) Cluster list:  0.0.0.1 0.0.0.2 0.0.0.4
-            m = p16.match(line)
+            m = p.p16.match(line)
             if m:
                 rt_entry_exist = rt_dict.get('rt-entry', None)
                 if rt_entry_exist:
@@ -1367,14 +1366,14 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
                     continue
 
             # Accepted Multipath
-            m = p16_1.match(line)
+            m = p.p16_1.match(line)
             if m:
                 group = m.groupdict()
                 rt_entry_dict.update({'accepted': group['accepted']})
                 continue
 
             # KRT in-kernel 0.0.0.0/0 -> {10.169.14.121}
-            m = p17.match(line)
+            m = p.p17.match(line)
             if m:
                 group = m.groupdict()
                 tsi_dict = rt_dict.setdefault('tsi', {})
@@ -1382,14 +1381,14 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
                 continue
             
             # Inactive reason: Route Preference
-            m = p18.match(line)
+            m = p.p18.match(line)
             if m:
                 group = m.groupdict()
                 rt_entry_dict.update({'inactive-reason': group['inactive_reason']})
                 continue
             
             # Area: 0.0.0.8
-            m = p19.match(line)
+            m = p.p19.match(line)
             if m:
                 group = m.groupdict()
                 rt_entry_dict.update({'rt-ospf-area': group['rt_ospf_area']})
@@ -1397,7 +1396,7 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
 
             # Label operation: Push 17000
             # Label operation: Push 17000, Push 1650, Push 1913(top)
-            m = p20.match(line)
+            m = p.p20.match(line)
             if m:
                 group = m.groupdict()
                 if protocol_nh_found:
@@ -1410,7 +1409,7 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
 
             # Label TTL action: no-prop-ttl
             # Label TTL action: no-prop-ttl, no-prop-ttl, no-prop-ttl(top)
-            m = p21.match(line)
+            m = p.p21.match(line)
             if m:
                 group = m.groupdict()
                 if protocol_nh_found:
@@ -1422,7 +1421,7 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
                 continue
 
             # Load balance label: Label 17000: None; Label 1650: None; Label 1913: None;
-            m = p22.match(line)
+            m = p.p22.match(line)
             if m:
                 group = m.groupdict()
                 if protocol_nh_found:
@@ -1434,7 +1433,7 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
                 continue
 
             # Label element ptr: 0xc5f6ec0
-            m = p23.match(line)
+            m = p.p23.match(line)
             if m:
                 group = m.groupdict()
                 if protocol_nh_found:
@@ -1446,7 +1445,7 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
                 continue
 
             # Label parent element ptr: 0x0
-            m = p24.match(line)
+            m = p.p24.match(line)
             if m:
                 group = m.groupdict()
                 nh_dict.update({k.replace('_', '-'):
@@ -1454,7 +1453,7 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
                 continue
             
             # Label element references: 2
-            m = p25.match(line)
+            m = p.p25.match(line)
             if m:
                 group = m.groupdict()
                 nh_dict.update({k.replace('_', '-'):
@@ -1462,7 +1461,7 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
                 continue
 
             # Label element child references: 1
-            m = p26.match(line)
+            m = p.p26.match(line)
             if m:
                 group = m.groupdict()
                 nh_dict.update({k.replace('_', '-'):
@@ -1470,7 +1469,7 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
                 continue
 
             # Label element lsp id: 0
-            m = p27.match(line)
+            m = p.p27.match(line)
             if m:
                 group = m.groupdict()
                 nh_dict.update({k.replace('_', '-'):
@@ -1478,7 +1477,7 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
                 continue
 
             # Task: OSPF3 I/O./var/run/ppmd_control
-            m = p28.match(line)
+            m = p.p28.match(line)
             if m:
                 group = m.groupdict()
                 rt_entry_dict.update({k.replace('_', '-'):
@@ -1486,7 +1485,7 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
                 continue
             
             # OSPF3 realm ipv6-unicast area : 0.0.0.0, LSA ID : 0.0.0.1, LSA type : Extern
-            m = p29.match(line)
+            m = p.p29.match(line)
             if m:
                 group = m.groupdict()
                 tsi_dict = rt_dict.setdefault('tsi', {})
@@ -1495,7 +1494,7 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
                 continue
             
             # Page 0 idx 1, (group hktGCS002 type Internal) Type 1 val 0x10c0b9b0 (adv_entry)
-            m = p30.match(line)
+            m = p.p30.match(line)
             if m:
                 tsi_dict = rt_dict.setdefault('tsi', {})
                 group = m.groupdict()
@@ -1513,7 +1512,7 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
             # Path 10.220.0.0
             # from 10.169.14.240
             # Vector len 4.  Val: 1
-            m = p31.match(line)
+            m = p.p31.match(line)
             if m:
                 group = m.groupdict()
                 tsi_dict = rt_dict.setdefault('tsi', {})
@@ -1522,7 +1521,7 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
                 continue
 
             # Indirect next hop: 0xc285884 1048574 INH Session ID: 0x1ac
-            m = p32.match(line)
+            m = p.p32.match(line)
             if m:
                 group = m.groupdict()
                 protocol_nh_dict.update({k.replace('_', '-'):
@@ -1530,7 +1529,7 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
                 continue
 
             # Indirect next hops: 1
-            m = p33.match(line)
+            m = p.p33.match(line)
             if m:
                 group = m.groupdict()
                 protocol_nh_found = True
@@ -1538,7 +1537,7 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
                 continue
 
             # 10.169.14.240/32 Originating RIB: inet.0
-            m = p34.match(line)
+            m = p.p34.match(line)
             if m:
                 originating_rib_found = True
                 proto_output = protocol_nh_dict.get('output', '')
@@ -1548,7 +1547,7 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
 
             # Node path count: 1
             # Forwarding nexthops: 1
-            m = p35.match(line)
+            m = p.p35.match(line)
             if m:
                 proto_output = protocol_nh_dict.get('output', '')
                 proto_output = '{}{}\n'.format(proto_output, line)
@@ -1556,7 +1555,7 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
                 continue
 
             # Cluster list:  10.16.2.2 10.64.4.4
-            m = p36.match(line)
+            m = p.p36.match(line)
             if m:
                 group = m.groupdict()
                 if rt_dict.get('rt-entry', None):
@@ -1564,7 +1563,7 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
                 continue
             
             # Router ID: 10.16.2.2 
-            m = p37.match(line)
+            m = p.p37.match(line)
             if m:
                 group = m.groupdict()
                 rt_entry_dict.update({'peer-id': group['peer_id']})
@@ -2782,55 +2781,56 @@ class ShowRouteTableLabelSwitchedNameSchema(MetaParser):
         * show route table {table} label-switched-path {name}
     """
 
+    nh_schema = CompiledSchema({
+                Optional("selected-next-hop"): bool,
+                "to": str,
+                "via": str,
+                "lsp-name": str,
+            })
+
+    def validate_nh_schema(value):
+        if not isinstance(value, list):
+            raise SchemaError('nh schema is not a list')
+
+        for item in value:
+            ShowRouteTableLabelSwitchedNameSchema.nh_schema.validate(item)
+        return value
+
+    rt_entry_schema = CompiledSchema({
+                Optional("active-tag"): str,
+                Optional("current-active"): str,
+                Optional("last-active"): str,
+                "protocol-name": str,
+                "preference": str,
+                "preference2": str,
+                "age": {
+                    '#text': str,
+                    Optional('@junos:seconds'): str,
+                },
+                "metric": str,
+                "nh": Use(validate_nh_schema)
+            })
+
+    def validate_rt_entry_schema(value):
+        if not isinstance(value, list):
+            raise SchemaError('rt entry schema is not a list')
+
+        for item in value:
+            ShowRouteTableLabelSwitchedNameSchema.rt_entry_schema.validate(
+                item)
+        return value
+
+    rt_schema = CompiledSchema({
+                "rt-destination": str,
+                "rt-entry": Use(validate_rt_entry_schema)
+            })
+
     def validate_rt_schema(value):
         if not isinstance(value, list):
             raise SchemaError('rt schema is not a list')
 
-        def validate_rt_entry_schema(value):
-            if not isinstance(value, list):
-                raise SchemaError('rt entry schema is not a list')
-
-            def validate_nh_schema(value):
-                if not isinstance(value, list):
-                    raise SchemaError('nh schema is not a list')
-            
-                nh_schema = Schema({
-                            Optional("selected-next-hop"): bool,
-                            "to": str,
-                            "via": str,
-                            "lsp-name": str,
-                        })
-            
-                for item in value:
-                    nh_schema.validate(item)
-                return value
-        
-            rt_entry_schema = Schema({
-                        Optional("active-tag"): str,
-                        Optional("current-active"): str,
-                        Optional("last-active"): str,
-                        "protocol-name": str,
-                        "preference": str,
-                        "preference2": str,
-                        "age": {
-                            '#text': str,
-                            Optional('@junos:seconds'): str,
-                        },
-                        "metric": str,
-                        "nh": Use(validate_nh_schema)
-                    })
-        
-            for item in value:
-                rt_entry_schema.validate(item)
-            return value
-    
-        rt_schema = Schema({
-                    "rt-destination": str,
-                    "rt-entry": Use(validate_rt_entry_schema)
-                })
-    
         for item in value:
-            rt_schema.validate(item)
+            ShowRouteTableLabelSwitchedNameSchema.rt_schema.validate(item)
         return value
 
     schema = {
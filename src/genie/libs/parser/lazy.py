@@ -0,0 +1,106 @@
+'''Lazy loading of the parser modules of an OS package.
+
+Parser modules are large, `nxos/show_bgp.py` alone is 12k lines, and most
+processes only need a few of them. OS packages therefore do not import their
+modules; a module level `__getattr__` (PEP 562) imports a module the first
+time it, or one of its classes, is accessed:
+
+    >>> from genie.libs.parser import iosxe
+    >>> iosxe.ShowVersion    # imports genie.libs.parser.iosxe.show_platform
+    >>> iosxe.show_bgp       # imports genie.libs.parser.iosxe.show_bgp
+
+Classes are found through the class map of the parser index, built with
+parsers.idx at build time (`make json`), which also holds the classes which
+are not registered, such as schemas. Without an index, only the classes of
+the parser registry (`parser_data`) are found.
+
+Usage, in the `__init__.py` of an OS or token package:
+
+    from genie.libs.parser.lazy import lazy_getattr
+    __getattr__ = lazy_getattr(__name__, __path__)
+'''
+
+# python
+import os
+import importlib
+
+PARSER_PACKAGE = 'genie.libs.parser'
+
+# package name -> {class name: module name} of the index and the registry
+_package_classes = None
+
+
+def _registered_classes():
+    '''Return the parser classes of every package'''
+    global _package_classes
+
+    if _package_classes is None:
+        # Deferred, the registry is not needed until a class is looked up
+        from .utils.common import parser_data
+        from .utils.parser_index import load_parser_classes
+
+        classes = {}
+
+        def _walk(entry, package):
+            if not isinstance(entry, dict):
+                return
+            if entry.get('package') == PARSER_PACKAGE and 'class' in entry:
+                classes.setdefault(package, {}).setdefault(
+                    entry['class'], entry['module_name'])
+            for token, value in entry.items():
+                if isinstance(value, dict):
+                    _walk(value, '{}.{}'.format(package, token))
+
+        for command, source in parser_data.items():
+            if not isinstance(source, dict):
+                continue
+            for os_name, entry in source.items():
+                _walk(entry, '{}.{}'.format(PARSER_PACKAGE, os_name))
+
+        # Then the unregistered classes, schemas and helpers
+        for package, names in load_parser_classes().items():
+            package_classes = classes.setdefault(package, {})
+            for name, module_name in names.items():
+                package_classes.setdefault(name, module_name)
+
+        _package_classes = classes
+
+    return _package_classes
+
+
+def lazy_getattr(package_name, package_path):
+    '''Build the module level `__getattr__` of a parser package.
+
+    Args:
+        package_name (`str`): name of the package, `__name__`
+        package_path (`list`): location of the package, `__path__`
+
+    Returns:
+        function: the `__getattr__` to assign in the package
+    '''
+    path = list(package_path)[0]
+
+    def __getattr__(name):
+        # Dunder and private attributes are probed by various tools,
+        # never import anything for them
+        if name.startswith('_'):
+            raise AttributeError("module '{}' has no attribute '{}'"
+                                 .format(package_name, name))
+
+        # Submodule or token subpackage
+        if os.path.isfile(os.path.join(path, name + '.py')) or \
+                os.path.isfile(os.path.join(path, name, '__init__.py')):
+            return importlib.import_module('{}.{}'.format(package_name, name))
+
+        # Class of one of the modules
+        module_name = _registered_classes().get(package_name, {}).get(name)
+        if module_name is not None:
+            module = importlib.import_module('{}.{}'.format(package_name,
+                                                            module_name))
+            if hasattr(module, name):
+                return getattr(module, name)
+
+        raise AttributeError("module '{}' has no attribute '{}'"
+                             .format(package_name, name))
+
+    return __getattr__
@@ -28,6 +28,7 @@ from genie.metaparser.util.schemaengine import Schema, \
                                          Default, \
                                          Use
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.records import RecordIterator, RecordSplitter
 
 class ShowMacAddressTableBaseSchema(MetaParser):
     """Schema for:
@@ -66,13 +67,16 @@ class ShowMacAddressTableBaseSchema(MetaParser):
             },
         }
 
-class ShowMacAddressTableBase(ShowMacAddressTableBaseSchema):
+class ShowMacAddressTableBase(RecordIterator, ShowMacAddressTableBaseSchema):
     """Base parser for:
         'show mac address-table vni <WORD> | grep <WORD>'
         'show mac address-table local vni <WORD>'
         'show mac address-table'
         'show system internal l2fwder mac'"""
 
+    # Every line is an entry, see iter_records
+    records = RecordSplitter(start=r'')
+
     def cli(self, out):
 
         # initial return dictionary
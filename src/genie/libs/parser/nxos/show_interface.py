@@ -24,6 +24,7 @@ from genie.metaparser.util.schemaengine import Schema, Any, Optional
                                          
 # import parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.patterns import PatternTable
 
 
 # ===========================
@@ -187,16 +188,7 @@ class ShowInterface(ShowInterfaceSchema):
       'in_crc_errors',
       'reliability']
 
-    def cli(self, interface="", output=None):
-        if output is None:
-            if interface:
-                cmd = self.cli_command[1].format(interface=interface)
-            else:
-                cmd = self.cli_command[0]
-            out = self.device.execute(cmd)
-        else:
-            out = output
-
+    patterns = PatternTable(
         # Ethernet2/1.10 is down (Administratively down)
         # Vlan1 is down (Administratively down), line protocol is down, autostate enabled
         # Vlan200 is down (VLAN/BD is down), line protocol is down, autostate enabled
@@ -211,257 +203,272 @@ class ShowInterface(ShowInterfaceSchema):
         # Ethernet1/12 is down (Transceiver validation failed)
         # Ethernet1/13 is down (SFP validation failed)
         # Ethernet1/13 is down (Channel admin down)
-        p1 = re.compile(r'^(?P<interface>\S+)\s*is\s*(?P<link_state>(down|up|'
-                        r'inactive|Transceiver +validation +failed|'
-                        r'SFP +validation +failed|Channel +admin +down))?'
-                        r'(administratively\s+(?P<admin_1>(down)))?\s*'
-                        r'(\(Administratively\s*(?P<admin_2>(down))\))?'
-                        r'(\(VLAN\/BD\s+is+\s+(down|up)\))?'
-                        r'(,\s*line\s+protocol\s+is\s+(?P<line_protocol>\w+))?'
-                        r'(,\s+autostate\s+(?P<autostate>\S+))?'
-                        r'(\(No\s+operational\s+members\))?'
-                        r'(\(Link\s+not\s+connected\))?'
-                        r'(\(SFP\s+validation\s+failed\))?'
-                        r'(\(SFP\s+not\s+inserted\))?'
-                        r'(\(suspended\(.*\)\))?'
-                        r'(\(\S+ErrDisabled\))?'
-                        r'(\(XCVR\s+not\s+inserted\))?'
-                        r'(\(.*ACK.*\))?$')
+        p1=r'^(?P<interface>\S+)\s*is\s*(?P<link_state>(down|up|'
+           r'inactive|Transceiver +validation +failed|'
+           r'SFP +validation +failed|Channel +admin +down))?'
+           r'(administratively\s+(?P<admin_1>(down)))?\s*'
+           r'(\(Administratively\s*(?P<admin_2>(down))\))?'
+           r'(\(VLAN\/BD\s+is+\s+(down|up)\))?'
+           r'(,\s*line\s+protocol\s+is\s+(?P<line_protocol>\w+))?'
+           r'(,\s+autostate\s+(?P<autostate>\S+))?'
+           r'(\(No\s+operational\s+members\))?'
+           r'(\(Link\s+not\s+connected\))?'
+           r'(\(SFP\s+validation\s+failed\))?'
+           r'(\(SFP\s+not\s+inserted\))?'
+           r'(\(suspended\(.*\)\))?'
+           r'(\(\S+ErrDisabled\))?'
+           r'(\(XCVR\s+not\s+inserted\))?'
+           r'(\(.*ACK.*\))?$',
 
         # admin state is up
         # admin state is up,
         # admin state is up, Dedicated Interface
         # admin state is up, Dedicated Interface, [parent interface is Ethernet2/1]
-        p2 = re.compile(r'^admin +state +is'
-                        r' +(?P<admin_state>([a-zA-Z0-9\/\.]+))(?:,)?'
-                        r'(?: +(?P<dedicated_intf>(Dedicated Interface)))?'
-                        r'(?:, +\[parent +interface +is'
-                        r' +(?P<parent_intf>(\S+))\])?$')
+        p2=r'^admin +state +is'
+           r' +(?P<admin_state>([a-zA-Z0-9\/\.]+))(?:,)?'
+           r'(?: +(?P<dedicated_intf>(Dedicated Interface)))?'
+           r'(?:, +\[parent +interface +is'
+           r' +(?P<parent_intf>(\S+))\])?$',
 
         # Dedicated Interface
-        p2_1 = re.compile(r'^Dedicated Interface$')
+        p2_1=r'^Dedicated Interface$',
 
         # Belongs to Po1
-        p2_2 = re.compile(r'^Belongs *to *(?P<port_channel_int>[a-zA-Z0-9]+)$')
+        p2_2=r'^Belongs *to *(?P<port_channel_int>[a-zA-Z0-9]+)$',
 
         # Hardware: Ethernet, address: 5254.00ff.9c38 (bia 5254.00ff.9c38)
-        p3 = re.compile(r'^Hardware: *(?P<types>[a-zA-Z0-9\/\s]+),'
-                        r' *address: *(?P<mac_address>[a-z0-9\.]+)'
-                        r' *\(bia *(?P<phys_address>[a-z0-9\.]+)\)$')
+        p3=r'^Hardware: *(?P<types>[a-zA-Z0-9\/\s]+),'
+           r' *address: *(?P<mac_address>[a-z0-9\.]+)'
+           r' *\(bia *(?P<phys_address>[a-z0-9\.]+)\)$',
 
         #Description: desc
-        p4 = re.compile(r'^Description: *(?P<description>.*)$')
+        p4=r'^Description: *(?P<description>.*)$',
 
         #Internet Address is 10.4.4.4/24 secondary tag 10
-        p5 = re.compile(r'^Internet *Address *is *(?P<ip>[0-9\.]+)'
-                        r'\/(?P<prefix_length>[0-9]+)'
-                        r'(?: *(?P<secondary>(secondary)))?(?: *tag'
-                        r' *(?P<route_tag>[0-9]+))?$')
+        p5=r'^Internet *Address *is *(?P<ip>[0-9\.]+)'
+           r'\/(?P<prefix_length>[0-9]+)'
+           r'(?: *(?P<secondary>(secondary)))?(?: *tag'
+           r' *(?P<route_tag>[0-9]+))?$',
 
         # MTU 1600 bytes, BW 768 Kbit, DLY 3330 usec
         # MTU 1500 bytes, BW 1000000 Kbit, DLY 10 usec,
         # MTU 1500 bytes, BW 1000000 Kbit
         # MTU 600 bytes, BW 10000000 Kbit , DLY 10 usec
-        p6 = re.compile(r'^MTU *(?P<mtu>[0-9]+) *bytes, *BW'
-                        r' *(?P<bandwidth>[0-9]+) *Kbit( *, *DLY'
-                        r' *(?P<delay>[0-9]+) *usec)?,?$')
+        p6=r'^MTU *(?P<mtu>[0-9]+) *bytes, *BW'
+           r' *(?P<bandwidth>[0-9]+) *Kbit( *, *DLY'
+           r' *(?P<delay>[0-9]+) *usec)?,?$',
 
         # MTU 1500 bytes,  BW 40000000 Kbit,, BW 40000000 Kbit, DLY 10 usec
-        p6_1 = re.compile(r'^MTU *(?P<mtu>[0-9]+) *bytes, *BW'
-                          r' *(?P<bandwidth>[0-9]+) *Kbit, *,? *BW'
-                          r' *([0-9]+) *Kbit, *DLY'
-                          r' *(?P<delay>[0-9]+) *usec$')   
+        p6_1=r'^MTU *(?P<mtu>[0-9]+) *bytes, *BW'
+             r' *(?P<bandwidth>[0-9]+) *Kbit, *,? *BW'
+             r' *([0-9]+) *Kbit, *DLY'
+             r' *(?P<delay>[0-9]+) *usec$',
 
         # reliability 255/255, txload 1/255, rxload 1/255
-        p7 = re.compile(r'^reliability *(?P<reliability>[0-9\/]+),'
-                        r' *txload *(?P<txload>[0-9\/]+),'
-                        r' *rxload *(?P<rxload>[0-9\/]+)$')   
+        p7=r'^reliability *(?P<reliability>[0-9\/]+),'
+           r' *txload *(?P<txload>[0-9\/]+),'
+           r' *rxload *(?P<rxload>[0-9\/]+)$',
 
         #Encapsulation 802.1Q Virtual LAN, Vlan ID 10, medium is broadcast
         #Encapsulation 802.1Q Virtual LAN, Vlan ID 20, medium is p2p
         #Encapsulation ARPA, medium is broadcast
-        p8 = re.compile(r'^Encapsulation *(?P<encapsulation>[a-zA-Z0-9\.\s]+),'
-                        r' *medium *is *(?P<medium>[a-zA-Z]+)$')   
+        p8=r'^Encapsulation *(?P<encapsulation>[a-zA-Z0-9\.\s]+),'
+           r' *medium *is *(?P<medium>[a-zA-Z]+)$',
 
-        p8_1 = re.compile(r'^Encapsulation *(?P<encapsulation>[a-zA-Z0-9\.\s]+),'
-                          r' *Vlan *ID *(?P<first_dot1q>[0-9]+),'
-                          r' *medium *is *(?P<medium>[a-z0-9]+)$') 
+        p8_1=r'^Encapsulation *(?P<encapsulation>[a-zA-Z0-9\.\s]+),'
+             r' *Vlan *ID *(?P<first_dot1q>[0-9]+),'
+             r' *medium *is *(?P<medium>[a-z0-9]+)$',
 
         # Encapsulation ARPA, loopback not set
-        p8_2 = re.compile(r'^Encapsulation *(?P<encapsulation>[a-zA-Z0-9\.\s]+),'
-                          r' *([\w\s]+)$') 
+        p8_2=r'^Encapsulation *(?P<encapsulation>[a-zA-Z0-9\.\s]+),'
+             r' *([\w\s]+)$',
 
         #Port mode is routed
-        p9 = re.compile(r'^Port *mode *is *(?P<port_mode>[a-z]+)$')
+        p9=r'^Port *mode *is *(?P<port_mode>[a-z]+)$',
 
         # auto-duplex, auto-speed
-        p10_1 = re.compile(r'^auto-duplex, +auto-speed$')
+        p10_1=r'^auto-duplex, +auto-speed$',
 
         #full-duplex, 1000 Mb/s
         # auto-duplex, auto-speed
         # full-duplex, 1000 Mb/s, media type is 1G
         # auto-duplex, auto-speed, media type is 10G
-        p10 = re.compile(r'^(?P<duplex_mode>[a-z]+)-duplex, *(?P<port_speed>[a-z0-9\-]+)(?: '
-                         r'*[G|M]b/s)?(?:, +media +type +is (?P<media_type>\w+))?$')
+        p10=r'^(?P<duplex_mode>[a-z]+)-duplex, *(?P<port_speed>[a-z0-9\-]+)(?: '
+            r'*[G|M]b/s)?(?:, +media +type +is (?P<media_type>\w+))?$',
 
         #Beacon is turned off
-        p11 = re.compile(r'^Beacon *is *turned *(?P<beacon>[a-z]+)$')
+        p11=r'^Beacon *is *turned *(?P<beacon>[a-z]+)$',
 
         #Auto-Negotiation is turned off
-        p12 = re.compile(r'^Auto-Negotiation *is *turned'
-                         r' *(?P<auto_negotiate>(off))$')
+        p12=r'^Auto-Negotiation *is *turned'
+            r' *(?P<auto_negotiate>(off))$',
 
         #Auto-Negotiation is turned on
-        p12_1 = re.compile(r'^Auto-Negotiation *is *turned'
-                           r' *(?P<auto_negotiate>(on))$')
+        p12_1=r'^Auto-Negotiation *is *turned'
+              r' *(?P<auto_negotiate>(on))$',
 
         #Input flow-control is off, output flow-control is off
-        p13 = re.compile(r'^Input *flow-control *is *(?P<receive>(off)+),'
-                         r' *output *flow-control *is *(?P<send>(off)+)$')
+        p13=r'^Input *flow-control *is *(?P<receive>(off)+),'
+            r' *output *flow-control *is *(?P<send>(off)+)$',
 
         #Input flow-control is off, output flow-control is on
-        p13_1 = re.compile(r'^Input *flow-control *is *(?P<receive>(on)+),'
-                           r' *output *flow-control *is *(?P<send>(on)+)$')
+        p13_1=r'^Input *flow-control *is *(?P<receive>(on)+),'
+              r' *output *flow-control *is *(?P<send>(on)+)$',
 
         #Auto-mdix is turned off
-        p14 = re.compile(r'^Auto-mdix *is *turned *(?P<auto_mdix>[a-z]+)$')
+        p14=r'^Auto-mdix *is *turned *(?P<auto_mdix>[a-z]+)$',
 
-        #Switchport monitor is off 
-        p15 = re.compile(r'^Switchport *monitor *is *(?P<switchport_monitor>[a-z]+)$')
+        #Switchport monitor is off
+        p15=r'^Switchport *monitor *is *(?P<switchport_monitor>[a-z]+)$',
 
-        #EtherType is 0x8100 
-        p16 = re.compile(r'^EtherType *is *(?P<ethertype>[a-z0-9]+)$')
+        #EtherType is 0x8100
+        p16=r'^EtherType *is *(?P<ethertype>[a-z0-9]+)$',
 
         # Members in this channel: Eth1/15, Eth1/16
         # Members in this channel: Eth1/28
-        p38 = re.compile(r'^Members +in +this +channel *: *'
-                         r'(?P<port_channel_member_intfs>[\w\/\.\-\,\s]+)$')
+        p38=r'^Members +in +this +channel *: *'
+            r'(?P<port_channel_member_intfs>[\w\/\.\-\,\s]+)$',
 
         #EEE (efficient-ethernet) : n/a
-        p17 = re.compile(r'^EEE *\(efficient-ethernet\) *:'
-                         r' *(?P<efficient_ethernet>[A-Za-z\/]+)$')
+        p17=r'^EEE *\(efficient-ethernet\) *:'
+            r' *(?P<efficient_ethernet>[A-Za-z\/]+)$',
 
         #Last link flapped 00:07:28
         #Last link flapped 15week(s) 5day(s)
-        p18 = re.compile(r'^Last *link *flapped'
-                         r' *(?P<last_link_flapped>[\S ]+)$')
+        p18=r'^Last *link *flapped'
+            r' *(?P<last_link_flapped>[\S ]+)$',
 
         # Last clearing of "show interface" counters never
-        p19 = re.compile(r'^Last *clearing *of *\"show *interface\"'
-                         r' *counters *(?P<last_clear>[a-z0-9\:]+)$')
+        p19=r'^Last *clearing *of *\"show *interface\"'
+            r' *counters *(?P<last_clear>[a-z0-9\:]+)$',
 
         # Last clearing of "" counters 00:15:42
-        p19_1 = re.compile(r'^Last *clearing *of *\" *\"'
-                           r' *counters *(?P<last_clear>[a-z0-9\:]+)$')
+        p19_1=r'^Last *clearing *of *\" *\"'
+              r' *counters *(?P<last_clear>[a-z0-9\:]+)$',
 
         #1 interface resets
-        p20 = re.compile(r'^(?P<interface_reset>[0-9]+) *interface'
-                         r' *resets$')
+        p20=r'^(?P<interface_reset>[0-9]+) *interface'
+            r' *resets$',
 
-        # 1 minute input rate 0 bits/sec, 0 packets/sec  
-        p21 = re.compile(r'^(?P<load_interval>[0-9\#]+)'
-                         r' *(minute|second|minutes|seconds) *input *rate'
-                         r' *(?P<in_rate>[0-9]+) *bits/sec,'
-                         r' *(?P<in_rate_pkts>[0-9]+) *packets/sec$')
+        # 1 minute input rate 0 bits/sec, 0 packets/sec
+        p21=r'^(?P<load_interval>[0-9\#]+)'
+            r' *(minute|second|minutes|seconds) *input *rate'
+            r' *(?P<in_rate>[0-9]+) *bits/sec,'
+            r' *(?P<in_rate_pkts>[0-9]+) *packets/sec$',
 
         #1 minute output rate 24 bits/sec, 0 packets/sec
-        p22 = re.compile(r'^(?P<load_interval>[0-9\#]+)'
-                         r' *(minute|second|minutes|seconds) *output'
-                         r' *rate *(?P<out_rate>[0-9]+)'
-                         r' *bits/sec, *(?P<out_rate_pkts>[0-9]+)'
-                         r' *packets/sec$')
+        p22=r'^(?P<load_interval>[0-9\#]+)'
+            r' *(minute|second|minutes|seconds) *output'
+            r' *rate *(?P<out_rate>[0-9]+)'
+            r' *bits/sec, *(?P<out_rate_pkts>[0-9]+)'
+            r' *packets/sec$',
 
         #input rate 0 bps, 0 pps; output rate 0 bps, 0 pps
-        p23 = re.compile(r'^input *rate *(?P<in_rate_bps>[0-9]+) *bps,'
-                         r' *(?P<in_rate_pps>[0-9]+) *pps; *output *rate'
-                         r' *(?P<out_rate_bps>[0-9]+) *bps,'
-                         r' *(?P<out_rate_pps>[0-9]+) *pps$')
+        p23=r'^input *rate *(?P<in_rate_bps>[0-9]+) *bps,'
+            r' *(?P<in_rate_pps>[0-9]+) *pps; *output *rate'
+            r' *(?P<out_rate_bps>[0-9]+) *bps,'
+            r' *(?P<out_rate_pps>[0-9]+) *pps$',
 
         # RX
         # Rx
-        p23_1 = re.compile(r'^(?P<rx>(RX|Rx))$')
+        p23_1=r'^(?P<rx>(RX|Rx))$',
 
         #0 unicast packets  0 multicast packets  0 broadcast packets
-        p24 = re.compile(r'^(?P<in_unicast_pkts>[0-9]+) +unicast +packets'
-                         r' +(?P<in_multicast_pkts>[0-9]+) +multicast +packets'
-                         r' +(?P<in_broadcast_pkts>[0-9]+) +broadcast +packets$')
+        p24=r'^(?P<in_unicast_pkts>[0-9]+) +unicast +packets'
+            r' +(?P<in_multicast_pkts>[0-9]+) +multicast +packets'
+            r' +(?P<in_broadcast_pkts>[0-9]+) +broadcast +packets$',
 
         # 0 input packets  0 bytes
         # 607382344 input packets 445986207 unicast packets 132485585 multicast packets
-        p25 = re.compile(r'^(?P<in_pkts>[0-9]+) +input +packets(?: '
-                         r'+(?P<in_octets>[0-9]+) +bytes)?(?: +(?P<in_unicast_pkts>[0-9]+) '
-                         r'+unicast +packets +(?P<in_multicast_pkts>[0-9]+) +multicast +packets)?$')
+        p25=r'^(?P<in_pkts>[0-9]+) +input +packets(?: '
+            r'+(?P<in_octets>[0-9]+) +bytes)?(?: +(?P<in_unicast_pkts>[0-9]+) '
+            r'+unicast +packets +(?P<in_multicast_pkts>[0-9]+) +multicast +packets)?$',
 
         #0 jumbo packets  0 storm suppression packets
-        p26 = re.compile(r'^(?P<in_jumbo_packets>[0-9]+) +jumbo +packets'
-                         r' *(?P<in_storm_suppression_packets>[0-9]+)'
-                         r' *storm *suppression *packets$')
+        p26=r'^(?P<in_jumbo_packets>[0-9]+) +jumbo +packets'
+            r' *(?P<in_storm_suppression_packets>[0-9]+)'
+            r' *storm *suppression *packets$',
 
         #0 runts  0 giants  0 CRC/FCS  0 no buffer
         #0 runts  0 giants  0 CRC  0 no buffer
-        p27 = re.compile(r'^(?P<in_runts>[0-9]+) *runts'
-                         r' *(?P<in_oversize_frame>[0-9]+) *giants'
-                         r' *(?P<in_crc_errors>[0-9]+) *CRC(/FCS)?'
-                         r' *(?P<in_no_buffer>[0-9]+) *no *buffer$')
+        p27=r'^(?P<in_runts>[0-9]+) *runts'
+            r' *(?P<in_oversize_frame>[0-9]+) *giants'
+            r' *(?P<in_crc_errors>[0-9]+) *CRC(/FCS)?'
+            r' *(?P<in_no_buffer>[0-9]+) *no *buffer$',
 
         #0 input error  0 short frame  0 overrun   0 underrun  0 ignored
-        p28 = re.compile(r'^(?P<in_errors>[0-9]+) *input *error'
-                         r' *(?P<in_short_frame>[0-9]+) *short *frame'
-                         r' *(?P<in_overrun>[0-9]+) *overrun *(?P<in_underrun>[0-9]+)'
-                         r' *underrun *(?P<in_ignored>[0-9]+) *ignored$')
+        p28=r'^(?P<in_errors>[0-9]+) *input *error'
+            r' *(?P<in_short_frame>[0-9]+) *short *frame'
+            r' *(?P<in_overrun>[0-9]+) *overrun *(?P<in_underrun>[0-9]+)'
+            r' *underrun *(?P<in_ignored>[0-9]+) *ignored$',
 
         #0 watchdog  0 bad etype drop  0 bad proto drop  0 if down drop
-        p29 = re.compile(r'^(?P<in_watchdog>[0-9]+) *watchdog'
-                         r' *(?P<in_bad_etype_drop>[0-9]+)'
-                         r' *bad *etype *drop *(?P<in_unknown_protos>[0-9]+)'
-                         r' *bad *proto'
-                         r' *drop *(?P<in_if_down_drop>[0-9]+) *if *down *drop$')
+        p29=r'^(?P<in_watchdog>[0-9]+) *watchdog'
+            r' *(?P<in_bad_etype_drop>[0-9]+)'
+            r' *bad *etype *drop *(?P<in_unknown_protos>[0-9]+)'
+            r' *bad *proto'
+            r' *drop *(?P<in_if_down_drop>[0-9]+) *if *down *drop$',
 
         # 0 input with dribble  0 input discard
-        p30 = re.compile(r'^(?P<in_with_dribble>[0-9]+) *input *with'
-                         r' *dribble *(?P<in_discard>[0-9]+) *input *discard$')
+        p30=r'^(?P<in_with_dribble>[0-9]+) *input *with'
+            r' *dribble *(?P<in_discard>[0-9]+) *input *discard$',
 
         # 0 Rx pause
-        p31 = re.compile(r'^(?P<in_mac_pause_frames>[0-9]+) *Rx *pause$')
+        p31=r'^(?P<in_mac_pause_frames>[0-9]+) *Rx *pause$',
 
         # TX
-        p31_1 = re.compile(r'^(?P<tx>(TX|Tx))$')
+        p31_1=r'^(?P<tx>(TX|Tx))$',
 
         #0 unicast packets  0 multicast packets  0 broadcast packets
-        p32 = re.compile(r'^(?P<out_unicast_pkts>[0-9]+) *unicast *packets'
-                         r' *(?P<out_multicast_pkts>[0-9]+) *multicast *packets'
-                         r' *(?P<out_broadcast_pkts>[0-9]+) *broadcast *packets$')
+        p32=r'^(?P<out_unicast_pkts>[0-9]+) *unicast *packets'
+            r' *(?P<out_multicast_pkts>[0-9]+) *multicast *packets'
+            r' *(?P<out_broadcast_pkts>[0-9]+) *broadcast *packets$',
 
         #0 output packets  0 bytes
-        p33 = re.compile(r'^(?P<out_pkts>[0-9]+) *output *packets'
-                         r' *(?P<out_octets>[0-9]+) *bytes$')
+        p33=r'^(?P<out_pkts>[0-9]+) *output *packets'
+            r' *(?P<out_octets>[0-9]+) *bytes$',
 
         #0 jumbo packets
-        p34 = re.compile(r'^(?P<out_jumbo_packets>[0-9]+) *jumbo *packets$')
+        p34=r'^(?P<out_jumbo_packets>[0-9]+) *jumbo *packets$',
 
         #0 output error  0 collision  0 deferred  0 late collision
-        p35 = re.compile(r'^(?P<out_errors>[0-9]+) *output *error'
-                         r' *(?P<out_collision>[0-9]+) *collision'
-                         r' *(?P<out_deferred>[0-9]+) *deferred'
-                         r' *(?P<out_late_collision>[0-9]+)'
-                         r' *late *collision$')
+        p35=r'^(?P<out_errors>[0-9]+) *output *error'
+            r' *(?P<out_collision>[0-9]+) *collision'
+            r' *(?P<out_deferred>[0-9]+) *deferred'
+            r' *(?P<out_late_collision>[0-9]+)'
+            r' *late *collision$',
 
         #0 lost carrier  0 no carrier  0 babble  0 output discard
-        p36 = re.compile(r'^(?P<out_lost_carrier>[0-9]+) *lost *carrier'
-                         r' *(?P<out_no_carrier>[0-9]+) *no *carrier'
-                         r' *(?P<out_babble>[0-9]+) *babble'
-                         r' *(?P<out_discard>[0-9]+) *output *discard$')
+        p36=r'^(?P<out_lost_carrier>[0-9]+) *lost *carrier'
+            r' *(?P<out_no_carrier>[0-9]+) *no *carrier'
+            r' *(?P<out_babble>[0-9]+) *babble'
+            r' *(?P<out_discard>[0-9]+) *output *discard$',
 
         #0 Tx pause
-        p37 = re.compile(r'^(?P<out_mac_pause_frames>[0-9]+) *Tx *pause$')
-
-        # Members in this channel: Eth1/15, Eth1/16
-        # Members in this channel: Eth1/28
-        p38 = re.compile(r'^Members +in +this +channel *: *'
-                         r'(?P<port_channel_member_intfs>[\w\/\.\-\,\s]+)$')
+        p37=r'^(?P<out_mac_pause_frames>[0-9]+) *Tx *pause$',
 
         # 28910552 broadcast packets 63295517997 bytes
-        p39 = re.compile(r'^(?P<in_broadcast_pkts>[0-9]+) +broadcast +packets +(?P<in_octets>[0-9]+) +bytes$')
+        p39=r'^(?P<in_broadcast_pkts>[0-9]+) +broadcast +packets +(?P<in_octets>[0-9]+) +bytes$',
+    )
+
+    # Patterns tried on every line, in order
+    dispatcher = patterns.dispatcher(
+        'p1', 'p2', 'p2_1', 'p2_2', 'p3', 'p4', 'p5', 'p6', 'p6_1',
+        'p7', 'p8', 'p8_1', 'p8_2', 'p9', 'p10_1', 'p10', 'p11', 'p12',
+        'p12_1', 'p13', 'p13_1', 'p14', 'p15', 'p16', 'p38', 'p17',
+        'p18', 'p19', 'p19_1', 'p20', 'p21', 'p22', 'p23', 'p23_1',
+        'p24', 'p25', 'p39', 'p26', 'p27', 'p28', 'p29', 'p30', 'p31',
+        'p31_1', 'p32', 'p33', 'p34', 'p35', 'p36', 'p37')
+
+    def cli(self, interface="", output=None):
+        if output is None:
+            if interface:
+                cmd = self.cli_command[1].format(interface=interface)
+            else:
+                cmd = self.cli_command[0]
+            out = self.device.execute(cmd)
+        else:
+            out = output
 
         interface_dict = {}
 
@@ -470,441 +477,405 @@ class ShowInterface(ShowInterfaceSchema):
         for line in out.splitlines():
             line = line.replace('\t', '    ')
             line = line.strip()
+            for name, m in self.dispatcher.matches(line):
+                # Ethernet2/1.10 is down (Administratively down)
+                # Vlan1 is down (Administratively down), line protocol is down, autostate enabled
+                # Vlan200 is down (VLAN/BD is down), line protocol is down, autostate enabled
+                # Vlan23 is administratively down (Administratively down), line protocol is down, autostate enabled
+                # Ethernet2/2 is up
+                # Ethernet1/10 is down (Link not connected)
+                # Ethernet1/3 is down (XCVR not inserted)
+                # Ethernet1/1 is down (DCX-No ACK in 100 PDUs)
+                if name == 'p1':
+                    group = m.groupdict()
+                    interface = group['interface']
+
+                    if interface not in interface_dict:
+                        interface_dict[interface] = {}
+                        interface_dict[interface]['port_channel'] = {}
+                        interface_dict[interface]['port_channel']['port_channel_member'] = False
 
-            # Ethernet2/1.10 is down (Administratively down)
-            # Vlan1 is down (Administratively down), line protocol is down, autostate enabled
-            # Vlan200 is down (VLAN/BD is down), line protocol is down, autostate enabled
-            # Vlan23 is administratively down (Administratively down), line protocol is down, autostate enabled
-            # Ethernet2/2 is up
-            # Ethernet1/10 is down (Link not connected)
-            # Ethernet1/3 is down (XCVR not inserted)
-            # Ethernet1/1 is down (DCX-No ACK in 100 PDUs)
-            m = p1.match(line)
-            if m:
-                group = m.groupdict()
-                interface = group['interface']
-
-                if interface not in interface_dict:
-                    interface_dict[interface] = {}
-                    interface_dict[interface]['port_channel'] = {}
-                    interface_dict[interface]['port_channel']['port_channel_member'] = False
-
-                if group['link_state']:
-                    interface_dict[interface]['link_state'] = group['link_state']
-
-
-                    if 'oper_status' not in interface_dict[interface]:
-                        interface_dict[interface]['oper_status'] = group['link_state']
+                    if group['link_state']:
+                        interface_dict[interface]['link_state'] = group['link_state']
 
-                if group['admin_1']:
-                    interface_dict[interface]['enabled'] = False
-                elif group['admin_2']:
-                    interface_dict[interface]['enabled'] = False
-                else:
-                    interface_dict[interface]['enabled'] = True
 
-                if group['line_protocol']:
-                    interface_dict[interface]['line_protocol'] = group['line_protocol']
-                    if 'oper_status' not in interface_dict[interface]:
-                        interface_dict[interface]['oper_status'] = group['line_protocol']
+                        if 'oper_status' not in interface_dict[interface]:
+                            interface_dict[interface]['oper_status'] = group['link_state']
 
-                if group['autostate']:
-                    interface_dict[interface]['autostate'] = True if group['autostate'] == 'enabled' else False
-                continue
-
-            # admin state is up
-            # admin state is up,
-            # admin state is up, Dedicated Interface
-            # admin state is up, Dedicated Interface, [parent interface is Ethernet2/1]
-            m = p2.match(line)
-            if m:
-                # admin_state
-                admin_state = m.groupdict()['admin_state']
-                interface_dict[interface]['admin_state'] = admin_state
-                if admin_state == 'up':
-                    interface_dict[interface]['enabled'] = True
-                # dedicated_interface
-                if m.groupdict()['dedicated_intf']:
+                    if group['admin_1']:
+                        interface_dict[interface]['enabled'] = False
+                    elif group['admin_2']:
+                        interface_dict[interface]['enabled'] = False
+                    else:
+                        interface_dict[interface]['enabled'] = True
+
+                    if group['line_protocol']:
+                        interface_dict[interface]['line_protocol'] = group['line_protocol']
+                        if 'oper_status' not in interface_dict[interface]:
+                            interface_dict[interface]['oper_status'] = group['line_protocol']
+
+                    if group['autostate']:
+                        interface_dict[interface]['autostate'] = True if group['autostate'] == 'enabled' else False
+                    break
+
+                # admin state is up
+                # admin state is up,
+                # admin state is up, Dedicated Interface
+                # admin state is up, Dedicated Interface, [parent interface is Ethernet2/1]
+                elif name == 'p2':
+                    # admin_state
+                    admin_state = m.groupdict()['admin_state']
+                    interface_dict[interface]['admin_state'] = admin_state
+                    if admin_state == 'up':
+                        interface_dict[interface]['enabled'] = True
+                    # dedicated_interface
+                    if m.groupdict()['dedicated_intf']:
+                        interface_dict[interface]['dedicated_interface'] = True
+                    # parent_interface
+                    if m.groupdict()['parent_intf']:
+                        interface_dict[interface]['parent_interface'] = \
+                            m.groupdict()['parent_intf']
+                    break
+
+                # Dedicated Interface
+                elif name == 'p2_1':
                     interface_dict[interface]['dedicated_interface'] = True
-                # parent_interface
-                if m.groupdict()['parent_intf']:
-                    interface_dict[interface]['parent_interface'] = \
-                        m.groupdict()['parent_intf']
-                continue
-
-            # Dedicated Interface
-            m = p2_1.match(line)
-            if m:
-                interface_dict[interface]['dedicated_interface'] = True
-                continue
-
-            # Belongs to Po1
-            m = p2_2.match(line)
-            if m:
-                port_channel_int = str(m.groupdict()['port_channel_int'])
-                if 'port_channel' not in interface_dict[interface]:
-                    interface_dict[interface]['port_channel'] = {}
-                interface_dict[interface]['port_channel']\
-                    ['port_channel_member'] = True
-                interface_dict[interface]['port_channel']\
-                    ['port_channel_int'] = Common.convert_intf_name(port_channel_int)
-                continue
-
-            # Hardware: Ethernet, address: 5254.00ff.9c38 (bia 5254.00ff.9c38)
-            m = p3.match(line)
-            if m:
-                types = m.groupdict()['types']
-                mac_address = m.groupdict()['mac_address']
-                phys_address = m.groupdict()['phys_address']
-
-                interface_dict[interface]['types'] = types
-                interface_dict[interface]\
-                            ['mac_address'] = mac_address
-                interface_dict[interface]\
-                            ['phys_address'] = phys_address
-                continue
-
-            #Description: desc
-            m = p4.match(line)
-            if m:
-                description = m.groupdict()['description']
-
-                interface_dict[interface]['description'] = description
-                continue
-
-            #Internet Address is 10.4.4.4/24 secondary tag 10
-            m = p5.match(line)
-            if m:
-                ip = m.groupdict()['ip']
-                prefix_length = str(m.groupdict()['prefix_length'])
-                secondary = m.groupdict()['secondary']
-                route_tag = m.groupdict()['route_tag']
-                #address = ipv4+prefix_length
-                address = ip + '/' + prefix_length
-                if 'ipv4' not in interface_dict[interface]:
-                    interface_dict[interface]['ipv4'] = {}
-                if address not in interface_dict[interface]['ipv4']:
-                    interface_dict[interface]['ipv4'][address] = {}
+                    break
 
-                interface_dict[interface]['ipv4'][address]\
-                ['ip'] = ip
-                interface_dict[interface]['ipv4'][address]\
-                ['prefix_length'] = prefix_length
+                # Belongs to Po1
+                elif name == 'p2_2':
+                    port_channel_int = str(m.groupdict()['port_channel_int'])
+                    if 'port_channel' not in interface_dict[interface]:
+                        interface_dict[interface]['port_channel'] = {}
+                    interface_dict[interface]['port_channel']\
+                        ['port_channel_member'] = True
+                    interface_dict[interface]['port_channel']\
+                        ['port_channel_int'] = Common.convert_intf_name(port_channel_int)
+                    break
+
+                # Hardware: Ethernet, address: 5254.00ff.9c38 (bia 5254.00ff.9c38)
+                elif name == 'p3':
+                    types = m.groupdict()['types']
+                    mac_address = m.groupdict()['mac_address']
+                    phys_address = m.groupdict()['phys_address']
+
+                    interface_dict[interface]['types'] = types
+                    interface_dict[interface]\
+                                ['mac_address'] = mac_address
+                    interface_dict[interface]\
+                                ['phys_address'] = phys_address
+                    break
+
+                #Description: desc
+                elif name == 'p4':
+                    description = m.groupdict()['description']
+
+                    interface_dict[interface]['description'] = description
+                    break
+
+                #Internet Address is 10.4.4.4/24 secondary tag 10
+                elif name == 'p5':
+                    ip = m.groupdict()['ip']
+                    prefix_length = str(m.groupdict()['prefix_length'])
+                    secondary = m.groupdict()['secondary']
+                    route_tag = m.groupdict()['route_tag']
+                    #address = ipv4+prefix_length
+                    address = ip + '/' + prefix_length
+                    if 'ipv4' not in interface_dict[interface]:
+                        interface_dict[interface]['ipv4'] = {}
+                    if address not in interface_dict[interface]['ipv4']:
+                        interface_dict[interface]['ipv4'][address] = {}
 
-                if secondary:
                     interface_dict[interface]['ipv4'][address]\
-                    ['secondary'] = True
-                if route_tag:
+                    ['ip'] = ip
                     interface_dict[interface]['ipv4'][address]\
-                    ['route_tag'] = route_tag
-                continue
+                    ['prefix_length'] = prefix_length
+
+                    if secondary:
+                        interface_dict[interface]['ipv4'][address]\
+                        ['secondary'] = True
+                    if route_tag:
+                        interface_dict[interface]['ipv4'][address]\
+                        ['route_tag'] = route_tag
+                    break
             
-            # MTU 1600 bytes, BW 768 Kbit, DLY 3330 usec
-            # MTU 1500 bytes, BW 1000000 Kbit, DLY 10 usec,
-            # MTU 1500 bytes, BW 1000000 Kbit
-            m = p6.match(line)
-            if m:
-                mtu = int(m.groupdict()['mtu'])
-                bandwidth = int(m.groupdict()['bandwidth'])
-                if m.groupdict()['delay']:
-                    interface_dict[interface]['delay'] = int(m.groupdict()['delay'])
+                # MTU 1600 bytes, BW 768 Kbit, DLY 3330 usec
+                # MTU 1500 bytes, BW 1000000 Kbit, DLY 10 usec,
+                # MTU 1500 bytes, BW 1000000 Kbit
+                elif name == 'p6':
+                    mtu = int(m.groupdict()['mtu'])
+                    bandwidth = int(m.groupdict()['bandwidth'])
+                    if m.groupdict()['delay']:
+                        interface_dict[interface]['delay'] = int(m.groupdict()['delay'])
                 
-                interface_dict[interface]['mtu'] = mtu
-                interface_dict[interface]['bandwidth'] = bandwidth
-                continue
+                    interface_dict[interface]['mtu'] = mtu
+                    interface_dict[interface]['bandwidth'] = bandwidth
+                    break
             
-            # MTU 1500 bytes,  BW 40000000 Kbit,, BW 40000000 Kbit, DLY 10 usec
-            m = p6_1.match(line)
-            if m:
-                mtu = int(m.groupdict()['mtu'])
-                bandwidth = int(m.groupdict()['bandwidth'])
+                # MTU 1500 bytes,  BW 40000000 Kbit,, BW 40000000 Kbit, DLY 10 usec
+                elif name == 'p6_1':
+                    mtu = int(m.groupdict()['mtu'])
+                    bandwidth = int(m.groupdict()['bandwidth'])
                 
-                interface_dict[interface]['mtu'] = mtu
-                interface_dict[interface]['bandwidth'] = bandwidth
-                interface_dict[interface]['delay'] = int(m.groupdict()['delay'])
-                continue
-
-            # reliability 255/255, txload 1/255, rxload 1/255
-            m = p7.match(line)
-            if m:
-                reliability = m.groupdict()['reliability']
-                txload = m.groupdict()['txload']
-                rxload = m.groupdict()['rxload']
-
-                interface_dict[interface]['reliability'] = reliability
-                interface_dict[interface]['txload'] = txload
-                interface_dict[interface]['rxload'] = rxload
-                continue
-
-            #Encapsulation 802.1Q Virtual LAN, Vlan ID 10, medium is broadcast
-            #Encapsulation 802.1Q Virtual LAN, Vlan ID 20, medium is p2p
-            #Encapsulation ARPA, medium is broadcast
-            m = p8.match(line)
-            if m:
-                encapsulation = m.groupdict()['encapsulation'].lower()
-                encapsulation = encapsulation.replace("802.1q virtual lan","dot1q")
-                medium = m.groupdict()['medium']
-
-                if 'encapsulations' not in interface_dict[interface]:
-                    interface_dict[interface]['encapsulations'] = {}
-
-                interface_dict[interface]['encapsulations']\
-                ['encapsulation'] = encapsulation
-                interface_dict[interface]['medium'] = medium
-                continue
-
-            m = p8_1.match(line)
-            if m:
-                encapsulation = m.groupdict()['encapsulation'].lower()
-                encapsulation = encapsulation.replace("802.1q virtual lan","dot1q")
-                first_dot1q = str(m.groupdict()['first_dot1q'])
-                medium = m.groupdict()['medium']
-
-                if 'encapsulations' not in interface_dict[interface]:
-                    interface_dict[interface]['encapsulations'] = {}
-
-                interface_dict[interface]['encapsulations']\
-                ['encapsulation'] = encapsulation
-                interface_dict[interface]['encapsulations']\
-                ['first_dot1q'] = first_dot1q
-                interface_dict[interface]['medium'] = medium
-                continue
-
-            # Encapsulation ARPA, loopback not set
-            m = p8_2.match(line)
-            if m:
-                encapsulation = m.groupdict()['encapsulation'].lower()
-
-                if 'encapsulations' not in interface_dict[interface]:
-                    interface_dict[interface]['encapsulations'] = {}
-
-                interface_dict[interface]['encapsulations']\
-                ['encapsulation'] = encapsulation
-                continue
-
-            #Port mode is routed
-            m = p9.match(line)
-            if m:
-                port_mode = m.groupdict()['port_mode']
-                interface_dict[interface]['port_mode'] = port_mode
-                continue
-
-            # auto-duplex, auto-speed
-            m = p10_1.match(line)
-            if m:
-                # not caring for this line
-                continue
-
-            #full-duplex, 1000 Mb/s
-            # auto-duplex, auto-speed
-            # full-duplex, 1000 Mb/s, media type is 1G
-            # auto-duplex, auto-speed, media type is 10G
-            m = p10.match(line)
-            if m:
-                duplex_mode = m.groupdict()['duplex_mode'].lower()
-                port_speed = m.groupdict()['port_speed']
-                if m.groupdict()['media_type']:
-                    interface_dict[interface]['media_type'] = m.groupdict()['media_type']
-                else:
-                    media_type = None
-
-                interface_dict[interface]['duplex_mode'] = duplex_mode
-                interface_dict[interface]['port_speed'] = port_speed
-                continue
-
-            #Beacon is turned off
-            m = p11.match(line)
-            if m:
-                beacon = m.groupdict()['beacon']
-                interface_dict[interface]['beacon'] = beacon
-                continue
-
-            #Auto-Negotiation is turned off
-            m = p12.match(line)
-            if m:
-                auto_negotiation = m.groupdict()['auto_negotiate']
-                interface_dict[interface]['auto_negotiate'] = False
-                continue
-
-            #Auto-Negotiation is turned on
-            m = p12_1.match(line)
-            if m:
-                auto_negotiation = m.groupdict()['auto_negotiate']
-                interface_dict[interface]['auto_negotiate'] = True
-                continue
-
-            #Input flow-control is off, output flow-control is off
-            m = p13.match(line)
-            if m:
-                receive = m.groupdict()['receive']
-                send = m.groupdict()['send']
-
-                if 'flow_control' not in interface_dict[interface]:
-                    interface_dict[interface]['flow_control'] = {}
-
-                interface_dict[interface]['flow_control']['receive'] = False
-                interface_dict[interface]['flow_control']['send'] = False
-                continue
-            #Input flow-control is off, output flow-control is on
-            m = p13_1.match(line)
-            if m:
-                receive = m.groupdict()['receive']
-                send = m.groupdict()['send']
-
-                if 'flow_control' not in interface_dict[interface]:
-                    interface_dict[interface]['flow_control'] = {}
-
-                interface_dict[interface]['flow_control']['receive'] = True
-                interface_dict[interface]['flow_control']['send'] = True
-                continue
-
-            #Auto-mdix is turned off
-            m = p14.match(line)
-            if m:
-                auto_mdix = m.groupdict()['auto_mdix']
-                interface_dict[interface]['auto_mdix'] = auto_mdix
-                continue
-
-            #Switchport monitor is off 
-            m = p15.match(line)
-            if m:
-                switchport_monitor = m.groupdict()['switchport_monitor']
-                interface_dict[interface]['switchport_monitor'] = switchport_monitor
-                continue
-
-            #EtherType is 0x8100 
-            m = p16.match(line)
-            if m:
-                ethertype = m.groupdict()['ethertype']
-                interface_dict[interface]['ethertype'] = ethertype
-                continue
-
-            # Members in this channel: Eth1/15, Eth1/16
-            # Members in this channel: Eth1/28
-            m = p38.match(line)
-            if m:
-                port_channel_member_intfs = m.groupdict()['port_channel_member_intfs']
-                if port_channel_member_intfs:
-                    if 'port_channel' not in interface_dict[interface]:
-                        interface_dict[interface]['port_channel'] = {}
-                    interface_dict[interface]['port_channel']\
-                        ['port_channel_member'] = True
-                    interface_dict[interface]['port_channel']\
-                        ['port_channel_member_intfs'] = [Common.convert_intf_name(item) \
-                                for item in port_channel_member_intfs.split(',')]
-                continue
+                    interface_dict[interface]['mtu'] = mtu
+                    interface_dict[interface]['bandwidth'] = bandwidth
+                    interface_dict[interface]['delay'] = int(m.groupdict()['delay'])
+                    break
+
+                # reliability 255/255, txload 1/255, rxload 1/255
+                elif name == 'p7':
+                    reliability = m.groupdict()['reliability']
+                    txload = m.groupdict()['txload']
+                    rxload = m.groupdict()['rxload']
+
+                    interface_dict[interface]['reliability'] = reliability
+                    interface_dict[interface]['txload'] = txload
+                    interface_dict[interface]['rxload'] = rxload
+                    break
+
+                #Encapsulation 802.1Q Virtual LAN, Vlan ID 10, medium is broadcast
+                #Encapsulation 802.1Q Virtual LAN, Vlan ID 20, medium is p2p
+                #Encapsulation ARPA, medium is broadcast
+                elif name == 'p8':
+                    encapsulation = m.groupdict()['encapsulation'].lower()
+                    encapsulation = encapsulation.replace("802.1q virtual lan","dot1q")
+                    medium = m.groupdict()['medium']
+
+                    if 'encapsulations' not in interface_dict[interface]:
+                        interface_dict[interface]['encapsulations'] = {}
+
+                    interface_dict[interface]['encapsulations']\
+                    ['encapsulation'] = encapsulation
+                    interface_dict[interface]['medium'] = medium
+                    break
+
+                elif name == 'p8_1':
+                    encapsulation = m.groupdict()['encapsulation'].lower()
+                    encapsulation = encapsulation.replace("802.1q virtual lan","dot1q")
+                    first_dot1q = str(m.groupdict()['first_dot1q'])
+                    medium = m.groupdict()['medium']
+
+                    if 'encapsulations' not in interface_dict[interface]:
+                        interface_dict[interface]['encapsulations'] = {}
+
+                    interface_dict[interface]['encapsulations']\
+                    ['encapsulation'] = encapsulation
+                    interface_dict[interface]['encapsulations']\
+                    ['first_dot1q'] = first_dot1q
+                    interface_dict[interface]['medium'] = medium
+                    break
+
+                # Encapsulation ARPA, loopback not set
+                elif name == 'p8_2':
+                    encapsulation = m.groupdict()['encapsulation'].lower()
+
+                    if 'encapsulations' not in interface_dict[interface]:
+                        interface_dict[interface]['encapsulations'] = {}
+
+                    interface_dict[interface]['encapsulations']\
+                    ['encapsulation'] = encapsulation
+                    break
+
+                #Port mode is routed
+                elif name == 'p9':
+                    port_mode = m.groupdict()['port_mode']
+                    interface_dict[interface]['port_mode'] = port_mode
+                    break
+
+                # auto-duplex, auto-speed
+                elif name == 'p10_1':
+                    # not caring for this line
+                    break
+
+                #full-duplex, 1000 Mb/s
+                # auto-duplex, auto-speed
+                # full-duplex, 1000 Mb/s, media type is 1G
+                # auto-duplex, auto-speed, media type is 10G
+                elif name == 'p10':
+                    duplex_mode = m.groupdict()['duplex_mode'].lower()
+                    port_speed = m.groupdict()['port_speed']
+                    if m.groupdict()['media_type']:
+                        interface_dict[interface]['media_type'] = m.groupdict()['media_type']
+                    else:
+                        media_type = None
+
+                    interface_dict[interface]['duplex_mode'] = duplex_mode
+                    interface_dict[interface]['port_speed'] = port_speed
+                    break
+
+                #Beacon is turned off
+                elif name == 'p11':
+                    beacon = m.groupdict()['beacon']
+                    interface_dict[interface]['beacon'] = beacon
+                    break
+
+                #Auto-Negotiation is turned off
+                elif name == 'p12':
+                    auto_negotiation = m.groupdict()['auto_negotiate']
+                    interface_dict[interface]['auto_negotiate'] = False
+                    break
+
+                #Auto-Negotiation is turned on
+                elif name == 'p12_1':
+                    auto_negotiation = m.groupdict()['auto_negotiate']
+                    interface_dict[interface]['auto_negotiate'] = True
+                    break
+
+                #Input flow-control is off, output flow-control is off
+                elif name == 'p13':
+                    receive = m.groupdict()['receive']
+                    send = m.groupdict()['send']
+
+                    if 'flow_control' not in interface_dict[interface]:
+                        interface_dict[interface]['flow_control'] = {}
+
+                    interface_dict[interface]['flow_control']['receive'] = False
+                    interface_dict[interface]['flow_control']['send'] = False
+                    break
+                #Input flow-control is off, output flow-control is on
+                elif name == 'p13_1':
+                    receive = m.groupdict()['receive']
+                    send = m.groupdict()['send']
+
+                    if 'flow_control' not in interface_dict[interface]:
+                        interface_dict[interface]['flow_control'] = {}
+
+                    interface_dict[interface]['flow_control']['receive'] = True
+                    interface_dict[interface]['flow_control']['send'] = True
+                    break
+
+                #Auto-mdix is turned off
+                elif name == 'p14':
+                    auto_mdix = m.groupdict()['auto_mdix']
+                    interface_dict[interface]['auto_mdix'] = auto_mdix
+                    break
+
+                #Switchport monitor is off 
+                elif name == 'p15':
+                    switchport_monitor = m.groupdict()['switchport_monitor']
+                    interface_dict[interface]['switchport_monitor'] = switchport_monitor
+                    break
+
+                #EtherType is 0x8100 
+                elif name == 'p16':
+                    ethertype = m.groupdict()['ethertype']
+                    interface_dict[interface]['ethertype'] = ethertype
+                    break
+
+                # Members in this channel: Eth1/15, Eth1/16
+                # Members in this channel: Eth1/28
+                elif name == 'p38':
+                    port_channel_member_intfs = m.groupdict()['port_channel_member_intfs']
+                    if port_channel_member_intfs:
+                        if 'port_channel' not in interface_dict[interface]:
+                            interface_dict[interface]['port_channel'] = {}
+                        interface_dict[interface]['port_channel']\
+                            ['port_channel_member'] = True
+                        interface_dict[interface]['port_channel']\
+                            ['port_channel_member_intfs'] = [Common.convert_intf_name(item) \
+                                    for item in port_channel_member_intfs.split(',')]
+                    break
             
-            #EEE (efficient-ethernet) : n/a
-            m = p17.match(line)
-            if m:
-                efficient_ethernet = m.groupdict()['efficient_ethernet']
-                interface_dict[interface]['efficient_ethernet'] = efficient_ethernet
-                continue
-
-            #Last link flapped 00:07:28
-            m = p18.match(line)
-            if m:
-                last_link_flapped = m.groupdict()['last_link_flapped']
-                interface_dict[interface]['last_link_flapped']\
-                 = last_link_flapped
-                continue
-
-            # Last clearing of "show interface" counters never
-            m = p19.match(line)
-            if m:
-                last_clear = m.groupdict()['last_clear']
-                continue
-
-            # Last clearing of "" counters 00:15:42
-            m = p19_1.match(line)
-            if m:
-                last_clear = m.groupdict()['last_clear']
-                continue
-
-            #1 interface resets
-            m = p20.match(line)
-            if m:
-                interface_reset = int(m.groupdict()['interface_reset'])
-                interface_dict[interface]['interface_reset'] = interface_reset
-                continue
-
-            # 1 minute input rate 0 bits/sec, 0 packets/sec  
-            m = p21.match(line)
-            if m:
-
-                load_interval = int(m.groupdict()['load_interval'])
-                in_rate = int(m.groupdict()['in_rate'])
-                in_rate_pkts = int(m.groupdict()['in_rate_pkts'])
-
-                if 'counters' not in interface_dict[interface]:
-                    interface_dict[interface]['counters'] = {}
-                if 'rate' not in interface_dict[interface]['counters']:
-                    interface_dict[interface]['counters']['rate'] = {}
+                #EEE (efficient-ethernet) : n/a
+                elif name == 'p17':
+                    efficient_ethernet = m.groupdict()['efficient_ethernet']
+                    interface_dict[interface]['efficient_ethernet'] = efficient_ethernet
+                    break
+
+                #Last link flapped 00:07:28
+                elif name == 'p18':
+                    last_link_flapped = m.groupdict()['last_link_flapped']
+                    interface_dict[interface]['last_link_flapped']\
+                     = last_link_flapped
+                    break
+
+                # Last clearing of "show interface" counters never
+                elif name == 'p19':
+                    last_clear = m.groupdict()['last_clear']
+                    break
+
+                # Last clearing of "" counters 00:15:42
+                elif name == 'p19_1':
+                    last_clear = m.groupdict()['last_clear']
+                    break
+
+                #1 interface resets
+                elif name == 'p20':
+                    interface_reset = int(m.groupdict()['interface_reset'])
+                    interface_dict[interface]['interface_reset'] = interface_reset
+                    break
+
+                # 1 minute input rate 0 bits/sec, 0 packets/sec  
+                elif name == 'p21':
+
+                    load_interval = int(m.groupdict()['load_interval'])
+                    in_rate = int(m.groupdict()['in_rate'])
+                    in_rate_pkts = int(m.groupdict()['in_rate_pkts'])
+
+                    if 'counters' not in interface_dict[interface]:
+                        interface_dict[interface]['counters'] = {}
+                    if 'rate' not in interface_dict[interface]['counters']:
+                        interface_dict[interface]['counters']['rate'] = {}
                 
-                interface_dict[interface]['counters']['rate']\
-                ['load_interval'] = load_interval
-                interface_dict[interface]['counters']['rate']\
-                ['in_rate'] = in_rate
-                interface_dict[interface]['counters']['rate']\
-                ['in_rate_pkts'] = in_rate_pkts
-                continue
+                    interface_dict[interface]['counters']['rate']\
+                    ['load_interval'] = load_interval
+                    interface_dict[interface]['counters']['rate']\
+                    ['in_rate'] = in_rate
+                    interface_dict[interface]['counters']['rate']\
+                    ['in_rate_pkts'] = in_rate_pkts
+                    break
+
+                #1 minute output rate 24 bits/sec, 0 packets/sec
+                elif name == 'p22':
+                    load_interval = int(m.groupdict()['load_interval'])
+                    out_rate = int(m.groupdict()['out_rate'])
+                    out_rate_pkts = int(m.groupdict()['out_rate_pkts'])
+
+                    interface_dict[interface]['counters']['rate']\
+                    ['load_interval'] = load_interval
+                    interface_dict[interface]['counters']['rate']\
+                    ['out_rate'] = out_rate
+                    interface_dict[interface]['counters']['rate']\
+                    ['out_rate_pkts'] = out_rate_pkts
+                    break
+
+                #input rate 0 bps, 0 pps; output rate 0 bps, 0 pps
+                elif name == 'p23':
+                    in_rate_bps = int(m.groupdict()['in_rate_bps'])
+                    in_rate_pps = int(m.groupdict()['in_rate_pps'])
+                    out_rate_bps = int(m.groupdict()['out_rate_bps'])
+                    out_rate_pps = int(m.groupdict()['out_rate_pps'])
+
+                    if 'counters' not in interface_dict[interface]:
+                        interface_dict[interface]['counters'] = {}
+                    if 'rate' not in interface_dict[interface]['counters']:
+                        interface_dict[interface]['counters']['rate'] = {}
+
+                    interface_dict[interface]['counters']['rate']\
+                    ['in_rate_bps'] = in_rate_bps
+                    interface_dict[interface]['counters']['rate']\
+                    ['in_rate_pps'] = in_rate_pps
+                    interface_dict[interface]['counters']['rate']\
+                    ['out_rate_bps'] = out_rate_bps
+                    interface_dict[interface]['counters']['rate']\
+                    ['out_rate_pps'] = out_rate_pps
+                    break
+                # RX
+                # Rx
+                elif name == 'p23_1':
+                    rx = m.groupdict()['rx']
+                    if 'counters' not in interface_dict[interface]:
+                        interface_dict[interface]['counters'] = {}
+
+                    interface_dict[interface]['counters']['rx'] = True
+                    break
 
-            #1 minute output rate 24 bits/sec, 0 packets/sec
-            m = p22.match(line)
-            if m:
-                load_interval = int(m.groupdict()['load_interval'])
-                out_rate = int(m.groupdict()['out_rate'])
-                out_rate_pkts = int(m.groupdict()['out_rate_pkts'])
-
-                interface_dict[interface]['counters']['rate']\
-                ['load_interval'] = load_interval
-                interface_dict[interface]['counters']['rate']\
-                ['out_rate'] = out_rate
-                interface_dict[interface]['counters']['rate']\
-                ['out_rate_pkts'] = out_rate_pkts
-                continue
-
-            #input rate 0 bps, 0 pps; output rate 0 bps, 0 pps
-            m = p23.match(line)
-            if m:
-                in_rate_bps = int(m.groupdict()['in_rate_bps'])
-                in_rate_pps = int(m.groupdict()['in_rate_pps'])
-                out_rate_bps = int(m.groupdict()['out_rate_bps'])
-                out_rate_pps = int(m.groupdict()['out_rate_pps'])
-
-                if 'counters' not in interface_dict[interface]:
-                    interface_dict[interface]['counters'] = {}
-                if 'rate' not in interface_dict[interface]['counters']:
-                    interface_dict[interface]['counters']['rate'] = {}
-
-                interface_dict[interface]['counters']['rate']\
-                ['in_rate_bps'] = in_rate_bps
-                interface_dict[interface]['counters']['rate']\
-                ['in_rate_pps'] = in_rate_pps
-                interface_dict[interface]['counters']['rate']\
-                ['out_rate_bps'] = out_rate_bps
-                interface_dict[interface]['counters']['rate']\
-                ['out_rate_pps'] = out_rate_pps
-                continue
-            # RX
-            # Rx
-            m = p23_1.match(line)
-            if m:
-                rx = m.groupdict()['rx']
-                if 'counters' not in interface_dict[interface]:
-                    interface_dict[interface]['counters'] = {}
-
-                interface_dict[interface]['counters']['rx'] = True
-                continue
-
-            if rx:
                 #0 unicast packets  0 multicast packets  0 broadcast packets
-                m = p24.match(line)
-                if m:
+                elif name == 'p24' and rx:
                     in_unicast_pkts = int(m.groupdict()['in_unicast_pkts'])
                     in_multicast_pkts = int(m.groupdict()['in_multicast_pkts'])
                     in_broadcast_pkts = int(m.groupdict()['in_broadcast_pkts'])
-            
+
                     interface_dict[interface]['counters']['in_unicast_pkts'] = in_unicast_pkts
                     interface_dict[interface]['counters']['in_multicast_pkts'] = in_multicast_pkts
                     interface_dict[interface]['counters']['in_broadcast_pkts'] = in_broadcast_pkts
@@ -912,158 +883,142 @@ class ShowInterface(ShowInterfaceSchema):
                         interface_dict[interface]['counters']['last_clear'] = last_clear
                     except Exception:
                         pass
-                    continue
-                    
-
-            # 0 input packets  0 bytes
-            # 607382344 input packets 445986207 unicast packets 132485585 multicast packets
-            m = p25.match(line)
-            if m:
-                group = m.groupdict()
-                if 'counters' not in interface_dict[interface]:
-                    interface_dict[interface]['counters'] = {}
-                interface_dict[interface]['counters']['in_pkts'] = int(group['in_pkts'])
-                if group['in_octets']:
-                    interface_dict[interface]['counters']['in_octets'] = int(group['in_octets'])
-                if group['in_unicast_pkts']:
-                    interface_dict[interface]['counters']['in_unicast_pkts'] = int(group['in_unicast_pkts'])
-                if group['in_multicast_pkts']:
-                    interface_dict[interface]['counters']['in_multicast_pkts'] = int(group['in_multicast_pkts'])
-                continue
-
-            # 28910552 broadcast packets 63295517997 bytes
-            m = p39.match(line)
-            if m:
-                in_octets = int(m.groupdict()['in_octets'])
-                interface_dict[interface]['counters']['in_octets'] = in_octets
+                    break
+
+
+                # 0 input packets  0 bytes
+                # 607382344 input packets 445986207 unicast packets 132485585 multicast packets
+                elif name == 'p25':
+                    group = m.groupdict()
+                    if 'counters' not in interface_dict[interface]:
+                        interface_dict[interface]['counters'] = {}
+                    interface_dict[interface]['counters']['in_pkts'] = int(group['in_pkts'])
+                    if group['in_octets']:
+                        interface_dict[interface]['counters']['in_octets'] = int(group['in_octets'])
+                    if group['in_unicast_pkts']:
+                        interface_dict[interface]['counters']['in_unicast_pkts'] = int(group['in_unicast_pkts'])
+                    if group['in_multicast_pkts']:
+                        interface_dict[interface]['counters']['in_multicast_pkts'] = int(group['in_multicast_pkts'])
+                    break
+
+                # 28910552 broadcast packets 63295517997 bytes
+                elif name == 'p39':
+                    in_octets = int(m.groupdict()['in_octets'])
+                    interface_dict[interface]['counters']['in_octets'] = in_octets
                 
-                in_broadcast_pkts = int(m.groupdict()['in_broadcast_pkts'])
-                interface_dict[interface]['counters']['in_broadcast_pkts'] = in_broadcast_pkts
-
-            #0 jumbo packets  0 storm suppression packets
-            m = p26.match(line)
-            if m:
-                in_jumbo_packets = int(m.groupdict()['in_jumbo_packets'])
-                in_storm_suppression_packets = int(m.groupdict()['in_storm_suppression_packets'])
-
-                interface_dict[interface]['counters']['in_jumbo_packets']= in_jumbo_packets
-                interface_dict[interface]['counters']\
-                ['in_storm_suppression_packets'] = in_storm_suppression_packets
-                continue
-
-            #0 runts  0 giants  0 CRC/FCS  0 no buffer
-            #0 runts  0 giants  0 CRC  0 no buffer
-            m = p27.match(line)
-            if m:
-
-                interface_dict[interface]['counters']['in_runts'] = int(m.groupdict()['in_runts'])
-                interface_dict[interface]['counters']['in_oversize_frame'] = int(m.groupdict()['in_oversize_frame'])
-                interface_dict[interface]['counters']['in_crc_errors'] = int(m.groupdict()['in_crc_errors'])
-                interface_dict[interface]['counters']['in_no_buffer'] = int(m.groupdict()['in_no_buffer'])
-                continue
-
-            #0 input error  0 short frame  0 overrun   0 underrun  0 ignored
-            m = p28.match(line)
-            if m:
-
-                interface_dict[interface]['counters']['in_errors'] = int(m.groupdict()['in_errors'])
-                interface_dict[interface]['counters']['in_short_frame'] = int(m.groupdict()['in_short_frame'])
-                interface_dict[interface]['counters']['in_overrun'] = int(m.groupdict()['in_overrun'])
-                interface_dict[interface]['counters']['in_underrun'] = int(m.groupdict()['in_underrun'])
-                interface_dict[interface]['counters']['in_ignored'] = int(m.groupdict()['in_ignored'])
-                continue
-
-            #0 watchdog  0 bad etype drop  0 bad proto drop  0 if down drop
-            m = p29.match(line)
-            if m:
-
-                interface_dict[interface]['counters']['in_watchdog'] = int(m.groupdict()['in_watchdog'])
-                interface_dict[interface]['counters']['in_bad_etype_drop'] = int(m.groupdict()['in_bad_etype_drop'])
-                interface_dict[interface]['counters']['in_unknown_protos'] = int(m.groupdict()['in_unknown_protos'])
-                interface_dict[interface]['counters']['in_if_down_drop'] = int(m.groupdict()['in_if_down_drop'])
-                continue
-
-            # 0 input with dribble  0 input discard
-            m = p30.match(line)
-            if m:
-                in_with_dribble = int(m.groupdict()['in_with_dribble'])
-                in_discard = int(m.groupdict()['in_discard'])
-
-                interface_dict[interface]['counters']['in_with_dribble'] = in_with_dribble
-                interface_dict[interface]['counters']['in_discard'] = in_discard
-                continue
-
-            # 0 Rx pause
-            m = p31.match(line)
-            if m:
-                in_mac_pause_frames = int(m.groupdict()['in_mac_pause_frames'])
+                    in_broadcast_pkts = int(m.groupdict()['in_broadcast_pkts'])
+                    interface_dict[interface]['counters']['in_broadcast_pkts'] = in_broadcast_pkts
 
-                interface_dict[interface]['counters']['in_mac_pause_frames'] = in_mac_pause_frames
-                continue
-            # TX
-            # Tx
-            m = p31_1.match(line)
-            if m:
-                rx = False
-                tx = m.groupdict()['tx']
-                if 'counters' not in interface_dict[interface]:
-                    interface_dict[interface]['counters'] = {}
-                interface_dict[interface]['counters']['tx'] = True
-                continue
+                #0 jumbo packets  0 storm suppression packets
+                elif name == 'p26':
+                    in_jumbo_packets = int(m.groupdict()['in_jumbo_packets'])
+                    in_storm_suppression_packets = int(m.groupdict()['in_storm_suppression_packets'])
+
+                    interface_dict[interface]['counters']['in_jumbo_packets']= in_jumbo_packets
+                    interface_dict[interface]['counters']\
+                    ['in_storm_suppression_packets'] = in_storm_suppression_packets
+                    break
+
+                #0 runts  0 giants  0 CRC/FCS  0 no buffer
+                #0 runts  0 giants  0 CRC  0 no buffer
+                elif name == 'p27':
+
+                    interface_dict[interface]['counters']['in_runts'] = int(m.groupdict()['in_runts'])
+                    interface_dict[interface]['counters']['in_oversize_frame'] = int(m.groupdict()['in_oversize_frame'])
+                    interface_dict[interface]['counters']['in_crc_errors'] = int(m.groupdict()['in_crc_errors'])
+                    interface_dict[interface]['counters']['in_no_buffer'] = int(m.groupdict()['in_no_buffer'])
+                    break
+
+                #0 input error  0 short frame  0 overrun   0 underrun  0 ignored
+                elif name == 'p28':
+
+                    interface_dict[interface]['counters']['in_errors'] = int(m.groupdict()['in_errors'])
+                    interface_dict[interface]['counters']['in_short_frame'] = int(m.groupdict()['in_short_frame'])
+                    interface_dict[interface]['counters']['in_overrun'] = int(m.groupdict()['in_overrun'])
+                    interface_dict[interface]['counters']['in_underrun'] = int(m.groupdict()['in_underrun'])
+                    interface_dict[interface]['counters']['in_ignored'] = int(m.groupdict()['in_ignored'])
+                    break
+
+                #0 watchdog  0 bad etype drop  0 bad proto drop  0 if down drop
+                elif name == 'p29':
+
+                    interface_dict[interface]['counters']['in_watchdog'] = int(m.groupdict()['in_watchdog'])
+                    interface_dict[interface]['counters']['in_bad_etype_drop'] = int(m.groupdict()['in_bad_etype_drop'])
+                    interface_dict[interface]['counters']['in_unknown_protos'] = int(m.groupdict()['in_unknown_protos'])
+                    interface_dict[interface]['counters']['in_if_down_drop'] = int(m.groupdict()['in_if_down_drop'])
+                    break
+
+                # 0 input with dribble  0 input discard
+                elif name == 'p30':
+                    in_with_dribble = int(m.groupdict()['in_with_dribble'])
+                    in_discard = int(m.groupdict()['in_discard'])
+
+                    interface_dict[interface]['counters']['in_with_dribble'] = in_with_dribble
+                    interface_dict[interface]['counters']['in_discard'] = in_discard
+                    break
+
+                # 0 Rx pause
+                elif name == 'p31':
+                    in_mac_pause_frames = int(m.groupdict()['in_mac_pause_frames'])
+
+                    interface_dict[interface]['counters']['in_mac_pause_frames'] = in_mac_pause_frames
+                    break
+                # TX
+                # Tx
+                elif name == 'p31_1':
+                    rx = False
+                    tx = m.groupdict()['tx']
+                    if 'counters' not in interface_dict[interface]:
+                        interface_dict[interface]['counters'] = {}
+                    interface_dict[interface]['counters']['tx'] = True
+                    break
                 
-            if tx:
                 #0 unicast packets  0 multicast packets  0 broadcast packets
-                m = p32.match(line)
-                if m :
+                elif name == 'p32' and tx:
                     interface_dict[interface]['counters']['out_unicast_pkts'] = int(m.groupdict()['out_unicast_pkts'])
                     interface_dict[interface]['counters']['out_multicast_pkts'] = int(m.groupdict()['out_multicast_pkts'])
                     interface_dict[interface]['counters']['out_broadcast_pkts'] = int(m.groupdict()['out_broadcast_pkts'])
-                    continue
-
-            #0 output packets  0 bytes
-            m = p33.match(line)
-            if m:
-                out_pkts = int(m.groupdict()['out_pkts'])
-                out_octets = int(m.groupdict()['out_octets'])
-
-                interface_dict[interface]['counters']['out_pkts'] = out_pkts
-                interface_dict[interface]['counters']['out_octets'] = out_octets
-                continue
-
-            #0 jumbo packets
-            m = p34.match(line)
-            if m:
-                out_jumbo_packets = int(m.groupdict()['out_jumbo_packets'])
-
-                interface_dict[interface]['counters']['out_jumbo_packets'] = out_jumbo_packets
-                continue
-
-            #0 output error  0 collision  0 deferred  0 late collision
-            m = p35.match(line)
-            if m:
-                interface_dict[interface]['counters']['out_errors'] = int(m.groupdict()['out_errors'])
-                interface_dict[interface]['counters']['out_collision'] = int(m.groupdict()['out_collision'])
-                interface_dict[interface]['counters']['out_deferred'] = int(m.groupdict()['out_deferred'])
-                interface_dict[interface]['counters']['out_late_collision'] = int(m.groupdict()['out_late_collision'])
-                continue
-
-            #0 lost carrier  0 no carrier  0 babble  0 output discard
-            m = p36.match(line)
-            if m:
-
-                interface_dict[interface]['counters']['out_lost_carrier'] = int(m.groupdict()['out_lost_carrier'])
-                interface_dict[interface]['counters']['out_no_carrier'] = int(m.groupdict()['out_no_carrier'])
-                interface_dict[interface]['counters']['out_babble'] = int(m.groupdict()['out_babble'])
-                interface_dict[interface]['counters']['out_discard'] = int(m.groupdict()['out_discard'])
-                continue
-
-            #0 Tx pause
-            m = p37.match(line)
-            if m:
-                out_mac_pause_frames = int(m.groupdict()['out_mac_pause_frames'])
-
-                interface_dict[interface]['counters']['out_mac_pause_frames'] = out_mac_pause_frames
-                continue
+                    break
+
+                #0 output packets  0 bytes
+                elif name == 'p33':
+                    out_pkts = int(m.groupdict()['out_pkts'])
+                    out_octets = int(m.groupdict()['out_octets'])
+
+                    interface_dict[interface]['counters']['out_pkts'] = out_pkts
+                    interface_dict[interface]['counters']['out_octets'] = out_octets
+                    break
+
+                #0 jumbo packets
+                elif name == 'p34':
+                    out_jumbo_packets = int(m.groupdict()['out_jumbo_packets'])
+
+                    interface_dict[interface]['counters']['out_jumbo_packets'] = out_jumbo_packets
+                    break
+
+                #0 output error  0 collision  0 deferred  0 late collision
+                elif name == 'p35':
+                    interface_dict[interface]['counters']['out_errors'] = int(m.groupdict()['out_errors'])
+                    interface_dict[interface]['counters']['out_collision'] = int(m.groupdict()['out_collision'])
+                    interface_dict[interface]['counters']['out_deferred'] = int(m.groupdict()['out_deferred'])
+                    interface_dict[interface]['counters']['out_late_collision'] = int(m.groupdict()['out_late_collision'])
+                    break
+
+                #0 lost carrier  0 no carrier  0 babble  0 output discard
+                elif name == 'p36':
+
+                    interface_dict[interface]['counters']['out_lost_carrier'] = int(m.groupdict()['out_lost_carrier'])
+                    interface_dict[interface]['counters']['out_no_carrier'] = int(m.groupdict()['out_no_carrier'])
+                    interface_dict[interface]['counters']['out_babble'] = int(m.groupdict()['out_babble'])
+                    interface_dict[interface]['counters']['out_discard'] = int(m.groupdict()['out_discard'])
+                    break
+
+                #0 Tx pause
+                elif name == 'p37':
+                    out_mac_pause_frames = int(m.groupdict()['out_mac_pause_frames'])
+
+                    interface_dict[interface]['counters']['out_mac_pause_frames'] = out_mac_pause_frames
+                    break
 
         return interface_dict
 
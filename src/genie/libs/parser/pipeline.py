@@ -0,0 +1,195 @@
+'''Collecting and parsing outputs of a fleet of devices with asyncio.
+
+`MetaParser.parse()` executes its command on the device and parses the
+output in the same call, so a device waits on its parsing before sending its
+next command, and parsing waits on the device. A Pipeline overlaps both:
+commands are executed through awaitable callables, many devices at a time,
+while the outputs already collected are parsed in a pool of processes.
+Blocking callables, such as the `execute` of a pyATS device, are run in the
+threads of the event loop.
+
+    >>> async def main(devices):
+    ...     async with Pipeline(per_device=2) as pipeline:
+    ...         return await pipeline.run(
+    ...             (device, command, sessions[device.name].execute)
+    ...             for device in devices
+    ...             for command in ('show version', 'show ip route'))
+
+Each result holds what `parse()` returns for the output, or the exception it
+raised. The commands in flight per device are bounded, and so are the
+commands in flight and outputs waiting to be parsed over all the devices: a
+slow pool slows the collection down instead of piling outputs up in memory.
+
+OutputTransport stands in for a device session in tests and offline runs:
+
+    >>> transport = OutputTransport({'show version': output})
+    >>> await pipeline.parse(device, 'show version', transport.execute)
+'''
+
+# python
+import asyncio
+import inspect
+import collections
+from concurrent.futures import ProcessPoolExecutor
+
+from .batch import OfflineDevice
+from .utils import common
+
+# Result of a command of a device, `parsed` is None when `error` is set
+ParseResult = collections.namedtuple('ParseResult',
+                                     ['device', 'command', 'parsed', 'error'])
+
+
+class OutputTransport(object):
+    '''Awaitable execute over outputs known in advance.
+
+    Args:
+        outputs (`dict`): output of each command
+        delay (`float`): seconds each command takes, to simulate a device
+    '''
+
+    def __init__(self, outputs, delay=0):
+        self.outputs = outputs
+        self.delay = delay
+
+    async def execute(self, command):
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        try:
+            return self.outputs[command]
+        except KeyError:
+            raise KeyError("No output for '{}'".format(command)) from None
+
+
+async def _execute(execute, command):
+    '''Execute a command through an awaitable or a blocking callable'''
+    if asyncio.iscoroutinefunction(execute):
+        return await execute(command)
+    # Blocking, such as device.execute, kept out of the event loop
+    loop = asyncio.get_running_loop()
+    output = await loop.run_in_executor(None, execute, command)
+    if inspect.isawaitable(output):
+        output = await output
+    return output
+
+
+def _parse(parser_cls, device, output, kwargs):
+    '''Parse an output in a worker, as parse() would on the device'''
+    return parser_cls(device=OfflineDevice(*device)).parse(output=output,
+                                                           **kwargs)
+
+
+class Pipeline(object):
+    '''Execute commands on devices and parse their outputs concurrently.
+
+    Args:
+        executor: concurrent.futures executor the outputs are parsed in. By
+                  default a pool of processes, shut down on close()
+        workers (`int`): size of the default pool, the number of CPUs by
+                         default
+        per_device (`int`): commands in flight per device
+        pending (`int`): commands in flight and outputs not parsed yet, over
+                         all the devices
+    '''
+
+    def __init__(self, executor=None, workers=None, per_device=1,
+                 pending=64):
+        self._owned = executor is None
+        self.executor = executor or ProcessPoolExecutor(workers)
+        self.per_device = per_device
+        self.pending = pending
+        self._devices = {}
+        self._pending = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        self.close()
+
+    def close(self):
+        '''Shut the default pool down'''
+        if self._owned:
+            self.executor.shutdown()
+
+    def _device_slots(self, device):
+        name = getattr(device, 'name', device)
+        if name not in self._devices:
+            self._devices[name] = asyncio.Semaphore(self.per_device)
+        return self._devices[name]
+
+    async def parse(self, device, command, execute=None, **kwargs):
+        '''Execute a command on a device and parse its output.
+
+        Args:
+            device: device the command is for, its os/platform/model select
+                    the parser
+            command (`str`): show command
+            execute: callable executing a command and returning its
+                     output, `device.execute` by default. Callables which
+                     are not coroutine functions are run in the default
+                     executor of the event loop
+            **kwargs: arguments of the parser, on top of those found in the
+                      command
+
+        Returns:
+            dict: what `parse()` of the parser returns
+
+        Raises:
+            Exception: raised by get_parser, execute or the parser
+        '''
+        if self._pending is None:
+            # Created in the loop running the pipeline
+            self._pending = asyncio.Semaphore(self.pending)
+
+        parser_cls, parser_kwargs = common.get_parser(command, device)
+        parser_kwargs.update(kwargs)
+        execute = execute or device.execute
+
+        async with self._device_slots(device):
+            # Taken once the device is free, so the commands waiting on a
+            # busy device do not hold the budget of the other devices
+            await self._pending.acquire()
+            try:
+                output = await _execute(execute, command)
+            except BaseException:
+                self._pending.release()
+                raise
+
+        try:
+            # The device itself may not be picklable
+            tokens = (device.os, getattr(device, 'platform', None),
+                      getattr(device, 'model', None),
+                      getattr(device, 'name', None))
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self.executor, _parse, parser_cls, tokens, output,
+                parser_kwargs)
+        finally:
+            self._pending.release()
+
+    async def _result(self, job, callback):
+        device, command = job[:2]
+        execute = job[2] if len(job) > 2 else None
+        try:
+            result = ParseResult(device, command,
+                                 await self.parse(device, command, execute),
+                                 None)
+        except Exception as e:
+            result = ParseResult(device, command, None, e)
+        if callback:
+            callback(result)
+        return result
+
+    async def run(self, jobs, callback=None):
+        '''Execute and parse a batch of commands.
+
+        Args:
+            jobs: (device, command) or (device, command, execute) tuples
+            callback: called with each ParseResult as soon as it is ready
+
+        Returns:
+            list: the ParseResult of each job, in the order of the jobs
+        '''
+        return await asyncio.gather(*(self._result(job, callback)
+                                      for job in jobs))
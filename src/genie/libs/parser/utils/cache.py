@@ -0,0 +1,89 @@
+'''Bounded caches used by the parser utilities'''
+
+# python
+import threading
+from collections import OrderedDict
+
+# Marker for missing entries, None is a valid cached value
+_MISSING = object()
+
+
+class LRUCache(object):
+    '''Thread safe least recently used cache with hit/miss counters.
+
+    Args:
+        maxsize (`int`): maximum number of entries, 0 disables the cache
+
+    Example:
+
+        >>> cache = LRUCache(maxsize=2)
+        >>> cache.set('a', 1)
+        >>> cache.get('a')
+        1
+        >>> cache.info()
+        {'hits': 1, 'misses': 0, 'size': 1, 'maxsize': 2}
+    '''
+
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def get(self, key, default=None):
+        '''Return the cached value of `key` and mark it as recently used'''
+        with self._lock:
+            value = self._data.get(key, _MISSING)
+            if value is _MISSING:
+                self.misses += 1
+                return default
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def count_hit(self):
+        '''Count the last miss as a hit, for a value found elsewhere by the
+        caller, such as on disk'''
+        with self._lock:
+            self.misses -= 1
+            self.hits += 1
+
+    def set(self, key, value):
+        '''Cache `value`, evicting the least recently used entries if full'''
+        if self.maxsize <= 0:
+            return
+
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def resize(self, maxsize):
+        '''Change the maximum number of entries'''
+        with self._lock:
+            self.maxsize = maxsize
+            while len(self._data) > max(maxsize, 0):
+                self._data.popitem(last=False)
+
+    def clear(self, stats=False):
+        '''Drop all entries, and reset the counters if `stats` is True'''
+        with self._lock:
+            self._data.clear()
+            if stats:
+                self.hits = self.misses = 0
+
+    def info(self):
+        '''Return the hits, misses, size and maxsize of the cache'''
+        return {'hits': self.hits,
+                'misses': self.misses,
+                'size': len(self._data),
+                'maxsize': self.maxsize}
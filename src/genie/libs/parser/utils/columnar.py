@@ -0,0 +1,279 @@
+'''Compact columnar storage of large table outputs
+
+A parsed table is a tree of small dictionaries, one or more per entry, each
+holding its own keys and values: around a kilobyte per MAC address, ARP
+entry or route. A ColumnarTable holds the same data as columns instead. The
+entries sharing the same path in the schema, such as the interfaces of the
+MAC addresses of the VLANs, make a set of columns, one per field and one
+per variable key of the path. The columns are arrays of codes into a
+dictionary of the distinct values of the table, shared by all its columns:
+
+    >>> table = parser.parse_columnar(output)
+    >>> columns = table.columns(
+    ...     'mac_table', 'vlans', None, 'mac_addresses', None, 'interfaces',
+    ...     None)
+    >>> columns.keys
+    ('vlans', 'mac_addresses', 'interfaces')
+    >>> columns.column('entry_type')[:3]
+    ['dynamic', 'dynamic', 'static']
+
+and converts back to the dictionary the parser returns, for consumers of
+the schema:
+
+    >>> table.to_dict() == merge_records(parser.iter_records(output))
+    True
+
+Which keys are variable, such as VLAN ids or MAC addresses, and which are
+part of the schema, such as 'interfaces', is read from the schema of the
+parser: a key matched by Any() or by a type is variable. Without a schema,
+keys other than strings are.
+'''
+
+# python
+import copy
+from array import array
+
+# Metaparser
+from genie.metaparser.util.schemaengine import Any, Optional
+
+# Code of a field an entry does not have
+MISSING = -1
+
+# Types of the values decoded without a copy
+IMMUTABLE = (str, int, float, bool, type(None))
+
+
+def _value_key(value):
+    '''Key of a value in the dictionary of a table, None if it has none.
+
+    Strings are their own key. Other values are keyed with their type, so
+    that 1, 1.0 and True are told apart.
+    '''
+    if type(value) is str:
+        return value
+    if isinstance(value, list):
+        key = list, tuple(value)
+    else:
+        key = type(value), value
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _schema_keys(schema):
+    '''Split the keys of a schema dictionary into its fixed keys, with their
+    schema, and the schema of its variable keys'''
+    fixed = {}
+    variable = None
+    for key, value in schema.items():
+        if isinstance(key, Any) or isinstance(key, type):
+            variable = value
+        elif isinstance(key, Optional):
+            fixed[key.schema] = value
+        elif isinstance(key, str):
+            fixed[key] = value
+    return fixed, variable
+
+
+class Columns(object):
+    '''The columns of the entries of a table sharing a path.
+
+    Args:
+        table (`ColumnarTable`): table the columns belong to
+        path (`tuple`): path of the entries in the parsed dictionary, None in
+                        place of each variable key
+        keys (`tuple`): names of the variable keys of the path, from the
+                        fixed key before each of them
+    '''
+
+    __slots__ = ('table', 'path', 'keys', 'size', '_keys', '_fields')
+
+    def __init__(self, table, path, keys):
+        self.table = table
+        self.path = path
+        self.keys = keys
+        self.size = 0
+        self._keys = [array('i') for _ in keys]
+        self._fields = {}
+
+    def __len__(self):
+        return self.size
+
+    @property
+    def fields(self):
+        '''Names of the fields of the entries'''
+        return tuple(self._fields)
+
+    def append(self, keys, fields):
+        '''Append an entry.
+
+        Args:
+            keys (`list`): codes of the variable keys of its path
+            fields (`dict`): codes of its fields
+        '''
+        if self.size and all(column[-1] == code for column, code
+                             in zip(self._keys, keys)):
+            # The same entry, met again in another record
+            for name, code in fields.items():
+                if name not in self._fields:
+                    self._add_field(name)
+                self._fields[name][-1] = code
+            return
+
+        self.size += 1
+        for column, code in zip(self._keys, keys):
+            column.append(code)
+        for name, column in self._fields.items():
+            column.append(fields.pop(name, MISSING))
+        for name, code in fields.items():
+            self._add_field(name)
+            self._fields[name][-1] = code
+
+    def _add_field(self, name):
+        self._fields[name] = array('i', [MISSING]) * self.size
+
+    def column(self, name):
+        '''Return the values of a field, or of a variable key, as a list.
+        Entries without the field hold None.'''
+        if name in self._fields:
+            codes = self._fields[name]
+        else:
+            codes = self._keys[self.keys.index(name)]
+        decode = self.table.decode
+        return [None if code == MISSING else decode(code) for code in codes]
+
+    def __iter__(self):
+        '''Yield the variable keys and the fields of each entry'''
+        decode = self.table.decode
+        fields = list(self._fields.items())
+        for row in range(self.size):
+            yield (tuple(decode(column[row]) for column in self._keys),
+                   {name: decode(column[row]) for name, column in fields
+                    if column[row] != MISSING})
+
+
+class ColumnarTable(object):
+    '''Parsed output stored as columns, see the module documentation.
+
+    Args:
+        schema (`dict`): schema of the parser, to tell the variable keys of
+                         the parsed dictionaries from the fixed ones
+    '''
+
+    def __init__(self, schema=None):
+        self.schema = schema
+        self.values = []
+        self._codes = {}
+        # Columns of each path, in the order the paths are met
+        self._columns = {}
+
+    def __len__(self):
+        '''Number of entries, over all the paths'''
+        return sum(map(len, self._columns.values()))
+
+    @classmethod
+    def from_dict(cls, parsed, schema=None):
+        '''Build a table from a parsed dictionary'''
+        table = cls(schema)
+        table.append(parsed)
+        return table.compact()
+
+    def encode(self, value):
+        '''Return the code of a value, adding it to the dictionary'''
+        key = _value_key(value)
+        if key is None:
+            # Not hashable, stored as is
+            self.values.append(value)
+            return len(self.values) - 1
+        if self._codes is None:
+            self._codes = {_value_key(known): code
+                           for code, known in enumerate(self.values)}
+            self._codes.pop(None, None)
+        code = self._codes.get(key)
+        if code is None:
+            code = self._codes[key] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def decode(self, code):
+        '''Return the value of a code, a copy of it if it is mutable'''
+        value = self.values[code]
+        if type(value) in IMMUTABLE:
+            return value
+        return copy.deepcopy(value)
+
+    def compact(self):
+        '''Drop the index of the values, which only serves to append
+        entries. It is rebuilt if more are appended.
+
+        Returns:
+            the table
+        '''
+        self._codes = None
+        return self
+
+    def append(self, record):
+        '''Append the entries of a record, or of a whole parsed dictionary.
+
+        Entries met again, such as the VLAN of consecutive MAC addresses,
+        are merged into their last appearance, so records are merged the
+        way merge_records merges them.
+        '''
+        self._append(record, self.schema, (), (), [])
+
+    def _append(self, data, schema, path, names, keys):
+        if isinstance(schema, dict):
+            fixed, variable = _schema_keys(schema)
+        else:
+            fixed, variable = {}, None
+
+        fields = {}
+        children = []
+        for key, value in data.items():
+            if isinstance(value, dict):
+                children.append((key, value))
+            else:
+                fields[key] = self.encode(value)
+
+        if fields or not data:
+            columns = self._columns.get(path)
+            if columns is None:
+                columns = self._columns[path] = Columns(self, path, names)
+            columns.append(keys, fields)
+
+        for key, value in children:
+            # Keys the schema does not know of are fixed, if it has no
+            # variable key
+            if key in fixed or variable is None and \
+                    (isinstance(schema, dict) or isinstance(key, str)):
+                self._append(value, fixed.get(key), path + (key,), names,
+                             keys)
+            else:
+                name = path[-1] if path and path[-1] is not None else \
+                    '{}'.format(len(path))
+                self._append(value, variable, path + (None,),
+                             names + (name,), keys + [self.encode(key)])
+
+    def paths(self):
+        '''Return the paths of the entries, None in place of each variable
+        key'''
+        return list(self._columns)
+
+    def columns(self, *path):
+        '''Return the Columns of the entries at a path'''
+        return self._columns[path]
+
+    def to_dict(self):
+        '''Return the table as the dictionary the parser returns'''
+        result = {}
+        for columns in self._columns.values():
+            for keys, fields in columns:
+                node = result
+                keys = iter(keys)
+                for key in columns.path:
+                    node = node.setdefault(next(keys) if key is None
+                                           else key, {})
+                node.update(fields)
+        return result
@@ -0,0 +1,258 @@
+'''Token trie over the registered parser commands.
+
+The trie is used by `_fuzzy_search_command` to narrow down which registered
+commands can possibly match a search, so that `_matches_fuzzy` only has to
+score a handful of candidates instead of the whole `parser_data`.
+'''
+
+# python
+import re
+from bisect import bisect_left
+
+# Arguments which can only span a single search token. Every other argument
+# can span up to two search tokens (see `_matches_fuzzy`)
+SINGLE_TOKEN_ARGUMENTS = frozenset(['vrf', 'rd', 'instance', 'vrf_type',
+                                    'feature', 'fileA', 'fileB'])
+
+
+class CommandToken(object):
+    '''One token of a registered command.
+
+    Args:
+        text (`str`): the token as written in the command
+    '''
+
+    LITERAL = 'literal'
+    ARGUMENT = 'argument'
+    EMBEDDED = 'embedded'
+
+    __slots__ = ('text', 'kind', 'argument', 'span', 'start', 'end')
+
+    def __init__(self, text):
+        self.text = text
+        self.argument = None
+        self.span = 1
+        self.start = self.end = ''
+
+        if '{' not in text:
+            self.kind = self.LITERAL
+            return
+
+        self.argument = re.search('{(.*)}', text).groups()[0]
+
+        if text.startswith('{'):
+            self.kind = self.ARGUMENT
+            # Argument can span up to two search tokens
+            if self.argument not in SINGLE_TOKEN_ARGUMENTS:
+                self.span = 2
+        else:
+            # Argument embedded in the token, ie:
+            # /dna/intent/api/v1/interface/{interface}
+            self.kind = self.EMBEDDED
+            self.start, self.end = re.match('(.*){.*?}(.*)', text).groups()
+
+    def extract(self, token):
+        '''Return the value of an embedded argument, None if no match'''
+        if len(token) >= len(self.start) + len(self.end) and \
+                token.startswith(self.start) and token.endswith(self.end):
+            return token[len(self.start):len(token) - len(self.end)]
+        return None
+
+
+class CommandTemplate(object):
+    '''A registered command compiled once for the fuzzy matcher.
+
+    Args:
+        command (`str`): the registered command
+    '''
+
+    __slots__ = ('command', 'tokens', 'texts', 'lengths', 'arguments_from',
+                 'required_arguments', 'wildcard', '_pattern')
+
+    def __init__(self, command):
+        self.command = command
+        self.tokens = [CommandToken(text) for text in command.split()]
+        self.texts = [token.text for token in self.tokens]
+
+        # Summed length of the command tokens up to and including index j
+        self.lengths = []
+        total = 0
+        for text in self.texts:
+            total += len(text)
+            self.lengths.append(total)
+
+        # Whether an argument is found from index j onward
+        self.arguments_from = [False] * (len(self.tokens) + 1)
+        for j in reversed(range(len(self.tokens))):
+            self.arguments_from[j] = self.arguments_from[j + 1] or \
+                self.tokens[j].kind != CommandToken.LITERAL
+
+        self.required_arguments = len(re.findall('{.*?}', command))
+        self.wildcard = re.sub('{.*?}', '---', command)
+        self._pattern = None
+
+    @property
+    def pattern(self):
+        '''The command as a regex, arguments matching anything'''
+        if self._pattern is None:
+            self._pattern = re.compile(re.sub('{.*?}', '(.*)', self.command))
+        return self._pattern
+
+
+# Compiled templates, by command
+_templates = {}
+
+
+def get_template(command):
+    '''Return the compiled template of a command'''
+    template = _templates.get(command)
+    if template is None:
+        template = _templates[command] = CommandTemplate(command)
+    return template
+
+
+class _TrieNode(object):
+    '''A node of the command trie.
+
+    Literal command tokens are stored as children, argument placeholders
+    ({arg} or prefix{arg}suffix) are stored as wildcard edges. Commands ending
+    on this node are kept per OS.
+    '''
+
+    __slots__ = ('children', 'keys', 'wildcards', 'commands', 'os_commands')
+
+    def __init__(self):
+        self.children = {}
+        self.keys = None
+        self.wildcards = {}
+        self.commands = {}
+        self.os_commands = {}
+
+    def child(self, command_token):
+        if command_token.kind != CommandToken.LITERAL:
+            if command_token.text not in self.wildcards:
+                self.wildcards[command_token.text] = (command_token,
+                                                      _TrieNode())
+            return self.wildcards[command_token.text][1]
+
+        node = self.children.get(command_token.text)
+        if node is None:
+            node = self.children[command_token.text] = _TrieNode()
+            # Sorted keys are rebuilt on the next prefix search
+            self.keys = None
+        return node
+
+    def prefixed(self, token):
+        '''Yield children whose token starts with `token`.'''
+        if self.keys is None:
+            self.keys = sorted(self.children)
+
+        keys = self.keys
+        index = bisect_left(keys, token)
+        while index < len(keys) and keys[index].startswith(token):
+            yield self.children[keys[index]]
+            index += 1
+
+
+class CommandIndex(object):
+    '''Token trie of the registered commands with per-OS leaf sets.
+
+    The index only narrows down the search space; the candidates it returns
+    are a superset of the commands `_matches_fuzzy` accepts and must still be
+    scored by it. Candidates are returned in registration order so ranking
+    and ambiguity resolution are the same as a linear scan of `parser_data`.
+
+    Args:
+        data (`dict`): parser data to index, command -> os -> parser info
+    '''
+
+    def __init__(self, data=None):
+        self.clear()
+        if data:
+            self.build(data)
+
+    def __len__(self):
+        return len(self._order)
+
+    def __contains__(self, command):
+        return command in self._order
+
+    def clear(self):
+        self._root = _TrieNode()
+        self._order = {}
+
+    def build(self, data):
+        '''Index every command of `data`, replacing the current content.'''
+        self.clear()
+        for command, source in data.items():
+            self.add(command, source)
+
+    def add(self, command, source):
+        '''Index `command`, or refresh its OS set if already indexed.
+
+        Args:
+            command (`str`): the registered command
+            source (`dict`): parser information of the command, keyed by os
+        '''
+        order = self._order.setdefault(command, len(self._order))
+
+        node = self._root
+        for command_token in get_template(command).tokens:
+            node = node.child(command_token)
+
+        node.commands[command] = order
+        for os in source:
+            node.os_commands.setdefault(os, {})[command] = order
+
+    def search(self, tokens, os=None, fuzzy=False):
+        '''Return the commands which could match the search tokens.
+
+        Args:
+            tokens (`list`): the search tokens
+            os (`str`): only return commands registered for this os
+            fuzzy (`bool`): whether or not fuzzy mode is used
+
+        Returns:
+            list: candidate commands in registration order, or None when the
+                  search contains regex tokens and cannot be narrowed down
+        '''
+        if fuzzy:
+            # Deferred import, common imports this module
+            from .common import _is_regular_token
+
+            normalized = []
+            for token in tokens:
+                if token != '*' and not _is_regular_token(token):
+                    return None
+                normalized.append(token.replace(r'\|', '|')
+                                       .replace(r'\.', '.'))
+            tokens = normalized
+
+        found = {}
+        self._walk(self._root, tokens, 0, os, found)
+
+        return sorted(found, key=found.get)
+
+    def _walk(self, node, tokens, i, os, found):
+        if i == len(tokens):
+            if os is None:
+                found.update(node.commands)
+            else:
+                found.update(node.os_commands.get(os, {}))
+            return
+
+        token = tokens[i]
+
+        # Literal command tokens, either exact or abbreviated
+        for child in node.prefixed(token):
+            self._walk(child, tokens, i + 1, os, found)
+
+        # Argument placeholders
+        for command_token, child in node.wildcards.values():
+            if command_token.kind == CommandToken.ARGUMENT:
+                for width in range(1, command_token.span + 1):
+                    if i + width > len(tokens):
+                        break
+                    self._walk(child, tokens, i + width, os, found)
+            elif command_token.extract(token) is not None:
+                self._walk(child, tokens, i + 1, os, found)
@@ -7,6 +7,7 @@ import sys
 import json
 import math
 import logging
+import functools
 import warnings
 import importlib
 
@@ -16,6 +17,11 @@ from genie.metaparser.util import merge_dict
 
 from pyats import configuration as cfg
 from .extension import ExtendParsers
+from .cache import LRUCache
+from .command_index import CommandIndex, CommandToken, CommandTemplate, \
+                           get_template
+from .parser_index import parser_json_path, load_parser_data, \
+                          load_parser_details
 
 PYATS_EXT_PARSER = 'pyats.libs.external.parser'
 
@@ -23,20 +29,16 @@ log = logging.getLogger(__name__)
 
 def _load_parser_json():
     '''get all parser data in json file'''
-    try:
-        mod = importlib.import_module('genie.libs.parser')
-        parsers = os.path.join(mod.__path__[0], 'parsers.json')
-    except Exception:
-        parsers = ''
+    parsers = parser_json_path()
     if not os.path.isfile(parsers):
         log.warning('parsers.json does not exist, make sure you '
                     'are running with latest version of '
                     'genie.libs.parsers')
         parser_data = {}
     else:
-        # Open all the parsers in json file
-        with open(parsers) as f:
-            parser_data = json.load(f)
+        # Only the runtime part of parsers.json is loaded, docs and schemas
+        # are available through get_parser_details
+        parser_data = load_parser_data(parsers)
 
         # check if provided external parser packages
         ext_parser_package = cfg.get(PYATS_EXT_PARSER, None) or \
@@ -57,6 +59,82 @@ def _load_parser_json():
 # Parser within Genie
 parser_data = _load_parser_json()
 
+# Token trie over parser_data, built on first search
+command_index = CommandIndex()
+
+def _get_command_index():
+    '''Return the command index, (re)building it if parser_data changed'''
+    if len(command_index) != len(parser_data):
+        command_index.build(parser_data)
+
+    return command_index
+
+# Memoized get_parser resolutions
+PARSER_CACHE_SIZE = 1024
+parser_cache = LRUCache(maxsize=PARSER_CACHE_SIZE)
+
+# Full name of the interface types, by the short names parsers find in
+# outputs. Please add more when face other type of interface
+INTF_NAME_PREFIXES = {'Eth': 'Ethernet',
+                      'Lo': 'Loopback',
+                      'lo': 'Loopback',
+                      'Fa': 'FastEthernet',
+                      'Fas': 'FastEthernet',
+                      'Po': 'Port-channel',
+                      'PO': 'Port-channel',
+                      'Null': 'Null',
+                      'Gi': 'GigabitEthernet',
+                      'Gig': 'GigabitEthernet',
+                      'GE': 'GigabitEthernet',
+                      'Te': 'TenGigabitEthernet',
+                      'Ten': 'TenGigabitEthernet',
+                      'Tw': 'TwoGigabitEthernet',
+                      'Two': 'TwoGigabitEthernet',
+                      'Twe': 'TwentyFiveGigE',
+                      'mgmt': 'mgmt',
+                      'Vl': 'Vlan',
+                      'Tu': 'Tunnel',
+                      'Fe': '',
+                      'Hs': 'HSSI',
+                      'AT': 'ATM',
+                      'Et': 'Ethernet',
+                      'BD': 'BDI',
+                      'Se': 'Serial',
+                      'Fo': 'FortyGigabitEthernet',
+                      'For': 'FortyGigabitEthernet',
+                      'Hu': 'HundredGigE',
+                      'Hun': 'HundredGigE',
+                      'vl': 'vasileft',
+                      'vr': 'vasiright',
+                      'BE': 'Bundle-Ether'
+                      }
+
+_INTF_TYPE = re.compile(r'[a-zA-Z]+')
+_INTF_PORT = re.compile(r'[\d\/\.]+')
+
+# Common.convert_intf_name results are memoized, tables repeat the same few
+# interface names on many rows
+INTF_NAME_CACHE_SIZE = 4096
+
+def _convert_intf_name(intf):
+    '''Return the full interface name, uncached, see
+       Common.convert_intf_name'''
+    m = _INTF_TYPE.search(intf)
+    m1 = _INTF_PORT.search(intf)
+    if m and m1:
+        int_type = m.group(0)
+        if int_type in INTF_NAME_PREFIXES:
+            return INTF_NAME_PREFIXES[int_type] + m1.group(0)
+        # Unifying interface names
+        return intf[0].capitalize() + intf[1:].replace(
+            ' ', '').replace('ethernet', 'Ethernet')
+    return intf
+
+# functools.lru_cache rather than LRUCache: it is called for every row of
+# most tables, and a lookup in LRUCache costs as much as the conversion
+_cached_convert_intf_name = functools.lru_cache(
+    maxsize=INTF_NAME_CACHE_SIZE)(_convert_intf_name)
+
 def get_parser_commands(device, data=parser_data):
     '''Remove all commands which contain { as this requires
        extra kwargs which cannot be guessed dynamically
@@ -69,6 +147,27 @@ def get_parser_commands(device, data=parser_data):
         commands.append(command)
     return commands
 
+def get_parser_details(command, os=None):
+    '''Return the full parsers.json entry of a command, including the doc,
+       schema and url of its parsers. parsers.json is only read the first
+       time this is called.
+
+        Args:
+            command (`str`): the registered command
+            os (`str`): only return the entry for this os
+
+        Returns:
+            dict: the parser details, empty if the command is unknown
+    '''
+    details = load_parser_details().get(command)
+    if details is None:
+        # Parsers added at runtime are not part of parsers.json
+        details = parser_data.get(command, {})
+
+    if os:
+        return details.get(os, {})
+    return details
+
 def format_output(parser_data, tab=2):
     '''Format the parsed output in an aligned intended structure'''
 
@@ -84,6 +183,53 @@ def format_output(parser_data, tab=2):
     s.append('%s}' % ('  '*(tab-2)))
     return ''.join(s)
 
+def intern_value(value):
+    '''Return the interned copy of a string, other values unchanged.
+
+       Large tables repeat the same next hops, interface names or entry
+       types on many rows; interning them as they are assigned makes the
+       rows share a single string instead of one per regex match.
+    '''
+    return sys.intern(value) if type(value) is str else value
+
+def intern_values(data, keys):
+    '''Intern the values of some keys of a dict, in place.
+
+        Args:
+            data (`dict`): groupdict of a match, or any flat dict
+            keys (`iterable`): keys whose values repeat over rows
+
+        Returns:
+            the same dict
+    '''
+    for key in keys:
+        if key in data:
+            data[key] = intern_value(data[key])
+    return data
+
+def intern_strings(data):
+    '''Intern the string keys and values of a parsed output, in place.
+
+       Outputs parsed without interning, or kept in large numbers, can
+       share their repeated strings after the fact.
+
+        Args:
+            data (`dict`): parsed output, with nested dicts and lists
+
+        Returns:
+            the same output
+    '''
+    if isinstance(data, dict):
+        items = [(intern_value(key), intern_strings(value))
+                 for key, value in data.items()]
+        data.clear()
+        data.update(items)
+    elif isinstance(data, list):
+        data[:] = [intern_strings(value) for value in data]
+    else:
+        return intern_value(data)
+    return data
+
 def get_parser_exclude(command, device):
     try:
         return get_parser(command, device)[0].exclude
@@ -91,13 +237,34 @@ def get_parser_exclude(command, device):
         return []
 
 def get_parser(command, device, fuzzy=False):
-    '''From a show command and device, return parser class and kwargs if any'''
+    '''From a show command and device, return parser class and kwargs if any
+
+       Resolutions are memoized per command, device os/platform tokens and
+       abstraction order, see get_parser_cache_info and
+       invalidate_parser_cache.
+    '''
 
     try:
         order_list = device.custom.get('abstraction').get('order', [])
     except AttributeError:
         order_list = None
 
+    key = _parser_cache_key(command, device, fuzzy, order_list)
+    result = parser_cache.get(key)
+    if result is None:
+        result = _resolve_parser(command, device, fuzzy, order_list)
+        parser_cache.set(key, result)
+
+    # kwargs must not be shared between callers
+    if not fuzzy:
+        return result[0], dict(result[1])
+
+    return [(found_command, cls, dict(kwargs))
+                for found_command, cls, kwargs in result]
+
+def _resolve_parser(command, device, fuzzy, order_list):
+    '''Resolve a show command into a parser class for a device, uncached'''
+
     lookup = Lookup.from_device(device, packages={'parser': parser})
     results = _fuzzy_search_command(command, fuzzy, device.os, order_list)
     valid_results = []
@@ -130,6 +297,129 @@ def get_parser(command, device, fuzzy=False):
 
     return valid_results
 
+def _hashable(value):
+    '''Return a hashable version of a device attribute'''
+    if isinstance(value, (list, tuple)):
+        return tuple(_hashable(item) for item in value)
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
+
+def _parser_cache_key(command, device, fuzzy, order_list):
+    '''Build the get_parser cache key.
+
+       It holds everything the resolution depends on: the command, the
+       device tokens (including abstraction overrides) and the abstraction
+       order.
+    '''
+    # Searches which are not an exact command are whitespace normalized by
+    # _fuzzy_search_command, so all their variants resolve the same
+    if not fuzzy and command not in parser_data:
+        command = ' '.join(command.split())
+
+    return (command, fuzzy) + _device_lookup_key(device, order_list)
+
+def _device_lookup_key(device, order_list):
+    '''Return what parser resolution depends on for a device: its
+       os/platform/model tokens, abstraction overrides and order.
+       Devices with the same key resolve every command to the same parser.
+    '''
+    try:
+        abstraction = {k: v for k, v in
+                        device.custom.get('abstraction').items() if k != 'order'}
+    except (AttributeError, TypeError):
+        abstraction = {}
+
+    attributes = ['os', 'platform', 'model']
+    if isinstance(order_list, (list, tuple)):
+        attributes.extend(attr for attr in order_list
+                                            if attr not in attributes)
+
+    tokens = tuple(
+        (attr, _hashable(abstraction.get(attr, getattr(device, attr, None))))
+            for attr in attributes)
+
+    return (tokens, _hashable(order_list),
+            _hashable(sorted(abstraction.items(), key=lambda item: item[0])))
+
+def get_parsers(commands, devices):
+    '''Resolve many show commands for many devices at once.
+
+       Devices are grouped by os/platform tokens and abstraction order, each
+       command is resolved once per group and the result fanned out to every
+       device of the group.
+
+        Args:
+            commands (`list`): show commands to resolve
+            devices (`list`): devices to resolve the commands for
+
+        Returns:
+            dict: (command, device name) -> (parser class, kwargs), or None
+                  if no parser was found for the device
+
+        example:
+
+            >>> table = get_parsers(['show version', 'show vrf'],
+                                    testbed.devices.values())
+            >>> parser_cls, kwargs = table[('show version', 'R1')]
+    '''
+    groups = {}
+    for device in devices:
+        try:
+            order_list = device.custom.get('abstraction').get('order', [])
+        except AttributeError:
+            order_list = None
+
+        key = _device_lookup_key(device, order_list)
+        groups.setdefault(key, []).append(device)
+
+    table = {}
+    for group in groups.values():
+        for command in commands:
+            try:
+                parser_cls, kwargs = get_parser(command, group[0])
+            except Exception as e:
+                log.debug("Could not resolve '{c}' for {d}: {e}".format(
+                    c=command, d=[device.name for device in group], e=e))
+                for device in group:
+                    table[(command, device.name)] = None
+                continue
+
+            # kwargs must not be shared between devices
+            for device in group:
+                table[(command, device.name)] = (parser_cls, dict(kwargs))
+
+    return table
+
+def get_parser_cache_info():
+    '''Return the hits, misses, size and maxsize of the get_parser cache'''
+    return parser_cache.info()
+
+def get_intf_name_cache_info():
+    '''Return the hits, misses, size and maxsize of the
+       Common.convert_intf_name cache'''
+    info = _cached_convert_intf_name.cache_info()
+    return {'hits': info.hits,
+            'misses': info.misses,
+            'size': info.currsize,
+            'maxsize': info.maxsize}
+
+def invalidate_intf_name_cache():
+    '''Drop all memoized interface names, must be called whenever
+       INTF_NAME_PREFIXES is modified'''
+    _cached_convert_intf_name.cache_clear()
+
+def invalidate_parser_cache():
+    '''Drop all memoized get_parser resolutions and the command index.
+
+       Must be called whenever parser_data is modified, add_parser does it
+       for you.
+    '''
+    parser_cache.clear()
+    command_index.clear()
+
 def _fuzzy_search_command(search, fuzzy, os=None, order_list=None, 
                                                                 device=None):
     """ Find commands that match the search criteria.
@@ -161,10 +451,17 @@ def _fuzzy_search_command(search, fuzzy, os=None, order_list=None,
     best_score = -math.inf
     result = []
 
-    for command, source in parser_data.items():
+    # Only score the commands the index could not rule out
+    candidates = _get_command_index().search(tokens, os=os, fuzzy=fuzzy)
+    if candidates is None:
+        candidates = parser_data
+
+    for command in candidates:
+        source = parser_data[command]
+
         # Tokens and kwargs parameter must be non reference
         match_result = _matches_fuzzy(0, 0, tokens.copy(),
-                                                        command, {}, fuzzy)
+                                        get_template(command), {}, fuzzy)
 
         if match_result: 
             kwargs, score = match_result
@@ -194,12 +491,10 @@ def _fuzzy_search_command(search, fuzzy, os=None, order_list=None,
 
         # Check if the result regex match the search
         for instance in result:
-            s = re.sub('{.*?}', '(.*)', instance[0])
-            p =re.compile(s)
-            if p.match(search):
+            if get_template(instance[0]).pattern.match(search):
                 return [instance]
 
-        if len(set(re.sub('{.*?}', '---', instance[0]) 
+        if len(set(get_template(instance[0]).wildcard
                                                 for instance in result)) == 1:
             return [result[0]]
         else:
@@ -249,7 +544,8 @@ def _matches_fuzzy(i, j, tokens, command, kwargs, fuzzy,
             i (`int`): current end of tokens 
             j (`int`): current index of command tokens
             tokens (`list`): the search tokens
-            command (`str`): the command to be compared with
+            command (`str` or `CommandTemplate`): the command to be compared
+                                                  with
             kwargs (`dict`): the collected arguments
             fuzzy (`bool`): whether or not fuzzy should be used
             required_arguments (`int`): number of arguments command has
@@ -259,11 +555,15 @@ def _matches_fuzzy(i, j, tokens, command, kwargs, fuzzy,
                 bool: whether or not search matches the command
 
     """
-    command_tokens = command.split()
+    # Commands are compiled once into templates
+    if not isinstance(command, CommandTemplate):
+        command = get_template(command)
+
+    command_tokens = command.tokens
 
     # Initialize by counting how many arguments this command needs
     if required_arguments is None:
-        required_arguments = len(re.findall('{.*?}', command))
+        required_arguments = command.required_arguments
 
     while i < len(tokens):
         # If command token index is greater than its length, stop
@@ -291,102 +591,74 @@ def _matches_fuzzy(i, j, tokens, command, kwargs, fuzzy,
 
         if token_is_regular:
             # Current token might be command or argument
-            if '{' in command_token:
+            if command_token.kind == CommandToken.EMBEDDED:
                 # Handle the edge case of argument not being a token
                 # When this is implemented there is only one case:
                 # /dna/intent/api/v1/interface/{interface}
-                if not command_token.startswith('{'):
-                    # Find before and after string
-                    groups = re.match('(.*){.*?}(.*)', command_token).groups()
-                    is_found = False
-
-                    if len(groups) == 2:
-                        start, end = groups
-
-                        # Need to have perfect match with token
-                        if token.startswith(start) and token.endswith(end):
-                            # Escape regex
-                            start = re.escape(start)
-                            end = re.escape(end)
-
-                            # Find the argument using the escaped start and end
-                            kwargs[
-                                re.search('{(.*)}', command_token).groups()[0]
-                            ] = re.match('{}(.*){}'
-                                        .format(start, end), token).groups()[0]
-
-                            is_found = True
-                            score += 103
-                    
-                    if not is_found:
-                        return None
-                else:
-                    argument_key = re.search('{(.*)}', 
-                                                    command_token).groups()[0]
-                    i += 1
-                    j += 1
-                    
-                    # Plus 101 once to favor nongreedy argument fit
-                    score += 100
-
-                    # If argument is any of these, argument can only be 1 token
-                    # Else argument can be up to 2 tokens
-                    endpoint = i + 1 \
-                        if argument_key == 'vrf' \
-                            or argument_key == 'rd' \
-                            or argument_key == 'instance' \
-                            or argument_key == 'vrf_type' \
-                            or argument_key == 'feature' \
-                            or argument_key == 'fileA' \
-                            or argument_key == 'fileB' \
-                        else i + 2
-
-                    # Try out ways we can assign search tokens into argument
-                    for index in range(i, endpoint):
-                        if index > len(tokens):
-                            return None
 
-                        # Make sure not to use regex expression as argument
-                        if index > i: 
-                            if fuzzy and not _is_regular_token(tokens[
-                                                                    index - 1]): 
-                                return None
+                # Need to have perfect match with token
+                argument_value = command_token.extract(token)
+                if argument_value is None:
+                    return None
 
-                        # Currently spanned argument
-                        if 'match' in tokens or 'include' in tokens:
-                            argument_value = ' '.join(tokens[i - 1:index]).replace('\\', '')
-                        else:
-                            argument_value = ' '.join(tokens[i - 1:index]).rstrip(
-                                                            '"').replace('\\', '')
+                kwargs[command_token.argument] = argument_value
+                score += 103
+            elif command_token.kind == CommandToken.ARGUMENT:
+                argument_key = command_token.argument
+                i += 1
+                j += 1
+                
+                # Plus 101 once to favor nongreedy argument fit
+                score += 100
 
-                        # argument_value = ' '.join(tokens[i - 1:index]).replace('\\', '')
-                        
-                        # Delete the extra tokens if spanning more than one
-                        tokens_copy = tokens[:i] + tokens[index:]
-                        tokens_copy[i - 1] = command_token
-                        kwargs_copy = kwargs.copy()
-                        kwargs_copy.setdefault(argument_key, argument_value)
+                # If argument is any of SINGLE_TOKEN_ARGUMENTS, argument can
+                # only be 1 token. Else argument can be up to 2 tokens
+                endpoint = i + command_token.span
+
+                # Try out ways we can assign search tokens into argument
+                for index in range(i, endpoint):
+                    if index > len(tokens):
+                        return None
+
+                    # Make sure not to use regex expression as argument
+                    if index > i: 
+                        if fuzzy and not _is_regular_token(tokens[
+                                                                index - 1]): 
+                            return None
+
+                    # Currently spanned argument
+                    if 'match' in tokens or 'include' in tokens:
+                        argument_value = ' '.join(tokens[i - 1:index]).replace('\\', '')
+                    else:
+                        argument_value = ' '.join(tokens[i - 1:index]).rstrip(
+                                                        '"').replace('\\', '')
+
+                    # Delete the extra tokens if spanning more than one
+                    tokens_copy = tokens[:i] + tokens[index:]
+                    tokens_copy[i - 1] = command_token.text
+                    kwargs_copy = kwargs.copy()
+                    kwargs_copy.setdefault(argument_key, argument_value)
+                    
+                    result = _matches_fuzzy(i, j, tokens_copy, command,
+                            kwargs_copy, fuzzy, required_arguments, score)
                         
-                        result = _matches_fuzzy(i, j, tokens_copy, command,
-                                kwargs_copy, fuzzy, required_arguments, score)
-                            
-                        if result:
-                            result_kwargs, score = result
+                    if result:
+                        result_kwargs, score = result
 
-                            if len(result_kwargs) == required_arguments:
-                                    return result_kwargs, score
+                        if len(result_kwargs) == required_arguments:
+                                return result_kwargs, score
 
-                    return None
-            elif token == command_token:
+                return None
+            elif token == command_token.text:
                 # Same token, assign higher score
                 score += 102
-            elif not token == command_token:
+            else:
                 # Not matching, check if prefix
-                if not command_token.startswith(token):
+                if not command_token.text.startswith(token):
                     return None
 
                 # The two tokens are similar to each other, replace
-                tokens[i] = command_token
+                tokens[i] = command_token.text
                 score += 100
 
             # Matches current, go to next token
@@ -403,16 +675,16 @@ def _matches_fuzzy(i, j, tokens, command, kwargs, fuzzy,
                 skipped += 1
 
             # Match current span with command
-            test = re.match(' '.join(tokens[:i + 1]), command)
+            test = re.match(' '.join(tokens[:i + 1]), command.command)
 
             if test:
                 # Perform command token lookahead
                 _, end = test.span()
 
                 # Expression matches command to end
-                if i + 1 == len(tokens) and end == len(command): 
+                if i + 1 == len(tokens) and end == len(command.command): 
                     # Return result if from start to end there are no arguments
-                    if all(not '{' in ct for ct in command_tokens[j:]):
+                    if not command.arguments_from[j]:
                         return kwargs, score
                     else: 
                         # Else in range we have another unspecified argument
@@ -425,10 +697,8 @@ def _matches_fuzzy(i, j, tokens, command, kwargs, fuzzy,
                     return None
 
                 # Span single command token
-                if abs(
-                    end - sum(len(ct) for ct in command_tokens[:j + 1]) - j
-                ) <= 1:
-                    if not '{' in command_token:
+                if abs(end - command.lengths[j] - j) <= 1:
+                    if command_token.kind == CommandToken.LITERAL:
                         # Span single token if it is not argument
                         i += 1
                         j += 1
@@ -443,8 +713,8 @@ def _matches_fuzzy(i, j, tokens, command, kwargs, fuzzy,
                     current_sum = 0
                     token_end = 0
 
-                    while current_sum + len(command_tokens[token_end]) <= end:
-                        current_sum += len(command_tokens[token_end])
+                    while current_sum + len(command.texts[token_end]) <= end:
+                        current_sum += len(command.texts[token_end])
                         
                         if current_sum < end:
                             # Account for space 
@@ -523,56 +793,23 @@ class Common():
 
                 >>> convert_intf_name(intf='Eth2/1')
         '''
+        return _cached_convert_intf_name(intf)
 
-        # Please add more when face other type of interface
-        convert = {'Eth': 'Ethernet',
-                   'Lo': 'Loopback',
-                   'lo': 'Loopback',
-                   'Fa': 'FastEthernet',
-                   'Fas': 'FastEthernet',
-                   'Po': 'Port-channel',
-                   'PO': 'Port-channel',
-                   'Null': 'Null',
-                   'Gi': 'GigabitEthernet',
-                   'Gig': 'GigabitEthernet',
-                   'GE': 'GigabitEthernet',
-                   'Te': 'TenGigabitEthernet',
-                   'Ten': 'TenGigabitEthernet',
-                   'Tw': 'TwoGigabitEthernet',
-                   'Two': 'TwoGigabitEthernet',
-                   'Twe': 'TwentyFiveGigE',
-                   'mgmt': 'mgmt',
-                   'Vl': 'Vlan',
-                   'Tu': 'Tunnel',
-                   'Fe': '',
-                   'Hs': 'HSSI',
-                   'AT': 'ATM',
-                   'Et': 'Ethernet',
-                   'BD': 'BDI',
-                   'Se': 'Serial',
-                   'Fo': 'FortyGigabitEthernet',
-                   'For': 'FortyGigabitEthernet',
-                   'Hu': 'HundredGigE',
-                   'Hun': 'HundredGigE',
-                   'vl': 'vasileft',
-                   'vr': 'vasiright',
-                   'BE': 'Bundle-Ether'
-                   }
-        m = re.search(r'([a-zA-Z]+)', intf) 
-        m1 = re.search(r'([\d\/\.]+)', intf)
-        if hasattr(m, 'group') and hasattr(m1, 'group'):
-            int_type = m.group(0)
-            int_port = m1.group(0)
-            if int_type in convert.keys():
-                return(convert[int_type] + int_port)
-            else:
-                # Unifying interface names
-                converted_intf = intf[0].capitalize()+intf[1:].replace(
-                    ' ','').replace('ethernet', 'Ethernet')
-                return(converted_intf)
-        else:
-            return(intf)
+    @classmethod
+    def convert_intf_names(self, intfs):
+        '''return the full name of each interface
+
+            Args:
+                intfs (`iterable`): Short versions of interface names
 
+            Returns:
+                list of the full interface names, see convert_intf_name
+
+            example:
+
+                >>> convert_intf_names(['Eth2/1', 'Gi1/0/1'])
+        '''
+        return list(map(_cached_convert_intf_name, intfs))
 
     @classmethod
     def retrieve_xml_child(self, root, key):
@@ -31,18 +31,72 @@ example 'nxos', and the value is a list of MetaParser class definitions.
             ]
         }
 
+Parsers can also be given as 'module:ClassName' strings. Their commands are
+then read from the module source and the module is only imported when one of
+its commands is parsed. The module holding the function should not import
+the parser modules in that case.
+
+    def add_my_parsers():
+        return {
+            'iosxe': [
+                'mypkg.iosxe.show_interface_transceiver:'
+                'ShowInterfaceTransceiver'
+            ]
+        }
+
 """
 
 import sys
-import pkg_resources
+import time
 import logging
+import importlib
+import importlib.util
 
-from .common import parser_data
+try:
+    from importlib import metadata
+except ImportError:
+    # python < 3.8
+    metadata = None
+
+from .common import parser_data, invalidate_parser_cache
+from .extension import scan_parsers
 
 log = logging.getLogger(__name__)
 
 ENTRY_POINT_NAME = 'genie.libs.parser'
 
+# Cost of the last load_entry_points call
+entry_point_stats = {
+    'entry_points': 0,
+    'parsers': 0,
+    'deferred': 0,
+    'seconds': 0.0,
+}
+
+
+def _register(module_name, class_name, cli_commands, os_name):
+    """
+    Add the commands of parser `class_name` of module `module_name` to
+    parser_data for `os_name`
+    """
+    if isinstance(cli_commands, str):
+        cli_commands = [cli_commands]
+
+    package, _, name = module_name.rpartition('.')
+
+    for cmd in cli_commands:
+        if cmd not in parser_data:
+            parser_data[cmd] = {}
+
+        parser_data[cmd][os_name] = {
+            'module_name': name,
+            'package': package,
+            'class': class_name
+        }
+
+    # Resolutions and command index are out of date
+    invalidate_parser_cache()
+
 
 def add_parser(parser, os_name):
     """
@@ -63,25 +117,75 @@ def add_parser(parser, os_name):
         The NOS name for which the parser is supported, for example "nxos"
     """
     mod = sys.modules[parser.__module__]
-    package = mod.__package__
 
-    cli_commands = parser.cli_command
-    if isinstance(cli_commands, str):
-        cli_commands = [cli_commands]
+    _register(module_name='{}.{}'.format(mod.__package__,
+                                         mod.__name__.rsplit('.', 1)[-1]),
+              class_name=parser.__name__,
+              cli_commands=parser.cli_command,
+              os_name=os_name)
 
-    for cmd in cli_commands:
-        if cmd not in parser_data:
-            parser_data[cmd] = {}
 
-        parser_data[cmd][os_name] = {
-            'module_name': mod.__name__.rsplit('.', 1)[-1],
-            'package': package,
-            'class': parser.__name__
-        }
+def add_parser_path(path, os_name):
+    """
+    Add the parser found at `path` for the given network OS name `os_name`,
+    without importing its module when possible
+
+    Notes
+    -----
+    The commands of the parser are found by scanning the module source. The
+    module is only imported if its source cannot be understood statically.
+
+    Parameters
+    ----------
+    path : str
+        'module:ClassName' of the parser class
+
+    os_name : str
+        The NOS name for which the parser is supported, for example "nxos"
+
+    Returns
+    -------
+    bool
+        True if the parser was added without importing its module
+    """
+    module_name, _, class_name = path.partition(':')
+
+    spec = importlib.util.find_spec(module_name)
+    parsers = None
+    if spec is not None and spec.origin and spec.origin.endswith('.py'):
+        with open(spec.origin, encoding='utf-8') as f:
+            parsers = scan_parsers(f.read())
+
+    for name, cli_commands, _ in parsers or []:
+        if name == class_name:
+            _register(module_name, class_name, cli_commands, os_name)
+            return True
+
+    # Could not be found statically
+    mod = importlib.import_module(module_name)
+    add_parser(getattr(mod, class_name), os_name)
+    return False
+
+
+def _iter_entry_points(group):
+    if metadata is None:
+        import pkg_resources
+        return list(pkg_resources.iter_entry_points(group))
+
+    entry_points = metadata.entry_points()
+    if hasattr(entry_points, 'select'):
+        return list(entry_points.select(group=group))
+
+    # python < 3.10
+    return list(entry_points.get(group, []))
 
 
 def load_entry_points():
-    for ep in pkg_resources.iter_entry_points(ENTRY_POINT_NAME):
+    start = time.perf_counter()
+    entry_points = _iter_entry_points(ENTRY_POINT_NAME)
+    parsers = deferred = 0
+
+    for ep in entry_points:
         loader_function = ep.load()
         if not callable(loader_function):
             log.warning('unable to load parsers from entry point '
@@ -91,7 +195,21 @@ def load_entry_points():
         parser_dict = loader_function()
         for os_name, parser_list in parser_dict.items():
             for parser in parser_list:
-                add_parser(parser=parser, os_name=os_name)
+                parsers += 1
+                if isinstance(parser, str):
+                    deferred += add_parser_path(path=parser, os_name=os_name)
+                else:
+                    add_parser(parser=parser, os_name=os_name)
+
+    entry_point_stats.update({
+        'entry_points': len(entry_points),
+        'parsers': parsers,
+        'deferred': deferred,
+        'seconds': time.perf_counter() - start,
+    })
+    log.debug('Loaded {parsers} parsers ({deferred} deferred) from '
+              '{entry_points} entry points in {seconds:.3f}s'
+              .format(**entry_point_stats))
 
 
 load_entry_points()
@@ -1,22 +1,165 @@
+import os
+import ast
+import json
 import logging
 import pathlib
 import inspect
 import itertools
 import importlib
+import importlib.util
 from genie.metaparser import MetaParser
 
+from .files import write_atomic
+
 log = logging.getLogger(__name__)
 
+# Default location of the parser manifests
+MANIFEST_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'genie',
+                            'parser_manifests')
+
+# Bump when the layout of the manifest changes
+MANIFEST_VERSION = 1
+
+# Bases which are known not to be parsers
+_BUILTIN_BASES = frozenset(['object', 'Exception', 'dict', 'list', 'str'])
+
+
+def _base_name(node):
+    '''Return the dotted name of a class base, or None if not a name'''
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        value = _base_name(node.value)
+        return value and '{}.{}'.format(value, node.attr)
+    return None
+
+
+def scan_parsers(source):
+    '''Find the parsers of a module without importing it.
+
+    A parser is a public class with a `cli_command` attribute, either its own
+    or inherited from a class of the same module, which derives from
+    `MetaParser`. Bases imported from other modules are assumed to be
+    MetaParser classes when the class has a `cli_command`.
+
+    Args:
+        source (`str`): source code of the module
+
+    Returns:
+        list: [class name, cli commands, docstring] of each parser, sorted by
+              class name. None if the module cannot be understood statically
+              (dynamic cli_command, cli_command possibly inherited from another
+              module), it must then be imported.
+    '''
+    try:
+        tree = ast.parse(source)
+    except SyntaxError:
+        return None
+
+    classes = {}
+    for node in tree.body:
+        if not isinstance(node, ast.ClassDef):
+            continue
+
+        cli_command = None
+        for item in node.body:
+            if isinstance(item, ast.Assign) and any(
+                    isinstance(target, ast.Name) and target.id == 'cli_command'
+                        for target in item.targets):
+                try:
+                    cli_command = ast.literal_eval(item.value)
+                except (ValueError, TypeError, SyntaxError):
+                    return None
+
+        classes[node.name] = {'bases': [_base_name(b) for b in node.bases],
+                              'cli_command': cli_command,
+                              'doc': ast.get_docstring(node, clean=False)}
+
+    resolved = {}
+
+    def _resolve(name):
+        # Returns (is parser class, cli_command), None if unknown
+        if name in resolved:
+            return resolved[name]
+        resolved[name] = (False, None)
+
+        info = classes[name]
+        cli_command = info['cli_command']
+        is_meta = False
+        for base in info['bases']:
+            if base is None:
+                return None
+            if base == 'MetaParser' or base.endswith('.MetaParser'):
+                is_meta = True
+            elif base in classes:
+                result = _resolve(base)
+                if result is None:
+                    return None
+                base_meta, base_cli = result
+                is_meta = is_meta or base_meta
+                if cli_command is None:
+                    cli_command = base_cli
+            elif base not in _BUILTIN_BASES:
+                if cli_command is None:
+                    # Could inherit a cli_command from the other module
+                    return None
+                is_meta = True
+
+        resolved[name] = (is_meta, cli_command)
+        return resolved[name]
+
+    parsers = []
+    for name in sorted(classes):
+        if name.startswith('_'):
+            continue
+
+        result = _resolve(name)
+        if result is None:
+            return None
+
+        is_meta, cli_command = result
+        if not is_meta or cli_command is None:
+            continue
+
+        if not isinstance(cli_command, list):
+            cli_command = [cli_command]
+        parsers.append([name, cli_command, classes[name]['doc']])
+
+    return parsers
+
+
 class ExtendParsers(object):
+    '''Find the parsers of an external package.
+
+    Modules are scanned statically (see `scan_parsers`) and only imported when
+    they cannot be understood without executing them. The result of each file
+    is cached in a manifest keyed by file size and mtime, so unchanged
+    packages are not scanned again.
+
+    Args:
+        package (`str`): the external parser package
+        manifest_dir (`str`): where to keep the manifest, False to disable it
+    '''
     # Files and directories to ignore while walking package
     IGNORE_DIR = ['.git', '__pycache__', 'template', 'tests']
     IGNORE_FILE = ['__init__.py', 'base.py', 'utils.py']
 
-    def __init__(self, package):
+    def __init__(self, package, manifest_dir=None):
         self.output = {'tokens': [], 'extend_info': []}
         self.package = package
-        # Figure out location of package so you can walk it
-        self.module_loc = importlib.import_module(package).__path__[0]
+        # Figure out location of package so you can walk it, without
+        # executing it
+        spec = importlib.util.find_spec(package)
+        if spec is None:
+            raise ModuleNotFoundError("No module named '{}'".format(package))
+        self.module_loc = spec.submodule_search_locations[0]
+
+        if manifest_dir is None:
+            manifest_dir = MANIFEST_DIR
+        self.manifest_path = manifest_dir and os.path.join(
+            manifest_dir, '{}.json'.format(package))
+        self.manifest = {}
+        self._old_manifest = {}
 
     @staticmethod
     def _find_parsers(mod):
@@ -41,13 +184,13 @@ class ExtendParsers(object):
 
         return parsers
 
-    def _add_parser(self, parser, cli, tokens, mod):
+    def _add_parser(self, class_name, doc, cli, tokens, module_name):
         if cli not in self.output:
             self.output[cli] = {}
 
         extend_info = self.output['extend_info']
         extend_info.append("cli: '{}', tokens {}, class: {}"
-                    .format(cli, tokens, parser.__name__))
+                    .format(cli, tokens, class_name))
 
         output = self.output[cli]
         for token in tokens:
@@ -57,26 +200,45 @@ class ExtendParsers(object):
             if token not in self.output['tokens']:
                 self.output['tokens'].append(token)
 
-        output['module_name'] = mod.__name__.rsplit('.', 1)[-1]
+        output['module_name'] = module_name
         output['package'] = self.package
-        output['class'] = parser.__name__
-        output['doc'] = parser.__doc__
+        output['class'] = class_name
+        output['doc'] = doc
         output['uid'] = cli.replace(' ', '_').replace('{', '').replace('}', '').replace('|', '_')
 
-    def _add_parsers(self, item, tokens):
+    def _import_parsers(self, item, tokens):
         # Find all classes which has a function named parse
         # Will give module path
         path_list = [self.package] + tokens + [item.name.replace(item.suffix, '')]
         module_path = '.'.join(path_list)
         mod = importlib.import_module(module_path)
-        parsers = self._find_parsers(mod)
 
-        for parser in parsers:
-            if isinstance(parser.cli_command, list):
-                for cli in parser.cli_command:
-                    self._add_parser(parser, cli, tokens, mod)
-            else:
-                self._add_parser(parser, parser.cli_command, tokens, mod)
+        return [[parser.__name__,
+                 parser.cli_command if isinstance(parser.cli_command, list)
+                    else [parser.cli_command],
+                 parser.__doc__] for parser in self._find_parsers(mod)]
+
+    def _add_parsers(self, item, tokens):
+        relative = item.relative_to(self.module_loc).as_posix()
+        stat = item.stat()
+        stamp = [stat.st_size, stat.st_mtime_ns]
+
+        entry = self._old_manifest.get(relative)
+        if not entry or entry['stamp'] != stamp:
+            entry = {'stamp': stamp,
+                     'parsers': scan_parsers(item.read_text(encoding='utf-8'))}
+        self.manifest[relative] = entry
+
+        parsers = entry['parsers']
+        if parsers is None:
+            # Cannot be scanned statically, the result depends on other
+            # modules so it is never cached
+            parsers = self._import_parsers(item, tokens)
+
+        module_name = item.name.replace(item.suffix, '')
+        for class_name, cli_commands, doc in parsers:
+            for cli in cli_commands:
+                self._add_parser(class_name, doc, cli, tokens, module_name)
 
     def _recursive_find(self, item, token):
         for item in item.iterdir():
@@ -94,6 +256,39 @@ class ExtendParsers(object):
                 # item is a python file. Find all parsers in file.
                 self._add_parsers(item, token)
 
+    def _load_manifest(self):
+        if not self.manifest_path:
+            return {}
+        try:
+            with open(self.manifest_path) as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+        if manifest.get('version') != MANIFEST_VERSION or \
+                manifest.get('location') != self.module_loc:
+            return {}
+        return manifest.get('files', {})
+
+    def _save_manifest(self):
+        if not self.manifest_path:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.manifest_path), exist_ok=True)
+            write_atomic(self.manifest_path, json.dumps({
+                'version': MANIFEST_VERSION,
+                'location': self.module_loc,
+                'files': self.manifest}))
+        except OSError as e:
+            log.debug('Could not write parser manifest {p}: {e}'
+                      .format(p=self.manifest_path, e=e))
+
     def extend(self):
+        self._old_manifest = self._load_manifest()
+        self.manifest = {}
+
         # Walk all file in there and go through the parsers
         self._recursive_find(pathlib.Path(self.module_loc), [])
+
+        if self.manifest != self._old_manifest:
+            self._save_manifest()
@@ -0,0 +1,35 @@
+'''Files written by the parser utilities'''
+
+# python
+import os
+import threading
+
+
+def write_atomic(path, data):
+    '''Write a file whole, or not at all.
+
+    The data is written to a temporary file of the same folder, then moved
+    in place, so that other processes reading the file never see it
+    partially written. The temporary file is removed if the write fails.
+
+    Args:
+        path (`str`): the file to write
+        data (`bytes` or `str`): its content
+
+    Raises:
+        OSError: the file could not be written
+    '''
+    folder, name = os.path.split(path)
+    # One per process and thread, and hidden
+    tmp_path = os.path.join(folder, '.{n}.{p}.{t}.tmp'.format(
+        n=name, p=os.getpid(), t=threading.get_ident()))
+    try:
+        with open(tmp_path, 'wb' if isinstance(data, bytes) else 'w') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
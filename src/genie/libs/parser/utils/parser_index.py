@@ -0,0 +1,260 @@
+'''Compact runtime index of parsers.json
+
+parsers.json carries the `doc`, `schema`, `url` and `uid` of every parser,
+none of which is needed to resolve a command into a parser class. The index
+only keeps command -> os -> (package, module_name, class) and is stored as a
+pickle next to parsers.json, which loads an order of magnitude faster than
+the json file. It is only produced at build time (`make json`) and shipped
+with the package: whenever it is missing or out of date with parsers.json,
+parsers.json is loaded and slimmed in memory, the package directory is never
+written to at runtime.
+
+The index also maps the classes defined by the modules of every parser
+package, schemas included, to their module, for the lazy loading of the
+packages (see genie.libs.parser.lazy).
+'''
+
+# python
+import os
+import re
+import sys
+import json
+import zlib
+import pickle
+import logging
+import importlib
+
+from .files import write_atomic
+
+log = logging.getLogger(__name__)
+
+PARSER_JSON = 'parsers.json'
+PARSER_INDEX = 'parsers.idx'
+
+# Bump when the layout of the index changes
+INDEX_VERSION = 2
+
+# Parser information needed at runtime
+INDEX_KEYS = ('module_name', 'package', 'class')
+
+# Class definitions of the parser modules
+_CLASS_DEFINITION = re.compile(r'^class\s+(\w+)', re.MULTILINE)
+
+# Full parsers.json content, loaded on first use of load_parser_details
+_parser_details = None
+
+
+def parser_json_path():
+    '''Return the location of parsers.json, or '' if it cannot be found'''
+    try:
+        mod = importlib.import_module('genie.libs.parser')
+        return os.path.join(mod.__path__[0], PARSER_JSON)
+    except Exception:
+        return ''
+
+
+def slim_parser_data(data):
+    '''Return a copy of parser data keeping only what is needed at runtime.
+
+    Args:
+        data (`dict`): parser data as found in parsers.json
+
+    Returns:
+        dict: command -> os -> [tokens ->] module_name, package and class
+    '''
+    def _slim(value):
+        if not isinstance(value, dict):
+            return value
+        return {key: _slim(item) for key, item in value.items()
+                if isinstance(item, dict) or key in INDEX_KEYS}
+
+    return {command: _slim(value) for command, value in data.items()}
+
+
+def _source_stamp(path):
+    stat = os.stat(path)
+    return stat.st_size, stat.st_mtime_ns
+
+
+def _source_checksum(path):
+    with open(path, 'rb') as f:
+        return zlib.crc32(f.read())
+
+
+def scan_parser_classes(parser_path):
+    '''Return the classes defined by the modules of each parser package.
+
+    Args:
+        parser_path (`str`): location of genie.libs.parser
+
+    Returns:
+        dict: package name -> {class name: module name}
+    '''
+    classes = {}
+    for root, dirs, files in os.walk(parser_path):
+        # Packages only, without their tests
+        dirs[:] = sorted(
+            name for name in dirs if name not in ('tests', 'utils') and
+            os.path.isfile(os.path.join(root, name, '__init__.py')))
+        if root == parser_path:
+            continue
+        package = '.'.join(['genie.libs.parser'] + os.path.relpath(
+            root, parser_path).split(os.sep))
+        for filename in sorted(files):
+            if not filename.endswith('.py') or filename == '__init__.py':
+                continue
+            with open(os.path.join(root, filename), encoding='utf-8') as f:
+                for name in _CLASS_DEFINITION.findall(f.read()):
+                    classes.setdefault(package, {}).setdefault(
+                        name, filename[:-3])
+    return classes
+
+
+def _write_index(index_path, index):
+    # Concurrent readers never see a partially written index
+    write_atomic(index_path, pickle.dumps(index,
+                                          protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def make_parser_index(json_path=None, index_path=None, data=None):
+    '''Build the runtime index from parsers.json.
+
+    Args:
+        json_path (`str`): parsers.json location, defaults to the one shipped
+                           with genie.libs.parser
+        index_path (`str`): where to write the index, defaults to
+                            parsers.idx next to parsers.json
+        data (`dict`): content of parsers.json if already loaded
+
+    Returns:
+        dict: the slim parser data which was written
+    '''
+    json_path = json_path or parser_json_path()
+    index_path = index_path or os.path.join(os.path.dirname(json_path),
+                                            PARSER_INDEX)
+
+    if data is None:
+        with open(json_path) as f:
+            data = json.load(f)
+
+    slim = slim_parser_data(data)
+    index = {'version': INDEX_VERSION,
+             'python': tuple(sys.version_info[:2]),
+             'stamp': _source_stamp(json_path),
+             'checksum': _source_checksum(json_path),
+             'data': slim,
+             'classes': scan_parser_classes(os.path.dirname(json_path))}
+    _write_index(index_path, index)
+
+    return slim
+
+
+def _load_index(json_path, index_path=None):
+    index_path = index_path or os.path.join(os.path.dirname(json_path),
+                                            PARSER_INDEX)
+    try:
+        with open(index_path, 'rb') as f:
+            index = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        log.debug('Ignoring unreadable parser index {p}: {e}'
+                  .format(p=index_path, e=e))
+        return None
+
+    if not isinstance(index, dict) or \
+            index.get('version') != INDEX_VERSION or \
+            index.get('python') != tuple(sys.version_info[:2]):
+        return None
+
+    # mtimes are not preserved by every installer, fall back on the checksum
+    # before declaring the index stale
+    if index['stamp'] != _source_stamp(json_path) and \
+            index['checksum'] != _source_checksum(json_path):
+        return None
+
+    return index
+
+
+def load_parser_index(json_path, index_path=None):
+    '''Load the runtime index if it is up to date with parsers.json.
+
+    Args:
+        json_path (`str`): parsers.json location
+        index_path (`str`): index location, defaults to parsers.idx next to
+                            parsers.json
+
+    Returns:
+        dict: the slim parser data, or None if there is no usable index
+    '''
+    index = _load_index(json_path, index_path)
+    return index['data'] if index is not None else None
+
+
+def load_parser_classes(json_path=None, index_path=None):
+    '''Return the classes of the parser packages recorded in the index.
+
+    Args:
+        json_path (`str`): parsers.json location, defaults to the one shipped
+                           with genie.libs.parser
+        index_path (`str`): index location, defaults to parsers.idx next to
+                            parsers.json
+
+    Returns:
+        dict: package name -> {class name: module name}, empty if there is
+              no usable index
+    '''
+    json_path = json_path or parser_json_path()
+    try:
+        index = _load_index(json_path, index_path)
+    except OSError:
+        return {}
+    return index['classes'] if index is not None else {}
+
+
+def load_parser_data(json_path):
+    '''Return the slim parser data for parsers.json.
+
+    The index is used when up to date, otherwise parsers.json is loaded and
+    slimmed in memory. The index is not rebuilt, see make_parser_index.
+
+    Args:
+        json_path (`str`): parsers.json location
+
+    Returns:
+        dict: the slim parser data
+    '''
+    data = load_parser_index(json_path)
+    if data is not None:
+        return data
+
+    log.debug('No up to date parser index for {p}, run make json to build '
+              'it'.format(p=json_path))
+    with open(json_path) as f:
+        return slim_parser_data(json.load(f))
+
+
+def load_parser_details(json_path=None):
+    '''Return the full content of parsers.json, including docs and schemas.
+
+    The file is only read the first time this is called.
+
+    Args:
+        json_path (`str`): parsers.json location, defaults to the one shipped
+                           with genie.libs.parser
+    '''
+    global _parser_details
+
+    if json_path:
+        with open(json_path) as f:
+            return json.load(f)
+
+    if _parser_details is None:
+        path = parser_json_path()
+        if os.path.isfile(path):
+            with open(path) as f:
+                _parser_details = json.load(f)
+        else:
+            _parser_details = {}
+
+    return _parser_details
@@ -0,0 +1,333 @@
+'''Profiling the patterns of a parser
+
+When a parser is slow, the time goes to its p1...pN patterns, tried one
+after the other on every line. A pattern profile traces the patterns of a
+parser while it runs, and records for each of them the attempts, the hits
+and the time spent matching, and the lines no pattern matched:
+
+    >>> profile = profile_patterns(ShowInterfaces(device=None), output=out)
+    >>> print(profile.report())
+    pattern    location                 attempts      hits   total ms  us/try
+    p1         show_interface.py:214       20420      1000      11.37    0.56
+    ...
+    Never matched: p34, p41
+    Lines no pattern matched (2):
+      Carrier delay is 10 sec
+      ...
+    >>> profile.to_dict()
+
+or, around any call of the parser:
+
+    profile = PatternProfile()
+    with profile.trace(parser):
+        parser.parse()
+
+The patterns traced are:
+
+  * those compiled with re.compile by the modules of the parser class and
+    of its parents while tracing, named after the variable they are
+    assigned to, as in `p1 = re.compile(...)`
+  * the patterns, dispatchers and scanners of the class, see patterns.py,
+    and the compiled patterns at the top of the modules
+
+The patterns of a LineScanner are tried together in one call: its time and
+attempts are those of the scanner, and each of its patterns counts its own
+hits and the lines scanned.
+
+Tracing replaces re.compile and the module attributes for its duration,
+parsers should not run in other threads meanwhile.
+'''
+
+# python
+import re
+import sys
+import copy
+import time
+import linecache
+import contextlib
+
+from .patterns import LineDispatcher, LineScanner, PatternTable
+
+# p1 = re.compile(...
+_ASSIGNED = re.compile(r'^\s*(?:self\.)?(\w+)\s*=\s*re\.compile\(')
+
+_Pattern = type(re.compile(''))
+
+
+class PatternStats(object):
+    '''Attempts, hits and time of a pattern'''
+
+    __slots__ = ('name', 'pattern', 'location', 'attempts', 'hits',
+                 'seconds')
+
+    def __init__(self, name, pattern, location=None):
+        self.name = name
+        self.pattern = pattern
+        self.location = location
+        self.attempts = 0
+        self.hits = 0
+        self.seconds = 0.0
+
+    def to_dict(self):
+        return {'name': self.name, 'pattern': self.pattern,
+                'location': self.location, 'attempts': self.attempts,
+                'hits': self.hits, 'seconds': self.seconds}
+
+
+class _TracedPattern(object):
+    '''Compiled pattern recording its matches'''
+
+    __slots__ = ('_pattern', '_stats', '_lines')
+
+    def __init__(self, pattern, stats, lines):
+        self._pattern = pattern
+        self._stats = stats
+        self._lines = lines
+
+    def __getattr__(self, name):
+        return getattr(self._pattern, name)
+
+    def __repr__(self):
+        return repr(self._pattern)
+
+    def _trace(self, method, string, args):
+        start = time.perf_counter()
+        m = method(string, *args)
+        stats = self._stats
+        stats.seconds += time.perf_counter() - start
+        stats.attempts += 1
+        if m:
+            stats.hits += 1
+            self._lines[string] = True
+        elif string not in self._lines:
+            self._lines[string] = False
+        return m
+
+    def match(self, string, *args):
+        return self._trace(self._pattern.match, string, args)
+
+    def search(self, string, *args):
+        return self._trace(self._pattern.search, string, args)
+
+    def fullmatch(self, string, *args):
+        return self._trace(self._pattern.fullmatch, string, args)
+
+
+class _TracedScannerPattern(_TracedPattern):
+    '''Combined pattern of a LineScanner, counting the hits per branch'''
+
+    __slots__ = ('_branches',)
+
+    def __init__(self, pattern, stats, lines, branches):
+        super().__init__(pattern, stats, lines)
+        self._branches = branches
+
+    def match(self, string, *args):
+        m = self._trace(self._pattern.match, string, args)
+        for stats in self._branches.values():
+            stats.attempts += 1
+        if m:
+            self._branches[m.lastgroup].hits += 1
+        return m
+
+
+class _TracedDispatcher(LineDispatcher):
+    '''LineDispatcher noting the lines no candidate pattern is tried on'''
+
+    def __init__(self, patterns, lines):
+        super().__init__(patterns)
+        self._lines = lines
+
+    def matches(self, line):
+        if line not in self._lines:
+            self._lines[line] = False
+        return super().matches(line)
+
+
+class PatternProfile(object):
+    '''Attempts, hits and time of the patterns of parsers.
+
+    A profile accumulates over the traces, of one parser or several.
+    '''
+
+    def __init__(self):
+        # id of the compiled pattern, or compile site -> PatternStats
+        self.stats = {}
+        # line -> whether a pattern matched it
+        self.lines = {}
+        # Patterns at the top of the modules, only reported once tried
+        self._globals = set()
+
+    def _stats(self, key, name, pattern, location=None):
+        stats = self.stats.get(key)
+        if stats is None:
+            stats = self.stats[key] = PatternStats(
+                name, getattr(pattern, 'pattern', pattern), location)
+        return stats
+
+    def _wrap(self, name, pattern, location=None):
+        '''Return the traced pattern of a compiled pattern'''
+        if isinstance(pattern, _TracedPattern):
+            return pattern
+        return _TracedPattern(
+            pattern, self._stats(id(pattern), name, pattern, location),
+            self.lines)
+
+    def _traced(self, name, value):
+        '''Return the traced copy of a class or module attribute, or None
+        if it holds no pattern'''
+        if isinstance(value, _Pattern):
+            return self._wrap(name, value, name)
+
+        if isinstance(value, PatternTable):
+            table = copy.copy(value)
+            for pattern_name, pattern in value.items():
+                setattr(table, pattern_name,
+                        self._wrap(pattern_name, pattern, name))
+            return table
+
+        if isinstance(value, LineDispatcher):
+            return _TracedDispatcher(
+                [(pattern_name, self._wrap(pattern_name, pattern, name))
+                 for pattern_name, pattern in value.patterns], self.lines)
+
+        if isinstance(value, LineScanner):
+            scanner = copy.copy(value)
+            if len(value.patterns) == 1:
+                scanner.pattern = self._wrap(*value.patterns[0],
+                                             location=name)
+                return scanner
+            branches = {pattern_name: self._stats(id(pattern), pattern_name,
+                                                  pattern, name)
+                        for pattern_name, pattern in value.patterns}
+            stats = self._stats(id(value.pattern), '{}({})'.format(
+                name, ', '.join(branches)), value.pattern, name)
+            scanner.pattern = _TracedScannerPattern(
+                value.pattern, stats, self.lines, branches)
+            return scanner
+
+        return None
+
+    def _compile(self, compile, modules):
+        '''Return re.compile tracing the patterns compiled by `modules`'''
+        def traced_compile(pattern, flags=0):
+            compiled = compile(pattern, flags)
+            frame = sys._getframe(1)
+            if frame.f_globals.get('__name__') not in modules:
+                return compiled
+
+            filename, lineno = frame.f_code.co_filename, frame.f_lineno
+            key = (filename, lineno, pattern, flags)
+            stats = self.stats.get(key)
+            if stats is None:
+                m = _ASSIGNED.match(linecache.getline(filename, lineno))
+                stats = self._stats(
+                    key, m.group(1) if m else 'line {}'.format(lineno),
+                    pattern, '{}:{}'.format(filename.rsplit('/', 1)[-1],
+                                            lineno))
+            return _TracedPattern(compiled, stats, self.lines)
+        return traced_compile
+
+    @contextlib.contextmanager
+    def trace(self, parser):
+        '''Trace the patterns of `parser` within the block'''
+        # The parser classes, not MetaParser and object
+        classes = [klass for klass in type(parser).__mro__
+                   if klass is not object and
+                   not klass.__module__.startswith('genie.metaparser')]
+        modules = {klass.__module__ for klass in classes}
+
+        # Class attributes are shadowed on the parser itself
+        attributes = {}
+        for klass in reversed(classes):
+            for name, value in vars(klass).items():
+                attributes[name] = self._traced(name, value)
+        shadowed = [name for name, traced in attributes.items()
+                    if traced is not None and name not in vars(parser)]
+        for name in shadowed:
+            setattr(parser, name, attributes[name])
+
+        patched = []
+        for module_name in modules:
+            module = sys.modules[module_name]
+            for name, value in list(vars(module).items()):
+                if isinstance(value, _Pattern):
+                    self._globals.add(id(value))
+                    patched.append((module, name, value))
+                    setattr(module, name, self._wrap(
+                        name, value, module_name.rsplit('.', 1)[-1]))
+
+        compile = re.compile
+        re.compile = self._compile(compile, modules)
+        try:
+            yield self
+        finally:
+            re.compile = compile
+            for module, name, value in patched:
+                setattr(module, name, value)
+            for name in shadowed:
+                delattr(parser, name)
+
+    def unmatched(self):
+        '''Return the lines no pattern matched, in the order first seen,
+        blank lines aside'''
+        return [line for line, matched in self.lines.items()
+                if not matched and line.strip()]
+
+    def patterns(self):
+        '''Return the stats of the patterns, slowest first'''
+        return sorted((stats for key, stats in self.stats.items()
+                       if stats.attempts or key not in self._globals),
+                      key=lambda stats: -stats.seconds)
+
+    def never_matched(self):
+        '''Return the names of the patterns which never matched, tried or
+        not'''
+        return [stats.name for stats in self.patterns() if not stats.hits]
+
+    def to_dict(self):
+        '''Return the stats of the patterns, slowest first, the patterns
+        which never matched and the lines no pattern matched'''
+        return {
+            'patterns': [stats.to_dict() for stats in self.patterns()],
+            'never_matched': self.never_matched(),
+            'unmatched_lines': self.unmatched(),
+        }
+
+    def report(self, top=None, lines=20):
+        '''Return the profile as text, with the `top` slowest patterns and
+        up to `lines` of the lines no pattern matched'''
+        profile = self.to_dict()
+        report = ['{:<24} {:<26} {:>9} {:>9} {:>10} {:>7}'.format(
+            'pattern', 'location', 'attempts', 'hits', 'total ms', 'us/try')]
+        for stats in profile['patterns'][:top]:
+            report.append('{:<24} {:<26} {:>9} {:>9} {:>10.2f} {:>7}'.format(
+                stats['name'], stats['location'] or '', stats['attempts'],
+                stats['hits'], stats['seconds'] * 1e3,
+                '{:.2f}'.format(stats['seconds'] / stats['attempts'] * 1e6)
+                if stats['attempts'] and stats['seconds'] else '-'))
+        if profile['never_matched']:
+            report.append('Never matched: ' +
+                          ', '.join(profile['never_matched']))
+        unmatched = profile['unmatched_lines']
+        if unmatched:
+            report.append('Lines no pattern matched ({}):'.format(
+                len(unmatched)))
+            report.extend('  ' + line for line in unmatched[:lines])
+        return '\n'.join(report)
+
+
+def profile_patterns(parser, output=None, **kwargs):
+    '''Run parser.cli(output=output, **kwargs) tracing its patterns.
+
+    Args:
+        parser: the parser, e.g. ShowInterfaces(device=None)
+        output (`str`): output to parse, executed on the device if None
+
+    Returns:
+        PatternProfile: the profile of the patterns
+    '''
+    profile = PatternProfile()
+    with profile.trace(parser):
+        parser.cli(output=output, **kwargs)
+    return profile
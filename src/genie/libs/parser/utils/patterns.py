@@ -0,0 +1,446 @@
+'''Pattern tables compiled once per parser class
+
+Parsers used to compile their patterns inside `cli()`, on every call, and
+relied on the cache of the `re` module which only holds a few hundred
+patterns and is shared by every parser in use. A pattern table is declared
+on the parser class and compiled when the class is created:
+
+    class ShowClock(ShowClockSchema):
+
+        cli_command = 'show clock'
+
+        patterns = PatternTable(
+            # 05:26:38.035 EST Wed JAN 4 2019
+            p1=r'^(?P<time>[\\d\\:\\.]+) +(?P<timezone>\\w+)',
+            # Time source is NTP
+            p2=(r'^time +source +is +(?P<source>\\w+)$', re.IGNORECASE),
+        )
+
+        def cli(self, output=None):
+            ...
+            p = self.patterns
+            for line in out.splitlines():
+                m = p.p1.match(line)
+
+Subclasses inherit the table of their parent, and can extend it:
+
+    patterns = ShowClock.patterns.extend(p3=r'^Clock +is +(?P<state>\\w+)$')
+
+Parsers which try many patterns on every line can dispatch each line only to
+the patterns which can match it, see LineDispatcher:
+
+    dispatcher = patterns.dispatcher('p1', 'p2')
+
+    def cli(self, output=None):
+        ...
+        for line in out.splitlines():
+            for name, m in self.dispatcher.matches(line.strip()):
+                if name == 'p1':
+                    ...
+                    break
+                elif name == 'p2':
+                    ...
+
+Parsers whose lines each match at most one pattern, such as tables, can
+instead match every line against all of their patterns in a single call,
+see LineScanner:
+
+    scanner = patterns.scanner('p1', 'p2')
+
+    def cli(self, output=None):
+        ...
+        for name, group in self.scanner.scan(out):
+            if name == 'p1':
+                ...
+'''
+
+# python
+import re
+
+try:
+    from re import _parser as sre_parse
+    from re import _constants as sre_constants
+except ImportError:
+    # python < 3.11
+    import sre_parse
+    import sre_constants
+
+
+class PatternTable(object):
+    '''Named regular expressions, compiled when the table is created.
+
+    Args:
+        **patterns: name -> pattern, or (pattern, flags)
+
+    The compiled patterns are attributes of the table, in declaration order
+    when iterating over it.
+    '''
+
+    def __init__(self, **patterns):
+        self._names = []
+        self._sources = {}
+        for name, pattern in patterns.items():
+            self._add(name, pattern)
+
+    def _add(self, name, pattern):
+        if name.startswith('_') or \
+                name in ('extend', 'items', 'sources', 'dispatcher', 'scanner'):
+            raise ValueError("'{}' is not a valid pattern name".format(name))
+
+        flags = 0
+        if isinstance(pattern, tuple):
+            pattern, flags = pattern
+
+        if name not in self._sources:
+            self._names.append(name)
+        self._sources[name] = (pattern, flags)
+        setattr(self, name, re.compile(pattern, flags))
+
+    def __iter__(self):
+        return iter(self._names)
+
+    def __len__(self):
+        return len(self._names)
+
+    def __contains__(self, name):
+        return name in self._sources
+
+    def __repr__(self):
+        return '{}({})'.format(type(self).__name__, ', '.join(self._names))
+
+    def items(self):
+        '''Return (name, compiled pattern) in declaration order'''
+        return [(name, getattr(self, name)) for name in self._names]
+
+    def sources(self):
+        '''Return (name, pattern, flags) in declaration order'''
+        return [(name,) + self._sources[name] for name in self._names]
+
+    def extend(self, **patterns):
+        '''Return a new table with the patterns of this one, plus or
+        overridden by `patterns`'''
+        table = PatternTable()
+        for name, pattern, flags in self.sources():
+            table._names.append(name)
+            table._sources[name] = (pattern, flags)
+            setattr(table, name, getattr(self, name))
+        for name, pattern in patterns.items():
+            table._add(name, pattern)
+        return table
+
+    def dispatcher(self, *names):
+        '''Return a LineDispatcher over the patterns `names` of this table,
+        in that order, or over the whole table if no name is given'''
+        return LineDispatcher([(name, getattr(self, name))
+                               for name in names or self._names])
+
+    def scanner(self, *names):
+        '''Return a LineScanner over the patterns `names` of this table, in
+        that order, or over the whole table if no name is given'''
+        return LineScanner([(name, getattr(self, name))
+                            for name in names or self._names])
+
+
+# Lines are indexed by their first character when it is ASCII, lines starting
+# with any other character are tried against every pattern
+_ASCII = [chr(c) for c in range(128)]
+
+# ASCII characters matched by the character class escapes
+_CATEGORY_CHARS = {
+    category: {c for c in _ASCII if re.match('[' + escape + ']', c)}
+    for category, escape in (
+        (sre_constants.CATEGORY_DIGIT, r'\d'),
+        (sre_constants.CATEGORY_NOT_DIGIT, r'\D'),
+        (sre_constants.CATEGORY_SPACE, r'\s'),
+        (sre_constants.CATEGORY_NOT_SPACE, r'\S'),
+        (sre_constants.CATEGORY_WORD, r'\w'),
+        (sre_constants.CATEGORY_NOT_WORD, r'\W'),
+    )
+}
+
+
+def _char_set(items):
+    '''Return the ASCII characters of a character class, or None'''
+    chars = set()
+    negate = False
+    for op, av in items:
+        if op is sre_constants.NEGATE:
+            negate = True
+        elif op is sre_constants.LITERAL:
+            if av < 128:
+                chars.add(chr(av))
+        elif op is sre_constants.RANGE:
+            chars.update(chr(c) for c in range(av[0], min(av[1], 127) + 1))
+        elif op is sre_constants.CATEGORY and av in _CATEGORY_CHARS:
+            chars.update(_CATEGORY_CHARS[av])
+        else:
+            return None
+
+    if negate:
+        return set(_ASCII) - chars
+    return chars
+
+
+def _first_chars(items):
+    '''Return the ASCII characters a parsed pattern can start with, None if
+    unknown, and whether it can match an empty text'''
+    chars = set()
+    for op, av in items:
+        if op is sre_constants.AT:
+            # ^, $, \b do not consume any character
+            continue
+
+        if op is sre_constants.LITERAL:
+            first, nullable = {chr(av)} if av < 128 else set(), False
+        elif op is sre_constants.NOT_LITERAL:
+            first, nullable = set(_ASCII) - {chr(av)}, False
+        elif op is sre_constants.ANY:
+            first, nullable = set(_ASCII), False
+        elif op is sre_constants.IN:
+            first, nullable = _char_set(av), False
+        elif op is sre_constants.SUBPATTERN:
+            # (group, add_flags, del_flags, pattern)
+            if av[1] or av[2]:
+                return None, True
+            first, nullable = _first_chars(av[-1])
+        elif op in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT):
+            first, nullable = _first_chars(av[2])
+            nullable = nullable or av[0] == 0
+        elif op is sre_constants.BRANCH:
+            first, nullable = set(), False
+            for branch in av[1]:
+                branch_first, branch_nullable = _first_chars(branch)
+                if branch_first is None:
+                    return None, True
+                first.update(branch_first)
+                nullable = nullable or branch_nullable
+        else:
+            return None, True
+
+        if first is None:
+            return None, True
+        chars.update(first)
+        if not nullable:
+            return chars, False
+
+    return chars, True
+
+
+def _scan(pattern):
+    '''Return the characters a pattern can start with (None if any) and
+    the literal text every match starts with'''
+    try:
+        parsed = sre_parse.parse(pattern.pattern, pattern.flags)
+    except Exception:
+        return None, ''
+
+    # Case folding matches non ASCII characters with ASCII ones
+    if pattern.flags & re.IGNORECASE or not isinstance(pattern.pattern, str):
+        return None, ''
+
+    prefix = ''
+    for op, av in parsed:
+        if op is sre_constants.AT and not prefix:
+            continue
+        if op is not sre_constants.LITERAL:
+            break
+        prefix += chr(av)
+
+    chars, nullable = _first_chars(list(parsed))
+    if nullable:
+        chars = None
+    return chars, prefix
+
+
+class LineDispatcher(object):
+    '''Dispatch lines to the patterns which can match them.
+
+    Patterns are indexed by the characters they can start with and by their
+    literal prefix. A line is only tried against the patterns of its first
+    character whose prefix it starts with, in the order the patterns were
+    given, which yields exactly the patterns trying all of them in order
+    with `match` would.
+
+    Args:
+        patterns (`list`): (name, compiled pattern) in the order to try them
+    '''
+
+    def __init__(self, patterns):
+        self.patterns = list(patterns)
+
+        scanned = [(name, pattern) + _scan(pattern)
+                   for name, pattern in self.patterns]
+        candidates = [(name, prefix, pattern)
+                      for name, pattern, chars, prefix in scanned]
+
+        # Lines starting with a non ASCII character
+        self._all = tuple(candidates)
+
+        # Patterns which can start with anything are tried on every line
+        self._index = {}
+        for char in [''] + _ASCII:
+            self._index[char] = tuple(
+                candidate for candidate, (_, _, chars, _) in
+                zip(candidates, scanned)
+                if chars is None or char in chars)
+
+    def candidates(self, line):
+        '''Return the (name, prefix, pattern) which may match `line`'''
+        return self._index.get(line[:1], self._all)
+
+    def matches(self, line):
+        '''Yield the (name, match) of the patterns matching `line`, in
+        order'''
+        for name, prefix, pattern in self._index.get(line[:1], self._all):
+            if prefix and not line.startswith(prefix):
+                continue
+            m = pattern.match(line)
+            if m:
+                yield name, m
+
+    def match(self, line):
+        '''Return the (name, match) of the first pattern matching `line`,
+        or (None, None)'''
+        for name, m in self.matches(line):
+            return name, m
+        return None, None
+
+
+# Flags which can be scoped to a branch of the combined pattern
+_SCOPED_FLAGS = ((re.ASCII, 'a'), (re.IGNORECASE, 'i'), (re.MULTILINE, 'm'),
+                 (re.DOTALL, 's'), (re.VERBOSE, 'x'))
+
+# Flags set inline for the whole pattern, e.g. (?i)
+_GLOBAL_FLAGS = re.compile(r'^\(\?[aiLmsux]+\)')
+
+# Start of a named group, not escaped
+_NAMED_GROUP = re.compile(r'(?<!\\)\(\?P<(\w+)>')
+
+
+def _references(items):
+    '''Return whether a parsed pattern refers to one of its groups'''
+    for op, av in items:
+        if op in (sre_constants.GROUPREF, sre_constants.GROUPREF_EXISTS):
+            return True
+        for value in (av if isinstance(av, (tuple, list)) else (av,)):
+            if isinstance(value, sre_parse.SubPattern) and \
+                    _references(value):
+                return True
+            if isinstance(value, (tuple, list)) and any(
+                    isinstance(v, sre_parse.SubPattern) and _references(v)
+                    for v in value):
+                return True
+    return False
+
+
+class LineScanner(object):
+    '''Match lines against ordered patterns in a single call.
+
+    The patterns are combined into one alternation with a named branch per
+    pattern. Branches are tried in order, so a line matches the branch of
+    the first pattern which would have matched it with `match`, and gets
+    the groupdict that pattern would have returned.
+
+    Lines are stripped and matched one by one: the patterns are written for
+    a single stripped line, and `\\s`, `$` or negated classes would match
+    across lines if the whole output was scanned at once.
+
+    Args:
+        patterns (`list`): (name, compiled pattern) in the order to try them
+
+    Raises:
+        ValueError: a pattern refers to one of its groups, its groups can
+                    not be renamed in the combined pattern
+    '''
+
+    def __init__(self, patterns):
+        self.patterns = list(patterns)
+
+        if len(self.patterns) == 1:
+            # Nothing to combine, the pattern and its groupdict are used as is
+            self.pattern = self.patterns[0][1]
+            self._groups = None
+            return
+
+        branches = []
+        self._groups = {}
+        for index, (name, pattern) in enumerate(self.patterns):
+            source = pattern.pattern
+            if not isinstance(source, str) or _references(
+                    sre_parse.parse(source, pattern.flags)):
+                raise ValueError("Pattern '{}' can not be combined with "
+                                 "others".format(name))
+
+            # Group names are unique in the combined pattern, _<index>_<name>
+            source = _GLOBAL_FLAGS.sub('', source)
+            source = _NAMED_GROUP.sub(
+                lambda m: '(?P<_{}_{}>'.format(index, m.group(1)), source)
+
+            flags = ''.join(letter for flag, letter in _SCOPED_FLAGS
+                            if pattern.flags & flag)
+            if flags:
+                source = '(?{}:{}{})'.format(
+                    flags, source, '\n' if pattern.flags & re.VERBOSE else '')
+            branches.append('(?P<{}>{})'.format(name, source))
+
+            self._groups[name] = [
+                (group, '_{}_{}'.format(index, group))
+                for group, _ in sorted(pattern.groupindex.items(),
+                                       key=lambda item: item[1])]
+
+        try:
+            self.pattern = re.compile('|'.join(branches))
+        except re.error as e:
+            raise ValueError('Patterns can not be combined: {}'.format(e))
+
+        # The renaming must not have changed any group
+        if self.pattern.groups != sum(pattern.groups + 1 for _, pattern in
+                                      self.patterns) or \
+                any(renamed not in self.pattern.groupindex
+                    for groups in self._groups.values()
+                    for _, renamed in groups):
+            raise ValueError('Patterns can not be combined')
+
+        # name -> (group name, index in m.groups() of the combined pattern)
+        self._groups = {
+            name: tuple((group, self.pattern.groupindex[renamed] - 1)
+                        for group, renamed in groups)
+            for name, groups in self._groups.items()}
+
+    def match(self, line):
+        '''Return the (name, groupdict) of the first pattern matching
+        `line`, or (None, None)'''
+        m = self.pattern.match(line)
+        if not m:
+            return None, None
+        if self._groups is None:
+            return self.patterns[0][0], m.groupdict()
+        name = m.lastgroup
+        groups = m.groups()
+        return name, {group: groups[index]
+                      for group, index in self._groups[name]}
+
+    def scan(self, output):
+        '''Yield the (name, groupdict) of the first pattern matching each
+        stripped line of `output`, skipping the lines no pattern matches.
+
+        `output` is a string or an iterable of lines.
+        '''
+        if isinstance(output, str):
+            output = output.splitlines()
+        # Called for every line of large outputs, hence inlined
+        matches = map(self.pattern.match, map(str.strip, output))
+        branches = self._groups
+        if branches is None:
+            name = self.patterns[0][0]
+            for m in matches:
+                if m:
+                    yield name, m.groupdict()
+            return
+
+        for m in matches:
+            if m:
+                name = m.lastgroup
+                groups = m.groups()
+                yield name, {group: groups[index]
+                             for group, index in branches[name]}
@@ -0,0 +1,287 @@
+'''Streaming the entries of large table outputs
+
+Table parsers build one dictionary holding every entry of the output before
+returning it, which for a NAT or routing table with a million entries means
+holding the whole output and the whole dictionary in memory. Parsers of
+outputs made of independent entries can instead yield the entries one at a
+time, as they are read:
+
+    >>> parser = ShowArp(device=device)
+    >>> with open('show_arp.txt') as f:
+    ...     for record in parser.iter_records(f):
+    ...         process(record)
+
+Each record is shaped like the schema of the parser, and holds a single
+entry, so merging the records gives back what `cli()` returns for the whole
+output:
+
+    >>> merge_records(parser.iter_records(output)) == parser.cli(output=output)
+    True
+
+Outputs too large to parse in one process, such as the OSPF database of a
+large area, can be parsed in chunks of entries by a pool of processes:
+
+    >>> parsed = parser.parse_parallel(output, processes=8)
+
+or into a ColumnarTable, which holds the entries as compact columns rather
+than as dictionaries, see utils/columnar.py:
+
+    >>> table = parser.parse_columnar(output)
+
+Parsers opt in by inheriting RecordIterator and declaring how their output
+is split into entries with a RecordSplitter. Only parsers whose cli() reads
+nothing from one entry to the next but the context lines can opt in.
+'''
+
+# python
+import re
+import codecs
+import functools
+from concurrent.futures import ProcessPoolExecutor
+
+from .columnar import ColumnarTable
+
+
+def iter_lines(output):
+    '''Yield the lines of an output, without their line ending.
+
+    Args:
+        output: a string, or an iterable of lines or of chunks of text or
+                bytes, such as a file or the stream of a device session
+    '''
+    if isinstance(output, str):
+        yield from output.splitlines()
+        return
+
+    decoder = codecs.getincrementaldecoder('utf-8')('replace')
+    pending = ''
+    for chunk in output:
+        if isinstance(chunk, bytes):
+            chunk = decoder.decode(chunk)
+        if pending:
+            chunk = pending + chunk
+        lines = chunk.splitlines()
+        # The last line continues in the next chunk
+        if lines and not chunk.endswith(('\n', '\r')):
+            pending = lines.pop()
+        else:
+            pending = ''
+        yield from lines
+
+    pending += decoder.decode(b'', final=True)
+    if pending:
+        yield from pending.splitlines()
+
+
+class RecordSplitter(object):
+    '''Split the lines of an output into entries.
+
+    An entry starts with a line matching `start` and runs until the next
+    one. Context lines, such as the VRF or address family headers of a
+    routing table, apply to the entries after them: they are repeated
+    before each entry so it can be parsed on its own.
+
+    Lines are stripped before being matched, the way parsers match them.
+
+    Args:
+        start (`str`): pattern of the first line of an entry, or tuple of
+                       patterns
+        context (`tuple`): patterns of the context lines, outermost first.
+                           A context line replaces the previous line of its
+                           level and clears the levels inside it
+        lead (`tuple`): patterns of the optional lines an entry starts with,
+                        before its `start` line
+    '''
+
+    def __init__(self, start, context=(), lead=()):
+        if not isinstance(start, (tuple, list)):
+            start = (start,)
+        self.start = [re.compile(pattern) for pattern in start]
+        self.context = [re.compile(pattern) for pattern in context]
+        self.lead = [re.compile(pattern) for pattern in lead]
+
+    def split(self, lines, size=1):
+        '''Yield the lines of each entry, after the context lines in effect.
+
+        Lines before the first entry, and context lines not followed by any
+        entry, are yielded too, so no line of the output is left out. Chunks
+        of blank lines are not, as parsers read an empty output from the
+        device.
+
+        Args:
+            lines: the lines of the output
+            size (`int`): number of entries per chunk. The context lines met
+                          within a chunk are kept in it, in place
+        '''
+        for chunk in self._split(lines, size):
+            if any(line.strip() for line in chunk):
+                yield chunk
+
+    def _split(self, lines, size):
+        context = [None] * len(self.context)
+        chunk = []
+        # Whether the chunk holds lines not yielded yet, and lines other
+        # than context lines
+        unyielded = body = False
+        # Level of the last context line
+        last = None
+        # Entries in the chunk, and whether the last line was a lead line
+        entries = 0
+        leading = False
+
+        for line in lines:
+            stripped = line.strip()
+
+            level = None
+            for index, pattern in enumerate(self.context):
+                if pattern.match(stripped):
+                    level = index
+                    break
+
+            if level is not None:
+                context[level] = line
+                for index in range(level + 1, len(context)):
+                    context[index] = None
+                leading = False
+                if body and entries < size:
+                    chunk.append(line)
+                    continue
+                # Context lines nested in one another make a single chunk
+                if body or unyielded and level <= last:
+                    yield chunk
+                last = level
+                chunk = [header for header in context if header is not None]
+                unyielded, body = True, False
+                entries = 0
+                continue
+
+            if any(pattern.match(stripped) for pattern in self.lead):
+                opens, leading = True, True
+            else:
+                opens = not leading and any(pattern.match(stripped)
+                                            for pattern in self.start)
+                leading = False
+
+            if opens and body and entries >= size:
+                yield chunk
+                chunk = [header for header in context if header is not None]
+                body = False
+                entries = 0
+            if opens or not body:
+                entries += 1
+
+            chunk.append(line)
+            unyielded = body = True
+
+        if unyielded:
+            yield chunk
+
+
+def merge_records(records):
+    '''Merge records into the dictionary the parser returns for the whole
+    output'''
+    result = {}
+    for record in records:
+        _merge(result, record)
+    return result
+
+
+def _merge(into, record):
+    for key, value in record.items():
+        if isinstance(value, dict) and isinstance(into.get(key), dict):
+            _merge(into[key], value)
+        else:
+            into[key] = value
+
+
+class RecordIterator(object):
+    '''Mixin giving a streaming mode to the parsers declaring a
+    RecordSplitter as their `records`.
+
+    Each entry is parsed on its own with `cli()`, so the parser keeps a
+    single implementation and memory only holds one entry at a time.
+    '''
+
+    # RecordSplitter of the output of the parser
+    records = None
+
+    def iter_records(self, output, **kwargs):
+        '''Yield the entries of an output one at a time.
+
+        Args:
+            output: the output as a string, or an iterable of lines or of
+                    chunks of text, see iter_lines
+            **kwargs: arguments of cli(), e.g. the vrf of the command
+
+        Returns:
+            generator of the records, shaped like the schema of the parser
+        '''
+        if self.records is None:
+            raise NotImplementedError(
+                '{} does not declare its records'.format(type(self).__name__))
+
+        for chunk in self.records.split(iter_lines(output)):
+            record = self.cli(output='\n'.join(chunk), **kwargs)
+            if record:
+                yield record
+
+    def parse_columnar(self, output, **kwargs):
+        '''Parse an output into a ColumnarTable, one entry at a time.
+
+        The parsed dictionary of the whole output is never built: each
+        record is stored as columns as soon as it is read.
+        `to_dict()` of the table gives back the merged records.
+
+        Args:
+            output: the output as a string, or an iterable of lines or of
+                    chunks of text, see iter_lines
+            **kwargs: arguments of cli(), e.g. the vrf of the command
+
+        Returns:
+            ColumnarTable: the entries of the output, the schema is not
+                           checked
+        '''
+        table = ColumnarTable(getattr(self, 'schema', None))
+        for record in self.iter_records(output, **kwargs):
+            table.append(record)
+        return table.compact()
+
+    def parse_parallel(self, output, processes=None, chunk_size=500,
+                       executor=None, **kwargs):
+        '''Parse an output in chunks of entries, in parallel.
+
+        The output is split into chunks of `chunk_size` entries, each
+        starting with the context lines in effect. The chunks are parsed
+        with cli() in a pool of processes and the results merged in the
+        order of the output, so the result does not depend on the number of
+        processes.
+
+        Args:
+            output: the output as a string, or an iterable of lines or of
+                    chunks of text, see iter_lines
+            processes (`int`): size of the pool, the number of CPUs by default
+            chunk_size (`int`): number of entries parsed by a process at once
+            executor: a concurrent.futures executor to parse the chunks with
+                      instead of a new pool of processes
+            **kwargs: arguments of cli(), e.g. the vrf of the command
+
+        Returns:
+            dict: the merged result of cli(), the schema is not checked
+        '''
+        if self.records is None:
+            raise NotImplementedError(
+                '{} does not declare its records'.format(type(self).__name__))
+
+        chunks = ('\n'.join(chunk) for chunk in
+                  self.records.split(iter_lines(output), size=chunk_size))
+        parse = functools.partial(_parse_chunk, type(self), kwargs)
+
+        if executor is not None:
+            return merge_records(filter(None, executor.map(parse, chunks)))
+        with ProcessPoolExecutor(processes) as pool:
+            return merge_records(filter(None, pool.map(parse, chunks)))
+
+
+def _parse_chunk(parser_cls, kwargs, text):
+    '''Parse a chunk of an output in a worker process'''
+    return parser_cls(device=None).cli(output=text, **kwargs)
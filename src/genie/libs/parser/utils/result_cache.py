@@ -0,0 +1,296 @@
+'''Caching parse results by output
+
+Pollers parse the same commands over and over, and on a stable network
+most outputs do not change from one poll to the next: `show version`,
+`show inventory`, `show platform`, the OSPF neighbors... Once the result
+cache is enabled, MetaParser.parse serves the result of an output already
+parsed by the same parser with the same arguments from the cache, skipping
+both the parsing and the schema validation:
+
+    >>> enable_result_cache(maxsize=1024, path='/var/cache/parsers/results')
+    >>> device.parse('show version')       # parsed
+    >>> device.parse('show version')       # same output, from the cache
+    >>> get_result_cache_info()
+    {'hits': 1, 'misses': 1, 'size': 1, 'maxsize': 1024, 'disk_hits': 0,
+     'disk_writes': 1}
+
+Results are keyed by the parser class, the version of genieparser and a
+hash of the sources of the parser class and its parents, so that an upgrade
+or a fix of a parser does not serve the results of its previous code. They
+are also keyed by the os and platform of the device, whether the parser is
+validated in full, see validation.py, the arguments of parse() and a hash
+of the outputs. When parse() is given its output, that is the output
+hashed. Otherwise the commands the parser executed on the device last time,
+with the same arguments, are executed first and their outputs hashed, then
+handed to the parser on a miss, so each command still runs once per parse.
+
+Results are stored pickled, and every hit returns a new copy. The in-memory
+entries are bounded and evicted least recently used first; the optional
+store on disk, one file per result, is shared by the processes pointing to
+the same folder and is not bounded. The results on disk are loaded with
+pickle, which can run arbitrary code: the folder must only be writable by
+trusted users.
+'''
+
+# python
+import os
+import sys
+import pickle
+import hashlib
+import logging
+import threading
+
+# Metaparser
+from genie.metaparser import MetaParser
+
+from genie.libs.parser import __version__
+
+from .cache import LRUCache
+from .files import write_atomic
+from .validation import get_validation_policy
+
+log = logging.getLogger(__name__)
+
+# parse() of MetaParser, while the cache wraps it
+_parse = None
+
+# The cache in use, see enable_result_cache
+result_cache = None
+
+# parser class -> digest of the sources of its modules
+_source_digests = {}
+
+
+class _RecordingDevice(object):
+    '''Device recording the commands a parser executes.
+
+    The outputs of the commands executed ahead of the parser are handed to
+    it instead of executing them again, in the same order.
+
+    Args:
+        device: the device of the parser
+        executed (`list`): ((args, kwargs), output) of the commands executed
+                           ahead
+    '''
+
+    def __init__(self, device, executed=()):
+        self._device = device
+        self._executed = list(executed)
+        self.calls = []
+        self.outputs = []
+
+    def __getattr__(self, name):
+        return getattr(self._device, name)
+
+    def execute(self, *args, **kwargs):
+        call = (args, kwargs)
+        if self._executed and self._executed[0][0] == call:
+            output = self._executed.pop(0)[1]
+        else:
+            self._executed = []
+            output = self._device.execute(*args, **kwargs)
+        self.calls.append(call)
+        self.outputs.append(output)
+        return output
+
+
+def _digest(*parts):
+    digest = hashlib.blake2b(digest_size=20)
+    for part in parts:
+        if not isinstance(part, bytes):
+            part = str(part).encode('utf-8', 'surrogatepass')
+        digest.update(len(part).to_bytes(8, 'little'))
+        digest.update(part)
+    return digest.hexdigest()
+
+
+def _source_digest(parser_cls):
+    '''Return a digest of the sources of the modules of a parser class and
+    of its parents'''
+    digest = _source_digests.get(parser_cls)
+    if digest is None:
+        sources = []
+        for module_name in sorted({klass.__module__
+                                   for klass in parser_cls.__mro__}):
+            path = getattr(sys.modules.get(module_name), '__file__', None)
+            try:
+                with open(path, 'rb') as f:
+                    sources.append(f.read())
+            except (OSError, TypeError):
+                sources.append(module_name)
+        digest = _source_digests[parser_cls] = _digest(*sources)
+    return digest
+
+
+class ResultCache(object):
+    '''Results of parse() keyed by parser, arguments and outputs.
+
+    Args:
+        maxsize (`int`): maximum number of results held in memory
+        path (`str`): folder of the results stored on disk, None to keep
+                      them in memory only
+    '''
+
+    def __init__(self, maxsize=1024, path=None):
+        self.path = path
+        self.results = LRUCache(maxsize)
+        # Commands each parser executed, per arguments
+        self.commands = LRUCache(maxsize)
+        self.disk_hits = 0
+        self.disk_writes = 0
+        self._lock = threading.Lock()
+        if path:
+            os.makedirs(path, exist_ok=True)
+
+    def info(self):
+        '''Return the hits, misses, size and maxsize of the cache, and the
+        hits and writes of its store on disk'''
+        info = self.results.info()
+        info['disk_hits'] = self.disk_hits
+        info['disk_writes'] = self.disk_writes
+        return info
+
+    def clear(self, stats=False):
+        '''Drop the results held in memory, not those stored on disk, and
+        reset the counters if `stats` is True'''
+        self.results.clear(stats=stats)
+        self.commands.clear(stats=stats)
+        if stats:
+            self.disk_hits = self.disk_writes = 0
+
+    def _read(self, name):
+        if not self.path:
+            return None
+        try:
+            with open(os.path.join(self.path, name), 'rb') as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def _write(self, name, data):
+        if not self.path:
+            return
+        try:
+            # Written whole, or not at all, for other processes
+            write_atomic(os.path.join(self.path, name), data)
+            with self._lock:
+                self.disk_writes += 1
+        except OSError as e:
+            log.warning('Could not store a parse result in {p}: {e}'.format(
+                p=self.path, e=e))
+
+    def _load(self, key):
+        data = self.results.get(key)
+        if data is None:
+            data = self._read(key)
+            if data is None:
+                return None
+            with self._lock:
+                self.disk_hits += 1
+            # Served from disk, not missed
+            self.results.count_hit()
+            self.results.set(key, data)
+        return pickle.loads(data)
+
+    def _store(self, key, result):
+        data = pickle.dumps(result, pickle.HIGHEST_PROTOCOL)
+        self.results.set(key, data)
+        self._write(key, data)
+
+    def parse(self, parser, parse, kwargs):
+        '''Return the result of parse(parser, **kwargs), from the cache if
+        its outputs were parsed before'''
+        device = getattr(parser, 'device', None)
+        key = _digest(type(parser).__module__, type(parser).__qualname__,
+                      __version__, _source_digest(type(parser)),
+                      getattr(parser, 'context', None),
+                      getattr(device, 'os', None),
+                      getattr(device, 'platform', None),
+                      # Results not validated in full are not converted
+                      get_validation_policy(type(parser)).mode == 'full',
+                      sorted((name, repr(value)) for name, value
+                             in kwargs.items() if name != 'output'))
+
+        if kwargs.get('output') is not None:
+            key = _digest(key, kwargs['output'])
+            result = self._load(key)
+            if result is None:
+                result = parse(parser, **kwargs)
+                self._store(key, result)
+            return result
+
+        if device is None:
+            return parse(parser, **kwargs)
+
+        executed = []
+        calls = self.commands.get(key)
+        if calls is None:
+            data = self._read('commands-' + key)
+            calls = data and pickle.loads(data)
+        if calls:
+            executed = [(call, device.execute(*call[0], **call[1]))
+                        for call in calls]
+            result = self._load(_digest(key, *(output for _, output
+                                                in executed)))
+            if result is not None:
+                return result
+
+        recorder = _RecordingDevice(device, executed)
+        parser.device = recorder
+        try:
+            result = parse(parser, **kwargs)
+        finally:
+            parser.device = device
+
+        if recorder.calls != calls:
+            self.commands.set(key, recorder.calls)
+            self._write('commands-' + key, pickle.dumps(recorder.calls))
+        self._store(_digest(key, *recorder.outputs), result)
+        return result
+
+
+def _cached_parse(self, **kwargs):
+    cache = result_cache
+    if cache is None:
+        return _parse(self, **kwargs)
+    return cache.parse(self, _parse, kwargs)
+
+
+def enable_result_cache(maxsize=1024, path=None):
+    '''Cache the results of MetaParser.parse by output.
+
+    Args:
+        maxsize (`int`): maximum number of results held in memory
+        path (`str`): folder to store the results in, to share them between
+                      processes and runs
+
+    Returns:
+        ResultCache: the cache in use
+    '''
+    global _parse, result_cache
+    if _parse is None:
+        _parse = MetaParser.parse
+        MetaParser.parse = _cached_parse
+    result_cache = ResultCache(maxsize, path)
+    return result_cache
+
+
+def disable_result_cache():
+    '''Stop caching the results of MetaParser.parse'''
+    global _parse, result_cache
+    # Left in place, doing nothing, if parse() was wrapped again since
+    if _parse is not None and MetaParser.parse is _cached_parse:
+        MetaParser.parse = _parse
+        _parse = None
+    result_cache = None
+
+
+def get_result_cache_info():
+    '''Return the counters of the result cache, None if it is disabled'''
+    return result_cache.info() if result_cache else None
+
+
+def invalidate_result_cache():
+    '''Drop the results held in memory by the result cache'''
+    if result_cache:
+        result_cache.clear()
@@ -0,0 +1,49 @@
+'''Parser registry of the tests resolving commands with get_parser'''
+
+from unittest.mock import Mock, patch
+
+from genie.libs.parser.utils import common
+from genie.libs.parser.utils.cache import LRUCache
+from genie.libs.parser.utils.common import invalidate_parser_cache
+from genie.libs.parser.utils.tests.dummy_parser.iosxe.show_clock import \
+    ShowClock
+
+
+class MockRegistryMixin(object):
+    '''Mixin of the TestCases resolving commands through a registry of
+    their own.
+
+    For the duration of each test, parser_data of utils.common holds the
+    `parser_data` of the TestCase, the tokens of a device are its os and
+    platform, parser classes are found by `find_parser_cls` rather than
+    imported, and the parser cache is a new one.
+    '''
+
+    parser_data = {
+        'show clock': {
+            'iosxe': {'module_name': 'show_clock',
+                      'package': 'genie.libs.parser',
+                      'class': 'ShowClock'}},
+    }
+
+    @staticmethod
+    def find_parser_cls(device, data):
+        return ShowClock
+
+    def setUp(self):
+        super().setUp()
+
+        lookup = Mock()
+        lookup.from_device.side_effect = lambda device, packages: Mock(
+            _tokens=[t for t in (device.os, device.platform) if t])
+
+        # Cleanups run last in first out, the cache is cleared last
+        self.addCleanup(invalidate_parser_cache)
+        for patcher in (
+                patch.dict(common.parser_data, self.parser_data, clear=True),
+                patch.object(common, 'Lookup', lookup),
+                patch.object(common, '_find_parser_cls', self.find_parser_cls),
+                patch.object(common, 'parser_cache', LRUCache(maxsize=8))):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        invalidate_parser_cache()
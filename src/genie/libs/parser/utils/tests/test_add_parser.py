@@ -1,10 +1,19 @@
+import sys
 import unittest
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
+from genie.libs.parser.utils import entry_points
 from genie.libs.parser.utils.common import (
     parser_data
 )
-from genie.libs.parser.utils.entry_points import add_parser
+from genie.libs.parser.utils.entry_points import (
+    add_parser,
+    add_parser_path,
+    load_entry_points,
+    entry_point_stats
+)
+
+DUMMY = 'genie.libs.parser.utils.tests.dummy_parser'
 
 
 class TestAddParser(unittest.TestCase):
@@ -40,5 +49,40 @@ class TestAddParser(unittest.TestCase):
             self.assertIn(cmd, parser_data)
 
 
+class TestAddParserPath(unittest.TestCase):
+
+    def setUp(self):
+        self.patch = patch.dict(parser_data)
+        self.patch.start()
+        sys.modules.pop(DUMMY + '.iosxr.show_clock', None)
+
+    def tearDown(self):
+        self.patch.stop()
+
+    def test_add_parser_path_deferred(self):
+        self.assertTrue(add_parser_path(
+            DUMMY + '.iosxr.show_clock:ShowClock', os_name='iosxr'))
+
+        self.assertEqual(parser_data['show clock']['iosxr'], {
+            'module_name': 'show_clock',
+            'package': DUMMY + '.iosxr',
+            'class': 'ShowClock'})
+        self.assertNotIn(DUMMY + '.iosxr.show_clock', sys.modules)
+
+    def test_load_entry_points(self):
+        ep = Mock()
+        ep.load.return_value = lambda: {
+            'iosxr': [DUMMY + '.iosxr.show_clock:ShowClock']}
+
+        with patch.object(entry_points, '_iter_entry_points',
+                          return_value=[ep]):
+            load_entry_points()
+
+        self.assertIn('iosxr', parser_data['show clock'])
+        self.assertEqual(entry_point_stats['entry_points'], 1)
+        self.assertEqual(entry_point_stats['parsers'], 1)
+        self.assertEqual(entry_point_stats['deferred'], 1)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,120 @@
+import io
+import os
+import json
+import shutil
+import tempfile
+import unittest
+
+from genie.libs.parser import batch
+from genie.libs.parser.utils.tests.dummy_parser.iosxe.show_clock import \
+    ShowClock
+from genie.libs.parser.utils.tests.mock_registry import MockRegistryMixin
+
+
+class TestBatch(MockRegistryMixin, unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.tmp = tempfile.mkdtemp()
+        captures = {'R1.txt': '*05:26:38.035 EST Wed JAN 4 2019\n',
+                    'R2.txt': 'Invalid input detected\n'}
+        for name, output in captures.items():
+            with open(os.path.join(self.tmp, name), 'w') as f:
+                f.write(output)
+
+        self.entries = [
+            {'os': 'iosxe', 'command': 'show clock', 'path': 'R1.txt',
+             'device': 'R1'},
+            {'os': 'iosxe', 'command': 'show clock', 'path': 'R2.txt',
+             'device': 'R2'},
+            {'os': 'iosxe', 'command': 'show clock', 'path': 'R3.txt',
+             'device': 'R3'},
+            {'os': 'iosxe', 'command': 'show nothing', 'path': 'R1.txt',
+             'device': 'R1'},
+        ]
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def write_manifest(self, name='manifest.jsonl'):
+        path = os.path.join(self.tmp, name)
+        with open(path, 'w') as f:
+            for entry in self.entries:
+                f.write(json.dumps(entry) + '\n')
+        return path
+
+    def test_read_manifest(self):
+        path = os.path.join(self.tmp, 'manifest.csv')
+        with open(path, 'w') as f:
+            f.write('os,platform,command,path\n'
+                    'iosxe,cat9k,show clock,R1.txt\n')
+        self.assertEqual(list(batch.read_manifest(path)), [
+            {'os': 'iosxe', 'platform': 'cat9k', 'model': None,
+             'command': 'show clock', 'device': None,
+             'path': os.path.join(self.tmp, 'R1.txt'), 'error': None}])
+
+        with open(path, 'w') as f:
+            f.write('os,command\niosxe,show clock\n')
+        entry, = batch.read_manifest(path)
+        self.assertEqual(entry['error'], '{}: entry 1 needs an os, a command '
+                                         'and a path'.format(path))
+
+    def test_malformed_manifest(self):
+        path = self.write_manifest()
+        with open(path, 'a') as f:
+            f.write('{"os": "iosxe", "command": \n'
+                    '["iosxe", "show clock", "R1.txt"]\n'
+                    '{"os": "iosxe", "command": "show clock", "path": 1}\n')
+        errors = [entry['error'] for entry in batch.read_manifest(path)]
+        self.assertEqual(errors[:4], [None] * 4)
+        self.assertIn('entry 5 is not valid JSON', errors[4])
+        self.assertIn('entry 6 is not a JSON object', errors[5])
+        self.assertIn('entry 7 needs an os, a command and a path', errors[6])
+
+        # Reported, the other captures are still parsed
+        out = io.StringIO()
+        counts = batch.run(path, out, processes=1)
+        self.assertEqual((counts['ok'], counts['error']), (1, 4))
+        results = [json.loads(line) for line in out.getvalue().splitlines()]
+        self.assertEqual(len(results), 7)
+
+    def test_resolve(self):
+        resolutions, bundle = batch.resolve(
+            batch.read_manifest(self.write_manifest()))
+        self.assertEqual(resolutions, {
+            ('iosxe', None, None, 'show clock'): (ShowClock, {}),
+            ('iosxe', None, None, 'show nothing'): None})
+        self.assertEqual(bundle['modules'], [ShowClock.__module__])
+
+    def test_run(self):
+        out = io.StringIO()
+        counts = batch.run(self.write_manifest(), out, processes=2,
+                           chunksize=1)
+        results = {(result['device'], result['command']): result for result
+                   in map(json.loads, out.getvalue().splitlines())}
+
+        self.assertEqual(len(results), 4)
+        self.assertEqual(
+            {key: result['status'] for key, result in results.items()},
+            {('R1', 'show clock'): 'ok',
+             ('R2', 'show clock'): 'empty',
+             ('R3', 'show clock'): 'error',
+             ('R1', 'show nothing'): 'unresolved'})
+
+        result = results[('R1', 'show clock')]
+        self.assertEqual(result['parsed']['year'], '2019')
+        self.assertEqual(result['parser'], '{}.ShowClock'.format(
+            ShowClock.__module__))
+        self.assertIn('FileNotFoundError',
+                      results[('R3', 'show clock')]['error'])
+
+        self.assertEqual(counts['ok'], 1)
+        self.assertEqual(counts['unresolved'], 1)
+
+    def test_offline_device(self):
+        with self.assertRaises(RuntimeError):
+            batch.OfflineDevice('iosxe', name='R1').execute('show clock')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,149 @@
+import unittest
+
+from genie.metaparser.util.schemaengine import Any, Optional
+
+from genie.libs.parser.asa.show_vpn_sessiondb import ShowVpnSessiondbAnyconnect
+from genie.libs.parser.iosxe.show_arp import ShowArp
+from genie.libs.parser.utils.columnar import ColumnarTable
+from genie.libs.parser.utils.records import merge_records
+
+
+SCHEMA = {
+    'vlans': {
+        Any(): {
+            'vlan': int,
+            'macs': {
+                Any(): {
+                    'mac': str,
+                    Optional('ports'): list,
+                    Optional('age'): int,
+                },
+            },
+        },
+    },
+    Optional('total'): int,
+}
+
+PARSED = {
+    'vlans': {
+        '10': {'vlan': 10,
+               'macs': {'aaaa.bbbb.0001': {'mac': 'aaaa.bbbb.0001',
+                                           'ports': ['Gi1/0/1', 'Gi1/0/2'],
+                                           'age': 10},
+                        'aaaa.bbbb.0002': {'mac': 'aaaa.bbbb.0002'}}},
+        '20': {'vlan': 20,
+               'macs': {'aaaa.bbbb.0001': {'mac': 'aaaa.bbbb.0001',
+                                           'age': 1}}},
+    },
+    'total': 3,
+}
+
+ARP_OUTPUT = '''\
+Protocol  Address          Age (min)  Hardware Addr   Type   Interface
+Internet  192.168.234.1           -   58bf.eaff.e508  ARPA   Vlan100
+Internet  192.168.234.2          29   3820.56ff.6fc3  ARPA   Vlan100
+Internet  192.168.70.1            -   58bf.eaff.e519  ARPA   Vlan200
+'''
+
+VPN_OUTPUT = '''\
+Session Type: AnyConnect
+
+Username : lee Index : 1
+Assigned IP : 192.168.246.1 Public IP : 10.139.1.2
+Protocol : AnyConnect-Parent SSL-Tunnel DTLS-Tunnel
+Encryption : RC4 AES128 Hashing : SHA1
+Bytes Tx : 11079 Bytes Rx : 4942
+Login Time : 15:25:13 EST Fri Jan 28 2011
+Duration : 0h:00m:15s
+Inactivity : 0h:00m:00s
+
+Username : yumi Index : 2
+Assigned IP : 192.168.246.2 Public IP : 10.139.1.3
+Protocol : AnyConnect-Parent SSL-Tunnel DTLS-Tunnel
+Encryption : RC4 AES128 Hashing : SHA1
+Bytes Tx : 11055 Bytes Rx : 6942
+Login Time : 15:25:13 EST Fri Jan 29 2011
+Duration : 0h:05m:15s
+Inactivity : 0h:00m:00s
+'''
+
+
+class TestColumnarTable(unittest.TestCase):
+
+    def test_from_dict(self):
+        table = ColumnarTable.from_dict(PARSED, SCHEMA)
+        self.assertEqual(table.to_dict(), PARSED)
+        self.assertEqual(table.paths(), [(), ('vlans', None),
+                                         ('vlans', None, 'macs', None)])
+        self.assertEqual(len(table), 6)
+
+        columns = table.columns('vlans', None, 'macs', None)
+        self.assertEqual(columns.keys, ('vlans', 'macs'))
+        self.assertEqual(columns.fields, ('mac', 'ports', 'age'))
+        self.assertEqual(columns.column('vlans'), ['10', '10', '20'])
+        self.assertEqual(columns.column('age'), [10, None, 1])
+        self.assertEqual(list(columns)[1],
+                         (('10', 'aaaa.bbbb.0002'),
+                          {'mac': 'aaaa.bbbb.0002'}))
+
+        # The keys and values met again are stored once
+        self.assertEqual(table.values.count('aaaa.bbbb.0001'), 1)
+
+    def test_values(self):
+        table = ColumnarTable()
+        codes = [table.encode(value) for value in
+                 (1, True, 1.0, '1', None, 1, ['a'], ['a'], [{}], [{}])]
+        self.assertEqual(codes, [0, 1, 2, 3, 4, 0, 5, 5, 6, 7])
+
+        # Mutable values are copies
+        self.assertEqual(table.decode(5), ['a'])
+        self.assertIsNot(table.decode(5), table.decode(5))
+        self.assertIs(table.decode(1), True)
+
+        # Appending after compact() rebuilds the index of the values
+        table.compact()
+        self.assertEqual(table.encode(True), 1)
+        self.assertEqual(table.encode('2'), 8)
+
+    def test_without_schema(self):
+        parsed = {'index': {1: {'protocol': 'tcp'}, 2: {'protocol': 'udp'}},
+                  'vrf': {'default': {}}}
+        table = ColumnarTable.from_dict(parsed)
+        self.assertEqual(table.paths(), [('index', None),
+                                         ('vrf', 'default')])
+        self.assertEqual(table.to_dict(), parsed)
+
+    def test_records(self):
+        table = ColumnarTable(SCHEMA)
+        for vlan in ('10', '10', '20'):
+            table.append({'vlans': {vlan: {'vlan': int(vlan)}}})
+        # The VLAN met again in a row is merged into its last appearance
+        self.assertEqual(len(table.columns('vlans', None)), 2)
+
+
+class TestParseColumnar(unittest.TestCase):
+
+    def test_arp(self):
+        parser = ShowArp(device=None)
+        table = parser.parse_columnar(ARP_OUTPUT)
+        self.assertEqual(table.to_dict(), parser.cli(output=ARP_OUTPUT))
+
+        columns = table.columns('interfaces', None, 'ipv4', 'neighbors',
+                                None)
+        self.assertEqual(columns.column('interfaces'),
+                         ['Vlan100', 'Vlan100', 'Vlan200'])
+        self.assertEqual(columns.column('age'), ['-', '29', '-'])
+
+    def test_vpn_sessiondb(self):
+        parser = ShowVpnSessiondbAnyconnect(device=None)
+        self.assertEqual(merge_records(parser.iter_records(VPN_OUTPUT)),
+                         parser.cli(output=VPN_OUTPUT))
+        table = parser.parse_columnar(VPN_OUTPUT)
+        self.assertEqual(table.to_dict(), parser.cli(output=VPN_OUTPUT))
+        self.assertEqual(
+            table.columns('session_type', None, 'username', None, 'index',
+                          None, 'bytes').column('tx'), [11079, 11055])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+import unittest
+
+from genie.libs.parser.utils.command_index import (
+    CommandIndex,
+    CommandToken,
+    get_template
+)
+
+
+class TestCommandIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.index = CommandIndex({
+            'show version': {'iosxe': {}, 'nxos': {}},
+            'show vrf': {'nxos': {}},
+            'show ip interface brief': {'iosxe': {}},
+            'show ip interface {interface}': {'iosxe': {}},
+            'show ip route vrf {vrf}': {'iosxe': {}},
+            'show bgp {address_family} summary': {'iosxe': {}},
+            '/dna/intent/api/v1/interface/{interface}': {'dnac': {}},
+        })
+
+    def test_exact(self):
+        self.assertEqual(self.index.search('show version'.split()),
+                         ['show version'])
+
+    def test_prefix(self):
+        self.assertEqual(self.index.search('sh v'.split()),
+                         ['show version', 'show vrf'])
+        self.assertEqual(self.index.search('sh ip int br'.split()),
+                         ['show ip interface brief',
+                          'show ip interface {interface}'])
+
+    def test_os_leaf_sets(self):
+        self.assertEqual(self.index.search('sh v'.split(), os='iosxe'),
+                         ['show version'])
+        self.assertEqual(self.index.search('sh v'.split(), os='junos'), [])
+
+    def test_argument_span(self):
+        self.assertEqual(
+            self.index.search('sh bgp vpnv4 unicast summary'.split()),
+            ['show bgp {address_family} summary'])
+        self.assertEqual(
+            self.index.search('sh bgp a b c summary'.split()), [])
+
+        # vrf argument can only span one token
+        self.assertEqual(self.index.search('sh ip ro vrf a'.split()),
+                         ['show ip route vrf {vrf}'])
+        self.assertEqual(self.index.search('sh ip ro vrf a b'.split()), [])
+
+    def test_embedded_argument(self):
+        self.assertEqual(
+            self.index.search(['/dna/intent/api/v1/interface/Gi1']),
+            ['/dna/intent/api/v1/interface/{interface}'])
+
+    def test_fuzzy_regex_not_indexed(self):
+        self.assertIsNone(self.index.search('show .*'.split(), fuzzy=True))
+        self.assertEqual(self.index.search('sh ver'.split(), fuzzy=True),
+                         ['show version'])
+
+    def test_add_refreshes_os(self):
+        self.index.add('show vrf', {'nxos': {}, 'iosxe': {}})
+        self.assertEqual(self.index.search('sh vrf'.split(), os='iosxe'),
+                         ['show vrf'])
+
+
+class TestCommandTemplate(unittest.TestCase):
+
+    def test_tokens(self):
+        template = get_template('show ip route vrf {vrf} {route}')
+        self.assertEqual(template.texts,
+                         ['show', 'ip', 'route', 'vrf', '{vrf}', '{route}'])
+        self.assertEqual([t.kind for t in template.tokens][3:],
+                         [CommandToken.LITERAL, CommandToken.ARGUMENT,
+                          CommandToken.ARGUMENT])
+        self.assertEqual([t.argument for t in template.tokens][4:],
+                         ['vrf', 'route'])
+        self.assertEqual([t.span for t in template.tokens][4:], [1, 2])
+        self.assertEqual(template.required_arguments, 2)
+        self.assertEqual(template.lengths[:3], [4, 6, 11])
+        self.assertEqual(template.arguments_from,
+                         [True, True, True, True, True, True, False])
+        self.assertEqual(template.wildcard, 'show ip route vrf --- ---')
+        self.assertIsNotNone(template.pattern.match('show ip route vrf a b'))
+
+    def test_embedded(self):
+        token = get_template(
+            '/dna/intent/api/v1/interface/{interface}').tokens[0]
+        self.assertEqual(token.kind, CommandToken.EMBEDDED)
+        self.assertEqual(token.start, '/dna/intent/api/v1/interface/')
+        self.assertEqual(token.end, '')
+        self.assertEqual(token.extract('/dna/intent/api/v1/interface/Gi1'),
+                         'Gi1')
+        self.assertIsNone(token.extract('/dna/intent/api/v1/Gi1'))
+
+    def test_cached(self):
+        self.assertIs(get_template('show version'),
+                      get_template('show version'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+import unittest
+from unittest.mock import patch
+
+from genie.libs.parser.utils import common
+from genie.libs.parser.utils.common import (
+    Common,
+    get_intf_name_cache_info,
+    invalidate_intf_name_cache
+)
+
+
+class TestConvertIntfName(unittest.TestCase):
+
+    def setUp(self):
+        invalidate_intf_name_cache()
+
+    def tearDown(self):
+        invalidate_intf_name_cache()
+
+    def test_convert(self):
+        names = {'Gi1/0/1': 'GigabitEthernet1/0/1',
+                 'Po10': 'Port-channel10',
+                 'Eth2/1.100': 'Ethernet2/1.100',
+                 'BE1': 'Bundle-Ether1',
+                 'Fe0/1': '0/1',
+                 'gigabitethernet 0/1': 'GigabitEthernet0/1',
+                 'vlan100': 'Vlan100',
+                 'Loopback': 'Loopback',
+                 '': ''}
+        for name, expected in names.items():
+            self.assertEqual(Common.convert_intf_name(name), expected, name)
+        self.assertEqual(Common.convert_intf_names(names),
+                         list(names.values()))
+
+    def test_cache(self):
+        Common.convert_intf_names(['Gi1/0/1', 'Gi1/0/2', 'Gi1/0/1'])
+        info = get_intf_name_cache_info()
+        self.assertEqual((info['hits'], info['misses'], info['size']),
+                         (1, 2, 2))
+
+        with patch.dict(common.INTF_NAME_PREFIXES, {'Gi': 'Gig'}):
+            invalidate_intf_name_cache()
+            self.assertEqual(Common.convert_intf_name('Gi1/0/1'), 'Gig1/0/1')
+        invalidate_intf_name_cache()
+        self.assertEqual(Common.convert_intf_name('Gi1/0/1'),
+                         'GigabitEthernet1/0/1')
+
+    def test_invalid(self):
+        with self.assertRaises(TypeError):
+            Common.convert_intf_name(None)
+
+
+if __name__ == '__main__':
+    unittest.main()
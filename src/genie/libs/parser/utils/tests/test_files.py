@@ -0,0 +1,43 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from genie.libs.parser.utils.files import write_atomic
+
+
+class TestWriteAtomic(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.path = os.path.join(self.folder, 'parsers.idx')
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def test_write(self):
+        write_atomic(self.path, b'\x80index')
+        with open(self.path, 'rb') as f:
+            self.assertEqual(f.read(), b'\x80index')
+
+        write_atomic(self.path, '{"version": 2}')
+        with open(self.path) as f:
+            self.assertEqual(f.read(), '{"version": 2}')
+        self.assertEqual(os.listdir(self.folder), ['parsers.idx'])
+
+    def test_failure(self):
+        write_atomic(self.path, b'index')
+        with mock.patch('genie.libs.parser.utils.files.os.replace',
+                        side_effect=OSError('Permission denied')):
+            with self.assertRaises(OSError):
+                write_atomic(self.path, b'other index')
+
+        # The file is left as it was, without the temporary file
+        with open(self.path, 'rb') as f:
+            self.assertEqual(f.read(), b'index')
+        self.assertEqual(os.listdir(self.folder), ['parsers.idx'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+import unittest
+from unittest.mock import Mock
+
+from genie.libs.parser.utils import common
+from genie.libs.parser.utils.common import (
+    get_parser,
+    get_parsers,
+    get_parser_cache_info
+)
+from genie.libs.parser.utils.entry_points import add_parser
+from genie.libs.parser.utils.tests.mock_registry import MockRegistryMixin
+
+
+class TestGetParserCache(MockRegistryMixin, unittest.TestCase):
+
+    parser_data = {
+        'show version': {
+            'iosxe': {'module_name': 'show_platform',
+                      'package': 'genie.libs.parser',
+                      'class': 'ShowVersion',
+                      'c3850': {'module_name': 'show_platform',
+                                'package': 'genie.libs.parser',
+                                'class': 'ShowVersion_c3850'}}},
+        'show ip route vrf {vrf}': {
+            'iosxe': {'module_name': 'show_routing',
+                      'package': 'genie.libs.parser',
+                      'class': 'ShowIpRoute'}},
+    }
+
+    @staticmethod
+    def find_parser_cls(device, data):
+        return data['class']
+
+    def device(self, os='iosxe', platform=None, name='R1'):
+        device = Mock(os=os, platform=platform, model=None, custom={})
+        device.name = name
+        return device
+
+    def test_hit_and_miss(self):
+        device = self.device()
+        self.assertEqual(get_parser('show version', device),
+                         ('ShowVersion', {}))
+        self.assertEqual(get_parser('show version', device),
+                         ('ShowVersion', {}))
+        self.assertEqual(get_parser('show  version', self.device()),
+                         ('ShowVersion', {}))
+
+        # Whitespace variants share the same entry
+        info = get_parser_cache_info()
+        self.assertEqual(info['misses'], 1)
+        self.assertEqual(info['hits'], 2)
+        self.assertEqual(common.Lookup.from_device.call_count, 1)
+
+    def test_platform_tokens(self):
+        self.assertEqual(get_parser('show version', self.device())[0],
+                         'ShowVersion')
+        self.assertEqual(get_parser('show version',
+                                    self.device(platform='c3850'))[0],
+                         'ShowVersion_c3850')
+        self.assertEqual(get_parser_cache_info()['misses'], 2)
+
+    def test_kwargs_not_shared(self):
+        device = self.device()
+        _, kwargs = get_parser('show ip route vrf blue', device)
+        self.assertEqual(kwargs, {'vrf': 'blue'})
+        kwargs['vrf'] = 'red'
+
+        self.assertEqual(get_parser('show ip route vrf blue', device),
+                         ('ShowIpRoute', {'vrf': 'blue'}))
+
+    def test_failure_not_cached(self):
+        with self.assertRaises(Exception):
+            get_parser('show clock', self.device())
+        self.assertEqual(get_parser_cache_info()['size'], 0)
+
+    def test_invalidation(self):
+        device = self.device()
+        get_parser('show version', device)
+        self.assertEqual(get_parser_cache_info()['size'], 1)
+
+        mock_parser = Mock()
+        mock_parser.MockParser = Mock(cli_command='show test_parser_cache')
+        mock_parser.MockParser.__name__ = 'iosxe.MockParser'
+        add_parser(parser=mock_parser.MockParser, os_name='iosxe')
+
+        self.assertEqual(get_parser_cache_info()['size'], 0)
+        self.assertEqual(get_parser('show test_parser_cache', device)[0],
+                         'iosxe.MockParser')
+
+    def test_get_parsers(self):
+        devices = [self.device(name='R1'),
+                   self.device(name='R2'),
+                   self.device(platform='c3850', name='R3'),
+                   self.device(os='nxos', name='R4')]
+        table = get_parsers(['show version', 'show ip route vrf blue'],
+                            devices)
+
+        self.assertEqual(table, {
+            ('show version', 'R1'): ('ShowVersion', {}),
+            ('show version', 'R2'): ('ShowVersion', {}),
+            ('show version', 'R3'): ('ShowVersion_c3850', {}),
+            ('show version', 'R4'): None,
+            ('show ip route vrf blue', 'R1'): ('ShowIpRoute', {'vrf': 'blue'}),
+            ('show ip route vrf blue', 'R2'): ('ShowIpRoute', {'vrf': 'blue'}),
+            ('show ip route vrf blue', 'R3'): ('ShowIpRoute', {'vrf': 'blue'}),
+            ('show ip route vrf blue', 'R4'): None,
+        })
+
+        # Resolved once per os/platform group
+        self.assertEqual(common.Lookup.from_device.call_count, 6)
+        self.assertIsNot(table[('show ip route vrf blue', 'R1')][1],
+                         table[('show ip route vrf blue', 'R2')][1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+import unittest
+
+from genie.libs.parser.iosxe.show_fdb import ShowMacAddressTable
+from genie.libs.parser.iosxe.show_ip_nat import ShowIpNatTranslations
+from genie.libs.parser.utils.common import (
+    intern_strings,
+    intern_value,
+    intern_values
+)
+from genie.libs.parser.utils.records import merge_records
+
+
+def copy(string):
+    '''A string equal to, but not the same object as, string'''
+    return ''.join(list(string))
+
+
+class TestInternStrings(unittest.TestCase):
+
+    def test_intern_value(self):
+        value = copy('GigabitEthernet1/0/1')
+        self.assertIs(intern_value(value),
+                      intern_value(copy('GigabitEthernet1/0/1')))
+        for value in (None, 1, 1.5, True, ['a']):
+            self.assertIs(intern_value(value), value)
+
+    def test_intern_values(self):
+        group = {'protocol': copy('tcp'), 'inside': copy('10.1.1.1'),
+                 'timeout': None}
+        self.assertIs(intern_values(group, ('protocol', 'timeout', 'mac')),
+                      group)
+        self.assertIs(group['protocol'], intern_value(copy('tcp')))
+        self.assertIsNot(group['inside'], intern_value(copy('10.1.1.1')))
+        self.assertIsNone(group['timeout'])
+        self.assertNotIn('mac', group)
+
+    def test_intern_strings(self):
+        data = {copy('vrf'): {1: {'next_hop': copy('10.0.0.1'),
+                                  'labels': [copy('16'), 17, None]},
+                              2: {'next_hop': copy('10.0.0.1')}}}
+        expected = {'vrf': {1: {'next_hop': '10.0.0.1',
+                                'labels': ['16', 17, None]},
+                            2: {'next_hop': '10.0.0.1'}}}
+        inner = data['vrf']
+        self.assertIs(intern_strings(data), data)
+        self.assertEqual(data, expected)
+        self.assertIs(data['vrf'], inner)
+        self.assertIs(inner[1]['next_hop'], inner[2]['next_hop'])
+        self.assertIs(inner[1]['labels'][0], intern_value(copy('16')))
+        self.assertIs(intern_strings(copy('abc')), intern_value('abc'))
+
+    def test_mac_address_table(self):
+        output = '\n'.join(
+            '10    aaaa.bbff.88{:02d}    DYNAMIC     Gi1/0/{}'.format(row, row)
+            for row in range(1, 3))
+        parsed = ShowMacAddressTable(device=None).cli(output=output)
+        macs = parsed['mac_table']['vlans']['10']['mac_addresses']
+        first, second = (macs['aaaa.bbff.8801']['interfaces'],
+                         macs['aaaa.bbff.8802']['interfaces'])
+        self.assertIs(first['GigabitEthernet1/0/1']['entry_type'],
+                      second['GigabitEthernet1/0/2']['entry_type'])
+
+    def test_nat_translations(self):
+        output = '\n'.join(
+            'tcp 172.16.94.{r}:1024 192.168.1.{r}:1024 10.1.1.1:23 '
+            '10.1.1.1:23'.format(r=row) for row in range(1, 4))
+        parser = ShowIpNatTranslations(device=None)
+        for parsed in (parser.cli(output=output),
+                       merge_records(parser.iter_records(output))):
+            index = parsed['vrf']['default']['index']
+            self.assertIs(index[1]['protocol'], index[2]['protocol'])
+            self.assertIs(index[1]['outside_local'], index[2]['outside_local'])
+
+
+if __name__ == '__main__':
+    unittest.main()
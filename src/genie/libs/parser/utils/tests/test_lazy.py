@@ -0,0 +1,64 @@
+import sys
+import unittest
+import importlib
+from unittest import mock
+
+from genie.libs.parser import lazy
+from genie.libs.parser.lazy import lazy_getattr
+
+
+class TestLazyGetattr(unittest.TestCase):
+
+    def setUp(self):
+        self.package = 'genie.libs.parser.utils.tests.dummy_parser.iosxe'
+        self.getattr = lazy_getattr(
+            self.package, importlib.import_module(self.package).__path__)
+        self.module = sys.modules.pop(self.package + '.show_clock', None)
+        # Class map of the parser index
+        self.classes = mock.patch.object(lazy, '_package_classes', {
+            self.package: {'ShowClock': 'show_clock',
+                           'ShowClockSchema': 'show_clock'}})
+        self.classes.start()
+
+    def tearDown(self):
+        self.classes.stop()
+        # Other tests hold the classes of the original module
+        if self.module is not None:
+            sys.modules[self.package + '.show_clock'] = self.module
+
+    def test_module(self):
+        module = self.getattr('show_clock')
+        self.assertEqual(module.__name__, self.package + '.show_clock')
+
+    def test_token_package(self):
+        module = self.getattr('c9300')
+        self.assertEqual(module.__name__, self.package + '.c9300')
+
+    def test_class_imports_module(self):
+        self.assertNotIn(self.package + '.show_clock', sys.modules)
+        cls = self.getattr('ShowClock')
+        self.assertEqual(cls.__module__, self.package + '.show_clock')
+        self.assertIn(self.package + '.show_clock', sys.modules)
+
+    def test_schema(self):
+        cls = self.getattr('ShowClockSchema')
+        self.assertEqual(cls.__module__, self.package + '.show_clock')
+
+    def test_missing(self):
+        with self.assertRaises(AttributeError):
+            self.getattr('ShowNothing')
+        with self.assertRaises(AttributeError):
+            self.getattr('__path__')
+
+
+class TestOsPackage(unittest.TestCase):
+
+    def test_os_package(self):
+        from genie.libs.parser import iosxe
+        self.assertIs(iosxe.__getattr__.__module__, lazy.__name__)
+        self.assertEqual(iosxe.ShowVersion.__module__,
+                         'genie.libs.parser.iosxe.show_platform')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,146 @@
+import os
+import json
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from genie.libs.parser.utils import parser_index
+from genie.libs.parser.utils.parser_index import (
+    PARSER_INDEX,
+    slim_parser_data,
+    make_parser_index,
+    load_parser_index,
+    load_parser_data,
+    load_parser_classes,
+    load_parser_details
+)
+
+PARSERS = {
+    'tokens': ['iosxe', 'c3850'],
+    'show version': {
+        'iosxe': {
+            'module_name': 'show_platform',
+            'package': 'genie.libs.parser',
+            'class': 'ShowVersion',
+            'doc': 'Parser for show version',
+            'schema': '{}',
+            'uid': 'show_version',
+            'url': 'https://example.com',
+            'c3850': {
+                'module_name': 'show_platform',
+                'package': 'genie.libs.parser',
+                'class': 'ShowVersion',
+                'doc': 'Parser for show version',
+            }
+        }
+    }
+}
+
+SLIM = {
+    'tokens': ['iosxe', 'c3850'],
+    'show version': {
+        'iosxe': {
+            'module_name': 'show_platform',
+            'package': 'genie.libs.parser',
+            'class': 'ShowVersion',
+            'c3850': {
+                'module_name': 'show_platform',
+                'package': 'genie.libs.parser',
+                'class': 'ShowVersion',
+            }
+        }
+    }
+}
+
+
+class TestParserIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.json_path = os.path.join(self.folder, 'parsers.json')
+        self.index_path = os.path.join(self.folder, PARSER_INDEX)
+        with open(self.json_path, 'w') as f:
+            json.dump(PARSERS, f)
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def test_slim(self):
+        self.assertEqual(slim_parser_data(PARSERS), SLIM)
+
+    def test_index_roundtrip(self):
+        self.assertIsNone(load_parser_index(self.json_path))
+        make_parser_index(self.json_path)
+        self.assertTrue(os.path.isfile(self.index_path))
+        self.assertEqual(load_parser_index(self.json_path), SLIM)
+
+    def test_stale_index(self):
+        make_parser_index(self.json_path)
+        with open(self.json_path, 'w') as f:
+            json.dump({'tokens': []}, f)
+        self.assertIsNone(load_parser_index(self.json_path))
+
+        # Stale index is not used, nor rebuilt
+        self.assertEqual(load_parser_data(self.json_path), {'tokens': []})
+        self.assertIsNone(load_parser_index(self.json_path))
+
+    def test_missing_index(self):
+        self.assertEqual(load_parser_data(self.json_path), SLIM)
+        self.assertEqual(os.listdir(self.folder), ['parsers.json'])
+
+    def test_touched_source(self):
+        make_parser_index(self.json_path)
+        stat = os.stat(self.json_path)
+        os.utime(self.json_path, ns=(stat.st_atime_ns,
+                                     stat.st_mtime_ns + 10 ** 9))
+
+        # Same content, the index is used as is
+        index = os.stat(self.index_path)
+        with mock.patch('genie.libs.parser.utils.parser_index.'
+                        '_source_checksum',
+                        wraps=parser_index._source_checksum) as checksum:
+            self.assertEqual(load_parser_index(self.json_path), SLIM)
+        self.assertEqual(checksum.call_count, 1)
+        self.assertEqual(os.stat(self.index_path).st_mtime_ns,
+                         index.st_mtime_ns)
+
+    def test_failed_write(self):
+        with mock.patch('genie.libs.parser.utils.files.os.replace',
+                        side_effect=OSError('Permission denied')):
+            with self.assertRaises(OSError):
+                make_parser_index(self.json_path)
+        self.assertEqual(os.listdir(self.folder), ['parsers.json'])
+
+    def test_corrupted_index(self):
+        with open(self.index_path, 'w') as f:
+            f.write('not an index')
+        self.assertIsNone(load_parser_index(self.json_path))
+        self.assertEqual(load_parser_data(self.json_path), SLIM)
+
+    def test_classes(self):
+        package = os.path.join(self.folder, 'iosxe')
+        os.makedirs(os.path.join(package, 'tests'))
+        for path in (package, os.path.join(package, 'tests')):
+            with open(os.path.join(path, '__init__.py'), 'w') as f:
+                f.write('')
+        with open(os.path.join(package, 'show_platform.py'), 'w') as f:
+            f.write('class ShowVersionSchema(MetaParser):\n'
+                    '    pass\n\n'
+                    'class ShowVersion(ShowVersionSchema):\n'
+                    '    pass\n')
+        with open(os.path.join(package, 'tests', 'test_show.py'), 'w') as f:
+            f.write('class TestShowVersion(object):\n    pass\n')
+
+        self.assertEqual(load_parser_classes(self.json_path), {})
+        make_parser_index(self.json_path)
+        self.assertEqual(load_parser_classes(self.json_path), {
+            'genie.libs.parser.iosxe': {'ShowVersionSchema': 'show_platform',
+                                        'ShowVersion': 'show_platform'}})
+
+    def test_details(self):
+        self.assertEqual(load_parser_details(self.json_path), PARSERS)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,154 @@
+import re
+import unittest
+
+from genie.metaparser import MetaParser
+
+from genie.libs.parser.iosxe.show_arp import ShowArp
+from genie.libs.parser.utils.pattern_profile import PatternProfile, \
+                                                   profile_patterns
+from genie.libs.parser.utils.patterns import PatternTable
+
+
+OUTPUT = '''\
+Clock is synchronized
+Time source is NTP
+
+Stratum 2
+'''
+
+ARP_OUTPUT = '''\
+Protocol  Address          Age (min)  Hardware Addr   Type   Interface
+Internet  192.168.234.1           -   58bf.eaff.e508  ARPA   Vlan100
+Internet  192.168.234.2          29   3820.56ff.6fc3  ARPA   Vlan100
+'''
+
+
+class ShowClockStatus(MetaParser):
+
+    def cli(self, output=None):
+        result = {}
+        # Clock is synchronized
+        p1 = re.compile(r'^Clock +is +(?P<state>\w+)$')
+        # Time source is NTP
+        p2 = re.compile(
+            r'^Time +source +is +(?P<source>\w+)$')
+        # Peer is 10.1.1.1
+        p3 = re.compile(r'^Peer +is +(?P<peer>\S+)$')
+        for line in output.splitlines():
+            line = line.strip()
+            for p in (p1, p2, p3):
+                m = p.match(line)
+                if m:
+                    result.update(m.groupdict())
+                    break
+        return result
+
+
+class ShowClockStatusTable(MetaParser):
+
+    patterns = PatternTable(
+        p1=r'^Clock +is +(?P<state>\w+)$',
+        p2=r'^Time +source +is +(?P<source>\w+)$',
+        p3=r'^Peer +is +(?P<peer>\S+)$',
+    )
+    dispatcher = patterns.dispatcher()
+
+    def cli(self, output=None):
+        result = {}
+        for line in output.splitlines():
+            name, m = self.dispatcher.match(line.strip())
+            if m:
+                result.update(m.groupdict())
+        return result
+
+
+class ShowClockStatusScanner(MetaParser):
+
+    scanner = ShowClockStatusTable.patterns.scanner()
+
+    def cli(self, output=None):
+        return {name: group for name, group in self.scanner.scan(output)}
+
+
+class TestPatternProfile(unittest.TestCase):
+
+    def test_compiled_in_cli(self):
+        compile = re.compile
+        profile = profile_patterns(ShowClockStatus(device=None),
+                                   output=OUTPUT)
+        stats = {stats.name: stats for stats in profile.patterns()}
+        self.assertEqual(sorted(stats), ['p1', 'p2', 'p3'])
+        self.assertEqual((stats['p1'].attempts, stats['p1'].hits), (4, 1))
+        self.assertEqual((stats['p2'].attempts, stats['p2'].hits), (3, 1))
+        self.assertEqual((stats['p3'].attempts, stats['p3'].hits), (2, 0))
+        self.assertEqual(stats['p2'].pattern,
+                         r'^Time +source +is +(?P<source>\w+)$')
+        self.assertTrue(stats['p1'].location.startswith(
+            'test_pattern_profile.py:'))
+        self.assertEqual(profile.never_matched(), ['p3'])
+        self.assertEqual(profile.unmatched(), ['Stratum 2'])
+
+        self.assertIs(re.compile, compile)
+
+    def test_accumulates(self):
+        profile = PatternProfile()
+        parser = ShowClockStatus(device=None)
+        for _ in range(2):
+            with profile.trace(parser):
+                self.assertEqual(parser.cli(output=OUTPUT),
+                                 {'state': 'synchronized', 'source': 'NTP'})
+        self.assertEqual(len(profile.stats), 3)
+        self.assertEqual(sum(stats['attempts'] for stats in
+                             profile.to_dict()['patterns']), 18)
+
+    def test_dispatcher(self):
+        parser = ShowClockStatusTable(device=None)
+        profile = profile_patterns(parser, output=OUTPUT)
+        stats = {stats.name: stats for stats in profile.patterns()}
+        # Only the candidates of each line are tried
+        self.assertEqual((stats['p1'].attempts, stats['p1'].hits), (1, 1))
+        self.assertEqual((stats['p2'].attempts, stats['p2'].hits), (1, 1))
+        self.assertEqual(stats['p3'].attempts, 0)
+        self.assertEqual(stats['p1'].location, 'patterns')
+        self.assertEqual(profile.never_matched(), ['p3'])
+        self.assertEqual(profile.unmatched(), ['Stratum 2'])
+
+        # The class attributes are left untouched
+        self.assertNotIn('dispatcher', vars(parser))
+        self.assertIs(type(ShowClockStatusTable.patterns.p1),
+                      type(re.compile('')))
+
+    def test_scanner(self):
+        profile = profile_patterns(ShowClockStatusScanner(device=None),
+                                   output=OUTPUT)
+        stats = {stats['name']: stats
+                 for stats in profile.to_dict()['patterns']}
+        # The time is that of the scanner, the hits those of each pattern
+        self.assertEqual((stats['scanner(p1, p2, p3)']['attempts'],
+                          stats['scanner(p1, p2, p3)']['hits']), (4, 2))
+        self.assertEqual([(stats[name]['attempts'], stats[name]['hits'])
+                          for name in ('p1', 'p2', 'p3')],
+                         [(4, 1), (4, 1), (4, 0)])
+        self.assertEqual(profile.never_matched(), ['p3'])
+        self.assertEqual(profile.unmatched(), ['Stratum 2'])
+
+    def test_single_pattern_scanner(self):
+        profile = profile_patterns(ShowArp(device=None), output=ARP_OUTPUT)
+        p1 = profile.to_dict()['patterns'][0]
+        self.assertEqual((p1['name'], p1['attempts'], p1['hits']),
+                         ('p1', 3, 2))
+        self.assertEqual(profile.unmatched(), [ARP_OUTPUT.splitlines()[0]])
+
+    def test_report(self):
+        profile = profile_patterns(ShowClockStatus(device=None),
+                                   output=OUTPUT)
+        report = profile.report().splitlines()
+        self.assertTrue(report[0].startswith('pattern'))
+        self.assertEqual(len([line for line in report
+                              if line.startswith('p')]), 4)
+        self.assertIn('Never matched: p3', report)
+        self.assertEqual(report[-1], '  Stratum 2')
+
+
+if __name__ == '__main__':
+    unittest.main()
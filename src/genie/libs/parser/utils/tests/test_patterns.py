@@ -0,0 +1,153 @@
+import re
+import unittest
+
+from genie.libs.parser.utils.patterns import PatternTable, LineDispatcher, \
+                                            LineScanner
+
+
+class TestPatternTable(unittest.TestCase):
+
+    def setUp(self):
+        self.table = PatternTable(
+            p1=r'^Description: *(?P<description>.*)$',
+            p2=(r'^mtu +(?P<mtu>\d+)$', re.IGNORECASE),
+        )
+
+    def test_compiled(self):
+        self.assertEqual(
+            self.table.p1.match('Description: uplink').group('description'),
+            'uplink')
+        self.assertEqual(self.table.p2.match('MTU 1500').group('mtu'), '1500')
+        self.assertEqual(list(self.table), ['p1', 'p2'])
+        self.assertIn('p2', self.table)
+        self.assertEqual(self.table.sources()[1],
+                         ('p2', r'^mtu +(?P<mtu>\d+)$', re.IGNORECASE))
+
+    def test_extend(self):
+        table = self.table.extend(p2=r'^MTU (?P<mtu>\d+)$', p3=r'^BW$')
+        self.assertEqual(list(table), ['p1', 'p2', 'p3'])
+        self.assertIs(table.p1, self.table.p1)
+        self.assertIsNone(table.p2.match('mtu 1500'))
+
+        # The parent table is left untouched
+        self.assertEqual(len(self.table), 2)
+
+    def test_invalid_name(self):
+        with self.assertRaises(ValueError):
+            PatternTable(items=r'^a$')
+
+    def test_class_attribute(self):
+        from genie.libs.parser.iosxe.show_interface import ShowInterfaces
+        self.assertIsInstance(ShowInterfaces.patterns, PatternTable)
+        self.assertIn('p1', ShowInterfaces.patterns)
+
+
+class TestLineDispatcher(unittest.TestCase):
+
+    def setUp(self):
+        self.table = PatternTable(
+            p1=r'^(?P<interface>\S+) +is +(?P<status>up|down)$',
+            p2=r'^\s*Description: +(?P<description>.*)$',
+            p3=r'^\*?(?P<vlan>\d+) +(?P<mac>\S+)$',
+            p4=r'^Hardware is (?P<type>.+)$',
+            p5=r'^(?:MTU|mtu) +(?P<mtu>\d+)',
+            p6=(r'^hardware is (?P<type>\S+)$', re.IGNORECASE),
+            p7=r'^$',
+        )
+        self.dispatcher = self.table.dispatcher()
+
+    def sequential(self, line):
+        return [(name, pattern.match(line).group(0))
+                for name, pattern in self.table.items()
+                if pattern.match(line)]
+
+    def test_same_matches(self):
+        lines = ['Gi1 is up', 'Hardware is CSR', 'hardware is csr',
+                 '  Description: to core', 'Description: x', '*10 aabb.cc',
+                 '10 aabb.cc', 'MTU 1500 bytes', 'mtu 9000', '', ' ',
+                 '\u00e9 is up', 'Hardware', '* 10 aabb']
+        for line in lines:
+            self.assertEqual(
+                [(name, m.group(0))
+                 for name, m in self.dispatcher.matches(line)],
+                self.sequential(line), line)
+
+    def test_candidates(self):
+        names = [name for name, _, _ in self.dispatcher.candidates('MTU 1')]
+        # p6 ignores case and p7 can match an empty line
+        self.assertEqual(names, ['p1', 'p5', 'p6', 'p7'])
+        names = [name for name, _, _ in self.dispatcher.candidates(' 5 ab')]
+        self.assertEqual(names, ['p2', 'p6', 'p7'])
+
+    def test_match(self):
+        self.assertEqual(self.dispatcher.match('Hardware is CSR')[0], 'p4')
+        self.assertEqual(self.dispatcher.match('no match here'), (None, None))
+
+    def test_order(self):
+        dispatcher = self.table.dispatcher('p4', 'p1')
+        self.assertEqual([name for name, _ in
+                          dispatcher.matches('Hardware is up')], ['p4', 'p1'])
+        self.assertIsInstance(dispatcher, LineDispatcher)
+
+    def test_parser_dispatcher(self):
+        from genie.libs.parser.nxos.show_interface import ShowInterface
+        self.assertEqual(ShowInterface.dispatcher.match(
+            'Ethernet2/1 is up')[0], 'p1')
+
+
+class TestLineScanner(unittest.TestCase):
+
+    def setUp(self):
+        self.table = PatternTable(
+            p1=r'^(?P<vlan>\d+) +(?P<mac>\S+) +(?P<type>\w+)$',
+            p2=r'^(?P<vlan>\d+) +(?P<mac>\S+)( +(?P<ports>\S+))?$',
+            p3=(r'^total +(?P<total>\d+)$', re.IGNORECASE),
+            p4=(r'''^(?P<vlan>all) # any vlan
+                   \ +(?P<mac>\S+)''', re.VERBOSE),
+        )
+        self.scanner = self.table.scanner()
+
+    def test_same_matches(self):
+        lines = ['10 aabb.cc00 dynamic', '10 aabb.cc00', '10 aabb.cc00 Gi1 x',
+                 'Total 3', 'TOTAL 4', 'all aabb.cc00', '', 'vlan mac']
+        for line in lines:
+            expected = (None, None)
+            for name, pattern in self.table.items():
+                m = pattern.match(line)
+                if m:
+                    expected = (name, m.groupdict())
+                    break
+            self.assertEqual(self.scanner.match(line), expected, line)
+
+    def test_scan(self):
+        output = '''
+            Vlan  Mac
+            10    aabb.cc00   dynamic
+            20    aabb.cc01
+            Total 2
+        '''
+        self.assertEqual(list(self.scanner.scan(output)), [
+            ('p1', {'vlan': '10', 'mac': 'aabb.cc00', 'type': 'dynamic'}),
+            ('p2', {'vlan': '20', 'mac': 'aabb.cc01', 'ports': None}),
+            ('p3', {'total': '2'})])
+
+    def test_single_pattern(self):
+        scanner = self.table.scanner('p3')
+        self.assertEqual(list(scanner.scan('total 1\nnone\n  total 2')),
+                         [('p3', {'total': '1'}), ('p3', {'total': '2'})])
+
+    def test_backreference(self):
+        table = PatternTable(p1=r'^(?P<a>\w)(?P=a)$', p2=r'^b$')
+        with self.assertRaises(ValueError):
+            table.scanner()
+        self.assertIsInstance(table.scanner('p2'), LineScanner)
+
+    def test_parser_scanner(self):
+        from genie.libs.parser.iosxe.show_arp import ShowArp
+        name, group = ShowArp.scanner.match(
+            'Internet  10.1.1.1  -  aabb.ccff.0001  ARPA  Vlan100')
+        self.assertEqual((name, group['interface']), ('p1', 'Vlan100'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,142 @@
+import asyncio
+import unittest
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from genie.libs.parser.batch import OfflineDevice
+from genie.libs.parser.pipeline import Pipeline, OutputTransport
+from genie.libs.parser.utils.tests.dummy_parser.iosxe.show_clock import \
+    ShowClock
+from genie.libs.parser.utils.tests.mock_registry import MockRegistryMixin
+
+OUTPUT = '*05:26:38.035 EST Wed JAN 4 2019\n'
+
+
+class CountingTransport(OutputTransport):
+    '''Records the commands in flight, per device and over all devices'''
+
+    in_flight = {}
+
+    def __init__(self, name, outputs, delay):
+        super().__init__(outputs, delay)
+        self.name = name
+
+    async def execute(self, command):
+        counts = self.in_flight
+        counts[self.name] = counts.get(self.name, 0) + 1
+        counts['total'] = counts.get('total', 0) + 1
+        counts['max'] = max(counts.get('max', 0), counts[self.name])
+        counts['max_total'] = max(counts.get('max_total', 0),
+                                  counts['total'])
+        try:
+            return await super().execute(command)
+        finally:
+            counts[self.name] -= 1
+            counts['total'] -= 1
+
+
+class TestPipeline(MockRegistryMixin, unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        CountingTransport.in_flight = {}
+
+    def run_pipeline(self, coroutine):
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(coroutine)
+        finally:
+            loop.close()
+
+    def test_parse(self):
+        device = OfflineDevice('iosxe', name='R1')
+
+        async def main():
+            async with Pipeline(workers=1) as pipeline:
+                return await pipeline.parse(
+                    device, 'show clock',
+                    OutputTransport({'show clock': OUTPUT}).execute)
+
+        self.assertEqual(self.run_pipeline(main()),
+                         ShowClock(device=device).parse(output=OUTPUT))
+
+    def test_blocking_execute(self):
+        device = OfflineDevice('iosxe', name='R1')
+        threads = []
+
+        def execute(command):
+            threads.append(threading.current_thread())
+            return OUTPUT
+
+        device.execute = execute
+
+        async def main():
+            async with Pipeline(ThreadPoolExecutor(1)) as pipeline:
+                return await pipeline.parse(device, 'show clock')
+
+        self.assertEqual(self.run_pipeline(main())['year'], '2019')
+        # Out of the event loop
+        self.assertIsNot(threads[0], threading.current_thread())
+
+    def test_run(self):
+        devices = [OfflineDevice('iosxe', name='R{}'.format(i))
+                   for i in range(4)]
+        transports = {device.name: OutputTransport(
+            {'show clock': OUTPUT} if device.name != 'R2' else {}, 0.01)
+            for device in devices}
+        done = []
+
+        async def main():
+            async with Pipeline(ThreadPoolExecutor(2)) as pipeline:
+                return await pipeline.run(
+                    ((device, 'show clock', transports[device.name].execute)
+                     for device in devices), callback=done.append)
+
+        results = self.run_pipeline(main())
+        self.assertEqual([result.device for result in results], devices)
+        self.assertEqual(len(done), 4)
+        self.assertEqual(results[0].parsed['year'], '2019')
+        self.assertIsNone(results[0].error)
+        self.assertIsInstance(results[2].error, KeyError)
+        self.assertIsNone(results[2].parsed)
+
+    def test_limits(self):
+        devices = [OfflineDevice('iosxe', name='R{}'.format(i))
+                   for i in range(5)]
+        transports = {device.name: CountingTransport(
+            device.name, {'show clock': OUTPUT}, 0.01) for device in devices}
+
+        async def main():
+            async with Pipeline(ThreadPoolExecutor(2), per_device=2,
+                                pending=6) as pipeline:
+                return await pipeline.run(
+                    (device, 'show clock', transports[device.name].execute)
+                    for device in devices for _ in range(4))
+
+        results = self.run_pipeline(main())
+        self.assertTrue(all(result.parsed for result in results))
+        self.assertEqual(CountingTransport.in_flight['max'], 2)
+        self.assertLessEqual(CountingTransport.in_flight['max_total'], 6)
+
+    def test_busy_device(self):
+        busy, idle = (OfflineDevice('iosxe', name=name)
+                      for name in ('R1', 'R2'))
+        transport = OutputTransport({'show clock': OUTPUT}, 0.01)
+        done = []
+
+        async def main():
+            async with Pipeline(ThreadPoolExecutor(1), per_device=1,
+                                pending=4) as pipeline:
+                return await pipeline.run(
+                    [(busy, 'show clock', transport.execute)] * 10 +
+                    [(idle, 'show clock', transport.execute)],
+                    callback=done.append)
+
+        self.run_pipeline(main())
+        # The commands waiting on R1 do not hold the budget of R2
+        self.assertLessEqual([result.device for result in done].index(idle),
+                             1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,256 @@
+import os
+import glob
+import json
+import unittest
+from unittest.mock import Mock
+from concurrent.futures import ProcessPoolExecutor
+
+from genie.libs.parser.utils.records import iter_lines, RecordIterator, \
+                                           RecordSplitter, merge_records
+
+# Folder of the os packages, holding the golden tests of their parsers
+PARSERS = os.path.dirname(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__))))
+
+
+def golden_outputs(os_name, class_name):
+    '''Return the outputs and arguments of the golden tests of a parser'''
+    goldens = []
+    for path in sorted(glob.glob(os.path.join(
+            PARSERS, os_name, 'tests', class_name, 'cli', 'equal',
+            '*_output.txt'))):
+        with open(path) as f:
+            output = f.read()
+        arguments = path[:-len('_output.txt')] + '_arguments.json'
+        if os.path.isfile(arguments):
+            with open(arguments) as f:
+                goldens.append((output, json.load(f)))
+        else:
+            goldens.append((output, {}))
+    return goldens
+
+
+class TestIterLines(unittest.TestCase):
+
+    def test_string(self):
+        self.assertEqual(list(iter_lines('a\nb\r\nc')), ['a', 'b', 'c'])
+
+    def test_chunks(self):
+        chunks = ['Inter', 'net 10.1.1.1\n', 'Internet 10.1.1.2\nInt', 'ernet']
+        self.assertEqual(list(iter_lines(chunks)),
+                         ['Internet 10.1.1.1', 'Internet 10.1.1.2', 'Internet'])
+
+    def test_bytes(self):
+        # a multi-byte character split across chunks
+        data = 'Gi0/1 café\nGi0/2\n'.encode()
+        chunks = [data[i:i + 3] for i in range(0, len(data), 3)]
+        self.assertEqual(list(iter_lines(chunks)),
+                         ['Gi0/1 café', 'Gi0/2'])
+
+
+class TestRecordSplitter(unittest.TestCase):
+
+    def test_split(self):
+        splitter = RecordSplitter(start=r'^entry', context=(r'^vrf', r'^af'))
+        lines = ['header',
+                 'vrf red', 'af ipv4', 'entry 1', 'detail 1', 'entry 2',
+                 'af ipv6', 'entry 3',
+                 'vrf blue', 'entry 4',
+                 'vrf green']
+        self.assertEqual(list(splitter.split(lines)), [
+            ['header'],
+            ['vrf red', 'af ipv4', 'entry 1', 'detail 1'],
+            ['vrf red', 'af ipv4', 'entry 2'],
+            ['vrf red', 'af ipv6', 'entry 3'],
+            ['vrf blue', 'entry 4'],
+            ['vrf green']])
+
+    def test_lead(self):
+        splitter = RecordSplitter(start=r'^LS age', lead=(r'^Routing Bit',))
+        lines = ['LS age: 1', 'Routing Bit Set', 'LS age: 2', 'LS age: 3']
+        self.assertEqual(list(splitter.split(lines)), [
+            ['LS age: 1'], ['Routing Bit Set', 'LS age: 2'], ['LS age: 3']])
+
+    def test_size(self):
+        splitter = RecordSplitter(start=r'^entry', context=(r'^vrf',))
+        lines = ['vrf red', 'entry 1', 'entry 2', 'vrf blue', 'entry 3',
+                 'entry 4', '', '']
+        self.assertEqual(list(splitter.split(lines, size=2)), [
+            ['vrf red', 'entry 1', 'entry 2'],
+            ['vrf blue', 'entry 3', 'entry 4', '', '']])
+        self.assertEqual(list(splitter.split(lines, size=3)), [
+            ['vrf red', 'entry 1', 'entry 2', 'vrf blue', 'entry 3'],
+            ['vrf blue', 'entry 4', '', '']])
+
+    def test_blank_chunks(self):
+        splitter = RecordSplitter(start=r'^entry')
+        self.assertEqual(list(splitter.split(['', ' ', 'entry 1'])),
+                         [['entry 1']])
+
+    def test_several_starts(self):
+        splitter = RecordSplitter(start=(r'^\d+ ', r'^\* '))
+        self.assertEqual(list(splitter.split(['10 a', '* b', '  c'])),
+                         [['10 a'], ['* b', '  c']])
+
+
+class TestMergeRecords(unittest.TestCase):
+
+    def test_merge(self):
+        records = [{'vrf': {'red': {'index': {1: {'a': 1}}}}},
+                   {'vrf': {'red': {'index': {2: {'a': 2}}}}},
+                   {'vrf': {'total': 2}}]
+        self.assertEqual(merge_records(records), {
+            'vrf': {'red': {'index': {1: {'a': 1}, 2: {'a': 2}}},
+                    'total': 2}})
+
+
+class TestIterRecords(unittest.TestCase):
+
+    def test_show_arp(self):
+        from genie.libs.parser.iosxe.show_arp import ShowArp
+        output = '''
+            Protocol  Address          Age (min)  Hardware Addr   Type   Interface
+            Internet  10.1.1.1                -   aabb.ccff.0001  ARPA   Vlan100
+            Internet  10.1.1.2               10   aabb.ccff.0002  ARPA   Vlan100
+            Internet  10.2.1.1                -   aabb.ccff.0003  ARPA   Vlan200
+        '''
+        parser = ShowArp(device=Mock())
+        records = list(parser.iter_records(output))
+        self.assertEqual(len(records), 3)
+        self.assertEqual(merge_records(records), parser.cli(output=output))
+
+    def test_show_ip_route(self):
+        from genie.libs.parser.iosxe.show_routing import ShowIpRoute
+        output = '''
+            Routing Table: VRF1
+            Codes: L - local, C - connected, S - static, R - RIP, M - mobile, B - BGP
+
+            Gateway of last resort is not set
+
+                  10.0.0.0/24 is subnetted, 2 subnets
+            O        10.0.0.0 [110/1] via 10.81.1.2, 01:02:20, GigabitEthernet0/0/2.100
+            O        10.0.1.0 [110/1] via 10.81.1.2, 01:02:20, GigabitEthernet0/0/2.100
+                  10.81.0.0/8 is variably subnetted, 2 subnets, 2 masks
+            C        10.81.1.0/24 is directly connected, GigabitEthernet0/0/2.100
+            L        10.81.1.1/32 is directly connected, GigabitEthernet0/0/2.100
+            B     192.168.4.0/24 [200/0] via 192.168.51.1, 01:01:10
+                                 [200/0] via 192.168.51.2, 01:01:10
+        '''
+        parser = ShowIpRoute(device=Mock())
+        records = list(parser.iter_records(output, vrf='VRF1'))
+        self.assertEqual(len(records), 5)
+        self.assertEqual(merge_records(records),
+                         parser.cli(output=output, vrf='VRF1'))
+
+    def test_show_ip_nat_translations(self):
+        from genie.libs.parser.iosxe.show_ip_nat import ShowIpNatTranslations
+        output = '''
+            Pro Inside global      Inside local       Outside local      Outside global
+            --- 192.168.1.1       10.1.1.1           ---                ---
+            --- 192.168.1.2       10.1.1.2           ---                ---
+            --- 192.168.1.3       10.1.1.3           ---                ---
+            Total number of translations: 3
+        '''
+        parser = ShowIpNatTranslations(device=Mock())
+        records = list(parser.iter_records(output.splitlines(True)))
+        self.assertEqual(len(records), 4)
+        self.assertEqual(merge_records(records), parser.cli(output=output))
+
+    def test_no_records(self):
+        with self.assertRaises(NotImplementedError):
+            list(RecordIterator().iter_records('Internet 10.1.1.1'))
+
+
+class TestParseParallel(unittest.TestCase):
+
+    def test_show_arp(self):
+        from genie.libs.parser.iosxe.show_arp import ShowArp
+        output = '\n'.join(
+            'Internet  10.1.{}.{}  -  aabb.ccff.{:04x}  ARPA  Vlan{}'.format(
+                i // 250, i % 250, i, 100 + i % 3) for i in range(1000))
+        parser = ShowArp(device=Mock())
+        self.assertEqual(
+            parser.parse_parallel(output, processes=2, chunk_size=100),
+            parser.cli(output=output))
+
+    def test_no_records(self):
+        from genie.libs.parser.iosxe.show_ip_nat import ShowIpNatTranslations
+        with self.assertRaises(NotImplementedError):
+            ShowIpNatTranslations(device=Mock()).parse_parallel('')
+
+
+class TestGoldenRecords(unittest.TestCase):
+    '''The records of the golden outputs merge into what cli() returns'''
+
+    @classmethod
+    def setUpClass(cls):
+        cls.executor = ProcessPoolExecutor(2)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.executor.shutdown()
+
+    def assertRecords(self, os_name, parser_cls, goldens=None,
+                      chunk_sizes=(1, 3)):
+        if goldens is None:
+            goldens = golden_outputs(os_name, parser_cls.__name__)
+        self.assertTrue(goldens, parser_cls.__name__)
+        for index, (output, arguments) in enumerate(goldens):
+            with self.subTest(parser=parser_cls.__name__, golden=index):
+                parser = parser_cls(device=Mock())
+                expected = parser.cli(output=output, **arguments)
+                self.assertEqual(merge_records(parser.iter_records(
+                    output, **arguments)), expected)
+                self.assertEqual(parser.parse_columnar(
+                    output, **arguments).to_dict(), expected)
+                if parser_cls.records is None:
+                    continue
+                for chunk_size in chunk_sizes:
+                    self.assertEqual(parser.parse_parallel(
+                        output, chunk_size=chunk_size,
+                        executor=self.executor, **arguments), expected)
+
+    def test_iosxe(self):
+        from genie.libs.parser.iosxe.show_arp import ShowArp
+        from genie.libs.parser.iosxe.show_fdb import ShowMacAddressTable
+        from genie.libs.parser.iosxe.show_ip_nat import ShowIpNatTranslations
+        from genie.libs.parser.iosxe.show_routing import ShowIpRoute, \
+                                                         ShowIpv6Route
+        for parser_cls in (ShowArp, ShowMacAddressTable, ShowIpRoute,
+                           ShowIpv6Route, ShowIpNatTranslations):
+            self.assertRecords('iosxe', parser_cls)
+
+    def test_show_ip_ospf_database(self):
+        from genie.libs.parser.ios import show_ospf as ios_ospf
+        from genie.libs.parser.iosxe import show_ospf as iosxe_ospf
+        for name in ('External', 'Network', 'OpaqueArea', 'Summary'):
+            self.assertRecords('ios', getattr(
+                ios_ospf, 'ShowIpOspfDatabase' + name))
+        for name in ('External', 'Network', 'OpaqueArea',
+                     'OpaqueAreaAdvRouter', 'OpaqueAreaSelfOriginate',
+                     'Router', 'RouterSelfOriginate', 'Summary'):
+            parser_cls = getattr(iosxe_ospf, 'ShowIpOspfDatabase' + name)
+            self.assertTrue(issubclass(
+                parser_cls, iosxe_ospf.ShowIpOspfDatabaseTypeParser))
+            self.assertRecords('iosxe', parser_cls)
+
+    def test_iosxr_show_isis_database_detail(self):
+        # Tested with the outputs of its unit tests, it has no golden test
+        from genie.libs.parser.iosxr.show_isis import ShowIsisDatabaseDetail
+        from genie.libs.parser.iosxr.tests.test_show_isis import \
+            TestShowIsisDatabaseDetail
+        goldens = [(value['execute.return_value'], {}) for name, value
+                   in sorted(vars(TestShowIsisDatabaseDetail).items())
+                   if name.startswith('golden_output')]
+        self.assertEqual(len(goldens), 4)
+        self.assertRecords('iosxr', ShowIsisDatabaseDetail, goldens)
+
+    def test_show_bgp_all_detail(self):
+        # cli() files an entry under the address family and RD of entries
+        # read before it, which chunks of entries cannot carry
+        from genie.libs.parser.iosxe.show_bgp import ShowBgpAllDetail
+        self.assertFalse(issubclass(ShowBgpAllDetail, RecordIterator))
+
+
+if __name__ == '__main__':
+    unittest.main()
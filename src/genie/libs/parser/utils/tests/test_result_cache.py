@@ -0,0 +1,143 @@
+import shutil
+import tempfile
+import unittest
+from unittest.mock import Mock, patch
+
+from genie.metaparser import MetaParser
+
+from genie.libs.parser.utils import result_cache
+from genie.libs.parser.utils.result_cache import (
+    disable_result_cache,
+    enable_result_cache,
+    get_result_cache_info,
+    invalidate_result_cache
+)
+from genie.libs.parser.utils.tests.dummy_parser.iosxe.show_clock import \
+    ShowClock
+
+
+OUTPUT = '*05:26:38.035 EST Wed JAN 4 2019\n'
+
+
+class CountingShowClock(ShowClock):
+
+    calls = 0
+
+    def cli(self, output=None):
+        CountingShowClock.calls += 1
+        return super().cli(output=output)
+
+
+class TestResultCache(unittest.TestCase):
+
+    def setUp(self):
+        CountingShowClock.calls = 0
+        self.parse = MetaParser.parse
+        self.tmp = tempfile.mkdtemp()
+
+    def tearDown(self):
+        disable_result_cache()
+        shutil.rmtree(self.tmp)
+
+    def test_output(self):
+        enable_result_cache()
+        parser = CountingShowClock(device=None)
+        first = parser.parse(output=OUTPUT)
+        second = parser.parse(output=OUTPUT)
+        self.assertEqual(first, second)
+        self.assertEqual(first['year'], '2019')
+        self.assertIsNot(first, second)
+        self.assertEqual(CountingShowClock.calls, 1)
+
+        parser.parse(output=OUTPUT.replace('2019', '2020'))
+        self.assertEqual(CountingShowClock.calls, 2)
+        self.assertEqual(get_result_cache_info(),
+                         {'hits': 1, 'misses': 2, 'size': 2,
+                          'maxsize': 1024, 'disk_hits': 0,
+                          'disk_writes': 0})
+
+        invalidate_result_cache()
+        parser.parse(output=OUTPUT)
+        self.assertEqual(CountingShowClock.calls, 3)
+
+    def test_device(self):
+        enable_result_cache()
+        device = Mock(os='iosxe', platform=None,
+                      **{'execute.return_value': OUTPUT})
+        for _ in range(3):
+            self.assertEqual(CountingShowClock(device=device).parse()['day'],
+                             '4')
+        # Each command is executed once per parse, and parsed once
+        self.assertEqual(device.execute.call_count, 3)
+        self.assertEqual(CountingShowClock.calls, 1)
+
+        device.execute.return_value = OUTPUT.replace('2019', '2020')
+        self.assertEqual(CountingShowClock(device=device).parse()['year'],
+                         '2020')
+        self.assertEqual(device.execute.call_count, 4)
+        self.assertEqual(CountingShowClock.calls, 2)
+
+    def test_disk(self):
+        enable_result_cache(path=self.tmp)
+        device = Mock(os='iosxe', platform=None,
+                      **{'execute.return_value': OUTPUT})
+        expected = CountingShowClock(device=device).parse()
+
+        # Another process, sharing the folder
+        enable_result_cache(path=self.tmp)
+        self.assertEqual(CountingShowClock(device=device).parse(), expected)
+        self.assertEqual(CountingShowClock.calls, 1)
+        info = get_result_cache_info()
+        self.assertEqual((info['hits'], info['misses'], info['disk_hits']),
+                         (1, 0, 1))
+
+    def test_parser_code(self):
+        enable_result_cache(path=self.tmp)
+        CountingShowClock(device=None).parse(output=OUTPUT)
+
+        # Another run, after an upgrade of genieparser
+        enable_result_cache(path=self.tmp)
+        with patch.object(result_cache, '__version__', '0.0'):
+            CountingShowClock(device=None).parse(output=OUTPUT)
+        self.assertEqual(CountingShowClock.calls, 2)
+
+        # Another run, after a fix of the parser
+        enable_result_cache(path=self.tmp)
+        with patch.dict(result_cache._source_digests,
+                        {CountingShowClock: 'fixed'}):
+            CountingShowClock(device=None).parse(output=OUTPUT)
+        self.assertEqual(CountingShowClock.calls, 3)
+
+        # Same code, from the disk
+        enable_result_cache(path=self.tmp)
+        CountingShowClock(device=None).parse(output=OUTPUT)
+        self.assertEqual(CountingShowClock.calls, 3)
+
+    def test_eviction(self):
+        enable_result_cache(maxsize=1)
+        parser = CountingShowClock(device=None)
+        parser.parse(output=OUTPUT)
+        parser.parse(output=OUTPUT.replace('2019', '2020'))
+        parser.parse(output=OUTPUT)
+        self.assertEqual(CountingShowClock.calls, 3)
+
+    def test_errors(self):
+        enable_result_cache()
+        parser = CountingShowClock(device=None)
+        for _ in range(2):
+            with self.assertRaises(Exception):
+                parser.parse(output='not a clock')
+        self.assertEqual(CountingShowClock.calls, 2)
+        self.assertEqual(get_result_cache_info()['size'], 0)
+
+    def test_disable(self):
+        enable_result_cache()
+        self.assertIsNot(MetaParser.parse, self.parse)
+        disable_result_cache()
+        self.assertIs(MetaParser.parse, self.parse)
+        self.assertIsNone(result_cache.result_cache)
+        self.assertIsNone(get_result_cache_info())
+
+
+if __name__ == '__main__':
+    unittest.main()
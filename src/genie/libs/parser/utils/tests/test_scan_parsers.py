@@ -0,0 +1,88 @@
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from genie.libs.parser.utils import extension
+from genie.libs.parser.utils.extension import ExtendParsers, scan_parsers
+
+SOURCE = '''
+from genie.metaparser import MetaParser
+from genie.libs.parser.iosxe.show_vrf import ShowVrfSchema
+
+
+class ShowClockSchema(MetaParser):
+    """Schema for show clock"""
+    schema = {}
+
+
+class ShowClock(ShowClockSchema):
+    """Parser for show clock"""
+    cli_command = 'show clock'
+
+
+class ShowClockDetail(ShowClock):
+    pass
+
+
+class ShowVrf(ShowVrfSchema):
+    cli_command = ['show vrf', 'show vrf {vrf}']
+
+
+class _ShowPrivate(ShowClockSchema):
+    cli_command = 'show private'
+
+
+class Helper(object):
+    cli_command = 'show helper'
+'''
+
+
+class TestScanParsers(unittest.TestCase):
+
+    def test_scan(self):
+        self.assertEqual(scan_parsers(SOURCE), [
+            ['ShowClock', ['show clock'], 'Parser for show clock'],
+            ['ShowClockDetail', ['show clock'], None],
+            ['ShowVrf', ['show vrf', 'show vrf {vrf}'], None],
+        ])
+
+    def test_dynamic_cli_command(self):
+        self.assertIsNone(scan_parsers(
+            "class ShowA(MetaParser):\n"
+            "    cli_command = ['show a ' + x for x in 'bc']\n"))
+
+    def test_inherited_from_other_module(self):
+        self.assertIsNone(scan_parsers(
+            "from genie.libs.parser.iosxe.show_vrf import ShowVrf as Base\n"
+            "class ShowVrf(Base):\n"
+            "    pass\n"))
+
+
+class TestExtendManifest(unittest.TestCase):
+
+    def setUp(self):
+        self.manifest_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.manifest_dir)
+
+    def extend(self):
+        ext = ExtendParsers('genie.libs.parser.utils.tests.dummy_parser',
+                            manifest_dir=self.manifest_dir)
+        ext.extend()
+        return ext.output
+
+    def test_manifest_reused(self):
+        first = self.extend()
+
+        with patch.object(extension, 'scan_parsers') as scan:
+            second = self.extend()
+            scan.assert_not_called()
+
+        self.assertEqual(first, second)
+        self.assertEqual(first['show clock']['iosxr']['class'], 'ShowClock')
+
+
+if __name__ == '__main__':
+    unittest.main()
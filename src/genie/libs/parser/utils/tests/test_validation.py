@@ -0,0 +1,221 @@
+import unittest
+
+from genie.metaparser import MetaParser
+from genie.metaparser.util.schemaengine import Any, ListOf, Optional, \
+                                              Schema, Use
+from genie.metaparser.util.exceptions import SchemaEmptyParserError
+
+from genie.libs.parser.utils.result_cache import disable_result_cache, \
+                                                 enable_result_cache
+from genie.libs.parser.utils.validation import (
+    CompiledSchema,
+    ValidationPolicy,
+    get_validation_policy,
+    reset_validation_policy,
+    sample_output,
+    set_validation_policy
+)
+
+
+def validate_peers(value):
+    if not isinstance(value, list):
+        raise TypeError('peers is not a list')
+    for peer in value:
+        if not isinstance(peer['address'], str):
+            raise TypeError('address is not a str')
+    return value
+
+
+class ShowRoutesSchema(MetaParser):
+
+    schema = {
+        'vrf': {
+            Any(): {
+                'count': int,
+                Optional('name'): str,
+                'routes': {
+                    Any(): {
+                        'metric': Use(int),
+                        'next_hops': ListOf({'address': str}),
+                    },
+                },
+            },
+        },
+        Optional('peers'): Use(validate_peers),
+    }
+
+
+class ShowRoutes(ShowRoutesSchema):
+
+    def cli(self, output=None):
+        return output
+
+
+class ShowOtherRoutes(ShowRoutes):
+    pass
+
+
+def routes(count, metric='1'):
+    return {'vrf': {'default': {
+        'count': count,
+        'routes': {'10.0.{}.0/24'.format(index): {
+            'metric': metric,
+            'next_hops': [{'address': '192.168.0.{}'.format(hop)}
+                          for hop in range(count)]}
+            for index in range(count)}}}}
+
+
+class TestSampleOutput(unittest.TestCase):
+
+    def test_first(self):
+        output = routes(5)
+        output['peers'] = [{'address': str(index)} for index in range(5)]
+        sample = sample_output(output, ShowRoutes.schema, size=2)
+        vrf = sample['vrf']['default']
+        self.assertEqual(vrf['count'], 5)
+        self.assertEqual(list(vrf['routes']), ['10.0.0.0/24', '10.0.1.0/24'])
+        self.assertEqual(vrf['routes']['10.0.1.0/24']['next_hops'],
+                         [{'address': '192.168.0.0'},
+                          {'address': '192.168.0.1'}])
+        # The lists checked by callbacks are sampled too
+        self.assertEqual(sample['peers'], [{'address': '0'},
+                                           {'address': '1'}])
+        # The output is left untouched
+        self.assertEqual(len(output['vrf']['default']['routes']), 5)
+
+    def test_random(self):
+        output = routes(20)
+        first = sample_output(output, ShowRoutes.schema, size=3, random=True,
+                              seed=1)
+        second = sample_output(output, ShowRoutes.schema, size=3,
+                               random=True, seed=1)
+        self.assertEqual(first, second)
+        names = list(first['vrf']['default']['routes'])
+        self.assertEqual(len(names), 3)
+        # In the order of the output
+        self.assertEqual(names, [name for name in
+                                 output['vrf']['default']['routes']
+                                 if name in names])
+
+    def test_policy(self):
+        with self.assertRaises(ValueError):
+            ValidationPolicy('partial')
+        with self.assertRaises(ValueError):
+            ValidationPolicy('sampled', size=0)
+
+
+class TestCompiledSchema(unittest.TestCase):
+
+    def test_validate(self):
+        route = CompiledSchema({'route': {'address': str,
+                                          Optional('metric'): Use(int)},
+                                Optional('tag'): str})
+        self.assertEqual(
+            route.validate({'route': {'address': '10.0.0.1', 'metric': '2'}}),
+            {'route': {'address': '10.0.0.1', 'metric': 2}})
+
+        # A failed validation is not carried over to the next one
+        with self.assertRaises(Exception):
+            route.validate({'route': {'metric': '2'}})
+        self.assertEqual(route.validate({'route': {'address': '10.0.0.2'}}),
+                         {'route': {'address': '10.0.0.2'}})
+
+    def test_schema(self):
+        hop = CompiledSchema({'hop': {'address': str}, Optional('tag'): str})
+
+        def validate_hops(value):
+            for item in value:
+                hop.validate(item)
+            return value
+
+        with self.assertRaises(Exception):
+            Schema({'hops': Use(validate_hops)}).validate({'hops': [
+                {'hop': {}}]})
+        Schema({'hops': Use(validate_hops)}).validate({'hops': [
+            {'hop': {'address': '10.0.0.1'}}]})
+
+class TestValidationPolicy(unittest.TestCase):
+
+    def setUp(self):
+        self.parse = MetaParser.parse
+
+    def tearDown(self):
+        reset_validation_policy()
+        disable_result_cache()
+        self.assertIs(MetaParser.parse, self.parse)
+
+    def test_full(self):
+        self.assertEqual(get_validation_policy(ShowRoutes).mode, 'full')
+        output = ShowRoutes(device=None).parse(output=routes(3))
+        self.assertEqual(
+            output['vrf']['default']['routes']['10.0.0.0/24']['metric'], 1)
+        with self.assertRaises(Exception):
+            ShowRoutes(device=None).parse(output=routes(3, metric='x'))
+
+    def test_off(self):
+        set_validation_policy('off')
+        parser = ShowRoutes(device=None)
+        output = parser.parse(output=routes(3, metric='x'))
+        # Not converted
+        self.assertEqual(
+            output['vrf']['default']['routes']['10.0.0.0/24']['metric'], 'x')
+        self.assertNotIn('schema', vars(parser))
+        self.assertIs(parser.schema, ShowRoutes.schema)
+        with self.assertRaises(SchemaEmptyParserError):
+            parser.parse(output={})
+
+    def test_sampled(self):
+        set_validation_policy('sampled', size=2)
+        output = routes(4)
+        self.assertEqual(ShowRoutes(device=None).parse(output=output), output)
+
+        output['vrf']['default']['routes']['10.0.1.0/24']['metric'] = 'x'
+        with self.assertRaises(Exception) as error:
+            ShowRoutes(device=None).parse(output=output)
+        self.assertEqual(str(error.exception),
+                         'Parser ShowRoutes schema checking failed')
+
+        # Past the sample
+        output['vrf']['default']['routes']['10.0.1.0/24']['metric'] = '1'
+        output['vrf']['default']['routes']['10.0.3.0/24']['metric'] = 'x'
+        ShowRoutes(device=None).parse(output=output)
+
+        output['vrf']['default'].pop('count')
+        with self.assertRaises(Exception):
+            ShowRoutes(device=None).parse(output=output)
+
+    def test_per_parser(self):
+        set_validation_policy('off', parsers=[ShowRoutes])
+        self.assertEqual(get_validation_policy(ShowOtherRoutes).mode, 'off')
+        self.assertEqual(get_validation_policy(ShowRoutesSchema).mode, 'full')
+        ShowOtherRoutes(device=None).parse(output=routes(2, metric='x'))
+
+        set_validation_policy('full', parsers=[ShowOtherRoutes])
+        with self.assertRaises(Exception):
+            ShowOtherRoutes(device=None).parse(output=routes(2, metric='x'))
+
+        reset_validation_policy(parsers=[ShowRoutes, ShowOtherRoutes])
+        with self.assertRaises(Exception):
+            ShowRoutes(device=None).parse(output=routes(2, metric='x'))
+
+    def test_result_cache(self):
+        enable_result_cache()
+        set_validation_policy('off')
+        output = routes(2)
+        self.assertEqual(ShowRoutes(device=None).parse(output=output)
+                         ['vrf']['default']['routes']['10.0.0.0/24']
+                         ['metric'], '1')
+        # Not served the result left unconverted
+        set_validation_policy('full')
+        self.assertEqual(ShowRoutes(device=None).parse(output=output)
+                         ['vrf']['default']['routes']['10.0.0.0/24']
+                         ['metric'], 1)
+
+        # The policy stays in place when the cache is disabled first
+        disable_result_cache()
+        set_validation_policy('off')
+        ShowRoutes(device=None).parse(output=routes(2, metric='x'))
+
+
+if __name__ == '__main__':
+    unittest.main()
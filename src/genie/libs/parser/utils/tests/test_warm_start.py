@@ -0,0 +1,79 @@
+import os
+import re
+import shutil
+import tempfile
+import unittest
+from unittest.mock import Mock
+
+from genie.libs.parser.utils import common, warm_start
+from genie.libs.parser.utils.common import invalidate_parser_cache
+from genie.libs.parser.utils.patterns import PatternTable
+from genie.libs.parser.utils.tests.dummy_parser.iosxe.show_clock import \
+    ShowClock
+from genie.libs.parser.utils.tests.mock_registry import MockRegistryMixin
+
+
+class TestWarmStart(MockRegistryMixin, unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.tmp = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def device(self, name='R1'):
+        device = Mock(os='iosxe', platform=None, model=None, custom={})
+        device.name = name
+        return device
+
+    def test_build(self):
+        bundle = warm_start.build_bundle(
+            ['show clock', 'show nothing'],
+            [self.device('R1'), self.device('R2')])
+
+        self.assertEqual(bundle['modules'], [ShowClock.__module__])
+        self.assertEqual(len(bundle['resolutions']), 1)
+        self.assertEqual(bundle['resolutions'][0][1], (ShowClock, {}))
+        self.assertNotIn('patterns', bundle)
+
+    def test_attach(self):
+        bundle = warm_start.build_bundle(['show clock'], [self.device()])
+        path = os.path.join(self.tmp, 'iosxe.bundle')
+        warm_start.write_bundle(bundle, path)
+
+        # Fresh process
+        invalidate_parser_cache()
+        common.parser_cache.clear(stats=True)
+        re.purge()
+
+        stats = warm_start.attach(path)
+        self.assertEqual(stats['resolutions'], 1)
+        self.assertEqual(stats['patterns'],
+                         warm_start.class_patterns(ShowClock))
+
+        # Resolved from the bundle
+        self.assertEqual(common.get_parser('show clock', self.device()),
+                         (ShowClock, {}))
+        self.assertEqual(common.get_parser_cache_info()['hits'], 1)
+
+    def test_other_version(self):
+        bundle = warm_start.build_bundle(['show clock'], [self.device()])
+        bundle['parser_version'] = '0.0'
+        with self.assertRaises(ValueError):
+            warm_start.attach(bundle)
+
+    def test_class_patterns(self):
+        class ShowClockTable(ShowClock):
+            p0 = re.compile(r'^Clock')
+            patterns = PatternTable(p1=r'^Time', p2=r'^Peer', p3=r'^Stratum')
+            dispatcher = patterns.dispatcher('p1', 'p2')
+            scanner = patterns.scanner('p2', 'p3')
+
+        # Each pattern counted once
+        self.assertEqual(warm_start.class_patterns(ShowClockTable), 4)
+        self.assertEqual(warm_start.class_patterns(ShowClock), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
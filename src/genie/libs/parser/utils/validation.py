@@ -0,0 +1,291 @@
+'''Validation policy of the parse results
+
+MetaParser.parse checks every result against the schema of its parser, and
+on big outputs the check costs far more than the parsing itself: a junos
+`show route` of a few thousand routes is parsed in 4 ms and validated in
+180 ms. Parsers whose results are trusted, because their golden outputs
+pass or because their output is known, can be validated with a lighter
+policy:
+
+  * full: the whole result is validated, the default
+  * sampled: the result is validated on a sample, keeping the first entries
+    of every table of the schema, or random ones
+  * off: the result is not validated, only checked not to be empty
+
+    >>> set_validation_policy('sampled', size=5)
+    >>> set_validation_policy('off', parsers=[ShowRoute, ShowInterfaces])
+    >>> device.parse('show route')          # not validated
+    >>> device.parse('show bgp summary')    # validated on a sample
+    >>> reset_validation_policy()           # all fully validated again
+
+The policy of a parser is the one set for its class or the closest of its
+parents, else the global one.
+
+Without a full validation, the Use() conversions of the schema are not
+applied to the result, it is returned as its cli() built it. Results are
+still validated in full whenever the policy is full, as in the unit tests.
+'''
+
+# python
+import random
+import threading
+
+# Metaparser
+from genie.metaparser import MetaParser
+from genie.metaparser.util.schemaengine import Schema, Any, ListOf
+from genie.metaparser.util.exceptions import SchemaEmptyParserError
+
+VALIDATION_MODES = ('full', 'sampled', 'off')
+
+# parse() of MetaParser, while the policy wraps it
+_parse = None
+
+_lock = threading.Lock()
+
+
+class ValidationPolicy(object):
+    '''How the results of parsers are validated against their schema.
+
+    Args:
+        mode (`str`): 'full', 'sampled' or 'off'
+        size (`int`): entries kept of each table of the schema when sampled
+        random (`bool`): sample random entries instead of the first ones
+        seed: seed of the random samples, for reproducible samples
+    '''
+
+    def __init__(self, mode='full', size=10, random=False, seed=None):
+        if mode not in VALIDATION_MODES:
+            raise ValueError('Unknown validation mode {m}, expected one of '
+                             '{modes}'.format(m=mode, modes=VALIDATION_MODES))
+        if size < 1:
+            raise ValueError('The sample size must be at least 1')
+        self.mode = mode
+        self.size = size
+        self.random = random
+        self.seed = seed
+        self._random = None
+
+    def __repr__(self):
+        return '{c}({m!r}, size={s}, random={r})'.format(
+            c=type(self).__name__, m=self.mode, s=self.size, r=self.random)
+
+    def _choose(self, count):
+        '''Return the sorted indexes of the entries sampled out of `count`'''
+        if count <= self.size:
+            return range(count)
+        if not self.random:
+            return range(self.size)
+        with _lock:
+            if self._random is None:
+                self._random = random.Random(self.seed)
+            return sorted(self._random.sample(range(count), self.size))
+
+    def sample(self, output, schema):
+        '''Return a copy of `output` keeping `size` entries of each of its
+        tables, see sample_output'''
+        return _sample(output, schema, self._choose)
+
+
+class CompiledSchema(object):
+    '''Schema built once per parser class, for the sub-schemas checked by the
+    Use() callbacks of a schema:
+
+        def validate_nh_list(value):
+            for item in value:
+                ShowRouteSchema.nh_schema.validate(item)
+            return value
+
+        nh_schema = CompiledSchema({Optional('to'): str, ...})
+
+    A Schema keeps the keys missed by its last validation, and fails the
+    next one on them: the schema is reset before each validation, and each
+    thread validates with its own Schema.
+
+    Args:
+        schema (`dict`): the schema
+    '''
+
+    def __init__(self, schema):
+        self.schema = schema
+        self._local = threading.local()
+
+    def validate(self, data):
+        compiled = getattr(self._local, 'compiled', None)
+        if compiled is None:
+            compiled = self._local.compiled = Schema(self.schema)
+        compiled.missed = []
+        compiled.path = []
+        return compiled.validate(data)
+
+
+# The policy of all parsers, and those set per parser class
+_policy = ValidationPolicy()
+_policies = {}
+
+
+def _unwrap(schema):
+    '''Return the schema wrapped in a Schema, if a dict or list'''
+    while type(schema) is Schema:
+        schema = schema.schema
+    return schema
+
+
+def _literal(key):
+    '''Return the name of a fixed key of a dict schema, None for the keys
+    matching any entry of a table'''
+    if isinstance(key, Any):
+        return None
+    if isinstance(key, Schema):
+        key = key.schema
+    return key if isinstance(key, str) else None
+
+
+def _sample(output, schema, choose):
+    schema = _unwrap(schema)
+
+    if isinstance(output, dict):
+        if not isinstance(schema, dict):
+            # Schema checked by a callback, only its lists are sampled
+            return {key: _sample(value, None, choose)
+                    for key, value in output.items()}
+
+        fixed = {}
+        for key, value in schema.items():
+            name = _literal(key)
+            if name is not None:
+                fixed[name] = value
+        variable = [value for key, value in schema.items()
+                    if _literal(key) is None]
+        entry = variable[0] if len(variable) == 1 else None
+
+        sample = {}
+        entries = []
+        for key, value in output.items():
+            if key in fixed:
+                sample[key] = _sample(value, fixed[key], choose)
+            else:
+                entries.append(key)
+        for index in choose(len(entries)):
+            key = entries[index]
+            sample[key] = _sample(output[key], entry, choose)
+        return sample
+
+    if isinstance(output, list):
+        if isinstance(schema, ListOf):
+            item = schema.schema
+        elif isinstance(schema, list) and len(schema) == 1:
+            item = schema[0]
+        else:
+            item = None
+        return [_sample(output[index], item, choose)
+                for index in choose(len(output))]
+
+    return output
+
+
+def sample_output(output, schema, size=10, random=False, seed=None):
+    '''Return a copy of a parse result keeping the first `size` entries, or
+    random ones, of each of its tables.
+
+    The tables are the dicts keyed by the Any() keys, or other non literal
+    keys, of the schema, and all the lists. The fixed keys are all kept,
+    as are the keys of the dicts checked by a Use() callback.
+
+    Args:
+        output (`dict`): result of a parser
+        schema (`dict`): schema of the parser
+        size (`int`): entries kept of each table
+        random (`bool`): keep random entries instead of the first ones
+        seed: seed of the random samples
+    '''
+    return ValidationPolicy('sampled', size, random, seed).sample(output,
+                                                                  schema)
+
+
+def get_validation_policy(parser_cls=None):
+    '''Return the validation policy of a parser class, the global one if
+    None'''
+    if parser_cls is not None:
+        for klass in parser_cls.__mro__:
+            policy = _policies.get(klass)
+            if policy is not None:
+                return policy
+    return _policy
+
+
+def _validated_parse(self, **kwargs):
+    policy = get_validation_policy(type(self))
+    schema = getattr(self, 'schema', None)
+    if policy.mode == 'full' or not schema:
+        return _parse(self, **kwargs)
+
+    # MetaParser.parse skips the check of parsers without schema
+    attributes = vars(self)
+    own = 'schema' in attributes
+    self.schema = None
+    try:
+        output = _parse(self, **kwargs)
+    finally:
+        if own:
+            self.schema = schema
+        else:
+            del attributes['schema']
+
+    if not output:
+        raise SchemaEmptyParserError(data=output)
+    if policy.mode == 'sampled':
+        try:
+            Schema(schema).validate(policy.sample(output, schema))
+        except Exception as e:
+            raise Exception('Parser {p} schema checking failed'.format(
+                p=type(self).__name__)) from e
+    return output
+
+
+def set_validation_policy(mode, size=10, random=False, seed=None,
+                          parsers=None):
+    '''Set how MetaParser.parse validates the results of the parsers.
+
+    Args:
+        mode (`str`): 'full', 'sampled' or 'off'
+        size (`int`): entries kept of each table of the schema when sampled
+        random (`bool`): sample random entries instead of the first ones
+        seed: seed of the random samples
+        parsers (`list`): parser classes the policy applies to, and their
+                          subclasses, None for all the parsers
+
+    Returns:
+        ValidationPolicy: the policy set
+    '''
+    global _parse, _policy
+    policy = ValidationPolicy(mode, size, random, seed)
+    if parsers is None:
+        _policy = policy
+    else:
+        for parser_cls in parsers:
+            _policies[parser_cls] = policy
+    if _parse is None:
+        _parse = MetaParser.parse
+        MetaParser.parse = _validated_parse
+    return policy
+
+
+def reset_validation_policy(parsers=None):
+    '''Validate the results in full again.
+
+    Args:
+        parsers (`list`): parser classes back to the global policy, None to
+                          drop all the policies set
+    '''
+    global _parse, _policy
+    if parsers is not None:
+        for parser_cls in parsers:
+            _policies.pop(parser_cls, None)
+        return
+
+    _policy = ValidationPolicy()
+    _policies.clear()
+    # Left in place, doing nothing, if parse() was wrapped again since
+    if _parse is not None and MetaParser.parse is _validated_parse:
+        MetaParser.parse = _parse
+        _parse = None
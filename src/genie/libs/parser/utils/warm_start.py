@@ -0,0 +1,159 @@
+'''Warm start bundles for short lived parser workers
+
+A worker which parses a handful of outputs and exits pays, on its first
+parse, for resolving the command into a parser class, importing the parser
+module and compiling the patterns of its classes. A bundle records the
+resolutions and modules of a chosen set of commands and devices, once:
+
+    >>> bundle = build_bundle(get_parser_commands(device), [device])
+    >>> write_bundle(bundle, '/var/cache/parsers/iosxe.bundle')
+
+and a worker, or the parent process before forking its children, attaches
+to it:
+
+    >>> attach('/var/cache/parsers/iosxe.bundle')
+
+Attaching imports the parser modules, from their cached bytecode, and seeds
+the get_parser cache with the resolutions. Importing a module creates its
+parser classes, which compiles their pattern tables, dispatchers and
+scanners, see patterns.py. The patterns still compiled inside `cli()` are
+not warmed: the cache of the `re` module they go through is bounded and
+shared, and a large bundle would evict most of what it warmed.
+'''
+
+# python
+import re
+import sys
+import time
+import pickle
+import logging
+import importlib
+
+from . import common
+from .files import write_atomic
+from .patterns import LineDispatcher, LineScanner, PatternTable
+
+log = logging.getLogger(__name__)
+
+# Bump when the layout of the bundle changes
+BUNDLE_VERSION = 2
+
+_Pattern = type(re.compile(''))
+
+
+def class_patterns(parser_cls):
+    '''Return the number of distinct patterns compiled by the class
+    attributes of a parser class and its parents: compiled patterns,
+    pattern tables, dispatchers and scanners'''
+    patterns = set()
+    for klass in parser_cls.__mro__:
+        for value in vars(klass).values():
+            if isinstance(value, _Pattern):
+                patterns.add(id(value))
+            elif isinstance(value, PatternTable):
+                patterns.update(id(pattern) for _, pattern in value.items())
+            elif isinstance(value, (LineDispatcher, LineScanner)):
+                patterns.update(id(pattern) for _, pattern in value.patterns)
+    return len(patterns)
+
+
+def build_bundle(commands, devices):
+    '''Resolve `commands` for `devices` and collect what a worker needs to
+    parse them without a cold start.
+
+    Args:
+        commands (`list`): show commands, e.g. get_parser_commands(device)
+        devices (`list`): devices the commands are parsed for. Devices with
+                          the same os/platform/model share their resolutions
+
+    Returns:
+        dict: the bundle, see write_bundle and attach
+    '''
+    import genie.libs.parser
+
+    resolutions = []
+    modules = []
+    seen = set()
+
+    for device in devices:
+        try:
+            order_list = device.custom.get('abstraction').get('order', [])
+        except AttributeError:
+            order_list = None
+
+        for command in commands:
+            key = common._parser_cache_key(command, device, False,
+                                           order_list)
+            if key in seen:
+                continue
+            seen.add(key)
+
+            try:
+                parser_cls, kwargs = common.get_parser(command, device)
+            except Exception as e:
+                log.debug("Could not resolve '{c}' for {d}: {e}".format(
+                    c=command, d=getattr(device, 'name', device), e=e))
+                continue
+
+            resolutions.append((key, (parser_cls, kwargs)))
+            if parser_cls.__module__ not in modules:
+                modules.append(parser_cls.__module__)
+
+    return {'version': BUNDLE_VERSION,
+            'parser_version': genie.libs.parser.__version__,
+            'python': tuple(sys.version_info[:2]),
+            'modules': modules,
+            'resolutions': resolutions}
+
+
+def write_bundle(bundle, path):
+    '''Store a bundle built by build_bundle at `path`'''
+    # Concurrent workers never attach to a partially written bundle
+    write_atomic(path, pickle.dumps(bundle, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def load_bundle(path):
+    '''Load a bundle stored by write_bundle.
+
+    Loading the bundle imports the parser modules it references.
+    '''
+    with open(path, 'rb') as f:
+        return pickle.load(f)
+
+
+def attach(bundle):
+    '''Warm up the current process with a bundle.
+
+    Args:
+        bundle (`dict` or `str`): bundle, or location of a stored bundle
+
+    Returns:
+        dict: number of modules and resolutions loaded, of patterns compiled
+              by the parser classes, and the time it took
+
+    Raises:
+        ValueError: the bundle was built for another parser or python version
+    '''
+    import genie.libs.parser
+
+    start = time.perf_counter()
+    if isinstance(bundle, str):
+        bundle = load_bundle(bundle)
+
+    if bundle.get('version') != BUNDLE_VERSION or \
+            bundle.get('parser_version') != genie.libs.parser.__version__ or \
+            bundle.get('python') != tuple(sys.version_info[:2]):
+        raise ValueError('Bundle was built for another version, rebuild it')
+
+    for module in bundle['modules']:
+        importlib.import_module(module)
+
+    patterns = 0
+    for key, resolution in bundle['resolutions']:
+        common.parser_cache.set(key, resolution)
+        patterns += class_patterns(resolution[0])
+
+    return {'modules': len(bundle['modules']),
+            'resolutions': len(bundle['resolutions']),
+            'patterns': patterns,
+            'seconds': time.perf_counter() - start}
@@ -0,0 +1,417 @@
+"""Parallel and incremental runner of the folder based golden tests.
+
+Runs the same checks as ci_folder_parsing.py, without pyATS: the outputs of
+<os>/[<token>/]<Class>/cli/equal must parse to their expected output, and
+those of cli/empty must raise SchemaEmptyParserError (or AttributeError).
+Missing folders and the skip lists remain the job of ci_folder_parsing.py.
+
+* Classes are sharded across a pool of processes, the slowest classes of the
+  last run first.
+* Expected outputs are loaded once per file and content, and cached on disk
+  as pickles; loading the .py files is most of the cost of a run.
+* With --incremental, only the classes whose parser modules (the module of
+  the class, those it imports from genie.libs.parser, directly or not, and
+  utils/*.py) or golden files changed since they last passed are run.
+* The time of every class is reported, and recorded with the results.
+
+    python golden_runner.py
+    python golden_runner.py -o iosxe --incremental -j 8
+    python golden_runner.py -o iosxe -c ShowVersion --json
+"""
+
+# Python
+import os
+import re
+import sys
+import glob
+import json
+import time
+import pickle
+import hashlib
+import logging
+import argparse
+import importlib
+import multiprocessing
+from unittest.mock import Mock
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+SOURCES = os.path.join(os.path.dirname(HERE), "src", "genie", "libs", "parser")
+
+# As ci_folder_parsing.py, the OS converted to folder based tests
+OPERATING_SYSTEMS = ["asa", "ios", "iosxe", "junos", "viptela"]
+
+STATE_DIR = os.path.join(HERE, ".golden_runner")
+
+# Bump when the files recorded for a class change, to rerun all the classes
+RECORD_VERSION = 2
+
+CLASS_RE = re.compile(r"^class\s+(\w+)\s*[(:]", re.MULTILINE)
+
+log = logging.getLogger(__name__)
+
+# Hashes of the files read by this process, by path
+_digests = {}
+
+
+def file_digest(path):
+    """Helper function to hash the content of a file."""
+    digest = _digests.get(path)
+    if digest is None:
+        with open(path, "rb") as f:
+            digest = _digests[path] = hashlib.blake2b(
+                f.read(), digest_size=16).hexdigest()
+    return digest
+
+
+def folder_digest(folder):
+    """Helper function to hash the golden files of a class."""
+    digest = hashlib.blake2b(digest_size=16)
+    for path in sorted(glob.glob(os.path.join(folder, "cli", "*", "*"))):
+        digest.update(os.path.relpath(path, folder).encode())
+        digest.update(file_digest(path).encode())
+    return digest.hexdigest()
+
+
+def get_tasks(operating_systems, _class=None, _token=None):
+    """Find the classes to test: one per golden folder and module defining
+    a class of that name."""
+    tasks = []
+    for operating_system in operating_systems:
+        for folder in sorted(glob.glob(os.path.join(HERE, operating_system,
+                                                    "**", "cli"),
+                                       recursive=True)):
+            parts = os.path.relpath(folder, HERE).split(os.sep)[1:-1]
+            if len(parts) not in (1, 2):
+                continue
+            token, name = (parts[0] if len(parts) == 2 else None), parts[-1]
+            if _class and _class != name:
+                continue
+            if _token and _token != token:
+                continue
+            package = os.path.join(SOURCES, operating_system, token or "")
+            for module in get_modules(package).get(name, []):
+                tasks.append({
+                    "os": operating_system,
+                    "token": token,
+                    "name": name,
+                    "module": "genie.libs.parser.{}{}.{}".format(
+                        operating_system, "." + token if token else "",
+                        module),
+                    "folder": os.path.dirname(folder),
+                })
+    return tasks
+
+
+_modules = {}
+
+
+def get_modules(package):
+    """Helper function to map the class names of a package to the modules
+    defining them, read from the sources."""
+    if package not in _modules:
+        modules = _modules[package] = {}
+        for parse_file in sorted(glob.glob(os.path.join(package, "*.py"))):
+            if parse_file.endswith("__init__.py"):
+                continue
+            with open(parse_file) as f:
+                for name in CLASS_RE.findall(f.read()):
+                    modules.setdefault(name, []).append(
+                        os.path.basename(parse_file)[:-len(".py")])
+    return _modules[package]
+
+
+def task_key(task):
+    return "{}.{}".format(task["module"][len("genie.libs.parser."):],
+                          task["name"])
+
+
+def read_from_file(file_path):
+    """Helper function to read from a file."""
+    with open(file_path, "r") as f:
+        return f.read()
+
+
+def read_json_file(file_path):
+    """Helper function to read in json."""
+    with open(file_path) as f:
+        return json.load(f)
+
+
+def read_python_file(file_path, cache_dir=None):
+    """Helper function to read the expected_output of a Python file, from
+    the cache when the file was loaded before with the same content."""
+    cache_file = None
+    if cache_dir:
+        cache_file = os.path.join(cache_dir, file_digest(file_path))
+        try:
+            with open(cache_file, "rb") as f:
+                return pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            pass
+
+    namespace = {"__file__": file_path, "__name__": "expected"}
+    exec(compile(read_from_file(file_path), file_path, "exec"), namespace)
+    expected_output = namespace["expected_output"]
+
+    if cache_file:
+        try:
+            data = pickle.dumps(expected_output, pickle.HIGHEST_PROTOCOL)
+            tmp = "{}.{}".format(cache_file, os.getpid())
+            with open(tmp, "wb") as f:
+                f.write(data)
+            os.replace(tmp, cache_file)
+        except (OSError, pickle.PicklingError, TypeError, AttributeError):
+            pass
+    return expected_output
+
+
+# Parser modules imported by each module loaded in this process, by name
+_imports = {}
+
+
+def module_imports(name):
+    """Helper function to list the genie.libs.parser modules a module
+    imports, or imports names from."""
+    imports = _imports.get(name)
+    if imports is None:
+        imports = _imports[name] = set()
+        module = sys.modules.get(name)
+        for value in list(getattr(module, "__dict__", {}).values()):
+            if isinstance(value, type(sys)):
+                imported = value.__name__
+            else:
+                imported = getattr(value, "__module__", None)
+            if isinstance(imported, str) and \
+                    imported.startswith("genie.libs.parser.") and \
+                    imported != name:
+                imports.add(imported)
+    return imports
+
+
+def source_files(local_class):
+    """Helper function to list the parser modules of a class, those of its
+    parents and of what they import from genie.libs.parser, directly or
+    not, and utils/*.py: the files whose change reruns its tests."""
+    sources = os.path.realpath(SOURCES)
+    files = set(os.path.realpath(path) for path in
+                glob.glob(os.path.join(SOURCES, "utils", "*.py")))
+
+    names = [klass.__module__ for klass in local_class.__mro__]
+    seen = set()
+    while names:
+        name = names.pop()
+        if name in seen:
+            continue
+        seen.add(name)
+        names.extend(module_imports(name))
+        path = getattr(sys.modules.get(name), "__file__", None)
+        if path and os.path.realpath(path).startswith(sources):
+            files.add(os.path.realpath(path))
+    return sorted(files)
+
+
+def run_golden(local_class, folder, cache_dir):
+    """Parse the outputs of cli/equal, return the failures."""
+    failures = []
+    for user_defined in sorted(glob.glob(os.path.join(folder, "cli", "equal",
+                                                      "*_output.txt"))):
+        user_test = user_defined[:-len("_output.txt")]
+        test_name = os.path.basename(user_test)
+        try:
+            expected_output = read_python_file(user_test + "_expected.py",
+                                               cache_dir)
+            arguments = {}
+            if os.path.exists(user_test + "_arguments.json"):
+                arguments = read_json_file(user_test + "_arguments.json")
+            device = Mock(**{"execute.return_value":
+                             read_from_file(user_defined)})
+            parsed_output = local_class(device=device).parse(**arguments)
+        except Exception as e:
+            failures.append("{}: {}: {}".format(test_name, type(e).__name__,
+                                                e))
+            continue
+        if parsed_output != expected_output:
+            failures.append("{}: device output and expected output do not "
+                            "match".format(test_name))
+    return failures
+
+
+def run_empty(local_class, folder):
+    """Parse the outputs of cli/empty, return the failures."""
+    from genie.metaparser.util.exceptions import SchemaEmptyParserError
+
+    failures = []
+    for user_defined in sorted(glob.glob(os.path.join(folder, "cli", "empty",
+                                                      "*_output.txt"))):
+        user_test = user_defined[:-len("_output.txt")]
+        arguments = {}
+        if os.path.exists(user_test + "_arguments.json"):
+            arguments = read_json_file(user_test + "_arguments.json")
+        device = Mock(**{"execute.return_value": read_from_file(user_defined)})
+        try:
+            local_class(device=device).parse(**arguments)
+        except (SchemaEmptyParserError, AttributeError):
+            continue
+        except Exception as e:
+            failures.append("{}: {}: {}".format(os.path.basename(user_test),
+                                                type(e).__name__, e))
+            continue
+        failures.append("{}: file parsed, when expected not to".format(
+            os.path.basename(user_test)))
+    return failures
+
+
+def run_task(args):
+    """Run the golden and empty tests of a class, in a worker."""
+    task, cache_dir = args
+    start = time.perf_counter()
+    result = {"key": task_key(task), "failures": [], "files": []}
+    try:
+        local_class = getattr(importlib.import_module(task["module"]),
+                              task["name"])
+    except Exception as e:
+        result["failures"].append("import: {}: {}".format(type(e).__name__,
+                                                          e))
+    else:
+        if not hasattr(local_class, "cli"):
+            result["skipped"] = True
+        else:
+            result["failures"] = run_golden(local_class, task["folder"],
+                                            cache_dir) + \
+                run_empty(local_class, task["folder"])
+            result["files"] = source_files(local_class)
+    result["seconds"] = time.perf_counter() - start
+    return result
+
+
+def load_state(path):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_state(path, state):
+    tmp = "{}.{}".format(path, os.getpid())
+    with open(tmp, "w") as f:
+        json.dump(state, f, indent=1, sort_keys=True)
+    os.replace(tmp, path)
+
+
+def unchanged(task, record):
+    """Whether a class passed last time, and neither its parser modules nor
+    its golden files changed since."""
+    if not record or record.get("failures") or \
+            record.get("version") != RECORD_VERSION or \
+            record.get("golden") != folder_digest(task["folder"]):
+        return False
+    try:
+        return all(file_digest(path) == digest
+                   for path, digest in record.get("files", {}).items())
+    except OSError:
+        return False
+
+
+def main():
+    my_parser = argparse.ArgumentParser(
+        description="Parallel and incremental runner of the golden tests")
+    my_parser.add_argument("-o", "--operating_system", nargs="+",
+                           default=OPERATING_SYSTEMS,
+                           help="The OS you wish to filter on")
+    my_parser.add_argument("-c", "--class_name",
+                           help="The Class you wish to filter on")
+    my_parser.add_argument("-t", "--token",
+                           help="The Token associated with the class, such "
+                                "as 'asr1k'")
+    my_parser.add_argument("-j", "--jobs", type=int,
+                           default=multiprocessing.cpu_count(),
+                           help="Number of processes")
+    my_parser.add_argument("-i", "--incremental", action="store_true",
+                           help="Only run the classes changed since they "
+                                "last passed")
+    my_parser.add_argument("--state-dir", default=STATE_DIR,
+                           help="Folder of the recorded runs and cache of "
+                                "the expected outputs")
+    my_parser.add_argument("--no-cache", action="store_true",
+                           help="Load every expected output from its file")
+    my_parser.add_argument("--top", type=int, default=20,
+                           help="Number of slowest classes reported")
+    my_parser.add_argument("--json", action="store_true",
+                           help="Print the results as json")
+    args = my_parser.parse_args()
+
+    # The parsers log about what they skip, the failures are reported below
+    logging.disable(logging.CRITICAL)
+
+    cache_dir = None
+    if not args.no_cache:
+        cache_dir = os.path.join(args.state_dir, "expected")
+        os.makedirs(cache_dir, exist_ok=True)
+    os.makedirs(args.state_dir, exist_ok=True)
+    state_file = os.path.join(args.state_dir, "state.json")
+    state = load_state(state_file)
+
+    start = time.perf_counter()
+    tasks = get_tasks(args.operating_system, args.class_name, args.token)
+    skipped = 0
+    if args.incremental:
+        selected = [task for task in tasks
+                    if not unchanged(task, state.get(task_key(task)))]
+        skipped = len(tasks) - len(selected)
+        tasks = selected
+
+    # The slowest first, for the shards to end together
+    tasks.sort(key=lambda task: -state.get(task_key(task), {}).get(
+        "seconds", float("inf")))
+
+    results = []
+    work = [(task, cache_dir) for task in tasks]
+    if args.jobs > 1 and len(tasks) > 1:
+        with multiprocessing.Pool(args.jobs) as pool:
+            results = list(pool.imap_unordered(run_task, work))
+    else:
+        results = [run_task(item) for item in work]
+    elapsed = time.perf_counter() - start
+
+    folders = {task_key(task): task["folder"] for task in tasks}
+    for result in results:
+        if result.get("skipped"):
+            continue
+        state[result["key"]] = {
+            "version": RECORD_VERSION,
+            "failures": result["failures"],
+            "seconds": result["seconds"],
+            "golden": folder_digest(folders[result["key"]]),
+            "files": {path: file_digest(path) for path in result["files"]},
+        }
+    save_state(state_file, state)
+
+    results = [result for result in results if not result.get("skipped")]
+    failed = sorted((result for result in results if result["failures"]),
+                    key=lambda result: result["key"])
+
+    if args.json:
+        print(json.dumps({"results": sorted(results,
+                                            key=lambda r: r["key"]),
+                          "unchanged": skipped, "seconds": elapsed},
+                         indent=2, sort_keys=True))
+    else:
+        print("{:<70} {:>9}".format("class", "seconds"))
+        for result in sorted(results, key=lambda r: -r["seconds"])[:args.top]:
+            print("{:<70} {:>9.3f}".format(result["key"], result["seconds"]))
+        for result in failed:
+            print("FAILED {}".format(result["key"]))
+            for failure in result["failures"]:
+                print("    {}".format(failure))
+        print("{} classes run, {} failed, {} unchanged, in {:.1f}s "
+              "({:.1f}s of tests in {} processes)".format(
+                  len(results), len(failed), skipped, elapsed,
+                  sum(result["seconds"] for result in results), args.jobs))
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
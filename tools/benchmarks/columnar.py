@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+'''Measure the memory per entry of large tables, as dictionaries and columns.
+
+Synthetic outputs of the table parsers are generated with the requested
+number of entries and parsed with cli(), and with parse_columnar(). The
+memory of each result is the size of its objects, each counted once; the
+table is converted back with to_dict() and compared with the dictionary.
+
+    python tools/benchmarks/columnar.py
+    python tools/benchmarks/columnar.py --rows 1000000 --parser mac arp
+'''
+
+import sys
+import json
+import time
+import argparse
+import importlib
+
+from intern_strings import deep_size
+from scale_outputs import (arp_output, mac_output, nat_output,
+                           nxos_mac_output, route_output, vpn_output)
+
+
+# name: (<os>.<module>.<Class>, generator of the output lines)
+PARSERS = {
+    'mac': ('iosxe.show_fdb.ShowMacAddressTable', mac_output),
+    'arp': ('iosxe.show_arp.ShowArp', arp_output),
+    'nat': ('iosxe.show_ip_nat.ShowIpNatTranslations', nat_output),
+    'route': ('iosxe.show_routing.ShowIpRoute', route_output),
+    'nxos_mac': ('nxos.show_fdb.ShowMacAddressTable', nxos_mac_output),
+    'vpn': ('asa.show_vpn_sessiondb.ShowVpnSessiondbAnyconnect', vpn_output),
+}
+
+
+def table_size(table):
+    '''Return the size of a ColumnarTable and of everything it holds'''
+    size = sys.getsizeof(table) + sys.getsizeof(table.values) + \
+        sum(map(sys.getsizeof, table.values))
+    for path in table.paths():
+        columns = table.columns(*path)
+        size += sys.getsizeof(columns) + \
+            sum(map(sys.getsizeof, columns._keys)) + \
+            deep_size(columns._fields) + deep_size(path)
+    return size
+
+
+def measure(name, rows):
+    path, generate = PARSERS[name]
+    module_name, class_name = path.rsplit('.', 1)
+    parser = getattr(importlib.import_module(
+        'genie.libs.parser.' + module_name), class_name)(device=None)
+    output = '\n'.join(generate(rows))
+    results = {'parser': path, 'rows': rows}
+
+    start = time.perf_counter()
+    parsed = parser.cli(output=output)
+    results['dict_s'] = time.perf_counter() - start
+    results['dict_bytes'] = deep_size(parsed) / rows
+
+    start = time.perf_counter()
+    table = parser.parse_columnar(output)
+    results['columnar_s'] = time.perf_counter() - start
+    results['columnar_bytes'] = table_size(table) / rows
+
+    start = time.perf_counter()
+    converted = table.to_dict()
+    results['to_dict_s'] = time.perf_counter() - start
+    results['equal'] = converted == parsed
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--parser', nargs='+', default=list(PARSERS),
+                        choices=list(PARSERS), help='tables to measure')
+    parser.add_argument('--rows', type=int, default=200000,
+                        help='entries of each table')
+    parser.add_argument('--json', action='store_true',
+                        help='print the results as json')
+    args = parser.parse_args()
+
+    results = [measure(name, args.rows) for name in args.parser]
+
+    if args.json:
+        print(json.dumps(results, indent=2, sort_keys=True))
+        return
+
+    print('{:<50} {:>8} {:>12} {:>14} {:>9} {:>6}'.format(
+        'parser', 'rows', 'dict B/row', 'columnar B/row', 'ratio',
+        'equal'))
+    for result in results:
+        print('{:<50} {:>8} {:>12.0f} {:>14.0f} {:>8.1f}x {:>6}'.format(
+            result['parser'], result['rows'], result['dict_bytes'],
+            result['columnar_bytes'],
+            result['dict_bytes'] / result['columnar_bytes'],
+            str(result['equal'])))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+'''Measure the cost of Common.convert_intf_name per interface name.
+
+The interface names are the tokens of the golden outputs which look like
+one, e.g. Gi1/0/1 or Port-channel10, in the order they appear, so names
+repeat the way they do on the rows of a table. They are converted:
+
+  * previous: the way convert_intf_name did before its prefix table and
+    cache, building the table and looking its patterns up in the cache of
+    the re module on every call
+  * uncached: with the prefix table, without the cache
+  * cached: with convert_intf_name, cache warm
+  * bulk: with convert_intf_names, cache warm
+
+    python tools/benchmarks/convert_intf_name.py
+    python tools/benchmarks/convert_intf_name.py --os iosxe nxos --number 5
+'''
+
+import os
+import re
+import glob
+import json
+import timeit
+import argparse
+
+from genie.libs.parser.utils import common
+from genie.libs.parser.utils.common import Common
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__))))
+
+INTF_NAME = re.compile(r'^[A-Za-z][A-Za-z\-]*\d+(?:[/.:]\d+)*$')
+
+
+def previous_convert_intf_name(intf):
+    '''convert_intf_name before the prefix table, for comparison'''
+    convert = dict(common.INTF_NAME_PREFIXES)
+    m = re.search(r'([a-zA-Z]+)', intf)
+    m1 = re.search(r'([\d\/\.]+)', intf)
+    if hasattr(m, 'group') and hasattr(m1, 'group'):
+        int_type = m.group(0)
+        int_port = m1.group(0)
+        if int_type in convert.keys():
+            return(convert[int_type] + int_port)
+        else:
+            converted_intf = intf[0].capitalize()+intf[1:].replace(
+                ' ', '').replace('ethernet', 'Ethernet')
+            return(converted_intf)
+    else:
+        return(intf)
+
+
+def golden_names(os_names):
+    '''Return the interface names of the golden outputs of some OSes'''
+    names = []
+    for os_name in os_names:
+        pattern = os.path.join(ROOT, 'tests', os_name, '**', '*_output.txt')
+        for path in sorted(glob.glob(pattern, recursive=True)):
+            with open(path, errors='replace') as f:
+                names.extend(token for token in f.read().split()
+                             if INTF_NAME.match(token))
+    return names
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--os', nargs='+', default=['iosxe', 'nxos', 'iosxr'],
+                        help='OSes of the golden outputs')
+    parser.add_argument('--number', type=int, default=3,
+                        help='iterations per measurement')
+    parser.add_argument('--json', action='store_true',
+                        help='print the results as json')
+    args = parser.parse_args()
+
+    names = golden_names(args.os)
+    if not names:
+        raise SystemExit('No interface name found')
+
+    def previous():
+        for name in names:
+            previous_convert_intf_name(name)
+
+    def uncached():
+        for name in names:
+            common._convert_intf_name(name)
+
+    def cached():
+        for name in names:
+            Common.convert_intf_name(name)
+
+    def bulk():
+        Common.convert_intf_names(names)
+
+    cached()
+    results = {'names': len(names), 'distinct': len(set(names))}
+    for name, function in (('previous', previous), ('uncached', uncached),
+                           ('cached', cached), ('bulk', bulk)):
+        seconds = min(timeit.repeat(function, number=args.number, repeat=3))
+        results[name + '_ns'] = seconds / args.number / len(names) * 1e9
+    results['cache'] = common.get_intf_name_cache_info()
+
+    if args.json:
+        print(json.dumps(results, indent=2, sort_keys=True))
+        return
+
+    print('{names} names, {distinct} distinct'.format(**results))
+    for name in ('previous', 'uncached', 'cached', 'bulk'):
+        print('{:<10} {:>8.0f} ns per name'.format(name,
+                                                   results[name + '_ns']))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,263 @@
+#!/usr/bin/env python
+'''Measure the throughput of the parsers on their golden outputs.
+
+Every golden output of tests/<os>/[<token>/]<Class>/cli/equal is parsed with
+parse(**arguments) from a mocked device, the way tests/ci_folder_parsing.py
+checks it, repeatedly. For each class the best of the repeats gives the time
+per call and the lines parsed per second; the peak of the memory allocated
+while parsing is traced once per output, apart from the timings.
+
+The results can be saved as a baseline, and later runs compared with it:
+the classes slower, or allocating more, than the baseline by more than the
+threshold are reported as regressions and the script exits with 1.
+
+    python tools/benchmarks/golden_throughput.py --os iosxe --save base.json
+    python tools/benchmarks/golden_throughput.py --os iosxe \\
+        --compare base.json --threshold 0.2
+    python tools/benchmarks/golden_throughput.py --class ShowVersion --json
+'''
+
+import gc
+import os
+import re
+import sys
+import glob
+import json
+import time
+import logging
+import argparse
+import platform
+import importlib
+import tracemalloc
+from unittest.mock import Mock
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__))))
+TESTS = os.path.join(ROOT, 'tests')
+SOURCES = os.path.join(ROOT, 'src', 'genie', 'libs', 'parser')
+
+CLASS_RE = re.compile(r'^class\s+(\w+)\s*[(:]', re.MULTILINE)
+
+
+def golden_folders(os_names=None, class_names=None):
+    '''Yield (os, token, class name, folder) of the golden tests'''
+    for folder in sorted(glob.glob(os.path.join(TESTS, '*', '**', 'cli',
+                                                'equal'), recursive=True)):
+        parts = os.path.relpath(folder, TESTS).split(os.sep)[:-2]
+        if len(parts) not in (2, 3):
+            continue
+        os_name, token, class_name = parts[0], parts[1:-1], parts[-1]
+        if os_names and os_name not in os_names:
+            continue
+        if class_names and class_name not in class_names:
+            continue
+        yield os_name, token[0] if token else None, class_name, folder
+
+
+def class_modules(os_name, token=None):
+    '''Return {class name: [modules defining it]} of a parser package,
+    read from the sources so only the modules measured are imported'''
+    package = 'genie.libs.parser.' + os_name
+    folder = os.path.join(SOURCES, os_name)
+    if token:
+        package += '.' + token
+        folder = os.path.join(folder, token)
+    modules = {}
+    for path in sorted(glob.glob(os.path.join(folder, '*.py'))):
+        if path.endswith('__init__.py'):
+            continue
+        module = '{}.{}'.format(package, os.path.basename(path)[:-3])
+        with open(path) as f:
+            for class_name in CLASS_RE.findall(f.read()):
+                modules.setdefault(class_name, []).append(module)
+    return modules
+
+
+def find_class(modules, class_name):
+    '''Return the first parser class named `class_name` of the modules'''
+    for module in modules.get(class_name, []):
+        try:
+            parser_cls = getattr(importlib.import_module(module), class_name)
+        except Exception:
+            continue
+        if hasattr(parser_cls, 'cli'):
+            return parser_cls
+    return None
+
+
+def golden_outputs(folder):
+    '''Return the outputs and arguments of the golden tests of a folder'''
+    goldens = []
+    for path in sorted(glob.glob(os.path.join(folder, '*_output.txt'))):
+        base = path[:-len('_output.txt')]
+        arguments = {}
+        if os.path.exists(base + '_arguments.json'):
+            with open(base + '_arguments.json') as f:
+                arguments = json.load(f)
+        with open(path) as f:
+            goldens.append((f.read(), arguments))
+    return goldens
+
+
+def time_parse(obj, arguments, number, repeat):
+    '''Return the best time of `number` calls of obj.parse(**arguments)'''
+    best = None
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for _ in range(number):
+                obj.parse(**arguments)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+    finally:
+        if gc_enabled:
+            gc.enable()
+    return best / number
+
+
+def peak_parse(obj, arguments):
+    '''Return the peak of the memory allocated by obj.parse(**arguments)'''
+    tracemalloc.start()
+    try:
+        obj.parse(**arguments)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def measure(parser_cls, os_name, goldens, number, repeat):
+    '''Return the throughput of a parser class on its golden outputs'''
+    result = {'outputs': 0, 'errors': 0, 'lines': 0, 'seconds': 0.0,
+              'peak_bytes': 0}
+    for output, arguments in goldens:
+        device = Mock(os=os_name, platform=None,
+                      **{'execute.return_value': output})
+        obj = parser_cls(device=device)
+        try:
+            # Once before timing, to skip the outputs failing to parse and
+            # the cost of the first call
+            obj.parse(**arguments)
+        except Exception:
+            result['errors'] += 1
+            continue
+        result['seconds'] += time_parse(obj, arguments, number, repeat)
+        result['peak_bytes'] = max(result['peak_bytes'],
+                                   peak_parse(obj, arguments))
+        result['outputs'] += 1
+        result['lines'] += len(output.splitlines())
+
+    if result['outputs']:
+        result['us_per_call'] = result['seconds'] / result['outputs'] * 1e6
+        result['lines_per_s'] = result['lines'] / result['seconds'] \
+            if result['seconds'] else 0.0
+    return result
+
+
+def run(os_names, class_names, number, repeat):
+    '''Return {<os>[.<token>].<Class>: result} of the golden tests found'''
+    results = {}
+    packages = {}
+    for os_name, token, class_name, folder in golden_folders(os_names,
+                                                             class_names):
+        if (os_name, token) not in packages:
+            packages[os_name, token] = class_modules(os_name, token)
+        name = '.'.join(part for part in (os_name, token, class_name)
+                        if part)
+        parser_cls = find_class(packages[os_name, token], class_name)
+        goldens = golden_outputs(folder)
+        if parser_cls is None or not goldens:
+            continue
+        results[name] = measure(parser_cls, os_name, goldens, number,
+                                repeat)
+    return results
+
+
+def compare(results, baseline, threshold):
+    '''Return the regressions of the results against a baseline.
+
+    A class regressed when its time per call, or its peak allocation, is
+    more than `threshold` (0.2 is 20%) above the baseline.
+    '''
+    regressions = []
+    for name, result in sorted(results.items()):
+        base = baseline.get(name)
+        if not base or not result.get('us_per_call') \
+                or not base.get('us_per_call'):
+            continue
+        for metric in ('us_per_call', 'peak_bytes'):
+            if not base.get(metric):
+                continue
+            ratio = result[metric] / base[metric]
+            if ratio > 1 + threshold:
+                regressions.append({'parser': name, 'metric': metric,
+                                    'baseline': base[metric],
+                                    'current': result[metric],
+                                    'ratio': ratio})
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--os', nargs='+',
+                        help='OS of the golden tests, all by default')
+    parser.add_argument('--class', nargs='+', dest='classes',
+                        help='parser classes to measure, all by default')
+    parser.add_argument('--number', type=int, default=5,
+                        help='calls of parse() per repeat')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='repeats, the best one is kept')
+    parser.add_argument('--save', metavar='PATH',
+                        help='write the results to a baseline file')
+    parser.add_argument('--compare', metavar='PATH',
+                        help='baseline file to compare the results with')
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help='slowdown flagged as a regression, 0.2 is 20%%')
+    parser.add_argument('--json', action='store_true',
+                        help='print the results as json')
+    args = parser.parse_args()
+
+    # The parsers log about the outputs they skip, not measured here
+    logging.disable(logging.CRITICAL)
+    results = run(args.os, args.classes, args.number, args.repeat)
+
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump({'python': platform.python_version(),
+                       'number': args.number, 'repeat': args.repeat,
+                       'parsers': results}, f, indent=2, sort_keys=True)
+
+    regressions = []
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)['parsers']
+        regressions = compare(results, baseline, args.threshold)
+
+    if args.json:
+        print(json.dumps({'parsers': results, 'regressions': regressions},
+                         indent=2, sort_keys=True))
+    else:
+        print('{:<60} {:>7} {:>10} {:>12} {:>10}'.format(
+            'parser', 'outputs', 'us/call', 'lines/s', 'peak KiB'))
+        for name, result in sorted(results.items()):
+            if not result['outputs']:
+                print('{:<60} {:>7} {:>10}'.format(name, 0, 'errors'))
+                continue
+            print('{:<60} {:>7} {:>10.0f} {:>12.0f} {:>10.1f}'.format(
+                name, result['outputs'], result['us_per_call'],
+                result['lines_per_s'], result['peak_bytes'] / 1024))
+        total = sum(result['seconds'] for result in results.values())
+        lines = sum(result['lines'] for result in results.values())
+        print('{} parsers, {} lines in {:.3f}s per pass'.format(
+            len(results), lines, total))
+        for regression in regressions:
+            print('REGRESSION {parser} {metric}: {baseline:.0f} -> '
+                  '{current:.0f} ({ratio:.2f}x)'.format(**regression))
+
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+'''Measure the import time of the parser OS packages.
+
+For every OS, a fresh interpreter imports `genie.libs.parser` (the genie
+framework), the OS package, then each of its parser modules. The import of
+the package alone is what `Lookup` and `get_parser` pay up front; the cost
+of a module is only paid on first use. The lookup is the first attribute
+missed on the package, which loads the class map of its `__getattr__`.
+
+    python tools/benchmarks/import_time.py
+    python tools/benchmarks/import_time.py --os iosxe nxos --top 5 --json
+'''
+
+import os
+import sys
+import json
+import argparse
+import subprocess
+
+import genie.libs.parser
+
+PARSER_PATH = os.path.dirname(genie.libs.parser.__file__)
+
+OS_PACKAGES = ['apic', 'asa', 'bigip', 'dnac', 'ios', 'iosxe', 'iosxr',
+               'ironware', 'junos', 'linux', 'nxos', 'sros', 'viptela']
+
+# Run in a fresh interpreter, nothing imported yet
+CHILD = '''
+import os, sys, json, time, importlib
+os_name, path = sys.argv[1:3]
+start = time.perf_counter()
+importlib.import_module('genie.libs.parser')
+framework = time.perf_counter() - start
+start = time.perf_counter()
+package = importlib.import_module('genie.libs.parser.' + os_name)
+imported = time.perf_counter() - start
+start = time.perf_counter()
+getattr(package, 'NoSuchParser', None)
+lookup = time.perf_counter() - start
+modules = {}
+for filename in sorted(os.listdir(path)):
+    if not filename.startswith('show_') or not filename.endswith('.py'):
+        continue
+    name = 'genie.libs.parser.{}.{}'.format(os_name, filename[:-3])
+    start = time.perf_counter()
+    try:
+        importlib.import_module(name)
+    except Exception:
+        continue
+    modules[filename[:-3]] = time.perf_counter() - start
+print(json.dumps({'framework': framework, 'package': imported,
+                  'lookup': lookup, 'modules': modules}))
+'''
+
+
+def measure(os_name):
+    path = os.path.join(PARSER_PATH, os_name)
+    out = subprocess.check_output([sys.executable, '-c', CHILD, os_name, path])
+    result = json.loads(out.decode().splitlines()[-1])
+    result['os'] = os_name
+    result['all_modules'] = sum(result['modules'].values())
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--os', nargs='+', default=OS_PACKAGES,
+                        help='OS packages to measure')
+    parser.add_argument('--top', type=int, default=3,
+                        help='number of slowest modules shown per OS')
+    parser.add_argument('--json', action='store_true',
+                        help='print the results as json')
+    args = parser.parse_args()
+
+    results = [measure(os_name) for os_name in args.os]
+
+    if args.json:
+        print(json.dumps(results, indent=2, sort_keys=True))
+        return
+
+    print('{:<10} {:>14} {:>12} {:>11} {:>14} {:>8}'.format(
+        'os', 'framework (ms)', 'package (ms)', 'lookup (ms)',
+        'modules (ms)', 'modules'))
+    for result in results:
+        print('{:<10} {:>14.1f} {:>12.1f} {:>11.1f} {:>14.1f} {:>8}'.format(
+            result['os'], result['framework'] * 1000,
+            result['package'] * 1000, result['lookup'] * 1000,
+            result['all_modules'] * 1000, len(result['modules'])))
+        slowest = sorted(result['modules'].items(),
+                         key=lambda item: item[1], reverse=True)
+        for name, seconds in slowest[:args.top]:
+            print('{:<10}   {:<55} {:>8.1f}'.format('', name, seconds * 1000))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+'''Measure the memory held by large parsed tables with and without interning.
+
+Synthetic outputs of the big table parsers are generated with the requested
+number of rows, and parsed:
+
+  * plain: with the intern helpers of the parser module replaced by the
+    identity, the way the parsers were before interning
+  * interned: as the parsers are
+  * after: plain, then passed through intern_strings
+
+The memory of each result is the size of its objects, each counted once.
+
+    python tools/benchmarks/intern_strings.py
+    python tools/benchmarks/intern_strings.py --rows 100000 --parser mac nat
+'''
+
+import sys
+import json
+import time
+import argparse
+import importlib
+from unittest.mock import patch
+
+from genie.libs.parser.utils.common import intern_strings
+
+from scale_outputs import bgp_output, mac_output, nat_output, route_output
+
+
+# name: (<module>.<Class>, generator of the output lines)
+PARSERS = {
+    'mac': ('iosxe.show_fdb.ShowMacAddressTable', mac_output),
+    'route': ('iosxe.show_routing.ShowIpRoute', route_output),
+    'nat': ('iosxe.show_ip_nat.ShowIpNatTranslations', nat_output),
+    'bgp': ('iosxe.show_bgp.ShowBgpAllDetail', bgp_output),
+}
+
+
+def deep_size(data):
+    '''Return the size of an object and of everything it holds, each object
+    counted once'''
+    seen = set()
+    size = 0
+    stack = [data]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple)):
+            stack.extend(obj)
+    return size
+
+
+def measure(name, rows):
+    path, generate = PARSERS[name]
+    module_name, class_name = path.rsplit('.', 1)
+    module = importlib.import_module('genie.libs.parser.' + module_name)
+    parser = getattr(module, class_name)(device=None)
+    output = '\n'.join(generate(rows))
+    results = {'parser': path, 'rows': rows, 'mb': len(output) / 1e6}
+
+    # Without the helpers, as the parsers were before interning
+    helpers = [patch.object(module, helper, lambda value, *keys: value)
+               for helper in ('intern_value', 'intern_values')
+               if hasattr(module, helper)]
+    for helper in helpers:
+        helper.start()
+    try:
+        start = time.perf_counter()
+        parsed = parser.cli(output=output)
+        results['plain_s'] = time.perf_counter() - start
+    finally:
+        for helper in helpers:
+            helper.stop()
+    results['plain_mb'] = deep_size(parsed) / 1e6
+
+    start = time.perf_counter()
+    intern_strings(parsed)
+    results['after_s'] = time.perf_counter() - start
+    results['after_mb'] = deep_size(parsed) / 1e6
+    del parsed
+
+    start = time.perf_counter()
+    parsed = parser.cli(output=output)
+    results['interned_s'] = time.perf_counter() - start
+    results['interned_mb'] = deep_size(parsed) / 1e6
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--parser', nargs='+', default=sorted(PARSERS),
+                        choices=sorted(PARSERS), help='tables to measure')
+    parser.add_argument('--rows', type=int, default=1000000,
+                        help='rows of each table')
+    parser.add_argument('--json', action='store_true',
+                        help='print the results as json')
+    args = parser.parse_args()
+
+    results = [measure(name, args.rows) for name in args.parser]
+
+    if args.json:
+        print(json.dumps(results, indent=2, sort_keys=True))
+        return
+
+    print('{:<42} {:>8} {:>10} {:>12} {:>10} {:>8}'.format(
+        'parser', 'rows', 'plain MB', 'interned MB', 'after MB', 'saved'))
+    for result in results:
+        print('{:<42} {:>8} {:>10.0f} {:>12.0f} {:>10.0f} {:>7.0%}'.format(
+            result['parser'], result['rows'], result['plain_mb'],
+            result['interned_mb'], result['after_mb'],
+            1 - result['interned_mb'] / result['plain_mb']))
+
+
+if __name__ == '__main__':
+    main()
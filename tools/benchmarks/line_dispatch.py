@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+'''Measure what line dispatchers save over trying every pattern in order.
+
+For each parser with a dispatcher, the lines of its golden outputs, and of
+the outputs of its unit tests, are matched the way the parser does: against
+the patterns of the dispatcher, in order, until the first match. This is
+done with the dispatcher and with every pattern tried in turn, then the
+outputs are parsed to put the saving in perspective.
+
+    python tools/benchmarks/line_dispatch.py
+    python tools/benchmarks/line_dispatch.py \\
+        --parser nxos.show_interface.ShowInterface --number 50
+'''
+
+import os
+import json
+import glob
+import timeit
+import argparse
+import importlib
+import unittest
+from unittest.mock import Mock
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__))))
+
+PARSERS = ['iosxe.show_interface.ShowInterfaces',
+           'nxos.show_interface.ShowInterface',
+           'iosxr.show_interface.ShowInterfacesDetail',
+           'iosxr.show_interface.ShowInterfaces']
+
+
+def golden_outputs(os_name, class_name):
+    '''Return the outputs of the golden tests of a parser'''
+    folder = os.path.join(ROOT, 'tests', os_name, class_name, 'cli', 'equal')
+    outputs = []
+    for path in sorted(glob.glob(os.path.join(folder, '*_output.txt'))):
+        with open(path) as f:
+            outputs.append(f.read())
+    return outputs
+
+
+def unittest_outputs(os_name, module_name):
+    '''Return the device outputs mocked by the unit tests of a module'''
+    try:
+        module = importlib.import_module('genie.libs.parser.{}.tests.test_{}'
+                                         .format(os_name, module_name))
+    except ImportError:
+        return []
+
+    outputs = []
+    for test_cls in vars(module).values():
+        if not isinstance(test_cls, type) or \
+                not issubclass(test_cls, unittest.TestCase):
+            continue
+        for value in vars(test_cls).values():
+            if isinstance(value, dict) and \
+                    isinstance(value.get('execute.return_value'), str):
+                outputs.append(value['execute.return_value'])
+    return outputs
+
+
+def measure(path, number):
+    module_name, class_name = path.rsplit('.', 1)
+    os_name, short_name = module_name.split('.')
+    parser_cls = getattr(importlib.import_module(
+        'genie.libs.parser.' + module_name), class_name)
+    dispatcher = parser_cls.dispatcher
+
+    outputs = golden_outputs(os_name, class_name) + \
+        unittest_outputs(os_name, short_name)
+    # Parsers strip the lines before dispatching them
+    lines = [line.strip() for output in outputs
+             for line in output.splitlines()]
+
+    def dispatched():
+        for line in lines:
+            dispatcher.match(line)
+
+    def sequential():
+        for line in lines:
+            for name, pattern in dispatcher.patterns:
+                if pattern.match(line):
+                    break
+
+    def parse():
+        parser = parser_cls(device=Mock())
+        for output in outputs:
+            try:
+                parser.cli(output=output)
+            except Exception:
+                # outputs of other commands of the module
+                pass
+
+    candidates = sum(len(dispatcher.candidates(line)) for line in lines)
+    line_count = max(len(lines), 1)
+    dispatched_time = min(timeit.repeat(dispatched, number=number, repeat=3))
+    sequential_time = min(timeit.repeat(sequential, number=number, repeat=3))
+    parse_time = min(timeit.repeat(parse, number=number, repeat=3))
+
+    return {'parser': path,
+            'patterns': len(dispatcher.patterns),
+            'outputs': len(outputs),
+            'lines': len(lines),
+            'candidates_per_line': candidates / line_count,
+            'sequential_us': sequential_time / number * 1e6,
+            'dispatched_us': dispatched_time / number * 1e6,
+            'parse_us': parse_time / number * 1e6}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--parser', nargs='+', default=PARSERS,
+                        help='<os>.<module>.<Class> of parsers with a '
+                             'dispatcher')
+    parser.add_argument('--number', type=int, default=10,
+                        help='iterations per measurement')
+    parser.add_argument('--json', action='store_true',
+                        help='print the results as json')
+    args = parser.parse_args()
+
+    results = [measure(path, args.number) for path in args.parser]
+
+    if args.json:
+        print(json.dumps(results, indent=2, sort_keys=True))
+        return
+
+    print('{:<45} {:>8} {:>6} {:>10} {:>15} {:>15} {:>11}'.format(
+        'parser', 'patterns', 'lines', 'candidates', 'sequential (us)',
+        'dispatched (us)', 'parse (us)'))
+    for result in results:
+        print('{parser:<45} {patterns:>8} {lines:>6} '
+              '{candidates_per_line:>10.1f} {sequential_us:>15.1f} '
+              '{dispatched_us:>15.1f} {parse_us:>11.1f}'.format(**result))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+'''Measure what line scanners save over matching each pattern in turn.
+
+For each parser with a scanner, its golden outputs are repeated until they
+reach the requested number of lines, then matched line by line the way the
+parser used to, one pattern at a time until the first match, and with the
+scanner, which matches every line against all the patterns at once. The
+repeated output is also parsed to put the saving in perspective.
+
+    python tools/benchmarks/line_scan.py
+    python tools/benchmarks/line_scan.py \\
+        --parser iosxe.show_arp.ShowArp --lines 500000
+'''
+
+import os
+import glob
+import json
+import timeit
+import argparse
+import importlib
+from unittest.mock import Mock
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__))))
+
+PARSERS = ['iosxe.show_fdb.ShowMacAddressTable',
+           'iosxe.show_arp.ShowArp',
+           'iosxe.show_ip_nat.ShowIpNatTranslations']
+
+
+def golden_outputs(os_name, class_name):
+    '''Return the outputs of the golden tests of a parser'''
+    folder = os.path.join(ROOT, 'tests', os_name, class_name, 'cli', 'equal')
+    outputs = []
+    for path in sorted(glob.glob(os.path.join(folder, '*_output.txt'))):
+        with open(path) as f:
+            outputs.append(f.read())
+    return outputs
+
+
+def measure(path, lines, number):
+    module_name, class_name = path.rsplit('.', 1)
+    os_name = module_name.split('.')[0]
+    parser_cls = getattr(importlib.import_module(
+        'genie.libs.parser.' + module_name), class_name)
+    scanner = parser_cls.scanner
+
+    golden = [line for output in golden_outputs(os_name, class_name)
+              for line in output.splitlines()]
+    if not golden:
+        raise SystemExit('No golden output for {}'.format(path))
+    output = '\n'.join((golden * (lines // len(golden) + 1))[:lines])
+
+    def sequential():
+        for line in output.splitlines():
+            line = line.strip()
+            for name, pattern in scanner.patterns:
+                m = pattern.match(line)
+                if m:
+                    m.groupdict()
+                    break
+
+    def scanned():
+        for name, group in scanner.scan(output):
+            pass
+
+    def parse():
+        parser_cls(device=Mock()).cli(output=output)
+
+    sequential_time = min(timeit.repeat(sequential, number=number, repeat=3))
+    scanned_time = min(timeit.repeat(scanned, number=number, repeat=3))
+    parse_time = min(timeit.repeat(parse, number=number, repeat=3))
+
+    return {'parser': path,
+            'patterns': len(scanner.patterns),
+            'lines': lines,
+            'sequential_ms': sequential_time / number * 1e3,
+            'scanned_ms': scanned_time / number * 1e3,
+            'parse_ms': parse_time / number * 1e3}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--parser', nargs='+', default=PARSERS,
+                        help='<os>.<module>.<Class> of parsers with a scanner')
+    parser.add_argument('--lines', type=int, default=100000,
+                        help='lines of output to parse')
+    parser.add_argument('--number', type=int, default=3,
+                        help='iterations per measurement')
+    parser.add_argument('--json', action='store_true',
+                        help='print the results as json')
+    args = parser.parse_args()
+
+    results = [measure(path, args.lines, args.number)
+               for path in args.parser]
+
+    if args.json:
+        print(json.dumps(results, indent=2, sort_keys=True))
+        return
+
+    print('{:<40} {:>8} {:>8} {:>15} {:>12} {:>10}'.format(
+        'parser', 'patterns', 'lines', 'sequential (ms)', 'scanned (ms)',
+        'parse (ms)'))
+    for result in results:
+        print('{parser:<40} {patterns:>8} {lines:>8} {sequential_ms:>15.1f} '
+              '{scanned_ms:>12.1f} {parse_ms:>10.1f}'.format(**result))
+
+
+if __name__ == '__main__':
+    main()
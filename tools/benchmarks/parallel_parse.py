@@ -0,0 +1,140 @@
+#!/usr/bin/env python
+'''Measure parsing large outputs in chunks with a pool of processes.
+
+For each parser declaring its records, the largest output of its golden
+tests, or of its unit tests when it has no golden test, is repeated until it
+reaches the requested size, then parsed whole with cli() and with
+parse_parallel() for each number of processes. The results of both are
+compared on the original output.
+
+    python tools/benchmarks/parallel_parse.py
+    python tools/benchmarks/parallel_parse.py \\
+        --parser iosxe.show_ospf.ShowIpOspfDatabaseRouter --mb 50 \\
+        --processes 4 8
+'''
+
+import os
+import glob
+import json
+import time
+import argparse
+import importlib
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__))))
+
+PARSERS = ['iosxe.show_ospf.ShowIpOspfDatabaseRouter',
+           'iosxr.show_isis.ShowIsisDatabaseDetail']
+
+
+def golden_outputs(os_name, class_name):
+    '''Return the outputs of the golden tests of a parser'''
+    folder = os.path.join(ROOT, 'tests', os_name, class_name, 'cli', 'equal')
+    outputs = []
+    for path in sorted(glob.glob(os.path.join(folder, '*_output.txt'))):
+        with open(path) as f:
+            outputs.append(f.read())
+    return outputs
+
+
+def unittest_outputs(os_name, module_name):
+    '''Return the device outputs mocked by the unit tests of a module'''
+    try:
+        module = importlib.import_module('genie.libs.parser.{}.tests.test_{}'
+                                         .format(os_name, module_name))
+    except ImportError:
+        return []
+
+    outputs = []
+    for test_cls in vars(module).values():
+        if not isinstance(test_cls, type) or \
+                not issubclass(test_cls, unittest.TestCase):
+            continue
+        for value in vars(test_cls).values():
+            if isinstance(value, dict) and \
+                    isinstance(value.get('execute.return_value'), str):
+                outputs.append(value['execute.return_value'])
+    return outputs
+
+
+def measure(path, size, processes, chunk_size):
+    module_name, class_name = path.rsplit('.', 1)
+    os_name, short_name = module_name.split('.')
+    parser_cls = getattr(importlib.import_module(
+        'genie.libs.parser.' + module_name), class_name)
+    parser = parser_cls(device=None)
+
+    outputs = []
+    for output in golden_outputs(os_name, class_name) or \
+            unittest_outputs(os_name, short_name):
+        try:
+            if output.strip() and parser.cli(output=output):
+                outputs.append(output)
+        except Exception:
+            # outputs of other commands of the module
+            pass
+    if not outputs:
+        raise SystemExit('No output for {}'.format(path))
+
+    # The largest output, so its context lines apply to all its entries
+    sample = max(outputs, key=len)
+    output = '\n'.join([sample] * (size // len(sample) + 1))
+
+    start = time.perf_counter()
+    parser.cli(output=output)
+    results = {'parser': path,
+               'mb': len(output) / 1e6,
+               'cli_s': time.perf_counter() - start,
+               'parallel_s': {}}
+
+    for count in processes:
+        start = time.perf_counter()
+        parser.parse_parallel(output, processes=count, chunk_size=chunk_size)
+        results['parallel_s'][count] = time.perf_counter() - start
+
+    # Entries repeated in the same output are not merged the way cli()
+    # merges them, so the results are compared on the original output, one
+    # entry per chunk
+    results['equal'] = parser.parse_parallel(sample, chunk_size=1) == \
+        parser.cli(output=sample)
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--parser', nargs='+', default=PARSERS,
+                        help='<os>.<module>.<Class> of parsers declaring '
+                             'their records')
+    parser.add_argument('--mb', type=float, default=10,
+                        help='size of the output to parse, in MB')
+    parser.add_argument('--processes', type=int, nargs='+',
+                        default=[1, 2, os.cpu_count()],
+                        help='sizes of the pool of processes')
+    parser.add_argument('--chunk-size', type=int, default=500,
+                        help='entries parsed by a process at once')
+    parser.add_argument('--json', action='store_true',
+                        help='print the results as json')
+    args = parser.parse_args()
+
+    results = [measure(path, int(args.mb * 1e6), args.processes,
+                       args.chunk_size)
+               for path in args.parser]
+
+    if args.json:
+        print(json.dumps(results, indent=2, sort_keys=True))
+        return
+
+    print('{:<42} {:>6} {:>8} {:>24} {:>6}'.format(
+        'parser', 'MB', 'cli (s)', 'parallel (s) per pool', 'equal'))
+    for result in results:
+        parallel = ' '.join('{}:{:.2f}'.format(count, seconds) for
+                            count, seconds in result['parallel_s'].items())
+        print('{:<42} {:>6.1f} {:>8.2f} {:>24} {:>6}'.format(
+            result['parser'], result['mb'], result['cli_s'], parallel,
+            str(result['equal'])))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+'''Profile the patterns of parsers on their golden or synthetic outputs.
+
+The golden outputs of each parser, or a synthetic output of the given size
+for the parsers of scale_outputs.py, are parsed with cli() while tracing the
+patterns, see genie.libs.parser.utils.pattern_profile: attempts, hits and
+time of each pattern, the patterns which never matched and the lines no
+pattern matched.
+
+    python tools/benchmarks/pattern_profile.py iosxe.show_bgp.ShowBgpAllDetail
+    python tools/benchmarks/pattern_profile.py --rows 10000 \\
+        iosxe.show_interface.ShowInterfaces
+'''
+
+import json
+import argparse
+import importlib
+
+from genie.libs.parser.utils.pattern_profile import PatternProfile
+
+from golden_throughput import TESTS, golden_outputs
+from scale_outputs import GENERATORS
+
+
+def outputs(path, rows):
+    '''Return the outputs and arguments to parse'''
+    if rows:
+        generators = {parser: generate
+                      for parser, generate, _ in GENERATORS.values()}
+        if path not in generators:
+            raise SystemExit('No generator for {}'.format(path))
+        return [('\n'.join(generators[path](rows)), {})]
+
+    os_name, class_name = path.split('.')[0], path.rsplit('.', 1)[1]
+    goldens = golden_outputs('/'.join((TESTS, os_name, class_name, 'cli',
+                                       'equal')))
+    if not goldens:
+        raise SystemExit('No golden output for {}'.format(path))
+    return goldens
+
+
+def profile(path, rows):
+    module_name, class_name = path.rsplit('.', 1)
+    parser_cls = getattr(importlib.import_module(
+        'genie.libs.parser.' + module_name), class_name)
+    result = PatternProfile()
+    for output, arguments in outputs(path, rows):
+        parser = parser_cls(device=None)
+        with result.trace(parser):
+            try:
+                parser.cli(output=output, **arguments)
+            except Exception:
+                pass
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('parser', nargs='+',
+                        help='<os>.<module>.<Class> of parsers')
+    parser.add_argument('--rows', type=int,
+                        help='parse a synthetic output of this size')
+    parser.add_argument('--top', type=int,
+                        help='number of slowest patterns shown')
+    parser.add_argument('--json', action='store_true',
+                        help='print the profiles as json')
+    args = parser.parse_args()
+
+    profiles = {path: profile(path, args.rows) for path in args.parser}
+
+    if args.json:
+        print(json.dumps({path: result.to_dict()
+                          for path, result in profiles.items()},
+                         indent=2, sort_keys=True))
+        return
+
+    for path, result in profiles.items():
+        print(path)
+        print(result.report(top=args.top))
+        print()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+'''Measure what class level pattern tables save per parser call.
+
+For each parser, the golden outputs of tests/<os>/<Class>/cli/equal are
+parsed and compared with the cost of compiling the pattern table of the
+parser inside cli(), which is what parsers without a table pay on every
+call: a lookup in the cache of the `re` module when it is warm, a full
+compilation once dozens of parsers have thrashed it.
+
+    python tools/benchmarks/pattern_tables.py
+    python tools/benchmarks/pattern_tables.py \\
+        --parser iosxe.show_interface.ShowInterfaces --number 50
+'''
+
+import os
+import re
+import json
+import glob
+import timeit
+import argparse
+import importlib
+from unittest.mock import Mock
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__))))
+
+PARSERS = ['iosxe.show_interface.ShowInterfaces',
+           'junos.show_route.ShowRouteProtocolExtensive']
+
+
+def golden_outputs(os_name, class_name):
+    '''Return the (output, arguments) of the golden tests of a parser'''
+    folder = os.path.join(ROOT, 'tests', os_name, class_name, 'cli', 'equal')
+    goldens = []
+    for path in sorted(glob.glob(os.path.join(folder, '*_output.txt'))):
+        arguments = {}
+        arguments_path = path[:-len('_output.txt')] + '_arguments.json'
+        if os.path.exists(arguments_path):
+            with open(arguments_path) as f:
+                arguments = json.load(f)
+        with open(path) as f:
+            goldens.append((f.read(), arguments))
+    return goldens
+
+
+def measure(path, number):
+    module_name, class_name = path.rsplit('.', 1)
+    os_name = module_name.split('.')[0]
+    parser_cls = getattr(importlib.import_module(
+        'genie.libs.parser.' + module_name), class_name)
+    sources = parser_cls.patterns.sources()
+
+    goldens = golden_outputs(os_name, class_name)
+    parsers = [(parser_cls(device=Mock()), output, arguments)
+               for output, arguments in goldens]
+
+    def parse():
+        for parser, output, arguments in parsers:
+            parser.parse(output=output, **arguments)
+
+    def compile_warm():
+        for _, pattern, flags in sources:
+            re.compile(pattern, flags)
+
+    def compile_cold():
+        re.purge()
+        compile_warm()
+
+    calls = max(len(parsers), 1)
+    parse_time = min(timeit.repeat(parse, number=number, repeat=3)) / calls
+    warm = min(timeit.repeat(compile_warm, number=number, repeat=3))
+    cold = min(timeit.repeat(compile_cold, number=number, repeat=3))
+
+    return {'parser': path,
+            'patterns': len(sources),
+            'goldens': len(parsers),
+            'parse_us': parse_time / number * 1e6,
+            'saved_warm_us': warm / number * 1e6,
+            'saved_cold_us': cold / number * 1e6}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--parser', nargs='+', default=PARSERS,
+                        help='<os>.<module>.<Class> of parsers with a table')
+    parser.add_argument('--number', type=int, default=10,
+                        help='iterations per measurement')
+    parser.add_argument('--json', action='store_true',
+                        help='print the results as json')
+    args = parser.parse_args()
+
+    results = [measure(path, args.number) for path in args.parser]
+
+    if args.json:
+        print(json.dumps(results, indent=2, sort_keys=True))
+        return
+
+    print('{:<45} {:>8} {:>11} {:>15} {:>15}'.format(
+        'parser', 'patterns', 'parse (us)', 'saved warm (us)',
+        'saved cold (us)'))
+    for result in results:
+        print('{parser:<45} {patterns:>8} {parse_us:>11.1f} '
+              '{saved_warm_us:>15.1f} {saved_cold_us:>15.1f}'.format(**result))
+
+
+if __name__ == '__main__':
+    main()
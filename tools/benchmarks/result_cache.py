@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+'''Measure parse() of golden outputs, with the result cache cold and warm.
+
+Each golden output of the parsers is parsed from a mocked device, the way a
+poller parses it: without the cache, on a miss of the cache and on a hit.
+
+    python tools/benchmarks/result_cache.py
+    python tools/benchmarks/result_cache.py --parser iosxe.show_platform.ShowVersion
+'''
+
+import os
+import glob
+import json
+import time
+import argparse
+import importlib
+from unittest.mock import Mock
+
+from genie.libs.parser.utils.result_cache import (disable_result_cache,
+                                                  enable_result_cache)
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__))))
+
+PARSERS = ['iosxe.show_platform.ShowVersion',
+           'iosxe.show_platform.ShowInventory',
+           'iosxe.show_platform.ShowPlatform',
+           'iosxe.show_ospf.ShowIpOspfNeighbor',
+           'iosxe.show_ospf.ShowIpOspfNeighborDetail']
+
+
+def golden_outputs(os_name, class_name):
+    '''Return the outputs and arguments of the golden tests of a parser'''
+    folder = os.path.join(ROOT, 'tests', os_name, class_name, 'cli', 'equal')
+    goldens = []
+    for path in sorted(glob.glob(os.path.join(folder, '*_output.txt'))):
+        base = path[:-len('_output.txt')]
+        arguments = {}
+        if os.path.exists(base + '_arguments.json'):
+            with open(base + '_arguments.json') as f:
+                arguments = json.load(f)
+        with open(path) as f:
+            goldens.append((f.read(), arguments))
+    return goldens
+
+
+def parse_all(parser_cls, goldens, os_name, number):
+    start = time.perf_counter()
+    for _ in range(number):
+        for output, arguments in goldens:
+            device = Mock(os=os_name, platform=None,
+                          **{'execute.return_value': output})
+            try:
+                parser_cls(device=device).parse(**arguments)
+            except Exception:
+                pass
+    return (time.perf_counter() - start) / number / len(goldens) * 1e6
+
+
+def measure(path, number):
+    module_name, class_name = path.rsplit('.', 1)
+    os_name = module_name.split('.')[0]
+    parser_cls = getattr(importlib.import_module(
+        'genie.libs.parser.' + module_name), class_name)
+    goldens = golden_outputs(os_name, class_name)
+    if not goldens:
+        raise SystemExit('No golden output for {}'.format(path))
+
+    results = {'parser': path, 'outputs': len(goldens)}
+    disable_result_cache()
+    results['uncached_us'] = parse_all(parser_cls, goldens, os_name, number)
+
+    enable_result_cache()
+    results['miss_us'] = parse_all(parser_cls, goldens, os_name, 1)
+    results['hit_us'] = parse_all(parser_cls, goldens, os_name, number)
+    disable_result_cache()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--parser', nargs='+', default=PARSERS,
+                        help='<os>.<module>.<Class> of parsers')
+    parser.add_argument('--number', type=int, default=20,
+                        help='iterations per measurement')
+    parser.add_argument('--json', action='store_true',
+                        help='print the results as json')
+    args = parser.parse_args()
+
+    results = [measure(path, args.number) for path in args.parser]
+
+    if args.json:
+        print(json.dumps(results, indent=2, sort_keys=True))
+        return
+
+    print('{:<40} {:>8} {:>13} {:>9} {:>8}'.format(
+        'parser', 'outputs', 'uncached us', 'miss us', 'hit us'))
+    for result in results:
+        print('{:<40} {:>8} {:>13.0f} {:>9.0f} {:>8.0f}'.format(
+            result['parser'], result['outputs'], result['uncached_us'],
+            result['miss_us'], result['hit_us']))
+
+
+if __name__ == '__main__':
+    main()
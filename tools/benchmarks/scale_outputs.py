@@ -0,0 +1,272 @@
+'''Synthetic outputs of the big table parsers, at any scale.
+
+The golden outputs hold a handful of entries each; the generators of this
+module write the same outputs with as many entries as requested, to measure
+the parsers at the scale of production devices. Each generator yields the
+lines of the output, its entries written from the templates of the golden
+captures with unique keys (prefixes, MACs, interface names, LSP ids) and a
+realistic mix of the variable parts: protocols, next hops, ECMP paths,
+interfaces...
+
+    >>> output = '\\n'.join(bgp_output(1000000))
+    >>> ShowBgpAllDetail(device=None).cli(output=output)
+
+GENERATORS maps a short name to the parser class, the generator and a
+function counting the entries of the parsed output, which should be the
+number of entries generated.
+'''
+
+INTERFACES = ['GigabitEthernet1/0/{}'.format(port) for port in range(1, 49)]
+NEXT_HOPS = ['10.0.{}.1'.format(hop) for hop in range(16)]
+
+
+def ipv4(row, first=10):
+    '''Return a unique IPv4 address for the row, in `first`.0.0.0/8'''
+    return '{}.{}.{}.{}'.format(first, row >> 16 & 0xff, row >> 8 & 0xff,
+                                row & 0xff)
+
+
+def mac(row):
+    '''Return a unique MAC address for the row'''
+    return '{:04x}.{:04x}.{:04x}'.format(row >> 32 & 0xffff,
+                                         row >> 16 & 0xffff, row & 0xffff)
+
+
+def mac_output(rows):
+    '''show mac address-table, one MAC per row'''
+    yield 'Vlan    Mac Address       Type        Ports'
+    yield '----    -----------       --------    -----'
+    for row in range(rows):
+        yield '{vlan:<6} {mac}    {type:<11} {intf}'.format(
+            vlan=row % 100 + 1, mac=mac(row),
+            type='STATIC' if row % 10 == 0 else 'DYNAMIC',
+            intf=INTERFACES[row % len(INTERFACES)])
+
+
+def arp_output(rows):
+    '''show arp, one entry per row'''
+    yield 'Protocol  Address          Age (min)  Hardware Addr   Type   ' \
+          'Interface'
+    for row in range(rows):
+        yield 'Internet  {}  {:>14}   {}  ARPA   {}'.format(
+            ipv4(row), row % 240, mac(row), INTERFACES[row % len(INTERFACES)])
+
+
+def nxos_mac_output(rows):
+    '''show mac address-table of NX-OS, one MAC per row'''
+    yield '   VLAN     MAC Address      Type      age     Secure NTFY Ports'
+    yield '---------+-----------------+--------+---------+------+----+-------'
+    for row in range(rows):
+        yield '* {:>4}     {}   dynamic  0         F      F    ' \
+              'Eth1/{}'.format(row % 100 + 1, mac(row), row % 48 + 1)
+
+
+def vpn_output(rows):
+    '''show vpn-sessiondb anyconnect, one session per row'''
+    yield 'Session Type: AnyConnect'
+    for row in range(rows):
+        yield ''
+        yield 'Username : user{} Index : {}'.format(row, row + 1)
+        yield 'Assigned IP : 10.{}.{}.{} Public IP : 172.16.{}.{}'.format(
+            row >> 16 & 0xff, row >> 8 & 0xff, row & 0xff, row >> 8 & 0xff,
+            row & 0xff)
+        yield 'Protocol : AnyConnect-Parent SSL-Tunnel DTLS-Tunnel'
+        yield 'License : AnyConnect Premium'
+        yield 'Encryption : RC4 AES128 Hashing : SHA1'
+        yield 'Bytes Tx : {} Bytes Rx : {}'.format(row * 7, row * 3)
+        yield 'Group Policy : EngPolicy Tunnel Group : EngGroup'
+        yield 'Login Time : 15:25:13 EST Fri Jan 28 2011'
+        yield 'Duration : 0h:00m:15s'
+        yield 'Inactivity : 0h:00m:00s'
+
+
+def route_output(rows):
+    '''show ip route, one prefix per row: OSPF routes, one in four with two
+    equal cost paths, BGP and connected routes'''
+    yield 'Codes: L - local, C - connected, S - static, R - RIP, ' \
+          'M - mobile, B - BGP'
+    yield '       O - OSPF, IA - OSPF inter area'
+    yield ''
+    yield 'Gateway of last resort is not set'
+    yield ''
+    for row in range(rows):
+        prefix = ipv4(row) + '/32'
+        intf = INTERFACES[row % len(INTERFACES)]
+        if row % 16 == 15:
+            yield 'C        {} is directly connected, {}'.format(prefix, intf)
+        elif row % 8 == 7:
+            yield 'B        {} [20/0] via {}, 2w0d'.format(
+                prefix, NEXT_HOPS[row % 16])
+        else:
+            yield 'O IA     {} [110/2] via {}, 1d02h, {}'.format(
+                prefix, NEXT_HOPS[row % 16], intf)
+            if row % 4 == 0:
+                yield '                 [110/2] via {}, 1d02h, {}'.format(
+                    NEXT_HOPS[(row + 1) % 16],
+                    INTERFACES[(row + 1) % len(INTERFACES)])
+
+
+def nat_output(rows):
+    '''show ip nat translations verbose, one translation per row'''
+    yield 'Pro Inside global      Inside local       Outside local      ' \
+          'Outside global'
+    for row in range(rows):
+        address = '{}.{}.{}'.format(row >> 16 & 0xff, row >> 8 & 0xff,
+                                    row & 0xff)
+        yield 'tcp 172.{a}:{p} 192.{a}:{p} 10.1.1.1:23    10.1.1.1:23'.format(
+            a=address, p=1024 + row % 60000)
+        yield '  create: 02/15/12 11:38:01, use: 02/15/12 11:39:02, ' \
+              'timeout: 00:01:00'
+        yield '  Map-Id(In): 1'
+        yield '  Mac-Address: 0000.0000.0000    Input-IDB: ' + \
+              INTERFACES[row % len(INTERFACES)]
+        yield '  entry-id: 0x0, use_count:1'
+
+
+def bgp_output(rows, paths=1):
+    '''show bgp all detail, one prefix per row with `paths` paths each'''
+    yield 'For address family: IPv4 Unicast'
+    yield ''
+    for row in range(rows):
+        yield 'BGP routing table entry for {}/32, version {}'.format(
+            ipv4(row), row + 1)
+        yield 'Paths: ({} available, best #1, table default)'.format(paths)
+        yield 'Not advertised to any peer'
+        for path in range(paths):
+            hop = NEXT_HOPS[(row + path) % 16]
+            yield 'Refresh Epoch 1'
+            yield '65001 650{:02d}'.format((row + path) % 16)
+            yield '  {h} from {h} ({h})'.format(h=hop)
+            yield '    Origin IGP, metric 0, localpref 100, valid, ' \
+                  'external{}'.format(', best' if path == 0 else '')
+            yield '    Community: 65001:{}'.format(row % 100)
+            yield '    rx pathid: 0, tx pathid: {}'.format(
+                '0x0' if path == 0 else '0')
+
+
+def interfaces_output(rows):
+    '''show interfaces, one interface per row'''
+    for row in range(rows):
+        up = row % 4 != 3
+        yield 'TenGigabitEthernet{}/{}/{} is {}, line protocol is {}'.format(
+            row // 4096, row // 64 % 64, row % 64,
+            'up' if up else 'administratively down', 'up' if up else 'down')
+        yield '  Hardware is BUILT-IN-EPA-8x10G, address is {m} ' \
+              '(bia {m})'.format(m=mac(row))
+        yield '  Description: uplink {}'.format(row)
+        yield '  Internet address is {}/31'.format(ipv4(row * 2))
+        yield '  MTU 1500 bytes, BW 10000000 Kbit/sec, DLY 10 usec,'
+        yield '     reliability 255/255, txload 1/255, rxload 1/255'
+        yield '  Encapsulation ARPA, loopback not set'
+        yield '  Keepalive not supported'
+        yield '  Full Duplex, 10000Mbps, link type is force-up, ' \
+              'media type is SFP-LR'
+        yield '  output flow-control is unsupported, ' \
+              'input flow-control is unsupported'
+        yield '  ARP type: ARPA, ARP Timeout 04:00:00'
+        yield '  Last input 00:00:0{0}, output 00:00:0{0}, ' \
+              'output hang never'.format(row % 10)
+        yield '  Last clearing of "show interface" counters never'
+        yield '  Input queue: 0/375/0/0 (size/max/drops/flushes); ' \
+              'Total output drops: 0'
+        yield '  Queueing strategy: fifo'
+        yield '  Output queue: 0/40 (size/max)'
+        yield '  5 minute input rate {} bits/sec, {} packets/sec'.format(
+            row * 1000 % 9999000, row % 1000)
+        yield '  5 minute output rate {} bits/sec, {} packets/sec'.format(
+            row * 2000 % 9999000, row % 2000)
+        yield '     {} packets input, {} bytes, 0 no buffer'.format(
+            row * 31, row * 2917)
+        yield '     Received {} broadcasts (0 IP multicasts)'.format(row % 97)
+        yield '     0 runts, 0 giants, 0 throttles'
+        yield '     0 input errors, 0 CRC, 0 frame, 0 overrun, 0 ignored'
+        yield '     0 watchdog, 0 multicast, 0 pause input'
+        yield '     {} packets output, {} bytes, 0 underruns'.format(
+            row * 29, row * 2713)
+        yield '     0 output errors, 0 collisions, 1 interface resets'
+        yield '     0 unknown protocol drops'
+        yield '     0 babbles, 0 late collision, 0 deferred'
+        yield '     0 lost carrier, 0 no carrier, 0 pause output'
+        yield '     0 output buffer failures, 0 output buffers swapped out'
+
+
+def isis_output(rows):
+    '''show isis database detail, one router LSP per row, and a pseudonode
+    LSP every 4 routers'''
+    yield 'Tag core:'
+    yield 'IS-IS Level-2 Link State Database:'
+    yield 'LSPID                 LSP Seq Num  LSP Checksum  ' \
+          'LSP Holdtime/Rcvd      ATT/P/OL'
+    for row in range(rows):
+        name = 'R{}'.format(row)
+        peer = 'R{}'.format((row + 1) % rows)
+        yield '{:<20}{} 0x{:08X}   0x{:04X}                {:>4}/{}' \
+              '         0/0/0'.format(
+                  name + '.00-00', '*' if row == 0 else ' ', row + 1,
+                  row & 0xffff, 1199 - row % 1000,
+                  '*' if row == 0 else '1200')
+        yield '  Area Address: 49.{:04d}'.format(row // 1000 % 10000)
+        yield '  NLPID:        0xCC 0x8E'
+        yield '  Topology:     IPv4 (0x0)'
+        yield '                IPv6 (0x2)'
+        yield '  Hostname: ' + name
+        yield '  Metric: 10         IS-Extended {}.00'.format(peer)
+        yield '  Metric: 10         IS (MT-IPv6) {}.00'.format(peer)
+        yield '  IP Address:   ' + ipv4(row)
+        yield '  Metric: 10         IP {}/32'.format(ipv4(row))
+        yield '  Metric: 10         IP {}/31'.format(ipv4(row * 2, 172))
+        yield '  IPv6 Address: 2001:db8::{:x}'.format(row)
+        yield '  Metric: 10         IPv6 (MT-IPv6) 2001:db8::{:x}/128'.format(
+            row)
+        if row % 4 == 0:
+            yield '{:<20}  0x{:08X}   0x{:04X}                {:>4}/1200' \
+                  '      0/0/0'.format(name + '.01-00', row + 1, row & 0xffff,
+                                       1199 - row % 1000)
+            yield '  Metric: 0          IS-Extended {}.00'.format(name)
+            yield '  Metric: 0          IS-Extended {}.00'.format(peer)
+
+
+def _values(parsed, *path):
+    '''Return the values at the end of a path of the parsed output, None
+    in the path standing for every key'''
+    level = [parsed]
+    for key in path:
+        if key is None:
+            level = [value for item in level for value in item.values()]
+        else:
+            level = [item[key] for item in level if key in item]
+    return level
+
+
+def _count(*path):
+    '''Return a function counting the keys at the end of a path'''
+    return lambda parsed: sum(len(item) for item in _values(parsed, *path))
+
+
+def _bgp_count(parsed):
+    # Paths, not prefixes
+    return sum(len(prefix.get('index', {})) for prefix in _values(
+        parsed, 'instance', None, 'vrf', None, 'address_family', None,
+        'prefixes', None))
+
+
+def _isis_count(parsed):
+    # Router LSPs, not the pseudonodes
+    return sum(1 for lsps in _values(parsed, 'tag', None, 'level', None)
+               for lsp in lsps if lsp.endswith('.00-00'))
+
+
+# name: (<os>.<module>.<Class>, generator, entries of the parsed output)
+GENERATORS = {
+    'bgp': ('iosxe.show_bgp.ShowBgpAllDetail', bgp_output, _bgp_count),
+    'route': ('iosxe.show_routing.ShowIpRoute', route_output,
+              _count('vrf', None, 'address_family', None, 'routes')),
+    'mac': ('iosxe.show_fdb.ShowMacAddressTable', mac_output,
+            _count('mac_table', 'vlans', None, 'mac_addresses')),
+    'nat': ('iosxe.show_ip_nat.ShowIpNatTranslations', nat_output,
+            _count('vrf', None, 'index')),
+    'interfaces': ('iosxe.show_interface.ShowInterfaces', interfaces_output,
+                   len),
+    'isis': ('iosxe.show_isis.ShowIsisDatabaseDetail', isis_output,
+             _isis_count),
+}
@@ -0,0 +1,183 @@
+#!/usr/bin/env python
+'''Measure how the time and memory of the big parsers grow with the output.
+
+Synthetic outputs of each parser are generated at increasing sizes, see
+scale_outputs.py, and parsed with cli(), or parse() to include the schema
+validation. For every size the best time of the repeats and the peak of the
+memory allocated while parsing are measured, and the number of entries
+parsed is checked against the number generated.
+
+The growth of the time and the memory is the slope of their logarithm
+against the logarithm of the size: 1 is linear, 2 quadratic. A parser whose
+slope is above 1 plus the tolerance is reported as super-linear, and the
+script exits with 1.
+
+    python tools/benchmarks/scaling.py
+    python tools/benchmarks/scaling.py --parser bgp route --sizes 10000 \\
+        100000 1000000 --plot scaling.png
+    python tools/benchmarks/scaling.py --validate --sizes 250 1000 4000
+    python tools/benchmarks/scaling.py --validate --policy sampled
+'''
+
+import sys
+import math
+import json
+import time
+import argparse
+import importlib
+import tracemalloc
+
+from genie.libs.parser.utils.validation import VALIDATION_MODES, \
+                                              set_validation_policy
+
+from scale_outputs import GENERATORS
+
+
+def slope(sizes, values):
+    '''Return the least squares slope of log(values) against log(sizes)'''
+    points = [(math.log(size), math.log(value))
+              for size, value in zip(sizes, values) if value > 0]
+    if len(points) < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    var = sum((x - mean_x) ** 2 for x, _ in points)
+    if not var:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / var
+
+
+def measure(name, sizes, repeat, memory, validate):
+    path, generate, count = GENERATORS[name]
+    module_name, class_name = path.rsplit('.', 1)
+    parser_cls = getattr(importlib.import_module(
+        'genie.libs.parser.' + module_name), class_name)
+
+    def parse(output):
+        parser = parser_cls(device=None)
+        if validate:
+            return parser.parse(output=output)
+        return parser.cli(output=output)
+
+    results = {'parser': path, 'sizes': sizes, 'seconds': [],
+               'peak_bytes': [], 'entries': []}
+
+    for size in sizes:
+        output = '\n'.join(generate(size))
+        best = None
+        for attempt in range(repeat):
+            # The garbage collector is left enabled, its passes over the
+            # growing result are part of the cost at scale
+            start = time.perf_counter()
+            parsed = parse(output)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+            if not attempt:
+                results['entries'].append(count(parsed))
+            del parsed
+        results['seconds'].append(best)
+
+        if memory:
+            tracemalloc.start()
+            try:
+                parse(output)
+                results['peak_bytes'].append(
+                    tracemalloc.get_traced_memory()[1])
+            finally:
+                tracemalloc.stop()
+
+    results['time_slope'] = slope(sizes, results['seconds'])
+    results['memory_slope'] = slope(sizes, results['peak_bytes'])
+    return results
+
+
+def _format_slope(value):
+    return '-' if value is None else '{:.2f}'.format(value)
+
+
+def plot(results, path):
+    '''Plot the time and memory against the size, on log scales'''
+    try:
+        import matplotlib
+        matplotlib.use('Agg')
+        import matplotlib.pyplot as plt
+    except ImportError:
+        raise SystemExit('--plot requires matplotlib')
+
+    figure, (times, memories) = plt.subplots(1, 2, figsize=(12, 5))
+    for result in results:
+        times.loglog(result['sizes'], result['seconds'], marker='o',
+                     label=result['parser'].rsplit('.', 1)[1])
+        if result['peak_bytes']:
+            memories.loglog(result['sizes'],
+                            [peak / 1e6 for peak in result['peak_bytes']],
+                            marker='o')
+    times.set(xlabel='entries', ylabel='seconds', title='time')
+    memories.set(xlabel='entries', ylabel='MB', title='peak allocation')
+    times.legend()
+    figure.tight_layout()
+    figure.savefig(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--parser', nargs='+', default=list(GENERATORS),
+                        choices=list(GENERATORS), help='parsers to measure')
+    parser.add_argument('--sizes', nargs='+', type=int,
+                        default=[1000, 4000, 16000],
+                        help='entries of the outputs, in increasing order')
+    parser.add_argument('--repeat', type=int, default=2,
+                        help='parses per size, the best one is kept')
+    parser.add_argument('--validate', action='store_true',
+                        help='parse with parse(), validating the schema')
+    parser.add_argument('--policy', choices=VALIDATION_MODES, default='full',
+                        help='validation policy of parse(), with --validate')
+    parser.add_argument('--no-memory', dest='memory', action='store_false',
+                        help='skip tracing the peak allocation')
+    parser.add_argument('--tolerance', type=float, default=0.2,
+                        help='slope above 1 still considered linear')
+    parser.add_argument('--plot', metavar='PATH',
+                        help='save a plot of the results, with matplotlib')
+    parser.add_argument('--json', action='store_true',
+                        help='print the results as json')
+    args = parser.parse_args()
+    if args.policy != 'full':
+        set_validation_policy(args.policy)
+
+    results = [measure(name, args.sizes, args.repeat, args.memory,
+                       args.validate) for name in args.parser]
+    for result in results:
+        result['super_linear'] = any(
+            value is not None and value > 1 + args.tolerance
+            for value in (result['time_slope'], result['memory_slope']))
+        result['entries_ok'] = result['entries'] == result['sizes']
+
+    if args.plot:
+        plot(results, args.plot)
+
+    if args.json:
+        print(json.dumps(results, indent=2, sort_keys=True))
+    else:
+        print('{:<42} {:>9} {:>10} {:>9} {:>8}'.format(
+            'parser', 'entries', 'seconds', 'us/entry', 'peak MB'))
+        for result in results:
+            for index, size in enumerate(result['sizes']):
+                print('{:<42} {:>9} {:>10.3f} {:>9.1f} {:>8}'.format(
+                    result['parser'] if not index else '', size,
+                    result['seconds'][index],
+                    result['seconds'][index] / size * 1e6,
+                    '{:.1f}'.format(result['peak_bytes'][index] / 1e6)
+                    if result['peak_bytes'] else '-'))
+            print('{:<42} time slope {}, memory slope {}{}{}'.format(
+                '', _format_slope(result['time_slope']),
+                _format_slope(result['memory_slope']),
+                ', SUPER-LINEAR' if result['super_linear'] else '',
+                '' if result['entries_ok'] else
+                ', ENTRIES {}'.format(result['entries'])))
+
+    if any(result['super_linear'] for result in results):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()